@@ -6,12 +6,15 @@
 from __future__ import annotations
 
 import logging
-from asyncio import Semaphore, gather
+from asyncio import CancelledError, Event, Semaphore, Task, create_task, gather, get_running_loop, sleep, wait, wait_for
+from asyncio import TimeoutError as AsyncioTimeoutError
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from enum import Enum
 from functools import cached_property
 from inspect import getcoroutinelocals
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
@@ -19,20 +22,41 @@ from pydantic import BaseModel, ConfigDict
 from anta import GITHUB_SUGGESTION
 from anta.inventory import AntaInventory
 from anta.logger import anta_log_exception
+from anta.metrics import get_metrics
 from anta.models import AntaTest
 from anta.result_manager import ResultManager
+from anta.result_manager.diff import FAILED_STATUSES, AntaStatusChange, ResultKey, index_results
+from anta.result_manager.journal import input_digest
+from anta.result_manager.models import AntaTestStatus
 from anta.settings import AntaRunnerSettings
 from anta.tools import Catchtime
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Callable, Coroutine
 
     from anta.catalog import AntaCatalog, AntaTestDefinition
     from anta.device import AntaDevice
+    from anta.result_manager.journal import ResultJournal
     from anta.result_manager.models import TestResult
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_GRACE_PERIOD = 10.0
+"""Default time in seconds given to the running tests to complete when an ANTA run is cancelled."""
+
+
+class OutputRetention(str, Enum):
+    """Retention policy of the command outputs of the tests once they complete.
+
+    - `none`: only keep the test results, the command outputs are released as soon as a test completes.
+    - `failures`: keep the tests which failed or raised an error with their command outputs.
+    - `all`: keep all the tests with their command outputs, e.g. for debugging.
+    """
+
+    NONE = "none"
+    FAILURES = "failures"
+    ALL = "all"
+
 
 class AntaRunFilters(BaseModel):
     """Define filters for an ANTA run.
@@ -84,16 +108,30 @@ class AntaRunContext:
         Whether the run stops after setup and before test execution.
     disconnect: bool
         Whether the run disconnects matching inventory devices before returning.
+    journal: ResultJournal | None
+        Journal where completed test results are checkpointed. Tests already in the journal are not run again.
+    connect: bool
+        Whether the run connects to the devices of the filtered inventory before running the tests.
+    prescan: bool
+        Whether the eAPI port of the devices is probed before connecting to them.
+    output_retention: OutputRetention
+        Retention policy of the command outputs of the tests once they complete.
     filtered_inventory: AntaInventory
         Inventory matching the run device/tag filters, computed once for this run context.
     selected_inventory: AntaInventory
         The final inventory of devices selected for testing.
-    selected_tests: defaultdict[AntaDevice, set[AntaTestDefinition]]
+    selected_tests: defaultdict[AntaDevice, frozenset[AntaTestDefinition]]
         A mapping containing the final tests to be run per device.
     devices_filtered_at_setup: list[str]
         List of device names that were filtered during the inventory setup phase.
     devices_unreachable_at_setup: list[str]
         List of device names that were found unreachable during the inventory setup phase.
+    tests_resumed: int
+        Number of tests whose results were loaded from the journal instead of being run.
+    retained_tests: list[AntaTest]
+        Completed tests kept with their command outputs according to the output retention policy.
+    cancel_reason: str | None
+        Reason why the run was cancelled before all the tests completed. None if the run was not cancelled.
     warnings_at_setup: list[str]
         List of warnings caught during the setup phase.
     start_time: datetime | None
@@ -108,12 +146,19 @@ class AntaRunContext:
     filters: AntaRunFilters
     dry_run: bool = False
     disconnect: bool = False
+    journal: ResultJournal | None = None
+    connect: bool = True
+    prescan: bool = False
+    output_retention: OutputRetention = OutputRetention.NONE
 
     # State populated during the run
     selected_inventory: AntaInventory = field(default_factory=AntaInventory)
-    selected_tests: defaultdict[AntaDevice, set[AntaTestDefinition]] = field(default_factory=lambda: defaultdict(set))
+    selected_tests: defaultdict[AntaDevice, frozenset[AntaTestDefinition]] = field(default_factory=lambda: defaultdict(frozenset))
     devices_filtered_at_setup: list[str] = field(default_factory=list)
     devices_unreachable_at_setup: list[str] = field(default_factory=list)
+    tests_resumed: int = 0
+    retained_tests: list[AntaTest] = field(default_factory=list)
+    cancel_reason: str | None = None
     warnings_at_setup: list[str] = field(default_factory=list)
     start_time: datetime | None = None
     end_time: datetime | None = None
@@ -150,6 +195,11 @@ class AntaRunContext:
         """Total tests scheduled to run across all selected devices."""
         return sum(len(tests) for tests in self.selected_tests.values())
 
+    @property
+    def cancelled(self) -> bool:
+        """Whether the run was cancelled before all the tests completed."""
+        return self.cancel_reason is not None
+
     @property
     def duration(self) -> timedelta | None:
         """Calculate the duration of the run. Returns None if start or end time is not set."""
@@ -212,7 +262,7 @@ class AntaRunner:
         self._settings = settings if settings is not None else AntaRunnerSettings()
         logger.debug("AntaRunner initialized with settings: %s", self._settings.model_dump())
 
-    async def run(
+    async def run(  # noqa: PLR0913
         self,
         inventory: AntaInventory,
         catalog: AntaCatalog,
@@ -221,6 +271,14 @@ class AntaRunner:
         *,
         dry_run: bool = False,
         disconnect: bool = False,
+        on_result: Callable[[TestResult], None] | None = None,
+        journal: ResultJournal | None = None,
+        stop_event: Event | None = None,
+        max_duration: float | None = None,
+        grace_period: float = DEFAULT_GRACE_PERIOD,
+        connect: bool = True,
+        prescan: bool = False,
+        output_retention: OutputRetention = OutputRetention.NONE,
     ) -> AntaRunContext:
         """Run ANTA.
 
@@ -251,6 +309,32 @@ class AntaRunner:
             when the run owns the inventory lifecycle. Leave disabled when reusing the
             same inventory or devices across concurrent runs, and call
             `AntaInventory.disconnect_inventory()` once all runs are complete.
+        on_result
+            Callback called with each test result as soon as it is known, e.g. to stream results: when the test completes,
+            is skipped or cancelled, or is resumed from the journal. In dry-run mode, it is called with the results of the tests not run.
+            Results are still added to the result manager in the scheduling order once all tests complete.
+        journal
+            Journal where completed test results are checkpointed. The results of the tests already in the journal,
+            keyed by device, test and inputs, are added to the result manager and these tests are not run again,
+            except the tests in error which are retried.
+        stop_event
+            Event to cancel the run gracefully, e.g. when receiving a signal. Once set, the tests not started yet are
+            marked as skipped and the running tests are given `grace_period` seconds to complete.
+        max_duration
+            Maximum duration of the run in seconds. Once exceeded, the run is cancelled gracefully as with `stop_event`.
+        grace_period
+            Time in seconds given to the running tests to complete when the run is cancelled.
+            The tests still running after the grace period are cancelled and marked as error.
+        connect
+            Connect to the devices of the filtered inventory before running the tests. Disable when the caller keeps the inventory
+            connected between runs, e.g. `AntaService`: the devices which are not established are then reported as unreachable.
+        prescan
+            Probe the eAPI port of the devices concurrently before connecting to them. The devices whose port is not open
+            are marked as unreachable without waiting for the eAPI connection timeout. See `AntaInventory.prescan_inventory()`.
+        output_retention
+            Retention policy of the command outputs of the tests. By default, the command outputs of a test are released as soon
+            as it completes and only its result is kept. The retained tests are available in `AntaRunContext.retained_tests`.
+            The command outputs are also kept in the device caches until the end of the run, unless the caches are disabled.
 
         Returns
         -------
@@ -268,7 +352,15 @@ class AntaRunner:
             dry_run=dry_run,
             start_time=start_time,
             disconnect=disconnect,
+            journal=journal,
+            connect=connect,
+            prescan=prescan,
+            output_retention=output_retention,
         )
+        stop_event = stop_event if stop_event is not None else Event()
+        deadline_timer = None
+        if max_duration is not None:
+            deadline_timer = get_running_loop().call_later(max_duration, self._cancel_run, ctx, stop_event, f"Maximum run duration of {max_duration:g}s exceeded")
         try:
             if len(ctx.manager) > 0:
                 msg = (
@@ -291,7 +383,7 @@ class AntaRunner:
 
                 # Set up tests
                 with Catchtime(logger=logger, message="Preparing Tests"):
-                    setup_tests_ok = self._setup_tests(ctx)
+                    setup_tests_ok = self._setup_tests(ctx, on_result)
                     if not setup_tests_ok:
                         ctx.end_time = datetime.now(tz=timezone.utc)
                         return ctx
@@ -303,7 +395,7 @@ class AntaRunner:
 
             if ctx.dry_run:
                 logger.info("Dry-run mode, exiting before running the tests.")
-                self._close_test_coroutines(test_coroutines, ctx)
+                self._close_test_coroutines(test_coroutines, ctx, on_result)
                 ctx.end_time = datetime.now(tz=timezone.utc)
                 return ctx
 
@@ -311,20 +403,13 @@ class AntaRunner:
                 AntaTest.nrfu_task = AntaTest.progress.add_task("Running NRFU Tests ...", total=ctx.total_tests_scheduled)
 
             with Catchtime(logger=logger, message="Running Tests"):
-                sem = Semaphore(self._settings.max_concurrency)
-
-                async def run_with_sem(test_coro: Coroutine[Any, Any, TestResult]) -> TestResult:
-                    """Wrap the test coroutine with semaphore control."""
-                    async with sem:
-                        return await test_coro
-
-                results = await gather(*[run_with_sem(coro) for coro in test_coroutines])
-                for res in results:
-                    ctx.manager.add(res)
+                await self._run_test_coroutines(test_coroutines, ctx, on_result=on_result, stop_event=stop_event, grace_period=grace_period)
 
             self._log_cache_statistics(ctx)
 
         finally:
+            if deadline_timer is not None:
+                deadline_timer.cancel()
             if ctx.disconnect:
                 # Disconnect from devices after tests complete
                 with Catchtime(logger=logger, message="Disconnecting from devices"):
@@ -340,14 +425,14 @@ class AntaRunner:
         """
         initial_device_names = set(ctx.inventory.keys())
 
-        if not initial_device_names:
+        if not initial_device_names and not ctx.inventory.lazy_entries:
             self._log_warning_msg(msg="The initial inventory is empty. Exiting ...", ctx=ctx)
             return False
 
         filtered_device_names = set(ctx.filtered_inventory.keys())
         ctx.devices_filtered_at_setup = sorted(initial_device_names - filtered_device_names)
 
-        if not filtered_device_names:
+        if not filtered_device_names and not ctx.filtered_inventory.lazy_entries:
             msg_parts = ["The inventory is empty after filtering by tags/devices."]
             if ctx.filters.devices:
                 msg_parts.append(f"Devices filter: {', '.join(sorted(ctx.filters.devices))}.")
@@ -357,14 +442,24 @@ class AntaRunner:
             self._log_warning_msg(msg=" ".join(msg_parts), ctx=ctx)
             return False
 
+        if ctx.filtered_inventory.lazy_entries:
+            # Create the devices of the lazy networks and ranges matching the filters, without probing them in dry-run mode
+            with Catchtime(logger=logger, message="Expanding the inventory"):
+                await ctx.filtered_inventory.expand(probe=False if ctx.dry_run else None)
+            filtered_device_names = set(ctx.filtered_inventory.keys())
+            if not filtered_device_names:
+                self._log_warning_msg(msg="The inventory is empty after expanding its networks and ranges. Exiting ...", ctx=ctx)
+                return False
+
         # In dry-run mode, set the selected inventory to the filtered inventory
         if ctx.dry_run:
             ctx.selected_inventory = ctx.filtered_inventory
             return True
 
         # Attempt to connect to devices that passed filters
-        with Catchtime(logger=logger, message="Connecting to devices"):
-            await ctx.filtered_inventory.connect_inventory()
+        if ctx.connect:
+            with Catchtime(logger=logger, message="Connecting to devices"):
+                await ctx.filtered_inventory.connect_inventory(prescan=ctx.prescan)
 
         # Remove devices that are unreachable if required
         ctx.selected_inventory = ctx.filtered_inventory.get_inventory(established_only=True) if ctx.filters.established_only else ctx.filtered_inventory
@@ -378,29 +473,32 @@ class AntaRunner:
 
         return True
 
-    def _setup_tests(self, ctx: AntaRunContext) -> bool:
+    def _setup_tests(self, ctx: AntaRunContext, on_result: Callable[[TestResult], None] | None = None) -> bool:
         """Set up tests for the ANTA run.
 
-        Returns True if the test setup was successful, otherwise False.
+        Returns True if the test setup was successful, otherwise False. `on_result` is called with the results resumed from the journal.
         """
         # Build indexes for the catalog. If `ctx.filters.tests` is set, filter the indexes based on these tests
+        # The indexes are rebuilt from scratch since the catalog can be shared by runs with different test filters
+        ctx.catalog.clear_indexes()
         ctx.catalog.build_indexes(filtered_tests=ctx.filters.tests)
 
         # Create the device to tests mapping from the tags
+        # If there are CLI tags, execute tests with matching tags for each device. Otherwise, execute all tests that do not
+        # have any tags and the tests with matching tags from device tags. The selection is memoised per set of tags by the
+        # catalog: devices with the same tags share the same immutable set of tests.
         for device in ctx.selected_inventory.devices:
-            if ctx.filters.tags:
-                # If there are CLI tags, execute tests with matching tags for this device
-                if not (matching_tags := ctx.filters.tags.intersection(device.tags)):
-                    # The device does not have any selected tag, skipping
-                    # This should not never happen because the device will already be filtered by `_setup_inventory`
-                    continue
-                ctx.selected_tests[device].update(ctx.catalog.get_tests_by_tags(matching_tags))
-            else:
-                # If there is no CLI tags, execute all tests that do not have any tags
-                ctx.selected_tests[device].update(ctx.catalog.tag_to_tests[None])
-
-                # Then add the tests with matching tags from device tags
-                ctx.selected_tests[device].update(ctx.catalog.get_tests_by_tags(device.tags))
+            if ctx.filters.tags and ctx.filters.tags.isdisjoint(device.tags):
+                # The device does not have any selected tag, skipping
+                # This should not never happen because the device will already be filtered by `_setup_inventory`
+                continue
+            ctx.selected_tests[device] = ctx.catalog.get_tests_by_device_tags(device.tags, ctx.filters.tags)
+
+        if ctx.journal is not None:
+            self._resume_from_journal(ctx, on_result)
+            if ctx.total_tests_scheduled == 0 and ctx.tests_resumed > 0:
+                logger.info("All %d selected tests have already been run according to the journal. Exiting ...", ctx.tests_resumed)
+                return False
 
         if ctx.total_tests_scheduled == 0:
             msg_parts = ["No tests scheduled to run after filtering by tags/tests."]
@@ -414,6 +512,28 @@ class AntaRunner:
 
         return True
 
+    def _resume_from_journal(self, ctx: AntaRunContext, on_result: Callable[[TestResult], None] | None = None) -> None:
+        """Remove the selected tests already in the run journal and add their results to the result manager and to `on_result`.
+
+        Tests in error in the journal, e.g. after a timeout or a connection failure, are not resumed and are run again.
+        """
+        if ctx.journal is None or len(ctx.journal) == 0:
+            return
+        for device, test_definitions in ctx.selected_tests.items():
+            resumed_tests: set[AntaTestDefinition] = set()
+            for test_def in test_definitions:
+                result = ctx.journal.get((device.name, test_def.test.name, input_digest(test_def.inputs)))
+                if result is not None and result.result != AntaTestStatus.ERROR:
+                    resumed_tests.add(test_def)
+                    ctx.manager.add(result)
+                    if on_result is not None:
+                        on_result(result)
+                    ctx.tests_resumed += 1
+            if resumed_tests:
+                # The selected tests can be shared by several devices
+                ctx.selected_tests[device] = test_definitions - resumed_tests
+        logger.info("%d tests resumed from journal %s", ctx.tests_resumed, ctx.journal.filename)
+
     def _get_test_coroutines(self, ctx: AntaRunContext) -> list[Coroutine[Any, Any, TestResult]]:
         """Get the test coroutines for the ANTA run."""
         coros = []
@@ -433,20 +553,31 @@ class AntaRunner:
                     anta_log_exception(exc, msg, logger)
         return coros
 
-    def _close_test_coroutines(self, coros: list[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext) -> None:
+    def _close_test_coroutines(
+        self, coros: list[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext, on_result: Callable[[TestResult], None] | None = None
+    ) -> None:
         """Close the test coroutines. Used in dry-run."""
         for coro in coros:
-            # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
-            coro_locals = getcoroutinelocals(coro)
-            test = coro_locals.get("self") or coro_locals.get("args")
-            if isinstance(test, AntaTest):
+            if (test := self._get_coroutine_test(coro)) is not None:
                 ctx.manager.add(test.result)
-            elif test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
-                ctx.manager.add(test[0].result)
+                if on_result is not None:
+                    on_result(test.result)
             else:
                 logger.error("Coroutine %s does not have an AntaTest instance.", coro)
             coro.close()
 
+    @staticmethod
+    def _get_coroutine_test(coro: Coroutine[Any, Any, TestResult]) -> AntaTest | None:
+        """Get the AntaTest instance of a test coroutine. Returns None if not found."""
+        # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
+        coro_locals = getcoroutinelocals(coro)
+        test = coro_locals.get("self") or coro_locals.get("args")
+        if isinstance(test, AntaTest):
+            return test
+        if test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
+            return test[0]
+        return None
+
     def _log_run_information(self, ctx: AntaRunContext) -> None:
         """Log ANTA run information and potential resource limit warnings."""
         logger.info("Initial inventory contains %s devices", ctx.total_devices_in_inventory)
@@ -482,6 +613,226 @@ class AntaRunner:
             )
             self._log_warning_msg(msg=msg, ctx=ctx)
 
+    async def watch(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        interval: float,
+        filters: AntaRunFilters | None = None,
+        *,
+        iterations: int | None = None,
+        disconnect: bool = True,
+    ) -> AsyncIterator[tuple[AntaRunContext, list[AntaStatusChange]]]:
+        """Run ANTA continuously and yield the test status changes of each iteration.
+
+        The inventory connections (httpx connection pools and eAPI sessions) and the parsed catalog
+        are kept between iterations. The device caches are cleared before each iteration so that
+        commands are collected again from the devices.
+
+        The first iteration reports all the test results as changes.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        catalog
+            Catalog of tests to run.
+        interval
+            Interval in seconds between the start of two iterations. If an iteration lasts longer
+            than the interval, the next iteration starts immediately.
+        filters
+            Filters for the ANTA run. If `None`, run all tests on all devices.
+        iterations
+            Number of iterations to run. If `None`, run until the generator is closed or cancelled.
+        disconnect
+            Disconnect matching inventory devices when the generator is closed.
+
+        Yields
+        ------
+        tuple[AntaRunContext, list[AntaStatusChange]]
+            The context of the iteration and the test status changes since the previous iteration.
+        """
+        filters = filters if filters is not None else AntaRunFilters()
+        previous: dict[ResultKey, TestResult] = {}
+        iteration = 0
+        ctx: AntaRunContext | None = None
+        try:
+            while iterations is None or iteration < iterations:
+                if iteration > 0:
+                    for device in inventory.devices:
+                        if device.cache is not None:
+                            device.cache.clear()
+                start = monotonic()
+                ctx = await self.run(inventory, catalog, filters=filters)
+                current = index_results(ctx.manager)
+                changes = [
+                    AntaStatusChange(previous=previous.get(key), current=result)
+                    for key, result in current.items()
+                    if key not in previous or previous[key].result != result.result
+                ]
+                changes.extend(AntaStatusChange(previous=result, current=None) for key, result in previous.items() if key not in current)
+                previous = current
+                iteration += 1
+                yield ctx, changes
+                if iterations is None or iteration < iterations:
+                    await sleep(max(0.0, interval - (monotonic() - start)))
+        finally:
+            if disconnect and ctx is not None:
+                with Catchtime(logger=logger, message="Disconnecting from devices"):
+                    await ctx.filtered_inventory.disconnect_inventory()
+
+    @staticmethod
+    def _cancel_run(ctx: AntaRunContext, stop_event: Event, reason: str) -> None:
+        """Cancel an ANTA run gracefully."""
+        if ctx.cancel_reason is None:
+            ctx.cancel_reason = reason
+        stop_event.set()
+
+    async def _run_test(
+        self,
+        test_coro: Coroutine[Any, Any, TestResult],
+        test: AntaTest | None,
+        ctx: AntaRunContext,
+        sem: Semaphore,
+        stop_event: Event,
+        on_result: Callable[[TestResult], None] | None,
+    ) -> TestResult:
+        """Run a test coroutine with semaphore control and graceful cancellation.
+
+        The outcome of the test is recorded in the metrics and passed to `on_result` as soon as the test completes, is skipped or is cancelled.
+        """
+        started = completed = False
+        try:
+            async with sem:
+                if stop_event.is_set() and test is not None:
+                    result = self._skip_test(test_coro, test, ctx)
+                else:
+                    started = True
+                    result = await self._await_test(test_coro, test)
+                    completed = True
+        except CancelledError:
+            if test is None:
+                raise
+            if started:
+                # The test was still running at the end of the grace period
+                test.result.is_error(f"Test cancelled: {ctx.cancel_reason}")
+                result = test.result
+            else:
+                result = self._skip_test(test_coro, test, ctx)
+        finally:
+            if test is not None:
+                self._retain_outputs(test, ctx)
+        if (metrics := get_metrics()) is not None:
+            metrics.observe_result(result)
+        if completed and ctx.journal is not None and test is not None:
+            ctx.journal.append((test.device.name, test.name, input_digest(test.inputs)), result)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    @staticmethod
+    def _retain_outputs(test: AntaTest, ctx: AntaRunContext) -> None:
+        """Keep a completed test with its command outputs according to the output retention policy of the run, or release its command outputs."""
+        if ctx.output_retention == OutputRetention.ALL or (ctx.output_retention == OutputRetention.FAILURES and test.result.result in FAILED_STATUSES):
+            ctx.retained_tests.append(test)
+            return
+        for command in test.instance_commands:
+            command.output = None
+
+    @staticmethod
+    async def _await_test(test_coro: Coroutine[Any, Any, TestResult], test: AntaTest | None) -> TestResult:
+        """Await a test coroutine, enforcing the test timeout if defined in the test inputs."""
+        if test is None or test.inputs.timeout is None:
+            return await test_coro
+        try:
+            return await wait_for(test_coro, timeout=test.inputs.timeout)
+        except AsyncioTimeoutError:
+            test.result.is_error(f"Test timed out after {test.inputs.timeout:g}s")
+            AntaTest.update_progress()
+            return test.result
+
+    @staticmethod
+    def _skip_test(test_coro: Coroutine[Any, Any, TestResult], test: AntaTest, ctx: AntaRunContext) -> TestResult:
+        """Close the coroutine of a test not started before the run was cancelled and mark the test as skipped."""
+        test_coro.close()
+        test.result.is_skipped(f"Test not run: {ctx.cancel_reason or 'ANTA run interrupted'}")
+        return test.result
+
+    async def _run_test_coroutines(
+        self,
+        test_coroutines: list[Coroutine[Any, Any, TestResult]],
+        ctx: AntaRunContext,
+        on_result: Callable[[TestResult], None] | None = None,
+        stop_event: Event | None = None,
+        grace_period: float = DEFAULT_GRACE_PERIOD,
+    ) -> None:
+        """Run the test coroutines with concurrency control and add the results to the context result manager.
+
+        When `stop_event` is set, the tests not started yet are marked as skipped and the running tests are given
+        `grace_period` seconds to complete before being cancelled and marked as error. The results of all the tests,
+        including the partial ones, are added to the result manager.
+
+        Parameters
+        ----------
+        test_coroutines
+            The list of test coroutines to run.
+        ctx
+            The ANTA run context.
+        on_result
+            Callback called with each test result as soon as the test completes.
+        stop_event
+            Event to cancel the run gracefully.
+        grace_period
+            Time in seconds given to the running tests to complete when the run is cancelled.
+        """
+        if (metrics := get_metrics()) is not None:
+            for device in ctx.filtered_inventory.devices:
+                metrics.register_device(device)
+
+        sem = Semaphore(self._settings.max_concurrency)
+        stop_event = stop_event if stop_event is not None else Event()
+        # The tests are only referenced by their task so that they can be released as soon as they complete
+        tasks: list[Task[TestResult]] = [
+            create_task(self._run_test(coro, self._get_coroutine_test(coro), ctx, sem, stop_event, on_result)) for coro in test_coroutines
+        ]
+        if tasks:
+            await self._wait_test_tasks(tasks, ctx, stop_event, grace_period)
+
+        for task in tasks:
+            if task.cancelled():
+                continue
+            ctx.manager.add(task.result())
+
+    @staticmethod
+    async def _wait_test_tasks(tasks: list[Task[TestResult]], ctx: AntaRunContext, stop_event: Event, grace_period: float) -> None:
+        """Wait for the test tasks to complete or for the run to be cancelled.
+
+        When the run is cancelled, the tasks still running after the grace period are cancelled.
+        If the caller itself is cancelled, all the tasks are cancelled and awaited before re-raising,
+        so that no test keeps running once the inventory is disconnected.
+        """
+        stop_waiter = create_task(stop_event.wait())
+        all_done = gather(*tasks, return_exceptions=True)
+        try:
+            await wait({all_done, stop_waiter}, return_when="FIRST_COMPLETED")
+            stop_waiter.cancel()
+            if not all_done.done():
+                if ctx.cancel_reason is None:
+                    ctx.cancel_reason = "ANTA run interrupted"
+                logger.warning("%s: cancelling the ANTA run, waiting up to %gs for the running tests to complete ...", ctx.cancel_reason, grace_period)
+                _, pending = await wait(tasks, timeout=grace_period)
+                for task in pending:
+                    task.cancel()
+            await all_done
+        except CancelledError:
+            if ctx.cancel_reason is None:
+                ctx.cancel_reason = "ANTA run cancelled"
+            for task in tasks:
+                task.cancel()
+            stop_waiter.cancel()
+            await gather(*tasks, stop_waiter, return_exceptions=True)
+            raise
+
     def _log_cache_statistics(self, ctx: AntaRunContext) -> None:
         """Log cache statistics for each device in the inventory."""
         for device in ctx.selected_inventory.devices:
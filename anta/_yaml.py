@@ -0,0 +1,106 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""YAML loading helpers.
+
+The LibYAML based loaders are used when PyYAML has been built with LibYAML, falling back to the pure Python loaders otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING, Any
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import DocumentEndEvent, MappingEndEvent, MappingStartEvent, StreamEndEvent
+from yaml.resolver import Resolver
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml.cyaml import CParser
+
+    class StreamingSafeLoader(CParser, Composer, SafeConstructor, Resolver):  # type: ignore[misc]
+        """Safe YAML loader composing nodes from the LibYAML parser events.
+
+        Unlike `CSafeLoader`, nodes can be composed one at a time with `compose_node()`.
+        """
+
+        def __init__(self, stream: str | bytes | IO[str] | IO[bytes]) -> None:
+            """Initialize a StreamingSafeLoader."""
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+    StreamingSafeLoader = SafeLoader  # type: ignore[assignment,misc]
+
+
+class NotAMappingError(TypeError):
+    """Raised by `iter_mapping()` when the YAML document is not a mapping.
+
+    The `data` attribute holds the loaded YAML document.
+    """
+
+    def __init__(self, data: Any) -> None:  # noqa: ANN401
+        """Initialize a NotAMappingError."""
+        self.data = data
+        super().__init__(f"YAML document must be a mapping, got {type(data).__name__}")
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:  # noqa: ANN401
+    """Parse a YAML document like `yaml.safe_load()`, using LibYAML when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def iter_mapping(stream: str | bytes | IO[str] | IO[bytes]) -> Iterator[tuple[Any, Any]]:
+    """Parse a YAML document which is a mapping and yield its items one at a time.
+
+    The document tree is never built as a whole: each item is composed and constructed only when it is yielded.
+    The caller can process and release an item before the next one is parsed.
+
+    Parameters
+    ----------
+    stream
+        YAML document.
+
+    Yields
+    ------
+    tuple[Any, Any]
+        Key and value of each item of the mapping.
+
+    Raises
+    ------
+    NotAMappingError
+        If the YAML document is not a mapping.
+    yaml.YAMLError
+        If the YAML document is not valid.
+    """
+    loader = StreamingSafeLoader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(StreamEndEvent):
+            raise NotAMappingError(None)
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(MappingStartEvent):
+            raise NotAMappingError(loader.construct_document(loader.compose_node(None, None)))  # type: ignore[arg-type]
+        loader.get_event()
+        while not loader.check_event(MappingEndEvent):
+            key = loader.construct_document(loader.compose_node(None, None))  # type: ignore[arg-type]
+            value = loader.construct_document(loader.compose_node(None, None))  # type: ignore[arg-type]
+            yield key, value
+        loader.get_event()  # MappingEndEvent
+        if loader.check_event(DocumentEndEvent):
+            loader.get_event()
+        if not loader.check_event(StreamEndEvent):
+            event = loader.get_event()
+            msg = "expected a single document in the stream"
+            raise yaml.composer.ComposerError(msg, None, "but found another document", event.start_mark)
+    finally:
+        loader.dispose()
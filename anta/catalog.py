@@ -9,18 +9,21 @@ import importlib
 import logging
 import math
 from collections import defaultdict
+from functools import reduce
 from inspect import isclass
 from itertools import chain
 from json import load as json_load
+from operator import and_, or_
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, TextIO
 
 from pydantic import BaseModel, ConfigDict, RootModel, ValidationError, ValidationInfo, field_validator, model_serializer, model_validator
 from pydantic.types import ImportString
 from pydantic_core import PydanticCustomError
 from typing_extensions import deprecated
-from yaml import YAMLError, safe_dump, safe_load
+from yaml import YAMLError, safe_dump
 
+from anta._yaml import NotAMappingError, iter_mapping, safe_load
 from anta.logger import anta_log_exception
 from anta.models import AntaTest
 
@@ -28,6 +31,8 @@ if TYPE_CHECKING:
     import sys
     from types import ModuleType
 
+    from anta.catalog_cache import CatalogCache
+
     if sys.version_info >= (3, 11):
         from typing import Self
     else:
@@ -305,11 +310,20 @@ class AntaCatalog:
             self._filename = filename if isinstance(filename, Path) else Path(filename)
         self.indexes_built: bool
         self.tag_to_tests: defaultdict[str | None, set[AntaTestDefinition]]
+        self._test_positions: dict[AntaTestDefinition, int]
+        self._tag_to_bitset: dict[str | None, int]
+        self._tests_by_tags_cache: dict[tuple[frozenset[str], bool], frozenset[AntaTestDefinition]]
+        self._tests_by_device_tags_cache: dict[tuple[frozenset[str], bool], frozenset[AntaTestDefinition]]
         self._init_indexes()
 
     def _init_indexes(self) -> None:
         """Init indexes related variables."""
         self.tag_to_tests = defaultdict(set)
+        # Bitset index: bit N of a tag bitset is set if the Nth indexed test has this tag
+        self._test_positions = {}
+        self._tag_to_bitset = {}
+        self._tests_by_tags_cache = {}
+        self._tests_by_device_tags_cache = {}
         self.indexes_built = False
 
     @property
@@ -336,7 +350,7 @@ class AntaCatalog:
         self.clear_indexes()
 
     @staticmethod
-    def parse(filename: str | Path, file_format: Literal["yaml", "json"] = "yaml") -> AntaCatalog:
+    def parse(filename: str | Path, file_format: Literal["yaml", "json"] = "yaml", *, cache: CatalogCache | None = None) -> AntaCatalog:
         """Create an AntaCatalog instance from a test catalog file.
 
         Parameters
@@ -345,6 +359,9 @@ class AntaCatalog:
             Path to test catalog YAML or JSON file.
         file_format
             Format of the file, either 'yaml' or 'json'.
+        cache
+            Compiled catalog cache. If the catalog file has been compiled with `AntaCatalog.compile()`,
+            the validated tests are loaded from the cache instead of parsing and validating the file.
 
         Returns
         -------
@@ -357,8 +374,22 @@ class AntaCatalog:
 
         try:
             file: Path = filename if isinstance(filename, Path) else Path(filename)
+            if cache is not None:
+                with file.open("rb") as f:
+                    content = f.read()
+                if (tests := cache.load(content, file_format)) is not None:
+                    return AntaCatalog(tests, filename=filename)
             with file.open(encoding="UTF-8") as f:
-                data = safe_load(f) if file_format == "yaml" else json_load(f)
+                if file_format == "json":
+                    data = json_load(f)
+                else:
+                    try:
+                        return AntaCatalog._from_yaml_stream(f, filename=filename)
+                    except NotAMappingError as e:
+                        data = e.data
+        except ValidationError:
+            # Already logged when validating the catalog
+            raise
         except (TypeError, YAMLError, OSError, ValueError) as e:
             message = f"Unable to parse ANTA Test Catalog file '{filename}'"
             anta_log_exception(e, message, logger)
@@ -366,6 +397,70 @@ class AntaCatalog:
 
         return AntaCatalog.from_dict(data, filename=filename)
 
+    @staticmethod
+    def _from_yaml_stream(stream: TextIO, filename: str | Path) -> AntaCatalog:
+        """Create an AntaCatalog instance from a YAML test catalog stream.
+
+        The catalog is parsed and validated one Python module at a time so the raw data of the whole catalog is never loaded in memory.
+
+        Parameters
+        ----------
+        stream
+            YAML test catalog stream.
+        filename
+            value to be set as AntaCatalog instance attribute
+
+        Returns
+        -------
+        AntaCatalog
+            An AntaCatalog populated with the stream content.
+
+        Raises
+        ------
+        NotAMappingError
+            If the YAML document is not a mapping.
+        """
+        modules: dict[ModuleType, list[AntaTestDefinition]] = {}
+        for module_name, tests in iter_mapping(stream):
+            try:
+                catalog_data = AntaCatalogFile({module_name: tests})  # type: ignore[dict-item]
+            except ValidationError as e:
+                anta_log_exception(e, f"Test catalog is invalid! (from {filename})", logger)
+                raise
+            # Same behavior as a dictionary: the last definition of a module wins
+            modules.update(catalog_data.root)
+        return AntaCatalog(list(chain.from_iterable(modules.values())), filename=filename)
+
+    def compile(self, cache: CatalogCache, file_format: Literal["yaml", "json"] = "yaml") -> Path:
+        """Compile the catalog file in the compiled catalog cache.
+
+        The compiled catalog is keyed by the catalog file content and format and is used by `AntaCatalog.parse()`
+        to load the catalog without parsing and validating the file again.
+
+        Parameters
+        ----------
+        cache
+            Compiled catalog cache.
+        file_format
+            Format of the catalog file, either 'yaml' or 'json'.
+
+        Returns
+        -------
+        Path
+            Path of the compiled catalog.
+
+        Raises
+        ------
+        ValueError
+            If the catalog has not been loaded from a file.
+        """
+        if self.filename is None:
+            msg = "Only a catalog loaded from a file can be compiled"
+            raise ValueError(msg)
+        with self.filename.open("rb") as f:
+            content = f.read()
+        return cache.store(content, self.tests, file_format)
+
     @staticmethod
     def from_dict(data: RawCatalogInput, filename: str | Path | None = None) -> AntaCatalog:
         """Create an AntaCatalog instance from a dictionary data structure.
@@ -487,6 +582,7 @@ class AntaCatalog:
         If a `filtered_tests` set is provided, only the tests in this set will be indexed.
 
         This method populates the tag_to_tests attribute, which is a dictionary mapping tags to sets of tests.
+        It also builds a bitset per tag used by `get_tests_by_tags()` to efficiently compute unions and intersections.
 
         Once the indexes are built, the `indexes_built` attribute is set to True.
         """
@@ -495,22 +591,40 @@ class AntaCatalog:
             if filtered_tests and test.test.name not in filtered_tests:
                 continue
 
+            bit = 1 << self._test_positions.setdefault(test, len(self._test_positions))
             # Indexing by tag
             if test.inputs.filters and (test_tags := test.inputs.filters.tags):
                 for tag in test_tags:
                     self.tag_to_tests[tag].add(test)
+                    self._tag_to_bitset[tag] = self._tag_to_bitset.get(tag, 0) | bit
             else:
                 self.tag_to_tests[None].add(test)
+                self._tag_to_bitset[None] = self._tag_to_bitset.get(None, 0) | bit
 
+        # Indexes changed so memoised selections need to be recomputed
+        self._tests_by_tags_cache.clear()
+        self._tests_by_device_tags_cache.clear()
         self.indexes_built = True
 
+    def _get_tests_from_bitset(self, bitset: int) -> frozenset[AntaTestDefinition]:
+        """Return the indexed tests of a bitset."""
+        tests = list(self._test_positions)
+        selected: list[AntaTestDefinition] = []
+        while bitset:
+            lowest_bit = bitset & -bitset
+            selected.append(tests[lowest_bit.bit_length() - 1])
+            bitset ^= lowest_bit
+        return frozenset(selected)
+
     def clear_indexes(self) -> None:
         """Clear this AntaCatalog instance indexes."""
         self._init_indexes()
 
-    def get_tests_by_tags(self, tags: set[str], *, strict: bool = False) -> set[AntaTestDefinition]:
+    def get_tests_by_tags(self, tags: set[str] | frozenset[str], *, strict: bool = False) -> frozenset[AntaTestDefinition]:
         """Return all tests that match a given set of tags, according to the specified strictness.
 
+        Results are memoised per set of tags until the indexes are rebuilt: the same frozenset is returned for the same query.
+
         Parameters
         ----------
         tags
@@ -521,7 +635,7 @@ class AntaCatalog:
 
         Returns
         -------
-        set[AntaTestDefinition]
+        frozenset[AntaTestDefinition]
             A set of tests that match the given tags.
 
         Raises
@@ -532,13 +646,55 @@ class AntaCatalog:
         if not self.indexes_built:
             msg = "Indexes have not been built yet. Call build_indexes() first."
             raise ValueError(msg)
+        key = (frozenset(tags), strict)
+        if (tests := self._tests_by_tags_cache.get(key)) is not None:
+            return tests
+
         if not tags:
-            return self.tag_to_tests[None]
+            bitset = self._tag_to_bitset.get(None, 0)
+        elif not (bitsets := [self._tag_to_bitset[tag] for tag in tags if tag in self._tag_to_bitset]):
+            bitset = 0
+        elif strict:
+            bitset = reduce(and_, bitsets)
+        else:
+            bitset = reduce(or_, bitsets)
+
+        tests = self._tests_by_tags_cache[key] = self._get_tests_from_bitset(bitset)
+        return tests
+
+    def get_tests_by_device_tags(self, device_tags: set[str] | frozenset[str], tags: set[str] | None = None) -> frozenset[AntaTestDefinition]:
+        """Return the tests to run on a device according to its tags.
 
-        filtered_sets = [self.tag_to_tests[tag] for tag in tags if tag in self.tag_to_tests]
-        if not filtered_sets:
-            return set()
+        Results are memoised per set of tags until the indexes are rebuilt: devices with the same tags share the same frozenset.
 
-        if strict:
-            return set.intersection(*filtered_sets)
-        return set.union(*filtered_sets)
+        Parameters
+        ----------
+        device_tags
+            The tags of the device.
+        tags
+            The tags used to filter the tests. If provided, return the tests matching any of the device tags in `tags`.
+            Otherwise, return the tests without tags and the tests matching any of the device tags.
+
+        Returns
+        -------
+        frozenset[AntaTestDefinition]
+            A set of tests to run on the device.
+
+        Raises
+        ------
+        ValueError
+            If the indexes have not been built prior to method call.
+        """
+        # Tags not used by any indexed test do not change the selection, e.g. the device name which is always a device tag
+        matching_tags = tags.intersection(device_tags) if tags else device_tags
+        key = (frozenset(tag for tag in matching_tags if tag in self._tag_to_bitset), bool(tags))
+        if (tests := self._tests_by_device_tags_cache.get(key)) is not None:
+            return tests
+
+        indexed_tags, filtered = key
+        if filtered:
+            tests = self.get_tests_by_tags(indexed_tags) if indexed_tags else frozenset()
+        else:
+            tests = self.get_tests_by_tags(set()) | self.get_tests_by_tags(indexed_tags)
+        self._tests_by_device_tags_cache[key] = tests
+        return tests
@@ -0,0 +1,195 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Compiled catalog cache.
+
+Parsing a large test catalog is dominated by the YAML loading and the validation of every test inputs.
+A compiled catalog stores the validated test definitions so they can be reloaded without parsing and validating the catalog again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import platform
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, get_args
+
+import pydantic
+
+from anta import __version__ as anta_version
+from anta.logger import exc_to_str
+
+if TYPE_CHECKING:
+    from anta.catalog import AntaTestDefinition
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_DIR_ENV = "ANTA_CATALOG_CACHE_DIR"
+"""Environment variable overriding the default directory of the compiled catalog cache."""
+
+
+def default_cache_dir() -> Path:
+    """Return the default directory of the compiled catalog cache.
+
+    It is the `ANTA_CATALOG_CACHE_DIR` environment variable if set, otherwise `anta/catalogs` in the user cache directory.
+    """
+    if cache_dir := os.environ.get(CATALOG_CACHE_DIR_ENV):
+        return Path(cache_dir)
+    if xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache_home) / "anta" / "catalogs"
+    return Path.home() / ".cache" / "anta" / "catalogs"
+
+
+def _module_stamp(module_name: str) -> tuple[int, int] | None:
+    """Return the modification time and size of the source file of a module, or None if not found."""
+    module = sys.modules.get(module_name)
+    filename = getattr(module, "__file__", None)
+    if filename is None:
+        return None
+    try:
+        stat = Path(filename).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _model_modules(model: type[pydantic.BaseModel], modules: set[str], visited: set[type]) -> None:
+    """Add the modules defining a pydantic model, its base models and the models and validators of its fields to `modules`."""
+    if model in visited:
+        return
+    visited.add(model)
+    modules.update(cls.__module__ for cls in model.__mro__ if issubclass(cls, pydantic.BaseModel) and cls is not pydantic.BaseModel)
+    for field in model.model_fields.values():
+        _annotation_modules(field.annotation, modules, visited)
+        for metadata in field.metadata:
+            _annotation_modules(metadata, modules, visited)
+
+
+def _annotation_modules(annotation: object, modules: set[str], visited: set[type]) -> None:
+    """Add the modules defining the pydantic models, enums and validators of a field type annotation to `modules`."""
+    if isinstance(annotation, type):
+        if issubclass(annotation, pydantic.BaseModel):
+            _model_modules(annotation, modules, visited)
+        elif annotation.__module__ != "builtins":
+            modules.add(annotation.__module__)
+    # Validators of Annotated types, e.g. pydantic.AfterValidator
+    elif (func := getattr(annotation, "func", None)) is not None and (module_name := getattr(func, "__module__", None)) is not None:
+        modules.add(module_name)
+    # Arguments of generic types and metadata of Annotated types
+    for arg in get_args(annotation):
+        _annotation_modules(arg, modules, visited)
+
+
+def _is_private(path: Path) -> bool:
+    """Return True if a directory is owned by the current user and only accessible by this user.
+
+    Always True on platforms without POSIX file ownership, e.g. Windows.
+    """
+    if not hasattr(os, "getuid"):  # pragma: no cover
+        return True
+    stat = path.stat()
+    return stat.st_uid == os.getuid() and stat.st_mode & 0o077 == 0
+
+
+class CatalogCache:
+    """Cache of compiled test catalogs.
+
+    A compiled catalog is keyed by a hash of the catalog file content and format, the ANTA, pydantic and Python versions.
+    It also records the source files of the test modules and of the modules defining the input models used by the catalog:
+    the compiled catalog is discarded if any of them has been modified since the catalog was compiled.
+
+    !!! warning
+        Compiled catalogs are stored with `pickle`. They are only loaded from a cache directory owned by the current user
+        and only accessible by this user, i.e. with mode 0700.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """Initialize a CatalogCache.
+
+        Parameters
+        ----------
+        cache_dir
+            Directory of the compiled catalogs. If None, `default_cache_dir()` is used.
+        """
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+
+    def path(self, content: bytes, file_format: Literal["yaml", "json"] = "yaml") -> Path:
+        """Return the path of the compiled catalog of a catalog file content and format."""
+        digest = hashlib.sha256()
+        for part in (anta_version, pydantic.VERSION, platform.python_version(), file_format):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(content)
+        return self.cache_dir / f"{digest.hexdigest()}.pickle"
+
+    def load(self, content: bytes, file_format: Literal["yaml", "json"] = "yaml") -> list[AntaTestDefinition] | None:
+        """Load the compiled catalog of a catalog file content.
+
+        Parameters
+        ----------
+        content
+            Content of the catalog file.
+        file_format
+            Format of the catalog file, either 'yaml' or 'json'.
+
+        Returns
+        -------
+        list[AntaTestDefinition] | None
+            The test definitions of the compiled catalog, or None if the catalog has not been compiled or is outdated.
+        """
+        path = self.path(content, file_format)
+        try:
+            with path.open("rb") as file:
+                if not _is_private(self.cache_dir):
+                    logger.warning("Ignoring compiled catalog %s: the cache directory %s must be owned by the current user with mode 0700", path, self.cache_dir)
+                    return None
+                modules: dict[str, Any] = pickle.load(file)  # noqa: S301
+                # Unpickling the tests imports the test modules, required to check their source files
+                tests: list[AntaTestDefinition] = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # noqa: BLE001
+            # Unpickling can raise almost any exception if the compiled catalog is corrupted or incompatible
+            logger.debug("Ignoring invalid compiled catalog %s: %s", path, exc_to_str(e))
+            return None
+        if any(_module_stamp(module_name) != stamp for module_name, stamp in modules.items()):
+            logger.debug("Ignoring outdated compiled catalog %s: test modules have been modified", path)
+            return None
+        logger.debug("Loaded compiled catalog %s", path)
+        return tests
+
+    def store(self, content: bytes, tests: list[AntaTestDefinition], file_format: Literal["yaml", "json"] = "yaml") -> Path:
+        """Store the compiled catalog of a catalog file content.
+
+        Parameters
+        ----------
+        content
+            Content of the catalog file.
+        tests
+            The validated test definitions of the catalog.
+        file_format
+            Format of the catalog file, either 'yaml' or 'json'.
+
+        Returns
+        -------
+        Path
+            Path of the compiled catalog.
+        """
+        module_names = {test_def.test.__module__ for test_def in tests}
+        visited: set[type] = set()
+        for inputs_class in {type(test_def.inputs) for test_def in tests}:
+            _model_modules(inputs_class, module_names, visited)
+        modules = {module_name: _module_stamp(module_name) for module_name in sorted(module_names)}
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = self.path(content, file_format)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with tmp_path.open("wb") as file:
+            pickle.dump(modules, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(tests, file, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        logger.debug("Stored compiled catalog %s", path)
+        return path
@@ -17,6 +17,8 @@ from anta.cli.debug import debug as debug_command
 from anta.cli.exec import _exec as exec_command
 from anta.cli.get import get as get_command
 from anta.cli.nrfu import nrfu as nrfu_command
+from anta.cli.results import results as results_command
+from anta.cli.serve import serve as serve_command
 from anta.cli.utils import AliasedGroup, ExitCode
 from anta.logger import Log, LogLevel, anta_log_exception, setup_logging
 
@@ -56,6 +58,8 @@ anta.add_command(check_command)
 anta.add_command(exec_command)
 anta.add_command(get_command)
 anta.add_command(debug_command)
+anta.add_command(serve_command)
+anta.add_command(results_command)
 
 
 def cli() -> None:
@@ -7,13 +7,16 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from pickle import PicklingError
+from typing import TYPE_CHECKING, Literal, cast
 
 import click
 from rich.pretty import pretty_repr
 
+from anta.catalog_cache import CatalogCache
 from anta.cli.console import console
-from anta.cli.utils import catalog_options
+from anta.cli.utils import ExitCode, catalog_options
+from anta.logger import exc_to_str
 
 if TYPE_CHECKING:
     from anta.catalog import AntaCatalog
@@ -23,7 +26,24 @@ logger = logging.getLogger(__name__)
 
 @click.command
 @catalog_options()
-def catalog(catalog: AntaCatalog) -> None:
+@click.option(
+    "--compile",
+    "compile_catalog",
+    help="Compile the catalog in the compiled catalog cache to speed up its loading. The cache directory can be set with ANTA_CATALOG_CACHE_DIR.",
+    is_flag=True,
+    default=False,
+)
+@click.pass_context
+def catalog(ctx: click.Context, catalog: AntaCatalog, *, compile_catalog: bool) -> None:
     """Check that the catalog is valid."""
     console.print(f"[bold][green]Catalog is valid: {catalog.filename}")
+    if compile_catalog:
+        try:
+            file_format = cast('Literal["json", "yaml"]', ctx.params["catalog_format"].lower())
+            path = catalog.compile(CatalogCache(), file_format=file_format)
+        except (OSError, PicklingError) as e:
+            console.print(f"Failed to compile the catalog {catalog.filename}: {exc_to_str(e)} ❌", style="cyan")
+            ctx.exit(ExitCode.USAGE_ERROR)
+        console.print(f"Compiled catalog saved to {path} ✅", style="cyan")
+        return
     console.print(pretty_repr(catalog.tests))
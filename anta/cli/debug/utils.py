@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -50,6 +51,10 @@ def debug_options(f: Callable[..., R]) -> Callable[..., R]:
         device: str,
         **kwargs: Any,  # noqa: ANN401
     ) -> R:
+        if device not in inventory and inventory.lazy_entries:
+            # The device may be an address of a network or a range of the inventory
+            inventory = inventory.get_inventory(devices={device})
+            asyncio.run(inventory.expand(probe=False))
         if (d := inventory.get(device)) is None:
             logger.error("Device '%s' does not exist in Inventory", device)
             ctx.exit(ExitCode.USAGE_ERROR)
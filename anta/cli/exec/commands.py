@@ -13,8 +13,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
-from yaml import safe_load
 
+from anta._yaml import safe_load
 from anta.cli.console import console
 from anta.cli.exec import utils
 from anta.cli.utils import inventory_options
@@ -22,8 +22,8 @@ from anta.cli.get.utils import inventory_output_options
 from anta.cli.utils import ExitCode, catalog_options, inventory_options
 
 from .utils import (
-    _explore_package,
     _filter_tests_via_catalog,
+    _find_tests,
     _get_unique_commands,
     _print_commands,
     create_inventory_from_ansible,
@@ -127,10 +127,11 @@ def inventory(inventory: AntaInventory, tags: set[str] | None, *, connected: boo
     logger.debug("Requesting devices for tags: %s", tags)
     console.print("Current inventory content is:", style="white on blue")
 
+    inventory_result = inventory.get_inventory(tags=tags)
     if connected:
-        asyncio.run(inventory.connect_inventory())
+        # Probe the eAPI port of the devices first to avoid waiting for the eAPI timeout of unreachable devices
+        asyncio.run(inventory_result.connect_inventory(prescan=True))
 
-    inventory_result = inventory.get_inventory(tags=tags)
     console.print(pretty_repr(inventory_result))
 
 
@@ -141,6 +142,8 @@ def tags(inventory: AntaInventory, **_kwargs: Any) -> None:  # noqa: ANN401
     tags: set[str] = set()
     for device in inventory.values():
         tags.update(device.tags)
+    for entry in inventory.lazy_entries:
+        tags.update(entry.tags)
     console.print("Tags defined in inventory:")
     console.print_json(data=sorted(tags), indent=2)
 
@@ -154,7 +157,7 @@ def tags(inventory: AntaInventory, **_kwargs: Any) -> None:  # noqa: ANN401
 def tests(ctx: click.Context, module: str, test: str | None, *, short: bool, count: bool) -> None:
     """Show all builtin ANTA tests with an example output retrieved from each test documentation."""
     try:
-        tests_found = _explore_package(module, test_name=test, short=short, count=count)
+        tests_found = _find_tests(module, test_name=test)
         if len(tests_found) == 0:
             console.print(f"""No test {f"'{test}' " if test else ""}found in '{module}'.""")
         elif count:
@@ -191,7 +194,7 @@ def commands(
     """
     # TODO: implement catalog format
     try:
-        tests_found = _explore_package(module, test_name=test)
+        tests_found = _find_tests(module, test_name=test)
         if catalog:
             tests_found = _filter_tests_via_catalog(tests_found, catalog)
         if len(tests_found) == 0:
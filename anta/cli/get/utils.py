@@ -11,7 +11,6 @@ import inspect
 import json
 import logging
 import pkgutil
-import re
 import sys
 import textwrap
 from importlib import util as importlib_util
@@ -26,11 +25,14 @@ import urllib3
 import yaml
 from typing_extensions import deprecated
 
+from anta._yaml import safe_load
 from anta.cli.console import console
 from anta.cli.utils import ExitCode
 from anta.inventory import AntaInventory
 from anta.inventory.models import AntaInventoryHost, AntaInventoryInput
-from anta.models import AntaCommand, AntaTest
+from anta.models import AntaTest
+from anta.registry import AntaTestRegistry, RegisteredTest
+from anta.registry import extract_examples as extract_examples  # noqa: PLC0414 Kept for backward compatibility
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -214,7 +216,7 @@ def create_inventory_from_ansible(inventory: Path, output: Path, ansible_group:
     """
     try:
         with inventory.open(encoding="utf-8") as inv:
-            ansible_inventory: dict[str, Any] = yaml.safe_load(inv)
+            ansible_inventory: dict[str, Any] = safe_load(inv)
     except yaml.constructor.ConstructorError as exc:
         if exc.problem and "!vault" in exc.problem:
             msg = (
@@ -298,6 +300,28 @@ def _explore_package(module_name: str, test_name: str | None = None, *, short: b
     return result
 
 
+def _find_tests(module_name: str, test_name: str | None = None) -> list[RegisteredTest]:
+    """Return the tests of a module, using the registry of the built-in ANTA tests when possible.
+
+    The modules of the built-in tests are only imported when the registry cannot be used.
+
+    Parameters
+    ----------
+    module_name
+        Name of the module to explore (e.g., 'anta.tests.routing.bgp').
+    test_name
+        If provided, only return tests starting with this name.
+
+    Returns
+    -------
+    list[RegisteredTest]:
+        A list of the tests found.
+    """
+    if (registry := AntaTestRegistry.load()) is not None and (tests := registry.find(module_name, test_name)) is not None:
+        return tests
+    return [RegisteredTest.from_test(test) for test in _explore_package(module_name, test_name=test_name)]
+
+
 def find_tests_in_module(qname: str, test_name: str | None) -> list[type[AntaTest]]:
     """Return the list of AntaTest in the passed module qname, potentially filtering on test_name.
 
@@ -331,7 +355,7 @@ def find_tests_in_module(qname: str, test_name: str | None) -> list[type[AntaTes
     return results
 
 
-def _filter_tests_via_catalog(tests: list[type[AntaTest]], catalog: AntaCatalog) -> list[type[AntaTest]]:
+def _filter_tests_via_catalog(tests: list[RegisteredTest], catalog: AntaCatalog) -> list[RegisteredTest]:
     """Return the filtered list of tests present in the catalog.
 
     Parameters
@@ -343,30 +367,30 @@ def _filter_tests_via_catalog(tests: list[type[AntaTest]], catalog: AntaCatalog)
 
     Returns
     -------
-    list[type[AntaTest]]:
+    list[RegisteredTest]:
         The filtered list of tests containing uniquely the tests found in the catalog.
     """
     catalog_test_names = {test.test.name for test in catalog.tests}
     return [test for test in tests if test.name in catalog_test_names]
 
 
-def print_tests(tests: list[type[AntaTest]], *, short: bool = False) -> None:
-    """Print a list of AntaTest.
+def print_tests(tests: list[RegisteredTest], *, short: bool = False) -> None:
+    """Print a list of tests.
 
     Parameters
     ----------
     tests
-        A list of AntaTest subclasses.
+        A list of registered tests.
     short
         If True, only print test names without their inputs.
     """
 
-    def module_name(test: type[AntaTest]) -> str:
+    def module_name(test: RegisteredTest) -> str:
         """Return the module name for the input test.
 
         Used to group the test by module.
         """
-        return test.__module__
+        return test.module
 
     for module, module_tests in groupby(tests, module_name):
         console.print(f"{module}:")
@@ -374,18 +398,20 @@ def print_tests(tests: list[type[AntaTest]], *, short: bool = False) -> None:
             print_test(test, short=short)
 
 
-def print_test(test: type[AntaTest], *, short: bool = False) -> None:
+def print_test(test: type[AntaTest] | RegisteredTest, *, short: bool = False) -> None:
     """Print a single test.
 
     Parameters
     ----------
     test
-        the representation of the AntaTest as returned by inspect.getmembers
+        the registered test or the AntaTest subclass as returned by inspect.getmembers
     short
         If True, only print test names without their inputs.
     """
-    if not test.__doc__ or (example := extract_examples(test.__doc__)) is None:
-        msg = f"Test {test.name} in module {test.__module__} is missing an Example"
+    if not isinstance(test, RegisteredTest):
+        test = RegisteredTest.from_test(test)
+    if (example := test.example) is None:
+        msg = f"Test {test.name} in module {test.module} is missing an Example"
         raise LookupError(msg)
     # Picking up only the inputs in the examples
     # Need to handle the fact that we nest the routing modules in Examples.
@@ -405,69 +431,44 @@ def print_test(test: type[AntaTest], *, short: bool = False) -> None:
             console.print(textwrap.indent(textwrap.dedent("\n".join(inputs[line_index + 1 : end])), " " * 6), soft_wrap=True)
 
 
-def extract_examples(docstring: str) -> str | None:
-    """Extract the content of the Example section in a Numpy docstring.
-
-    Returns
-    -------
-    str | None
-        The content of the section if present, None if the section is absent or empty.
-    """
-    pattern = r"Examples\s*--------\s*(.*)(?:\n\s*\n|\Z)"
-    match = re.search(pattern, docstring, flags=re.DOTALL)
-    return match[1].strip() if match and match[1].strip() != "" else None
-
-
-def _print_commands(tests: list[type[AntaTest]]) -> None:
+def _print_commands(tests: list[RegisteredTest]) -> None:
     """Print a list of commands per module and per test.
 
     Parameters
     ----------
     tests
-        A list of AntaTest subclasses.
+        A list of registered tests.
     """
 
-    def module_name(test: type[AntaTest]) -> str:
+    def module_name(test: RegisteredTest) -> str:
         """Return the module name for the input test.
 
         Used to group the test by module.
         """
-        return test.__module__
+        return test.module
 
     for module, module_tests in groupby(tests, module_name):
         console.print(f"{module}:")
         for test in module_tests:
             console.print(f"  - {test.name}:")
             for command in test.commands:
-                if isinstance(command, AntaCommand):
-                    console.print(f"    - {command.command}")
-                else:  # isinstance(command, AntaTemplate):
-                    console.print(f"    - {command.template}")
+                console.print(f"    - {command}")
 
 
-def _get_unique_commands(tests: list[type[AntaTest]]) -> set[str]:
+def _get_unique_commands(tests: list[RegisteredTest]) -> set[str]:
     """Return a set of unique commands used by the tests.
 
     Parameters
     ----------
     tests
-        A list of AntaTest subclasses.
+        A list of registered tests.
 
     Returns
     -------
     set[str]
         A set of commands or templates used by each test.
     """
-    result: set[str] = set()
-
-    for test in tests:
-        for command in test.commands:
-            if isinstance(command, AntaCommand):
-                result.add(command.command)
-            else:  # isinstance(command, AntaTemplate):
-                result.add(command.template)
-
-    return result
+    return {command for test in tests for command in test.commands}
 
 
 @deprecated("This function is deprecated, use `_explore_package`. This will be removed in ANTA v2.0.0.", category=DeprecationWarning)
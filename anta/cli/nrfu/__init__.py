@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import pathlib
 import sys
 from typing import TYPE_CHECKING, Any
 
@@ -118,6 +119,74 @@ HIDE_STATUS.remove("unset")
     default=True,
     show_default=True,
 )
+@click.option(
+    "--metrics-file",
+    help="Write run and transport metrics in the OpenMetrics text format to this file once the test run is complete.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=False, writable=True, path_type=pathlib.Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--metrics-port",
+    help="Serve run and transport metrics in the OpenMetrics text format on http://127.0.0.1:PORT/metrics during the test run.",
+    type=click.IntRange(min=1, max=65535),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--watch",
+    help="Run the tests continuously every INTERVAL seconds, keeping the devices connected, and print only the test status changes.",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="INTERVAL",
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--max-duration",
+    help="Maximum duration of the test run in seconds. Once exceeded, the test run is cancelled gracefully and the partial results are reported.",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--prescan",
+    help="Probe the eAPI port of the devices concurrently before connecting to them: devices whose port is not open are not connected.",
+    default=False,
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--compact-results",
+    help="Keep the test results in a compact form to reduce the memory used by large runs. Messages of successful tests are not kept.",
+    default=False,
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--journal",
+    help="Checkpoint the test results to this journal file as soon as the tests complete. The journal file is overwritten.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=False, writable=True, path_type=pathlib.Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--resume",
+    help="Resume an interrupted test run from this journal file: tests already in the journal are not run again, except tests in error. Results are appended to it.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, writable=True, path_type=pathlib.Path),
+    metavar="JOURNAL",
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--results-db",
+    help="Store the test results of the run in this SQLite database, created if needed. Stored runs can be queried with `anta results query`.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=False, writable=True, path_type=pathlib.Path),
+    show_envvar=True,
+    required=False,
+)
 @click.pass_context
 def nrfu(
     ctx: click.Context,
@@ -133,15 +202,33 @@ def nrfu(
     dry_run: bool,
     disconnect: bool,
     catalog_format: str = "yaml",
+    metrics_file: pathlib.Path | None = None,
+    metrics_port: int | None = None,
+    watch: float | None = None,
+    max_duration: float | None = None,
+    prescan: bool = False,
+    compact_results: bool = False,
+    journal: pathlib.Path | None = None,
+    resume: pathlib.Path | None = None,
+    results_db: pathlib.Path | None = None,
 ) -> None:
     """Run ANTA tests on selected inventory devices."""
     # If help is invoke somewhere, skip the command
     if ctx.obj.get("_anta_help"):
         return
 
+    if journal is not None and resume is not None:
+        msg = "Options --journal and --resume are mutually exclusive."
+        raise click.UsageError(msg)
+
+    # The watch mode prints the test status changes and never renders a report
+    if watch is not None and not dry_run and ctx.invoked_subcommand not in {None, "table", "text"}:
+        msg = f"Option --watch only prints the test status changes to the console and cannot be used with the `{ctx.invoked_subcommand}` reporter."
+        raise click.UsageError(msg)
+
     # We use ctx.obj to pass stuff to the next Click functions
     _: dict[str, Any] = ctx.ensure_object(dict)
-    ctx.obj["result_manager"] = ResultManager()
+    ctx.obj["result_manager"] = ResultManager(compact=compact_results)
     ctx.obj["ignore_status"] = ignore_status
     ctx.obj["ignore_error"] = ignore_error
     ctx.obj["hide"] = set(hide) if hide else None
@@ -153,6 +240,14 @@ def nrfu(
     ctx.obj["test"] = test
     ctx.obj["dry_run"] = dry_run
     ctx.obj["disconnect"] = disconnect
+    ctx.obj["metrics_file"] = metrics_file
+    ctx.obj["metrics_port"] = metrics_port
+    ctx.obj["watch"] = watch
+    ctx.obj["max_duration"] = max_duration
+    ctx.obj["prescan"] = prescan
+    ctx.obj["journal"] = journal
+    ctx.obj["resume"] = resume
+    ctx.obj["results_db"] = results_db
 
     # Invoke `anta nrfu table` if no command is passed
     if not ctx.invoked_subcommand:
@@ -162,6 +257,8 @@ def nrfu(
 nrfu.add_command(commands.table)
 nrfu.add_command(commands.csv)
 nrfu.add_command(commands.json)
+nrfu.add_command(commands.ndjson)
+nrfu.add_command(commands.parquet)
 nrfu.add_command(commands.text)
 nrfu.add_command(commands.tpl_report)
 nrfu.add_command(commands.md_report)
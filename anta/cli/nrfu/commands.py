@@ -13,7 +13,7 @@ import click
 
 from anta.cli.utils import exit_with_code
 
-from .utils import print_jinja, print_json, print_table, print_text, run_tests, save_markdown_report, save_to_csv
+from .utils import print_jinja, print_json, print_table, print_text, run_tests, save_markdown_report, save_ndjson, save_parquet, save_to_csv
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +71,44 @@ def json(ctx: click.Context, output: pathlib.Path | None) -> None:
     exit_with_code(ctx)
 
 
+@click.command()
+@click.pass_context
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=True, dir_okay=False, exists=False, writable=True, path_type=pathlib.Path),
+    show_envvar=True,
+    required=True,
+    help="Path of the NDJSON file where each result is written as soon as its test completes",
+)
+def ndjson(ctx: click.Context, output: pathlib.Path) -> None:
+    """ANTA command to check network state with NDJSON results.
+
+    Each result is written to the file as soon as its test completes. The file can be tailed while the tests are running.
+    """
+    save_ndjson(ctx, output=output)
+    exit_with_code(ctx)
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=True, dir_okay=False, exists=False, writable=True, path_type=pathlib.Path),
+    show_envvar=True,
+    required=True,
+    help="Path of the Parquet file where the results are written",
+)
+def parquet(ctx: click.Context, output: pathlib.Path) -> None:
+    """ANTA command to check network state with Parquet results.
+
+    Requires the optional pyarrow dependency: pip install 'anta[parquet]'.
+    """
+    save_parquet(ctx, output=output)
+    exit_with_code(ctx)
+
+
 @click.command()
 @click.pass_context
 @click.option(
@@ -102,11 +140,13 @@ def text(ctx: click.Context, *, expand: bool) -> None:
     ),
     show_envvar=True,
     required=True,
-    help="Path to save report as a CSV file",
+    help="Path to save report as a CSV file, compressed with gzip if the file name ends with .gz",
 )
 def csv(ctx: click.Context, csv_output: pathlib.Path) -> None:
-    """ANTA command to check network state with CSV report."""
-    _ = run_tests(ctx)
+    """ANTA command to check network state with CSV report.
+
+    Each result is written to the file as soon as its test completes.
+    """
     save_to_csv(ctx, csv_file=csv_output)
     exit_with_code(ctx)
 
@@ -154,8 +194,23 @@ def tpl_report(ctx: click.Context, template: pathlib.Path, output: pathlib.Path
     show_default=True,
     help="Flag to indicate if atomic results should be shown.",
 )
-def md_report(ctx: click.Context, md_output: pathlib.Path, *, expand: bool) -> None:
+@click.option(
+    "--stream",
+    default=False,
+    show_envvar=True,
+    is_flag=True,
+    show_default=True,
+    help="Write the test results grouped by device, in the order they were run, without sorting them.",
+)
+@click.option(
+    "--split-by",
+    type=click.Choice(["device", "category"], case_sensitive=False),
+    default=None,
+    show_envvar=True,
+    help="Split the test results into one Markdown file per device or per category, written to a directory named after the report. Implies --stream.",
+)
+def md_report(ctx: click.Context, md_output: pathlib.Path, split_by: Literal["device", "category"] | None, *, expand: bool, stream: bool) -> None:
     """ANTA command to check network state with Markdown report."""
     run_context = run_tests(ctx)
-    save_markdown_report(ctx, md_output=md_output, run_context=run_context, expand=expand)
+    save_markdown_report(ctx, md_output=md_output, run_context=run_context, expand=expand, stream=stream, split_by=split_by)
     exit_with_code(ctx)
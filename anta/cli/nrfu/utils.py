@@ -8,35 +8,55 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Literal
+import signal
+import sqlite3
+from contextlib import nullcontext, suppress
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from rich._spinners import SPINNERS
 from rich.panel import Panel
 from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 
 from anta import __version__ as anta_version
-from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
+from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner, AntaStatusChange
 from anta.cli.console import console
 from anta.cli.utils import ExitCode
+from anta.logger import exc_to_str
+from anta.metrics import disable_metrics, enable_metrics
 from anta.models import AntaTest
 from anta.reporter import ReportJinja, ReportTable
-from anta.reporter.csv_reporter import ReportCsv
+from anta.reporter.csv_reporter import ReportCsvWriter
 from anta.reporter.md_reporter import MDReportGenerator
+from anta.reporter.ndjson_reporter import ReportNDJson
+from anta.reporter.parquet_reporter import ReportParquet
+from anta.result_manager.database import ResultDatabase
+from anta.result_manager.journal import ResultJournal
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import Callable, Coroutine
 
     import click
 
     from anta.catalog import AntaCatalog
     from anta.inventory import AntaInventory
+    from anta.metrics import AntaMetrics
     from anta.result_manager import ResultManager
+    from anta.result_manager.models import TestResult
 
 logger = logging.getLogger(__name__)
 
 
-def run_tests(ctx: click.Context) -> AntaRunContext:
-    """Run the tests."""
+def run_tests(ctx: click.Context, on_result: Callable[[TestResult], None] | None = None) -> AntaRunContext:
+    """Run the tests.
+
+    Parameters
+    ----------
+    ctx
+        Click context.
+    on_result
+        Callback called with each test result as soon as the test completes.
+    """
     # Digging up the parameters from the parent context
     if ctx.parent is None:
         ctx.exit()
@@ -46,28 +66,178 @@ def run_tests(ctx: click.Context) -> AntaRunContext:
     test = nrfu_ctx_params["test"] or None
     dry_run = nrfu_ctx_params["dry_run"]
     disconnect = nrfu_ctx_params["disconnect"]
+    metrics_file: pathlib.Path | None = nrfu_ctx_params.get("metrics_file")
+    metrics_port: int | None = nrfu_ctx_params.get("metrics_port")
+    watch: float | None = nrfu_ctx_params.get("watch")
+    max_duration: float | None = nrfu_ctx_params.get("max_duration")
+    prescan: bool = nrfu_ctx_params.get("prescan", False)
+    journal_file: pathlib.Path | None = nrfu_ctx_params.get("resume") or nrfu_ctx_params.get("journal")
+    results_db: pathlib.Path | None = nrfu_ctx_params.get("results_db")
 
     catalog: AntaCatalog = ctx.obj["catalog"]
     inventory: AntaInventory = ctx.obj["inventory"]
 
+    metrics = enable_metrics() if metrics_file is not None or metrics_port is not None else None
+
     print_settings(inventory, catalog)
-    with anta_progress_bar() as AntaTest.progress:
-        runner = AntaRunner()
-        filters = AntaRunFilters(
-            devices=set(device) if device else None,
-            tests=set(test) if test else None,
-            tags=tags,
-        )
-        run_ctx = asyncio.run(
-            runner.run(inventory=inventory, catalog=catalog, result_manager=ctx.obj["result_manager"], filters=filters, dry_run=dry_run, disconnect=disconnect)
+    runner = AntaRunner()
+    filters = AntaRunFilters(
+        devices=set(device) if device else None,
+        tests=set(test) if test else None,
+        tags=tags,
+    )
+    if watch is not None and not dry_run:
+        watch_tests(runner, inventory, catalog, filters, watch, metrics=metrics, metrics_port=metrics_port, disconnect=disconnect)
+        _teardown_metrics(ctx, metrics, metrics_file)
+        ctx.exit()
+
+    stop_event = asyncio.Event()
+    journal = ResultJournal(journal_file, resume=nrfu_ctx_params.get("resume") is not None) if journal_file is not None and not dry_run else None
+
+    with anta_progress_bar() as AntaTest.progress, journal if journal is not None else nullcontext():
+        run = runner.run(
+            inventory=inventory,
+            catalog=catalog,
+            result_manager=ctx.obj["result_manager"],
+            filters=filters,
+            dry_run=dry_run,
+            disconnect=disconnect,
+            journal=journal,
+            stop_event=stop_event,
+            max_duration=max_duration,
+            prescan=prescan,
+            on_result=on_result,
         )
+        run = _handle_signals(run, stop_event)
+        run_ctx = asyncio.run(_serve_metrics(run, metrics, metrics_port) if metrics is not None and metrics_port is not None else run)
+
+    _teardown_metrics(ctx, metrics, metrics_file)
+
+    if run_ctx.cancelled:
+        ctx.obj["run_cancelled"] = True
+        console.print(f"{run_ctx.cancel_reason}: the test run has been cancelled, reporting partial results.", style="bold yellow")
 
     if dry_run:
         ctx.exit()
 
+    if results_db is not None:
+        save_results_db(ctx, run_ctx, results_db)
+
     return run_ctx
 
 
+def watch_tests(
+    runner: AntaRunner,
+    inventory: AntaInventory,
+    catalog: AntaCatalog,
+    filters: AntaRunFilters,
+    interval: float,
+    *,
+    metrics: AntaMetrics | None = None,
+    metrics_port: int | None = None,
+    disconnect: bool = True,
+) -> None:
+    """Run the tests continuously and print the test status changes until interrupted."""
+    console.print(f"Watching NRFU every {interval:g} seconds, press Ctrl+C to stop.", style="cyan")
+
+    async def _watch() -> None:
+        async for run_ctx, changes in runner.watch(inventory, catalog, interval, filters, disconnect=disconnect):
+            print_status_changes(run_ctx, changes)
+
+    try:
+        asyncio.run(_serve_metrics(_watch(), metrics, metrics_port) if metrics is not None and metrics_port is not None else _watch())
+    except KeyboardInterrupt:
+        console.print("Watch mode stopped.", style="cyan")
+
+
+def print_status_changes(run_ctx: AntaRunContext, changes: list[AntaStatusChange]) -> None:
+    """Print the test status changes of a watch mode iteration."""
+    timestamp = run_ctx.end_time.astimezone().strftime("%Y-%m-%d %H:%M:%S") if run_ctx.end_time is not None else ""
+    for change in changes:
+        result = change.result
+        previous = change.previous_status
+        current = change.current_status
+        transition = f"[{previous}]{previous.upper()}[/{previous}] -> " if previous is not None else ""
+        transition += f"[{current}]{current.upper()}[/{current}]" if current is not None else "NOT RUN"
+        console.print(f"{timestamp} :: {result.name} :: {result.test} :: {transition}", highlight=False)
+        if current is not None and result.messages:
+            console.print("\n".join(f"    {message}" for message in result.messages), highlight=False)
+
+
+T = TypeVar("T")
+
+
+async def _handle_signals(run: Coroutine[Any, Any, T], stop_event: asyncio.Event) -> T:
+    """Run the coroutine, setting the stop event on SIGINT or SIGTERM to cancel the test run gracefully.
+
+    The signal handlers are removed once a signal is received so a second signal aborts the test run immediately.
+    """
+    loop = asyncio.get_running_loop()
+    installed: list[signal.Signals] = []
+
+    def _on_signal(signum: signal.Signals) -> None:
+        console.print(f"Received {signum.name}, stopping the test run gracefully. Send it again to abort.", style="bold yellow")
+        stop_event.set()
+        for sig in installed:
+            loop.remove_signal_handler(sig)
+        installed.clear()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Signal handlers are not supported on Windows event loops or outside the main thread
+        with suppress(NotImplementedError, RuntimeError):
+            loop.add_signal_handler(sig, _on_signal, sig)
+            installed.append(sig)
+    try:
+        return await run
+    finally:
+        for sig in installed:
+            loop.remove_signal_handler(sig)
+
+
+async def _serve_metrics(run: Coroutine[Any, Any, T], metrics: AntaMetrics, port: int) -> T:
+    """Run the coroutine while serving metrics on a local HTTP endpoint."""
+    try:
+        server = await metrics.serve(port=port)
+    except OSError as e:
+        logger.error("Unable to serve ANTA metrics on port %s: %s", port, exc_to_str(e))
+        return await run
+    try:
+        return await run
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def _teardown_metrics(ctx: click.Context, metrics: AntaMetrics | None, metrics_file: pathlib.Path | None) -> None:
+    """Disable metrics collection and save the metrics if requested."""
+    if metrics is None:
+        return
+    disable_metrics()
+    if metrics_file is not None:
+        save_metrics(ctx, metrics, metrics_file)
+
+
+def save_metrics(ctx: click.Context, metrics: AntaMetrics, output: pathlib.Path) -> None:
+    """Save run and transport metrics to an OpenMetrics text file."""
+    try:
+        metrics.write(output)
+        console.print(f"Metrics saved to {output} ✅", style="cyan")
+    except OSError:
+        console.print(f"Failed to save metrics to {output} ❌", style="cyan")
+        ctx.exit(ExitCode.USAGE_ERROR)
+
+
+def save_results_db(ctx: click.Context, run_ctx: AntaRunContext, filename: pathlib.Path) -> None:
+    """Store the test results of a run in a SQLite result database."""
+    try:
+        with ResultDatabase(filename) as db:
+            run_id = db.add_run(run_ctx.manager, start_time=run_ctx.start_time, end_time=run_ctx.end_time, cancel_reason=run_ctx.cancel_reason)
+    except sqlite3.Error as e:
+        console.print(f"Failed to store results in result database {filename}: {exc_to_str(e)} ❌", style="cyan")
+        ctx.exit(ExitCode.USAGE_ERROR)
+    console.print(f"Results stored as run {run_id} in result database {filename} ✅", style="cyan")
+
+
 def _get_result_manager(ctx: click.Context, *, apply_hide_filter: bool = True) -> ResultManager:
     """Get a ResultManager instance based on Click context."""
     if apply_hide_filter:
@@ -130,7 +300,7 @@ def print_json(ctx: click.Context, output: pathlib.Path | None = None) -> None:
 def print_text(ctx: click.Context, *, expand: bool) -> None:
     """Print results as simple text."""
     console.print()
-    for result in _get_result_manager(ctx).results:
+    for result in _get_result_manager(ctx):
         console.print(f"{result.name} :: {result.test} :: [{result.result}]{result.result.upper()}[/{result.result}]", highlight=False)
         if expand:
             for r in result.atomic_results:
@@ -154,16 +324,64 @@ def print_jinja(results: ResultManager, template: pathlib.Path, output: pathlib.
 
 
 def save_to_csv(ctx: click.Context, csv_file: pathlib.Path) -> None:
-    """Save results to a CSV file."""
+    """Run the tests and write each result to a CSV file as soon as the test completes.
+
+    The CSV file is compressed with gzip if its name ends with `.gz`.
+    """
     try:
-        ReportCsv.generate(results=_get_result_manager(ctx), csv_filename=csv_file)
-        console.print(f"CSV report saved to {csv_file} ✅", style="cyan")
+        with ReportCsvWriter(csv_file, compression="gzip" if csv_file.suffix == ".gz" else None) as report:
+            _ = run_tests(ctx, on_result=_unless_hidden(ctx, report.write))
     except OSError:
         console.print(f"Failed to save CSV report to {csv_file} ❌", style="cyan")
         ctx.exit(ExitCode.USAGE_ERROR)
+    console.print(f"CSV report saved to {csv_file} ✅", style="cyan")
+
+
+def _unless_hidden(ctx: click.Context, write: Callable[[TestResult], None]) -> Callable[[TestResult], None]:
+    """Return a callback calling `write` with the test results that are not hidden by the `--hide` option."""
+    hide = ctx.obj.get("hide") or set()
+
+    def on_result(result: TestResult) -> None:
+        if result.result not in hide:
+            write(result)
+
+    return on_result
+
+
+def save_ndjson(ctx: click.Context, output: pathlib.Path) -> None:
+    """Run the tests and write each result to an NDJSON file as soon as the test completes."""
+    try:
+        with ReportNDJson(output) as report:
+            _ = run_tests(ctx, on_result=_unless_hidden(ctx, report.write))
+    except OSError:
+        console.print(f"Failed to save NDJSON results to {output} ❌", style="cyan")
+        ctx.exit(ExitCode.USAGE_ERROR)
+    console.print(f"NDJSON results saved to {output} ✅", style="cyan")
+
+
+def save_parquet(ctx: click.Context, output: pathlib.Path) -> None:
+    """Run the tests and write the results to a Parquet file, one row group at a time during the run."""
+    try:
+        with ReportParquet(output) as report:
+            _ = run_tests(ctx, on_result=_unless_hidden(ctx, report.write))
+    except ImportError as e:
+        console.print(f"{e} ❌", style="cyan")
+        ctx.exit(ExitCode.USAGE_ERROR)
+    except OSError:
+        console.print(f"Failed to save Parquet results to {output} ❌", style="cyan")
+        ctx.exit(ExitCode.USAGE_ERROR)
+    console.print(f"Parquet results saved to {output} ✅", style="cyan")
 
 
-def save_markdown_report(ctx: click.Context, md_output: pathlib.Path, run_context: AntaRunContext | None = None, *, expand: bool = False) -> None:
+def save_markdown_report(
+    ctx: click.Context,
+    md_output: pathlib.Path,
+    run_context: AntaRunContext | None = None,
+    *,
+    expand: bool = False,
+    stream: bool = False,
+    split_by: Literal["device", "category"] | None = None,
+) -> None:
     """Save the markdown report to a file.
 
     Parameters
@@ -177,9 +395,13 @@ def save_markdown_report(ctx: click.Context, md_output: pathlib.Path, run_contex
         If provided, a `Run Overview` section will be generated in the report including the run context information.
     expand
         Expand atomic results in the report "Test Results" section.
+    stream
+        Render the test results grouped by device without sorting them.
+    split_by
+        Split the test results into one markdown file per `device` or per `category`, linked from the report.
     """
     # TODO: Add support for `render_custom_field` in the CLI
-    extra_data: dict[str, Any] = {"_report_options": {"expand_results": expand}}
+    extra_data: dict[str, Any] = {"_report_options": {"expand_results": expand, "stream": stream}}
     if run_context is not None:
         active_filters_dict = {}
         if run_context.filters.tags:
@@ -206,8 +428,15 @@ def save_markdown_report(ctx: click.Context, md_output: pathlib.Path, run_contex
             extra_data["warnings_at_setup"] = run_context.warnings_at_setup
 
     try:
-        manager = _get_result_manager(ctx, apply_hide_filter=False).sort(["name", "categories", "test"])
-        filtered_manager = _get_result_manager(ctx, apply_hide_filter=True).sort(["name", "categories", "test"])
+        manager = _get_result_manager(ctx, apply_hide_filter=False)
+        if split_by is None and not stream:
+            manager.sort(["name", "categories", "test"])
+        # The filtered results are selected after sorting, in the order of the results
+        filtered_manager = _get_result_manager(ctx, apply_hide_filter=True)
+        if split_by is not None:
+            paths = MDReportGenerator.generate_split(manager, md_output, split_by, extra_data, test_results=filtered_manager)
+            console.print(f"Markdown report saved to {md_output} with {len(paths)} {split_by} reports in {md_output.with_suffix('')} ✅", style="cyan")
+            return
         sections = [(section, filtered_manager) if section.__name__ == "TestResults" else (section, manager) for section in MDReportGenerator.DEFAULT_SECTIONS]
         MDReportGenerator.generate_sections(md_filename=md_output, sections=sections, extra_data=extra_data)
         console.print(f"Markdown report saved to {md_output} ✅", style="cyan")
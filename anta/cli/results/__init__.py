@@ -0,0 +1,18 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Click commands to query the test results stored in a result database and compare runs."""
+
+import click
+
+from anta.cli.results import commands
+
+
+@click.group
+def results() -> None:
+    """Commands to query the test results stored in a result database and compare runs."""
+
+
+results.add_command(commands.runs)
+results.add_command(commands.query)
+results.add_command(commands.diff)
@@ -0,0 +1,177 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Click commands to query the test results stored in a result database and compare runs."""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import sqlite3
+from typing import TYPE_CHECKING, get_args
+
+import click
+from rich.table import Table
+
+from anta.cli.console import console
+from anta.cli.utils import ExitCode
+from anta.logger import exc_to_str
+from anta.reporter import ReportTable
+from anta.result_manager import ResultManager
+from anta.result_manager.database import ResultDatabase, ResultGroupBy
+from anta.result_manager.diff import diff_results
+from anta.result_manager.models import AntaTestStatus
+
+from .utils import load_results, print_diff
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATUSES: list[str] = [status for status in AntaTestStatus if status != AntaTestStatus.UNSET]
+
+
+def database_option(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Click common option to open a result database."""
+    return click.option(
+        "--db",
+        "database",
+        help="Path of the SQLite result database created by `anta nrfu --results-db`.",
+        type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=pathlib.Path),
+        show_envvar=True,
+        required=True,
+    )(f)
+
+
+def _open_database(ctx: click.Context, database: pathlib.Path) -> ResultDatabase:
+    """Open a result database, exiting if the file is not a valid database."""
+    try:
+        return ResultDatabase(database)
+    except sqlite3.Error as e:
+        logger.critical("Unable to open result database %s: %s", database, exc_to_str(e))
+        ctx.exit(ExitCode.USAGE_ERROR)
+
+
+@click.command
+@database_option
+@click.option("--last", help="Only list this number of most recent runs.", type=click.IntRange(min=1), show_envvar=True, required=False)
+@click.pass_context
+def runs(ctx: click.Context, database: pathlib.Path, last: int | None) -> None:
+    """List the runs stored in a result database, the most recent first."""
+    with _open_database(ctx, database) as db:
+        stored_runs = db.runs(last=last)
+    table = Table(title=f"Runs stored in {database}", show_lines=True)
+    for column in ("Run", "Start Time", "Duration", "Results", "Cancelled"):
+        table.add_column(column, justify="left")
+    for run in stored_runs:
+        table.add_row(
+            str(run.id),
+            run.start_time.isoformat(sep=" ", timespec="seconds") if run.start_time else "-",
+            f"{run.duration:.3f}s" if run.duration is not None else "-",
+            str(run.total_results),
+            run.cancel_reason or "-",
+        )
+    console.print(table)
+
+
+@click.command
+@database_option
+@click.option(
+    "--last",
+    help="Query the results of this number of most recent runs.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    show_envvar=True,
+)
+@click.option("--run", "run_ids", help="Query the results of this run instead of the most recent runs. Can be repeated.", type=int, multiple=True)
+@click.option(
+    "--status",
+    "statuses",
+    help="Only query the results with this status. Can be repeated.",
+    type=click.Choice(STATUSES, case_sensitive=False),
+    multiple=True,
+)
+@click.option("--device", "-d", "devices", help="Only query the results of this device. Can be repeated.", type=str, multiple=True)
+@click.option("--test", "-t", "tests", help="Only query the results of this test. Can be repeated.", type=str, multiple=True)
+@click.option(
+    "--group-by",
+    help="Count the results grouped by this field. Can be repeated. If not set, the results are listed.",
+    type=click.Choice(get_args(ResultGroupBy), case_sensitive=False),
+    multiple=True,
+)
+@click.pass_context
+def query(
+    ctx: click.Context,
+    database: pathlib.Path,
+    last: int,
+    run_ids: tuple[int, ...],
+    statuses: tuple[str, ...],
+    devices: tuple[str, ...],
+    tests: tuple[str, ...],
+    group_by: tuple[ResultGroupBy, ...],
+) -> None:
+    # Using \b for click
+    # ruff: noqa: D301
+    """Query the test results stored in a result database.
+
+    \b
+    Example
+    -------
+        # Failures by test across the last 10 runs
+        anta results query --db anta.db --last 10 --status failure --group-by test
+
+    """
+    with _open_database(ctx, database) as db:
+        selected_runs = run_ids or [run.id for run in db.runs(last=last)]
+        selected_statuses = {AntaTestStatus(status) for status in statuses} or None
+        if group_by:
+            table = Table(title=f"Results grouped by {', '.join(group_by)}", show_lines=True)
+            for column in (*group_by, "count"):
+                table.add_column(column.capitalize(), justify="left")
+            for row in db.count(group_by, runs=selected_runs, statuses=selected_statuses, devices=set(devices) or None, tests=set(tests) or None):
+                table.add_row(*(f"[{value}]{value}" if isinstance(value, AntaTestStatus) else str(value) for value in row))
+            console.print(table)
+            return
+        manager = ResultManager()
+        for result in db.results(runs=selected_runs, statuses=selected_statuses, devices=set(devices) or None, tests=set(tests) or None):
+            manager.add(result)
+    console.print(ReportTable().generate(manager))
+
+
+@click.command
+@click.argument("baseline")
+@click.argument("current")
+@click.option(
+    "--db",
+    "database",
+    help="Path of a SQLite result database: BASELINE and CURRENT are identifiers of runs stored in this database instead of files.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=pathlib.Path),
+    show_envvar=True,
+    required=False,
+)
+@click.pass_context
+def diff(ctx: click.Context, baseline: str, current: str, database: pathlib.Path | None) -> None:
+    """Compare the test results of a BASELINE run and a CURRENT run.
+
+    BASELINE and CURRENT are JSON reports, NDJSON reports or run journals, or runs stored in a result database with --db.
+    Tests are matched by device, test and test inputs digest for run journals, and by device, test, description
+    and custom field otherwise: tests defined multiple times in the catalog are then matched in order of status and messages.
+
+    Exit with code 4 if some tests are failing or in error in CURRENT but were not in BASELINE.
+    """
+    try:
+        if database is not None:
+            if not (baseline.isdigit() and current.isdigit()):
+                ctx.fail("BASELINE and CURRENT must be run identifiers when using --db, see 'anta results runs'")
+            with _open_database(ctx, database) as db:
+                result_diff = diff_results(db.load(int(baseline)), db.load(int(current)))
+        else:
+            result_diff = diff_results(load_results(pathlib.Path(baseline)), load_results(pathlib.Path(current)))
+    except (ValueError, OSError, sqlite3.Error) as e:
+        logger.critical("Unable to compare the test results: %s", exc_to_str(e))
+        ctx.exit(ExitCode.USAGE_ERROR)
+    print_diff(result_diff)
+    ctx.exit(ExitCode.TESTS_FAILED if result_diff.new_failures else ExitCode.OK)
@@ -0,0 +1,113 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Utils functions to use with anta.cli.results.commands module."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from rich.table import Table
+
+from anta.cli.console import console
+from anta.result_manager.journal import ResultJournal
+from anta.result_manager.models import TestResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from pathlib import Path
+
+    from anta.result_manager.diff import AntaStatusChange, ResultDiff
+    from anta.result_manager.journal import JournalKey
+
+logger = logging.getLogger(__name__)
+
+_JOURNAL_ENTRY_KEYS = frozenset({"device", "test", "inputs", "result"})
+
+
+def _first_line(path: Path) -> str:
+    """Return the first line of a file which is not blank."""
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                return line.strip()
+    return ""
+
+
+def _read_ndjson(path: Path) -> Iterator[TestResult]:
+    """Yield the test results of an NDJSON report one line at a time."""
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield TestResult.from_dump(json.loads(line))
+
+
+def load_results(path: Path) -> Iterable[TestResult] | Mapping[JournalKey, TestResult]:
+    """Load the test results of a JSON report, an NDJSON report or a run journal.
+
+    The format is detected from the content of the file. The results of an NDJSON report are read lazily
+    and the entries of a run journal are keyed by device, test and test inputs digest.
+
+    Parameters
+    ----------
+    path
+        Path of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a JSON report, an NDJSON report or a run journal.
+    """
+    first_line = _first_line(path)
+    if first_line.startswith("["):
+        with path.open(encoding="utf-8") as file:
+            return [TestResult.from_dump(result) for result in json.load(file)]
+    if first_line.startswith("{"):
+        entry = json.loads(first_line)
+        if isinstance(entry, dict) and entry.keys() >= _JOURNAL_ENTRY_KEYS:
+            return ResultJournal(path, resume=True).entries
+        return _read_ndjson(path)
+    msg = f"{path} is not a JSON report, an NDJSON report or a run journal"
+    raise ValueError(msg)
+
+
+def _status(change: AntaStatusChange, *, previous: bool) -> str:
+    """Return the colored status of a test in one of the runs of a change."""
+    status = change.previous_status if previous else change.current_status
+    return f"[{status}]{status.upper()}[/{status}]" if status is not None else "NOT RUN"
+
+
+def print_diff(diff: ResultDiff) -> None:
+    """Print the summary and the details of the differences between two runs."""
+    summary = Table(title="Results diff summary", show_lines=True)
+    summary.add_column("Change", justify="left")
+    summary.add_column("Count", justify="left")
+    categories: list[tuple[str, list[AntaStatusChange]]] = [
+        ("New failures", diff.new_failures),
+        ("Fixed failures", diff.fixed_failures),
+        ("Status changed", diff.status_changed),
+        ("Messages changed", diff.messages_changed),
+        ("Added", diff.added),
+        ("Removed", diff.removed),
+    ]
+    for name, changes in categories:
+        summary.add_row(name, str(len(changes)))
+    summary.add_row("Unchanged", str(diff.unchanged))
+    console.print(summary)
+
+    details = Table(title="Results diff", show_lines=True)
+    for column in ("Change", "Device", "Test", "Baseline", "Current", "Message(s)"):
+        details.add_column(column, justify="left")
+    # A change is listed once, in its first category
+    listed: set[int] = set()
+    for name, changes in categories:
+        for change in changes:
+            if id(change) in listed:
+                continue
+            listed.add(id(change))
+            result = change.result
+            details.add_row(name, result.name, result.test, _status(change, previous=True), _status(change, previous=False), "\n".join(result.messages))
+    if listed:
+        console.print(details)
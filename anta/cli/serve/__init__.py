@@ -0,0 +1,110 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Click commands to run ANTA as a long-running service."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import pathlib
+from typing import TYPE_CHECKING
+
+import click
+
+from anta._runner import AntaRunFilters
+from anta.cli.console import console
+from anta.cli.utils import ExitCode, catalog_options, inventory_options
+from anta.logger import exc_to_str
+from anta.service import DEFAULT_JOB_CONCURRENCY, DEFAULT_MAX_QUEUED_JOBS, DEFAULT_MAX_RUNNING_JOBS, AntaService
+
+if TYPE_CHECKING:
+    from anta.catalog import AntaCatalog
+    from anta.inventory import AntaInventory
+
+logger = logging.getLogger(__name__)
+
+
+@click.command
+@inventory_options
+@catalog_options()
+@click.option("--host", help="Address to listen on.", type=str, default="127.0.0.1", show_default=True, show_envvar=True)
+@click.option("--port", help="TCP port to listen on.", type=click.IntRange(min=0, max=65535), default=8080, show_default=True, show_envvar=True)
+@click.option(
+    "--unix-socket",
+    help="Listen on this Unix socket instead of a TCP port.",
+    type=click.Path(file_okay=True, dir_okay=False, path_type=pathlib.Path),
+    show_envvar=True,
+    required=False,
+)
+@click.option(
+    "--max-queued-jobs",
+    help="Maximum number of jobs waiting to be run. New jobs are rejected when the queue is full.",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_QUEUED_JOBS,
+    show_default=True,
+    show_envvar=True,
+)
+@click.option(
+    "--max-running-jobs",
+    help="Maximum number of jobs running concurrently.",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_RUNNING_JOBS,
+    show_default=True,
+    show_envvar=True,
+)
+@click.option(
+    "--job-concurrency",
+    help="Maximum number of tests running concurrently within a job.",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOB_CONCURRENCY,
+    show_default=True,
+    show_envvar=True,
+)
+@click.pass_context
+def serve(
+    ctx: click.Context,
+    inventory: AntaInventory,
+    tags: set[str] | None,
+    catalog: AntaCatalog,
+    host: str,
+    port: int,
+    unix_socket: pathlib.Path | None,
+    max_queued_jobs: int,
+    max_running_jobs: int,
+    job_concurrency: int,
+) -> None:
+    # Using \b for click
+    # ruff: noqa: D301
+    """Run ANTA as a service accepting jobs on a local HTTP API.
+
+    \b
+    Example
+    -------
+        curl -X POST http://127.0.0.1:8080/jobs -d '{"tags": ["leaf"]}'
+
+    """
+    service = AntaService(
+        inventory,
+        catalog,
+        default_filters=AntaRunFilters(tags=tags),
+        max_queued_jobs=max_queued_jobs,
+        max_running_jobs=max_running_jobs,
+        job_concurrency=job_concurrency,
+    )
+    console.print(f"Serving ANTA on {f'unix:{unix_socket}' if unix_socket is not None else f'http://{host}:{port}'}, press Ctrl+C to stop.", style="cyan")
+    try:
+        asyncio.run(_serve(service, host, port, unix_socket))
+    except KeyboardInterrupt:
+        console.print("ANTA service stopped.", style="cyan")
+    except OSError as e:
+        logger.critical("Unable to start the ANTA service: %s", exc_to_str(e))
+        ctx.exit(ExitCode.USAGE_ERROR)
+
+
+async def _serve(service: AntaService, host: str, port: int, unix_socket: pathlib.Path | None) -> None:
+    """Start the ANTA service and serve the HTTP API until cancelled."""
+    async with service:
+        server = await service.serve_unix(unix_socket) if unix_socket is not None else await service.serve(host, port)
+        async with server:
+            await server.serve_forever()
@@ -16,6 +16,7 @@ import click
 from yaml import YAMLError
 
 from anta.catalog import AntaCatalog
+from anta.catalog_cache import CatalogCache
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 from anta.logger import anta_log_exception
@@ -63,6 +64,7 @@ def exit_with_code(ctx: click.Context) -> None:
     from the `ResultManger` instance.
     If flag `ignore_error` is set, the `error` status will be ignored in all the tests.
     If flag `ignore_status` is set, the exit code will always be 0.
+    If the test run has been cancelled, e.g. by a signal or `--max-duration`, the global test status is `error`.
     Exit the application with the following exit code:
         * 0 if `ignore_status` is `True` or global test status is `unset`, `skipped` or `success`
         * 1 if status is `failure`
@@ -77,6 +79,10 @@ def exit_with_code(ctx: click.Context) -> None:
     if ctx.obj.get("ignore_status"):
         ctx.exit(ExitCode.OK)
 
+    # A cancelled run is incomplete and reported as an error
+    if ctx.obj.get("run_cancelled") and not ctx.obj.get("ignore_error"):
+        ctx.exit(ExitCode.TESTS_ERROR)
+
     # If ignore_error is True then status can never be "error"
     status = ctx.obj["result_manager"].get_status(ignore_error=bool(ctx.obj.get("ignore_error")))
 
@@ -217,6 +223,18 @@ def core_options(f: Callable[..., R]) -> Callable[..., R]:
         default="yaml",
         type=click.Choice(["yaml", "json"], case_sensitive=False),
     )
+    @click.option(
+        "--inventory-expansion",
+        envvar="ANTA_INVENTORY_EXPANSION",
+        show_envvar=True,
+        help=(
+            "When the networks and ranges of the inventory are expanded into devices: 'eager' when parsing the inventory, "
+            "'lazy' when connecting to the devices matching the filters, 'probe' like 'lazy' but only for the addresses with an open eAPI port."
+        ),
+        default="eager",
+        show_default=True,
+        type=click.Choice(["eager", "lazy", "probe"], case_sensitive=False),
+    )
     @click.pass_context
     @functools.wraps(f)
     def wrapper(
@@ -233,6 +251,7 @@ def core_options(f: Callable[..., R]) -> Callable[..., R]:
         disable_cache: bool,
         use_session_auth: bool | None,
         inventory_format: Literal["json", "yaml"],
+        inventory_expansion: Literal["eager", "lazy", "probe"],
         **kwargs: Any,  # noqa: ANN401
     ) -> R:
         # If help is invoke somewhere, do not parse inventory
@@ -270,6 +289,8 @@ def core_options(f: Callable[..., R]) -> Callable[..., R]:
                 disable_cache=disable_cache,
                 use_session_auth=use_session_auth,
                 file_format=inventory_format,
+                lazy=inventory_expansion.lower() == "lazy",
+                probe=inventory_expansion.lower() == "probe",
             )
         except (TypeError, ValueError, YAMLError, OSError, InventoryIncorrectSchemaError, InventoryRootKeyError) as e:
             anta_log_exception(e, f"Failed to parse the inventory: {inventory}", logger)
@@ -356,7 +377,7 @@ def catalog_options(*, required: bool = True) -> Callable[..., Callable[..., obj
             try:
                 # the type checker needs help
                 file_format = cast('Literal["json", "yaml"]', catalog_format.lower())
-                c = AntaCatalog.parse(catalog, file_format=file_format)
+                c = AntaCatalog.parse(catalog, file_format=file_format, cache=CatalogCache())
             except (TypeError, ValueError, YAMLError, OSError) as e:
                 anta_log_exception(e, f"Failed to parse the catalog: {catalog}", logger)
                 ctx.exit(ExitCode.USAGE_ERROR)
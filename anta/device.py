@@ -21,6 +21,7 @@ from httpx import ConnectError, HTTPError, TimeoutException
 import asynceapi
 from anta import __DEBUG__
 from anta.logger import anta_log_exception, exc_to_str
+from anta.metrics import get_metrics
 from anta.models import AntaCommand
 from anta.settings import get_httpx_settings
 from asynceapi._models import EAPIClientConnectionOptions
@@ -31,6 +32,9 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from pathlib import Path
 
+    from httpx import URL
+
+    from anta.metrics import ErrorClass
     from asynceapi._types import EapiSimpleCommand
 
 logger = logging.getLogger(__name__)
@@ -149,6 +153,8 @@ class AntaDevice(ABC):
     """
 
     capabilities: ClassVar[AntaDeviceCapabilities] = AntaDeviceCapabilities()
+    # Incremented each time the `established` attribute of any device changes, used by AntaInventory to invalidate its cache
+    established_generation: ClassVar[int] = 0
 
     def __init__(self, name: str, tags: set[str] | None = None, *, disable_cache: bool = False) -> None:
         """Initialize an AntaDevice.
@@ -169,7 +175,7 @@ class AntaDevice(ABC):
         # A device always has its own name as tag
         self.tags.add(self.name)
         self.is_online: bool = False
-        self.established: bool = False
+        self._established: bool = False
         self.cache: AntaCache | None = None
         # Keeping cache_locks for backward compatibility.
         self.cache_locks: defaultdict[str, asyncio.Lock] | None = None
@@ -183,6 +189,17 @@ class AntaDevice(ABC):
     def _keys(self) -> tuple[Any, ...]:
         """Read-only property to implement hashing and equality for AntaDevice classes."""
 
+    @property
+    def established(self) -> bool:
+        """True if remote command execution succeeds."""
+        return self._established
+
+    @established.setter
+    def established(self, value: bool) -> None:
+        if value != self._established:
+            AntaDevice.established_generation += 1
+        self._established = value
+
     @property
     def max_connections(self) -> int | None:
         """Maximum number of concurrent connections allowed by the device. Can be overridden by subclasses, returns None if not available."""
@@ -210,6 +227,16 @@ class AntaDevice(ABC):
             return {"total_commands_sent": stats["total"], "cache_hits": stats["hits"], "cache_hit_ratio": f"{ratio * 100:.2f}%"}
         return None
 
+    @property
+    def bytes_received(self) -> int | None:
+        """Number of bytes received from the device. Can be overridden by subclasses, returns None if not available."""
+        return None
+
+    @property
+    def eapi_url(self) -> URL | None:
+        """URL of the device eAPI, used to probe its port. Can be overridden by subclasses, returns None if not available."""
+        return None
+
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
         """Implement Rich Repr Protocol.
 
@@ -536,6 +563,16 @@ class AsyncEOSDevice(AntaDevice):
         except AttributeError:
             return None
 
+    @property
+    def bytes_received(self) -> int | None:
+        """Number of bytes received from the device eAPI."""
+        return self._client.bytes_received
+
+    @property
+    def eapi_url(self) -> URL | None:
+        """URL of the device eAPI."""
+        return self._client.base_url
+
     @property
     def use_session_auth(self) -> bool:
         """Whether eAPI cookie-session authentication is enabled for this device."""
@@ -576,45 +613,64 @@ class AsyncEOSDevice(AntaDevice):
                 # No password
                 commands.append(EapiComplexCommand(cmd="enable"))
             commands += [EapiComplexCommand(cmd=command.command, revision=command.revision)] if command.revision else [EapiComplexCommand(cmd=command.command)]
+            error_class: ErrorClass | None = None
+            start = monotonic()
             try:
                 response = await self._client.cli(
                     commands=commands,
                     ofmt=command.ofmt,
                     version=command.version,
                     req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}",
+                    timeout=command.timeout,
                 )
                 # Do not keep response of 'enable' command
                 command.output = response[-1]
             except asynceapi.EapiCommandError as e:
                 # This block catches exceptions related to EOS issuing an error.
+                error_class = "command"
                 self._handle_eapi_command_error(command, e)
             except EapiAuthenticationError as e:
                 # This block catches authentication errors (HTTP 401) from eAPI when session auth is enabled.
+                error_class = "auth"
                 command.errors = [exc_to_str(e)]
                 logger.error("Authentication failed while sending a command to %s: %s", self.name, e)
             except TimeoutException as e:
                 # This block catches Timeout exceptions.
+                error_class = "timeout"
                 command.errors = [exc_to_str(e)]
-                timeouts = self._client.timeout.as_dict()
-                logger.error(
-                    "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
-                    exc_to_str(e),
-                    self.name,
-                    timeouts["connect"],
-                    timeouts["read"],
-                    timeouts["write"],
-                    timeouts["pool"],
-                )
+                self._handle_timeout_error(command, e)
             except (ConnectError, OSError) as e:
                 # This block catches OSError and socket issues related exceptions.
+                error_class = "connect"
                 command.errors = [exc_to_str(e)]
                 self._handle_connect_error(e)
             except HTTPError as e:
                 # This block catches most of the httpx Exceptions and logs a general message.
+                error_class = "http"
                 command.errors = [exc_to_str(e)]
                 anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
+            if (metrics := get_metrics()) is not None:
+                metrics.observe_request(self.name, command.command, monotonic() - start, error_class)
             logger.debug("%s: %s", self.name, command)
 
+    def _handle_timeout_error(self, command: AntaCommand, e: TimeoutException) -> None:
+        """Appropriately log a TimeoutException exception."""
+        if command.timeout is not None:
+            logger.error(
+                "%s occurred while sending '%s' to %s. Consider increasing the command timeout: %s", exc_to_str(e), command.command, self.name, command.timeout
+            )
+            return
+        timeouts = self._client.timeout.as_dict()
+        logger.error(
+            "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
+            exc_to_str(e),
+            self.name,
+            timeouts["connect"],
+            timeouts["read"],
+            timeouts["write"],
+            timeouts["pool"],
+        )
+
     def _handle_eapi_command_error(self, command: AntaCommand, e: asynceapi.EapiCommandError) -> None:
         """Handle and appropriately log an EapiCommandError exception."""
         # Filter out empty strings from the list of errors
@@ -7,17 +7,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import defaultdict
 from ipaddress import ip_address, ip_network
 from json import load as json_load
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from pydantic import ValidationError
-from yaml import YAMLError, safe_load
+from yaml import YAMLError
 
+from anta._yaml import safe_load
 from anta.device import AntaDevice, AntaDeviceCapabilities, AsyncEOSDevice
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
-from anta.inventory.models import AntaInventoryHost, AntaInventoryInput
+from anta.inventory.lazy import LazyInventoryEntry
+from anta.inventory.models import AntaInventoryHost, AntaInventoryInput, AntaInventoryNetwork, AntaInventoryRange
+from anta.inventory.probe import DEFAULT_PROBE_CONCURRENCY, DEFAULT_PROBE_TIMEOUT, probe_ports
 from anta.logger import anta_log_exception, exc_to_str
 
 logger = logging.getLogger(__name__)
@@ -27,13 +31,29 @@ if TYPE_CHECKING:
 
 
 class AntaInventory(dict[str, AntaDevice]):
-    """Inventory abstraction for ANTA framework."""
+    """Inventory abstraction for ANTA framework.
+
+    The inventory maintains an index of the device names per tag and caches the names of the established devices,
+    so `get_inventory()` does not need to check the tags of every device. Device tags must not be modified once the device
+    has been added to the inventory.
+
+    The networks and ranges of an inventory parsed with `lazy=True` are stored as `LazyInventoryEntry` objects in `lazy_entries`.
+    Their devices are only created when the inventory is expanded with `expand()`, which is done by `connect_inventory()`.
+    """
 
     # Root key of inventory part of the inventory file
     INVENTORY_ROOT_KEY: str = "anta_inventory"
     # Supported Output format
     INVENTORY_OUTPUT_FORMAT: ClassVar[list[str]] = ["native", "json"]
 
+    def __init__(self) -> None:
+        """Initialize an empty AntaInventory."""
+        super().__init__()
+        self._tag_index: defaultdict[str, set[str]] = defaultdict(set)
+        # Names of the established devices with the value of AntaDevice.established_generation when computed
+        self._established_cache: tuple[int, frozenset[str]] | None = None
+        self.lazy_entries: list[LazyInventoryEntry] = []
+
     def __str__(self) -> str:
         """Human readable string representing the inventory."""
         devs = {}
@@ -156,6 +176,8 @@ class AntaInventory(dict[str, AntaDevice]):
         inventory: AntaInventory,
         *,
         use_session_auth_override: bool | None,
+        lazy: bool = False,
+        probe: bool = False,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Parse the network section of an AntaInventoryInput and add the devices to the inventory.
@@ -168,6 +190,10 @@ class AntaInventory(dict[str, AntaDevice]):
             AntaInventory to add the parsed devices to.
         use_session_auth_override
             Session auth override: True forces on, False forces off, None defers to inventory.
+        lazy
+            Add the networks to the lazy entries of the inventory instead of creating their devices.
+        probe
+            Only create the devices with an open eAPI port when the lazy entries are expanded.
         **kwargs
            Additional keyword arguments to pass to the device constructor.
 
@@ -183,6 +209,17 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for network in inventory_input.networks:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=network.disable_cache)
+                if lazy:
+                    # Validate the network without walking its addresses
+                    ip_network(str(network.network))
+                    updated_kwargs["use_session_auth"] = AntaInventory._resolve_session_auth(
+                        str(network.network),
+                        AsyncEOSDevice.capabilities,
+                        use_session_auth_override=use_session_auth_override,
+                        inventory_use_session_auth=network.use_session_auth,
+                    )
+                    inventory.lazy_entries.append(LazyInventoryEntry(network, updated_kwargs, probe=probe))
+                    continue
                 for host_ip in ip_network(str(network.network)):
                     updated_kwargs["use_session_auth"] = AntaInventory._resolve_session_auth(
                         str(host_ip),
@@ -203,6 +240,8 @@ class AntaInventory(dict[str, AntaDevice]):
         inventory: AntaInventory,
         *,
         use_session_auth_override: bool | None,
+        lazy: bool = False,
+        probe: bool = False,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Parse the range section of an AntaInventoryInput and add the devices to the inventory.
@@ -215,6 +254,10 @@ class AntaInventory(dict[str, AntaDevice]):
             AntaInventory to add the parsed devices to.
         use_session_auth_override
             Session auth override: True forces on, False forces off, None defers to inventory.
+        lazy
+            Add the ranges to the lazy entries of the inventory instead of creating their devices.
+        probe
+            Only create the devices with an open eAPI port when the lazy entries are expanded.
         **kwargs
             Additional keyword arguments to pass to the device constructor.
 
@@ -232,6 +275,17 @@ class AntaInventory(dict[str, AntaDevice]):
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=range_def.disable_cache)
                 range_increment = ip_address(str(range_def.start))
                 range_stop = ip_address(str(range_def.end))
+                if lazy:
+                    # Validate the range without walking its addresses
+                    _ = range_increment <= range_stop  # type: ignore[operator]
+                    updated_kwargs["use_session_auth"] = AntaInventory._resolve_session_auth(
+                        f"{range_def.start}-{range_def.end}",
+                        AsyncEOSDevice.capabilities,
+                        use_session_auth_override=use_session_auth_override,
+                        inventory_use_session_auth=range_def.use_session_auth,
+                    )
+                    inventory.lazy_entries.append(LazyInventoryEntry(range_def, updated_kwargs, probe=probe))
+                    continue
                 while range_increment <= range_stop:  # type: ignore[operator]
                     # mypy raise an issue about comparing IPv4Address and IPv6Address
                     # but this is handled by the ipaddress module natively by raising a TypeError
@@ -254,7 +308,7 @@ class AntaInventory(dict[str, AntaDevice]):
             raise InventoryIncorrectSchemaError(message) from e
 
     @staticmethod
-    def parse(
+    def parse(  # noqa: PLR0913
         filename: str | Path,
         username: str,
         password: str,
@@ -266,6 +320,8 @@ class AntaInventory(dict[str, AntaDevice]):
         insecure: bool = False,
         disable_cache: bool = False,
         use_session_auth: bool | None = None,
+        lazy: bool = False,
+        probe: bool = False,
     ) -> AntaInventory:
         """Create an AntaInventory instance from an inventory file.
 
@@ -295,6 +351,11 @@ class AntaInventory(dict[str, AntaDevice]):
             Session authentication override. ``True`` forces session auth on for all devices,
             ``False`` (``--no-session-auth``) forces it off regardless of inventory settings,
             ``None`` (unset) defers to the per-device inventory value.
+        lazy
+            Do not create the devices of the networks and ranges of the inventory file until the inventory is expanded.
+            See `AntaInventory.expand()`.
+        probe
+            Only create the devices of the networks and ranges with an open eAPI port when the inventory is expanded. Implies `lazy`.
 
         Raises
         ------
@@ -341,8 +402,9 @@ class AntaInventory(dict[str, AntaDevice]):
 
         # Read data from input
         AntaInventory._parse_hosts(inventory_input, inventory, use_session_auth_override=use_session_auth, **kwargs)
-        AntaInventory._parse_networks(inventory_input, inventory, use_session_auth_override=use_session_auth, **kwargs)
-        AntaInventory._parse_ranges(inventory_input, inventory, use_session_auth_override=use_session_auth, **kwargs)
+        lazy = lazy or probe
+        AntaInventory._parse_networks(inventory_input, inventory, use_session_auth_override=use_session_auth, lazy=lazy, probe=probe, **kwargs)
+        AntaInventory._parse_ranges(inventory_input, inventory, use_session_auth_override=use_session_auth, lazy=lazy, probe=probe, **kwargs)
 
         return inventory
 
@@ -381,21 +443,32 @@ class AntaInventory(dict[str, AntaDevice]):
         AntaInventory
             An inventory with filtered AntaDevice objects.
         """
+        # None selects all the devices
+        names: set[str] | frozenset[str] | None = None
+        if tags is not None:
+            names = set().union(*(self._tag_index[tag] for tag in tags if tag in self._tag_index))
+        if devices is not None:
+            names = devices if names is None else names & devices
+        if established_only:
+            established = self._get_established()
+            names = established if names is None else established & names
 
-        def _filter_devices(device: AntaDevice) -> bool:
-            """Select the devices based on the inputs `tags`, `devices` and `established_only`."""
-            if tags is not None and all(tag not in tags for tag in device.tags):
-                return False
-            if devices is None or device.name in devices:
-                return bool(not established_only or device.established)
-            return False
-
-        filtered_devices: list[AntaDevice] = list(filter(_filter_devices, self.values()))
         result = AntaInventory()
-        for device in filtered_devices:
-            result.add_device(device)
+        for name, device in self.items():
+            if names is None or name in names:
+                result.add_device(device)
+        # Devices of the lazy entries are not established until the inventory is expanded and connected
+        if not established_only:
+            result.lazy_entries = [entry for entry in (lazy_entry.filter(tags, devices) for lazy_entry in self.lazy_entries) if entry is not None]
         return result
 
+    def _get_established(self) -> frozenset[str]:
+        """Return the names of the established devices, cached until the `established` attribute of a device changes."""
+        generation = AntaDevice.established_generation
+        if self._established_cache is None or self._established_cache[0] != generation:
+            self._established_cache = (generation, frozenset(name for name, device in self.items() if device.established))
+        return self._established_cache[1]
+
     def _get_potential_connections(self) -> int | None:
         """Calculate the total potential concurrent connections for the current inventory.
 
@@ -428,7 +501,27 @@ class AntaInventory(dict[str, AntaDevice]):
         if key != value.name:
             msg = f"The key must be the device name for device '{value.name}'. Use AntaInventory.add_device()."
             raise RuntimeError(msg)
-        return super().__setitem__(key, value)
+        if key in self:
+            self._unindex_device(self[key])
+        super().__setitem__(key, value)
+        for tag in value.tags:
+            self._tag_index[tag].add(key)
+        self._established_cache = None
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a device from the inventory."""
+        device = self[key]
+        super().__delitem__(key)
+        self._unindex_device(device)
+
+    def _unindex_device(self, device: AntaDevice) -> None:
+        """Remove a device from the tag index."""
+        for tag in device.tags:
+            if (names := self._tag_index.get(tag)) is not None:
+                names.discard(device.name)
+                if not names:
+                    del self._tag_index[tag]
+        self._established_cache = None
 
     def add_device(self, device: AntaDevice) -> None:
         """Add a device to final inventory.
@@ -445,11 +538,64 @@ class AntaInventory(dict[str, AntaDevice]):
     # MISC methods
     ###########################################################################
 
-    async def connect_inventory(self) -> None:
-        """Run `refresh()` coroutines for all AntaDevice objects in this inventory."""
+    async def expand(self, *, probe: bool | None = None) -> None:
+        """Create the devices of the lazy entries of this inventory.
+
+        Parameters
+        ----------
+        probe
+            Override the `probe` attribute of the lazy entries: if True, only create the devices with an open eAPI port.
+        """
+        lazy_entries, self.lazy_entries = self.lazy_entries, []
+        for entry in lazy_entries:
+            for device in await entry.expand(probe=probe):
+                self.add_device(device)
+            logger.debug("Expanded inventory entry %s", entry)
+
+    async def prescan_inventory(self, *, timeout: float = DEFAULT_PROBE_TIMEOUT, concurrency: int = DEFAULT_PROBE_CONCURRENCY) -> list[AntaDevice]:
+        """Probe the eAPI port of all AntaDevice objects in this inventory concurrently.
+
+        The devices whose eAPI port is not open are marked as offline and not established.
+        Devices without an eAPI URL, see `AntaDevice.eapi_url`, are not probed.
+
+        Parameters
+        ----------
+        timeout
+            Timeout in seconds to open a TCP connection to the eAPI port of a device.
+        concurrency
+            Maximum number of concurrent TCP connections.
+
+        Returns
+        -------
+        list[AntaDevice]
+            The devices whose eAPI port is open or which have not been probed.
+        """
+        urls = {name: url for name, device in self.items() if (url := device.eapi_url) is not None}
+        open_names = set(await probe_ports(urls, urls.__getitem__, timeout=timeout, concurrency=concurrency))
+        for name in urls.keys() - open_names:
+            logger.debug("eAPI port of device %s is not open", name)
+            self[name].is_online = False
+            self[name].established = False
+        if unreachable := len(urls) - len(open_names):
+            logger.info("%d devices out of %d do not have an open eAPI port", unreachable, len(urls))
+        return [device for name, device in self.items() if name not in urls or name in open_names]
+
+    async def connect_inventory(self, *, prescan: bool = False) -> None:
+        """Run `refresh()` coroutines for all AntaDevice objects in this inventory.
+
+        The lazy entries of the inventory are expanded first.
+
+        Parameters
+        ----------
+        prescan
+            Probe the eAPI port of the devices first and only refresh the devices whose port is open. See `prescan_inventory()`.
+        """
+        if self.lazy_entries:
+            await self.expand()
+        devices = await self.prescan_inventory() if prescan else self.devices
         logger.debug("Refreshing devices...")
         results = await asyncio.gather(
-            *(device.refresh() for device in self.values()),
+            *(device.refresh() for device in devices),
             return_exceptions=True,
         )
         for r in results:
@@ -474,7 +620,8 @@ class AntaInventory(dict[str, AntaDevice]):
     def dump(self) -> AntaInventoryInput:
         """Dump the AntaInventory to an AntaInventoryInput.
 
-        Each hosts is dumped individually.
+        Each hosts is dumped individually. Lazy entries are dumped as networks and ranges if they are not restricted
+        to some devices, otherwise each of their addresses is dumped as a host.
         """
         hosts = [
             AntaInventoryHost(
@@ -487,4 +634,22 @@ class AntaInventory(dict[str, AntaDevice]):
             )
             for device in self.devices
         ]
-        return AntaInventoryInput(hosts=hosts)
+        networks: list[AntaInventoryNetwork] = []
+        ranges: list[AntaInventoryRange] = []
+        for entry in self.lazy_entries:
+            if entry.names is not None:
+                hosts.extend(
+                    AntaInventoryHost(
+                        name=address,
+                        host=address,
+                        tags=entry.tags | {address},
+                        disable_cache=entry.device_kwargs.get("disable_cache") or False,
+                        use_session_auth=entry.device_kwargs.get("use_session_auth") or False,
+                    )
+                    for address in entry.addresses()
+                )
+            elif isinstance(entry.entry, AntaInventoryNetwork):
+                networks.append(entry.entry)
+            else:
+                ranges.append(entry.entry)
+        return AntaInventoryInput(hosts=hosts, networks=networks or None, ranges=ranges or None)
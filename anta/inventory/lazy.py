@@ -0,0 +1,143 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Inventory entries whose devices are created on demand."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+from typing import TYPE_CHECKING, Any
+
+from httpx import URL
+
+from anta.device import AsyncEOSDevice
+from anta.inventory.models import AntaInventoryNetwork, AntaInventoryRange
+from anta.inventory.probe import DEFAULT_PROBE_CONCURRENCY, DEFAULT_PROBE_TIMEOUT, probe_ports
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import Iterator
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LazyInventoryEntry:
+    """Network or range of an inventory file whose devices are created on demand.
+
+    A network or a range can describe tens of thousands of addresses. The devices of a lazy entry are only created
+    when the inventory is expanded, after filtering, and optionally only for the addresses with an open eAPI port.
+
+    Attributes
+    ----------
+    entry
+        Network or range of the inventory file.
+    device_kwargs
+        Keyword arguments to pass to the AsyncEOSDevice constructor.
+    probe
+        Whether or not to create devices only for the addresses with an open eAPI port.
+    names
+        If not None, only the devices with these names are created.
+    """
+
+    entry: AntaInventoryNetwork | AntaInventoryRange
+    device_kwargs: dict[str, Any]
+    probe: bool = False
+    names: frozenset[str] | None = None
+
+    def __str__(self) -> str:
+        """Return the network or range of the entry."""
+        if isinstance(self.entry, AntaInventoryNetwork):
+            return str(self.entry.network)
+        return f"{self.entry.start}-{self.entry.end}"
+
+    @property
+    def tags(self) -> set[str]:
+        """Tags of the devices of the entry, in addition to their own name."""
+        return self.entry.tags or set()
+
+    def _contains(self, address: str) -> bool:
+        """Return True if the address belongs to the network or range of the entry."""
+        try:
+            ip = ip_address(address)
+        except ValueError:
+            return False
+        if isinstance(self.entry, AntaInventoryNetwork):
+            return ip in ip_network(str(self.entry.network))
+        start = ip_address(str(self.entry.start))
+        end = ip_address(str(self.entry.end))
+        return ip.version == start.version and start <= ip <= end  # type: ignore[operator]
+
+    def addresses(self) -> Iterator[str]:
+        """Yield the addresses of the devices of the entry, one at a time."""
+        if self.names is not None:
+            # Do not walk the whole network or range when the devices are already known
+            yield from sorted((name for name in self.names if self._contains(name)), key=ip_address)
+            return
+        if isinstance(self.entry, AntaInventoryNetwork):
+            for ip in ip_network(str(self.entry.network)):
+                yield str(ip)
+            return
+        current: IPv4Address | IPv6Address = ip_address(str(self.entry.start))
+        end = ip_address(str(self.entry.end))
+        while current <= end:  # type: ignore[operator]
+            yield str(current)
+            current += 1
+
+    def filter(self, tags: set[str] | None = None, devices: set[str] | None = None) -> Self | None:
+        """Return the entry restricted to the devices matching the filters of `AntaInventory.get_inventory()`.
+
+        Parameters
+        ----------
+        tags
+            Tags to filter devices.
+        devices
+            Names to filter devices.
+
+        Returns
+        -------
+        LazyInventoryEntry | None
+            The filtered entry, or None if no device of the entry can match the filters.
+        """
+        names = self.names
+        if tags is not None and self.tags.isdisjoint(tags):
+            # Only the devices whose name is one of the tags can match
+            names = frozenset(tags) if names is None else names.intersection(tags)
+        if devices is not None:
+            names = frozenset(devices) if names is None else names.intersection(devices)
+        if names is not None and not any(self._contains(name) for name in names):
+            return None
+        return replace(self, names=names)
+
+    async def expand(
+        self, *, probe: bool | None = None, timeout: float = DEFAULT_PROBE_TIMEOUT, concurrency: int = DEFAULT_PROBE_CONCURRENCY
+    ) -> list[AsyncEOSDevice]:
+        """Create the devices of the entry.
+
+        Parameters
+        ----------
+        probe
+            Override the `probe` attribute of the entry.
+        timeout
+            Timeout in seconds to open a TCP connection to the eAPI port of an address when probing.
+        concurrency
+            Maximum number of concurrent TCP connections when probing.
+
+        Returns
+        -------
+        list[AsyncEOSDevice]
+            The devices of the entry.
+        """
+        addresses: Iterator[str] | list[str] = self.addresses()
+        if self.probe if probe is None else probe:
+            proto = self.device_kwargs.get("proto", "https")
+            addresses = await probe_ports(addresses, lambda address: URL(scheme=proto, host=address), timeout=timeout, concurrency=concurrency)
+            logger.debug("Found %d addresses with an open eAPI port in %s", len(addresses), self)
+        return [AsyncEOSDevice(host=address, tags=self.entry.tags, **self.device_kwargs) for address in addresses]
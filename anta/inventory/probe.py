@@ -0,0 +1,77 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Concurrent TCP probe of the eAPI port of inventory hosts."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, TypeVar
+
+from asynceapi.aio_portcheck import port_check_url
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from httpx import URL
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_PROBE_TIMEOUT = 2.0
+"""Default timeout in seconds to open a TCP connection to a probed port."""
+
+DEFAULT_PROBE_CONCURRENCY = 512
+"""Default maximum number of concurrent TCP connections opened by a probe."""
+
+
+async def is_port_open(url: URL, timeout: float = DEFAULT_PROBE_TIMEOUT) -> bool:
+    """Return True if a TCP connection can be opened to the host and port of the URL within the timeout."""
+    try:
+        return await port_check_url(url, timeout=timeout)
+    # On Python 3.10, asyncio.TimeoutError is neither the builtin TimeoutError nor an OSError
+    except (OSError, asyncio.TimeoutError) as e:
+        logger.debug("Port of %s is not open: %s", url, e)
+        return False
+
+
+async def probe_ports(
+    items: Iterable[T],
+    get_url: Callable[[T], URL],
+    *,
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+    concurrency: int = DEFAULT_PROBE_CONCURRENCY,
+) -> list[T]:
+    """Probe the ports of items concurrently and return the items with an open port.
+
+    The items are consumed lazily by a bounded pool of workers: at most `concurrency` connections are opened at the same time.
+
+    Parameters
+    ----------
+    items
+        Items to probe.
+    get_url
+        Function returning the URL of the host and port to probe for an item.
+    timeout
+        Timeout in seconds to open a TCP connection.
+    concurrency
+        Maximum number of concurrent TCP connections.
+
+    Returns
+    -------
+    list[T]
+        The items with an open port, in the order of `items`.
+    """
+    pending: Iterator[tuple[int, T]] = enumerate(items)
+    open_items: list[tuple[int, T]] = []
+
+    async def worker() -> None:
+        # The iterator is shared by the workers: each item is probed once
+        for index, item in pending:
+            if await is_port_open(get_url(item), timeout=timeout):
+                open_items.append((index, item))
+
+    await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+    return [item for _, item in sorted(open_items, key=lambda open_item: open_item[0])]
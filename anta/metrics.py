@@ -0,0 +1,289 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Run and transport metrics for ANTA.
+
+Metrics are collected in an `AntaMetrics` registry and rendered in the OpenMetrics text format,
+either to a file at the end of a run or on a local HTTP endpoint during long runs.
+
+Metrics collection is disabled by default. Call `enable_metrics()` to create the global registry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+from weakref import WeakValueDictionary
+
+from anta.logger import exc_to_str
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from anta.device import AntaDevice
+    from anta.result_manager.models import TestResult
+
+logger = logging.getLogger(__name__)
+
+ErrorClass = Literal["timeout", "connect", "auth", "command", "http"]
+"""Classes of errors that can occur while collecting a command from a device."""
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Default upper bounds in seconds of the latency histograms buckets."""
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+"""Content-Type header value of the OpenMetrics text format."""
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram of observed values.
+
+    Attributes
+    ----------
+    buckets
+        Sorted upper bounds of the buckets. The `+Inf` bucket is implicit.
+    counts
+        Number of observations per bucket, non-cumulative. The last element is the `+Inf` bucket.
+    sum
+        Sum of all observed values.
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Initialize the bucket counters."""
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def count(self) -> int:
+        """Total number of observations."""
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        """Record a new observation in the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+def _escape(value: str) -> str:
+    """Escape a label value as required by the OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    """Format a label set as required by the OpenMetrics text format."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_float(value: float) -> str:
+    """Format a float as required by the OpenMetrics text format."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class AntaMetrics:
+    """Registry of ANTA run and transport metrics.
+
+    The following metric families are exposed:
+
+    - `anta_eapi_requests_total{device}`: eAPI requests sent to a device.
+    - `anta_eapi_errors_total{device,class}`: eAPI request errors by class (timeout, connect, auth, command, http).
+    - `anta_eapi_received_bytes_total{device}`: Bytes received from a device eAPI.
+    - `anta_cache_lookups_total{device}` and `anta_cache_hits_total{device}`: Device cache usage.
+    - `anta_test_results_total{test,status}`: Test outcomes.
+    - `anta_device_request_duration_seconds{device}`: Latency histogram of eAPI requests per device.
+    - `anta_command_request_duration_seconds{command}`: Latency histogram of eAPI requests per command.
+
+    Cache and received bytes metrics are read from the registered devices when rendering.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize an empty AntaMetrics registry.
+
+        Parameters
+        ----------
+        buckets
+            Upper bounds in seconds of the latency histograms buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.requests: defaultdict[str, int] = defaultdict(int)
+        self.errors: defaultdict[tuple[str, ErrorClass], int] = defaultdict(int)
+        self.test_results: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.device_latency: defaultdict[str, Histogram] = defaultdict(self._new_histogram)
+        self.command_latency: defaultdict[str, Histogram] = defaultdict(self._new_histogram)
+        self._devices: WeakValueDictionary[str, AntaDevice] = WeakValueDictionary()
+
+    def _new_histogram(self) -> Histogram:
+        return Histogram(buckets=self.buckets)
+
+    def register_device(self, device: AntaDevice) -> None:
+        """Register a device to expose its cache and received bytes statistics."""
+        self._devices[device.name] = device
+
+    def observe_request(self, device: str, command: str, duration: float, error: ErrorClass | None = None) -> None:
+        """Record an eAPI request.
+
+        Parameters
+        ----------
+        device
+            Name of the device the request was sent to.
+        command
+            Command sent in the request.
+        duration
+            Duration of the request in seconds.
+        error
+            Class of the error raised by the request if any.
+        """
+        self.requests[device] += 1
+        self.device_latency[device].observe(duration)
+        self.command_latency[command].observe(duration)
+        if error is not None:
+            self.errors[(device, error)] += 1
+
+    def observe_result(self, result: TestResult) -> None:
+        """Record the outcome of a test."""
+        self.test_results[(result.test, str(result.result))] += 1
+
+    def _render_counter(self, name: str, help_text: str, samples: list[tuple[dict[str, str], float]]) -> list[str]:
+        lines = [f"# TYPE {name} counter", f"# HELP {name} {help_text}"]
+        lines.extend(f"{name}_total{_labels(**labels)} {_format_float(value)}" for labels, value in samples)
+        return lines
+
+    def _render_histogram(self, name: str, help_text: str, label: str, histograms: dict[str, Histogram]) -> list[str]:
+        lines = [f"# TYPE {name} histogram", f"# UNIT {name} seconds", f"# HELP {name} {help_text}"]
+        for value, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts, strict=True):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(**{label: value, 'le': _format_float(bound)})} {cumulative}")
+            lines.append(f"{name}_count{_labels(**{label: value})} {cumulative}")
+            lines.append(f"{name}_sum{_labels(**{label: value})} {_format_float(histogram.sum)}")
+        return lines
+
+    def render(self) -> str:
+        """Render the metrics in the OpenMetrics text format.
+
+        Returns
+        -------
+        str
+            The metrics exposition, terminated by `# EOF`.
+        """
+        devices = dict(sorted(self._devices.items()))
+        received_bytes = [({"device": name}, float(dev.bytes_received)) for name, dev in devices.items() if dev.bytes_received is not None]
+        cache_lookups = [({"device": name}, float(dev.cache.stats["total"])) for name, dev in devices.items() if dev.cache is not None]
+        cache_hits = [({"device": name}, float(dev.cache.stats["hits"])) for name, dev in devices.items() if dev.cache is not None]
+
+        lines: list[str] = []
+        lines += self._render_counter("anta_eapi_requests", "eAPI requests sent to a device.", [({"device": d}, float(v)) for d, v in sorted(self.requests.items())])
+        lines += self._render_counter(
+            "anta_eapi_errors",
+            "eAPI request errors by class.",
+            [({"device": d, "class": c}, float(v)) for (d, c), v in sorted(self.errors.items())],
+        )
+        lines += self._render_counter("anta_eapi_received_bytes", "Bytes received from a device eAPI.", received_bytes)
+        lines += self._render_counter("anta_cache_lookups", "Device cache lookups.", cache_lookups)
+        lines += self._render_counter("anta_cache_hits", "Device cache hits.", cache_hits)
+        lines += self._render_counter(
+            "anta_test_results", "Test outcomes.", [({"test": t, "status": s}, float(v)) for (t, s), v in sorted(self.test_results.items())]
+        )
+        lines += self._render_histogram("anta_device_request_duration_seconds", "Latency of eAPI requests per device.", "device", self.device_latency)
+        lines += self._render_histogram("anta_command_request_duration_seconds", "Latency of eAPI requests per command.", "command", self.command_latency)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, filename: Path) -> None:
+        """Write the metrics to an OpenMetrics text file.
+
+        The file is written atomically so a Prometheus node exporter textfile collector never reads a partial file.
+
+        Parameters
+        ----------
+        filename
+            Path of the OpenMetrics text file.
+        """
+        tmp_file = filename.with_name(f".{filename.name}.tmp")
+        tmp_file.write_text(self.render(), encoding="utf-8")
+        tmp_file.replace(filename)
+
+    async def _handle_http_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer a single HTTP request with the metrics exposition."""
+        try:
+            request_line = await reader.readline()
+            # Drain the request headers
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass
+            method, _, path = request_line.decode("latin-1").partition(" ")
+            if method == "GET" and path.split(" ")[0] in ("/", "/metrics"):
+                body = self.render().encode()
+                status = "200 OK"
+                content_type = OPENMETRICS_CONTENT_TYPE
+            else:
+                body = b"Not Found\n"
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+            headers = f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+            writer.write(headers.encode() + body)
+            await writer.drain()
+        except (ConnectionError, UnicodeDecodeError) as e:
+            logger.debug("Error while serving metrics: %s", exc_to_str(e))
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 9464) -> asyncio.Server:
+        """Serve the metrics on a local HTTP endpoint.
+
+        The server runs in the current event loop until it is closed by the caller.
+
+        Parameters
+        ----------
+        host
+            Address to listen on.
+        port
+            TCP port to listen on.
+
+        Returns
+        -------
+        asyncio.Server
+            The started server.
+        """
+        server = await asyncio.start_server(self._handle_http_request, host=host, port=port)
+        logger.info("Serving ANTA metrics on http://%s:%s/metrics", host, port)
+        return server
+
+
+_METRICS: AntaMetrics | None = None
+
+
+def enable_metrics(buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> AntaMetrics:
+    """Create a new global metrics registry and return it.
+
+    Parameters
+    ----------
+    buckets
+        Upper bounds in seconds of the latency histograms buckets.
+    """
+    global _METRICS  # noqa: PLW0603
+    _METRICS = AntaMetrics(buckets=buckets)
+    return _METRICS
+
+
+def disable_metrics() -> None:
+    """Discard the global metrics registry."""
+    global _METRICS  # noqa: PLW0603
+    _METRICS = None
+
+
+def get_metrics() -> AntaMetrics | None:
+    """Return the global metrics registry or None if metrics are disabled."""
+    return _METRICS
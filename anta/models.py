@@ -9,11 +9,12 @@ import hashlib
 import logging
 import re
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from functools import wraps
 from string import Formatter
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-from pydantic import BaseModel, ConfigDict, ValidationError, create_model, field_serializer
+from pydantic import BaseModel, ConfigDict, PositiveFloat, ValidationError, create_model, field_serializer
 
 from anta.constants import EOS_BLACKLIST_CMDS, KNOWN_EOS_ERRORS, UNSUPPORTED_PLATFORM_ERRORS
 from anta.custom_types import Revision
@@ -57,6 +58,8 @@ class AntaTemplate:
         eAPI output - json or text.
     use_cache
         Enable or disable caching for this AntaTemplate if the AntaDevice supports it.
+    timeout
+        Timeout in seconds of the eAPI request of the rendered commands. If None, the device timeout applies.
     """
 
     # pylint: disable=too-few-public-methods
@@ -69,12 +72,14 @@ class AntaTemplate:
         ofmt: Literal["json", "text"] = "json",
         *,
         use_cache: bool = True,
+        timeout: float | None = None,
     ) -> None:
         self.template = template
         self.version: Literal[1, "latest"] = version
         self.revision = revision
         self.ofmt: Literal["json", "text"] = ofmt
         self.use_cache = use_cache
+        self.timeout = timeout
 
         # Create a AntaTemplateParams model to elegantly store AntaTemplate variables
         field_names = [fname for _, fname, _, _ in Formatter().parse(self.template) if fname]
@@ -127,6 +132,7 @@ class AntaTemplate:
             template=self,
             params=self.params_schema(**params),
             use_cache=self.use_cache,
+            timeout=self.timeout,
         )
 
 
@@ -164,6 +170,8 @@ class AntaCommand(BaseModel):
         Pydantic Model containing the variables values used to render the template.
     use_cache
         Enable or disable caching for this AntaCommand if the AntaDevice supports it.
+    timeout
+        Timeout in seconds of the eAPI request of this command. If None, the device timeout applies.
 
     """
 
@@ -178,6 +186,7 @@ class AntaCommand(BaseModel):
     errors: list[str] = []
     params: AntaParamsBaseModel = AntaParamsBaseModel()
     use_cache: bool = True
+    timeout: PositiveFloat | None = None
 
     @property
     def uid(self) -> str:
@@ -389,18 +398,40 @@ class AntaTest(ABC):
         ----------
         result_overwrite
             Define fields to overwrite in the TestResult object.
+        filters
+            Runtime filters to map the test with devices.
+        timeout
+            Maximum duration of the test in seconds, including the commands collection.
+            The test result is set to error when exceeded.
         """
 
+        # The hash is cached in a slot: it is neither compared, copied nor pickled with the model
+        __slots__ = ("_hash",)
+
         model_config = ConfigDict(extra="forbid")
         result_overwrite: ResultOverwrite | None = None
         filters: Filters | None = None
+        timeout: PositiveFloat | None = None
 
         def __hash__(self) -> int:
             """Implement generic hashing for AntaTest.Input.
 
             This will work in most cases but this does not consider 2 lists with different ordering as equal.
+            The hash is computed once and invalidated when a field is assigned. Inputs must not be modified in place
+            (e.g. appending to a list field) once hashed, for instance once added to an AntaCatalog.
             """
-            return hash(self.model_dump_json())
+            try:
+                return self._hash
+            except AttributeError:
+                input_hash = hash(self.model_dump_json())
+                object.__setattr__(self, "_hash", input_hash)
+                return input_hash
+
+        def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+            """Invalidate the cached hash when a field is assigned."""
+            super().__setattr__(name, value)
+            with suppress(AttributeError):
+                object.__delattr__(self, "_hash")
 
         class ResultOverwrite(BaseModel):
             """Test inputs model to overwrite result fields.
@@ -0,0 +1,212 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Registry of the built-in ANTA tests.
+
+The registry is a manifest generated from the `anta.tests` package describing every test: its module, description, categories,
+commands, documentation example and input JSON schema. It allows to list the built-in tests without importing all the test modules.
+The registry is generated with `docs/scripts/generate_test_registry.py`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from anta import __version__ as anta_version
+from anta.logger import exc_to_str
+from anta.models import AntaCommand
+
+if TYPE_CHECKING:
+    import sys
+
+    from anta.models import AntaTest
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_PACKAGE = "anta.tests"
+"""Python package of the tests described in the registry."""
+
+REGISTRY_FILE = Path(__file__).parent / "tests" / "registry.json"
+"""Path of the registry file shipped with ANTA."""
+
+
+def extract_examples(docstring: str) -> str | None:
+    """Extract the content of the Example section in a Numpy docstring.
+
+    Returns
+    -------
+    str | None
+        The content of the section if present, None if the section is absent or empty.
+    """
+    pattern = r"Examples\s*--------\s*(.*)(?:\n\s*\n|\Z)"
+    match = re.search(pattern, docstring, flags=re.DOTALL)
+    return match[1].strip() if match and match[1].strip() != "" else None
+
+
+class RegisteredTest(BaseModel):
+    """Description of an ANTA test in the registry.
+
+    Attributes
+    ----------
+    name
+        Name of the test.
+    module
+        Python module in which the test is defined.
+    description
+        Description of the test.
+    categories
+        Categories of the test.
+    commands
+        EOS commands or command templates used by the test.
+    example
+        Example section of the test docstring.
+    input_schema
+        JSON schema of the test inputs. The definitions are shared by all the tests of the registry.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    module: str
+    description: str
+    categories: list[str]
+    commands: list[str]
+    example: str | None = None
+    input_schema: dict[str, Any] = {}
+
+    @classmethod
+    def from_test(cls, test: type[AntaTest]) -> Self:
+        """Create a RegisteredTest from an AntaTest subclass.
+
+        The input JSON schema is not computed: it is only required to generate the registry file.
+        """
+        return cls(
+            name=test.name,
+            module=test.__module__,
+            description=test.description,
+            categories=test.categories,
+            commands=[command.command if isinstance(command, AntaCommand) else command.template for command in test.commands],
+            example=extract_examples(test.__doc__) if test.__doc__ else None,
+        )
+
+    def load(self) -> type[AntaTest]:
+        """Import the test module and return the AntaTest subclass."""
+        return getattr(importlib.import_module(self.module), self.name)  # type: ignore[no-any-return]
+
+
+class AntaTestRegistry(BaseModel):
+    """Registry of the built-in ANTA tests.
+
+    Attributes
+    ----------
+    anta_version
+        ANTA version used to generate the registry.
+    definitions
+        JSON schema definitions shared by the input schemas of the tests.
+    tests
+        Tests of the registry, in the order of `anta get tests`.
+    """
+
+    anta_version: str
+    definitions: dict[str, Any] = {}
+    tests: list[RegisteredTest] = []
+
+    @classmethod
+    def build(cls, tests: list[type[AntaTest]]) -> Self:
+        """Build an AntaTestRegistry from AntaTest subclasses.
+
+        Parameters
+        ----------
+        tests
+            AntaTest subclasses to register.
+
+        Raises
+        ------
+        ValueError
+            If two input models with the same name have different JSON schemas.
+        """
+        definitions: dict[str, Any] = {}
+        registered_tests: list[RegisteredTest] = []
+        for test in tests:
+            schema = test.Input.model_json_schema(ref_template="#/definitions/{model}")
+            for name, definition in schema.pop("$defs", {}).items():
+                if definitions.setdefault(name, definition) != definition:
+                    msg = f"Input model {name} of test {test.name} conflicts with another input model with the same name"
+                    raise ValueError(msg)
+            registered_tests.append(RegisteredTest.from_test(test).model_copy(update={"input_schema": schema}))
+        return cls(anta_version=anta_version, definitions=definitions, tests=registered_tests)
+
+    @classmethod
+    def load(cls, filename: Path = REGISTRY_FILE) -> Self | None:
+        """Load a registry file.
+
+        Parameters
+        ----------
+        filename
+            Path of the registry file.
+
+        Returns
+        -------
+        AntaTestRegistry | None
+            The registry, or None if the file cannot be loaded or has been generated by another ANTA version.
+        """
+        try:
+            registry = cls.model_validate_json(filename.read_bytes())
+        except (OSError, ValidationError) as e:
+            logger.debug("Cannot load the test registry %s: %s", filename, exc_to_str(e))
+            return None
+        if registry.anta_version != anta_version:
+            logger.debug("Ignoring the test registry %s generated by ANTA %s", filename, registry.anta_version)
+            return None
+        return registry
+
+    def dump(self, filename: Path = REGISTRY_FILE) -> None:
+        """Write the registry file.
+
+        Parameters
+        ----------
+        filename
+            Path of the registry file.
+        """
+        with filename.open("w", encoding="UTF-8") as f:
+            json.dump(self.model_dump(mode="json"), f, separators=(",", ":"))
+            f.write("\n")
+
+    def input_schema(self, test: RegisteredTest) -> dict[str, Any]:
+        """Return the self-contained JSON schema of the inputs of a registered test."""
+        return {**test.input_schema, "definitions": self.definitions} if self.definitions else test.input_schema
+
+    def find(self, module_name: str, test_name: str | None = None) -> list[RegisteredTest] | None:
+        """Return the registered tests of a module.
+
+        Parameters
+        ----------
+        module_name
+            Name of a Python module or package (e.g., 'anta.tests.routing').
+        test_name
+            If provided, only return tests starting with this name.
+
+        Returns
+        -------
+        list[RegisteredTest] | None
+            The registered tests of the module, or None if the module is not described by the registry.
+        """
+        if module_name != REGISTRY_PACKAGE and not module_name.startswith(f"{REGISTRY_PACKAGE}."):
+            return None
+        tests = [test for test in self.tests if test.module == module_name or test.module.startswith(f"{module_name}.")]
+        if not tests:
+            # Not a module of the registry: the caller must import it
+            return None
+        return [test for test in tests if test_name is None or test.name.startswith(test_name)]
@@ -154,7 +154,7 @@ class ReportTable:
 
         table = ReportTable._build_table(title=self.title.all, columns=columns)
 
-        for result in manager.results:
+        for result in manager:
             state = self._color_result(result.result)
             message = self._split_list_to_txt_list(result.messages) if len(result.messages) > 0 else ""
             categories = ", ".join(convert_categories(result.categories))
@@ -216,7 +216,7 @@ class ReportTable:
             renderables = [categories, device, test, result.description, state, message]
             table.add_row(*renderables)
 
-        for result in manager.results:
+        for result in manager:
             add_line(result)
             for index, atomic_res in enumerate(result.atomic_results):
                 add_line(atomic_res, f"{index + 1}/{len(result.atomic_results)}")
@@ -7,22 +7,37 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import logging
 import os
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Literal, TextIO
 
 from anta.logger import anta_log_exception
 from anta.tools import convert_categories
 
 if TYPE_CHECKING:
     import pathlib
+    import sys
+    from collections.abc import Iterable
+    from types import TracebackType
 
-    from anta.result_manager import ResultManager
     from anta.result_manager.models import TestResult
 
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
 logger = logging.getLogger(__name__)
 
+WRITE_BUFFER_SIZE = 1024 * 1024
+"""Size in bytes of the buffer of the CSV file: the rows are written to the file in chunks of this size."""
+
+GZIP_COMPRESSION_LEVEL = 6
+"""Compression level of the gzip compressed CSV files, trading some compression ratio for speed."""
+
 
 class ReportCsv:
     """Build a CSV report."""
@@ -57,6 +72,23 @@ class ReportCsv:
         """
         return f"{delimiter}".join(f"{line}" for line in usr_list)
 
+    @classmethod
+    @cache
+    def _categories_to_txt(cls, categories: tuple[str, ...]) -> str:
+        """Convert the categories of a test result into a string, cached per report class as all the results of a test share them.
+
+        Parameters
+        ----------
+        categories
+            Categories of the test result.
+
+        Returns
+        -------
+        str
+            Categories converted into a string.
+        """
+        return cls.split_list_to_txt_list(convert_categories(categories)) if len(categories) > 0 else "None"
+
     @classmethod
     def convert_to_list(cls, result: TestResult) -> list[str]:
         """Convert a TestResult into a list of string for creating file content.
@@ -72,7 +104,7 @@ class ReportCsv:
             TestResult converted into a list.
         """
         message = cls.split_list_to_txt_list(result.messages) if len(result.messages) > 0 else ""
-        categories = cls.split_list_to_txt_list(convert_categories(result.categories)) if len(result.categories) > 0 else "None"
+        categories = cls._categories_to_txt(tuple(result.categories))
         return [
             str(result.name),
             result.test,
@@ -83,41 +115,122 @@ class ReportCsv:
         ]
 
     @classmethod
-    def generate(cls, results: ResultManager, csv_filename: pathlib.Path) -> None:
+    def generate(cls, results: Iterable[TestResult], csv_filename: pathlib.Path, *, compression: Literal["gzip"] | None = None) -> None:
         """Build CSV flle with tests results.
 
         Parameters
         ----------
         results
-            A ResultManager instance.
+            Test results, e.g. a ResultManager instance.
         csv_filename
             File path where to save CSV data.
+        compression
+            Compress the CSV file with `gzip`. Defaults to None.
 
         Raises
         ------
         OSError
             if any is raised while writing the CSV file.
         """
-        headers = [
-            cls.Headers.device,
-            cls.Headers.test_name,
-            cls.Headers.test_status,
-            cls.Headers.messages,
-            cls.Headers.description,
-            cls.Headers.categories,
-        ]
-
         try:
-            with csv_filename.open(mode="w", encoding="utf-8", newline="") as csvfile:
-                csvwriter = csv.writer(
-                    csvfile,
-                    delimiter=",",
-                    lineterminator=os.linesep,
-                )
-                csvwriter.writerow(headers)
-                for entry in results.results:
-                    csvwriter.writerow(cls.convert_to_list(entry))
+            with ReportCsvWriter(csv_filename, compression=compression, report_class=cls) as report:
+                for entry in results:
+                    report.write(entry)
         except OSError as exc:
             message = f"OSError caught while writing the CSV file '{csv_filename.resolve()}'."
             anta_log_exception(exc, message, logger)
             raise
+
+
+class ReportCsvWriter:
+    """Write test results to a CSV report as they arrive.
+
+    The rows are built with the `convert_to_list()` method of the report class, `ReportCsv` or a subclass, and are written
+    to the file through a buffer of `WRITE_BUFFER_SIZE` bytes, so the memory usage does not depend on the number of results.
+
+    `write()` can be used as the `on_result` callback of `AntaRunner.run()`. An OSError raised while writing the file
+    is raised when the writer is closed, so that the run is not interrupted.
+
+    Examples
+    --------
+    ```python
+    with ReportCsvWriter(Path("results.csv.gz"), compression="gzip") as report:
+        ctx = asyncio.run(AntaRunner().run(inventory, catalog, on_result=report.write))
+    ```
+    """
+
+    def __init__(self, filename: pathlib.Path, *, compression: Literal["gzip"] | None = None, report_class: type[ReportCsv] = ReportCsv) -> None:
+        """Initialize a ReportCsvWriter instance and write the headers.
+
+        The file is truncated.
+
+        Parameters
+        ----------
+        filename
+            Path of the CSV file.
+        compression
+            Compress the CSV file with `gzip`. Defaults to None.
+        report_class
+            Class providing the headers and the `convert_to_list()` method building the rows. Defaults to `ReportCsv`.
+        """
+        self.filename = filename
+        self.count = 0
+        self._report_class = report_class
+        if compression == "gzip":
+            self._file: TextIO | None = gzip.open(filename, mode="wt", compresslevel=GZIP_COMPRESSION_LEVEL, encoding="utf-8", newline="")  # noqa: SIM115
+        else:
+            self._file = filename.open(mode="w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE)
+        self._writer = csv.writer(self._file, delimiter=",", lineterminator=os.linesep)
+        self._error: OSError | None = None
+        headers = report_class.Headers
+        self._writerow([headers.device, headers.test_name, headers.test_status, headers.messages, headers.description, headers.categories])
+
+    def __enter__(self) -> Self:
+        """Enter the context of the writer."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Write the buffered rows and close the file."""
+        self.close()
+
+    def write(self, result: TestResult) -> None:
+        """Write a test result to the CSV report.
+
+        Parameters
+        ----------
+        result
+            The test result.
+        """
+        if self._file is None:
+            msg = f"CSV report {self.filename} is closed"
+            raise ValueError(msg)
+        self._writerow(self._report_class.convert_to_list(result))
+        self.count += 1
+
+    def _writerow(self, row: list[str]) -> None:
+        """Write a row to the buffer of the file, keeping the first OSError to raise it when the writer is closed."""
+        if self._error is not None:
+            return
+        try:
+            self._writer.writerow(row)
+        except OSError as e:
+            self._error = e
+
+    def close(self) -> None:
+        """Write the buffered rows and close the file.
+
+        Raises
+        ------
+        OSError
+            If the results could not be written to the file.
+        """
+        if self._file is None:
+            return
+        file, self._file = self._file, None
+        try:
+            file.close()
+        except OSError as e:
+            self._error = self._error or e
+        if self._error is not None:
+            raise self._error
+        logger.debug("%d results written to CSV report %s", self.count, self.filename)
@@ -5,11 +5,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, ClassVar, TextIO
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TextIO
 
 from anta.constants import ACRONYM_CATEGORIES, MD_REPORT_TOC, MD_REPORT_TOC_WITH_RUN_OVERVIEW
 from anta.logger import anta_log_exception
@@ -17,7 +19,7 @@ from anta.result_manager.models import AntaTestStatus, TestResult
 from anta.tools import convert_categories, convert_single_category_cached
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable, Iterator
     from pathlib import Path
 
     from anta.result_manager import ResultManager
@@ -47,6 +49,9 @@ STATUS_MAP = {
 }
 """Mapping of `AntaTestStatus` to their string representation with icons and non-breaking spaces for Markdown."""
 
+WRITE_BUFFER_SIZE = 1024 * 1024
+"""Size in bytes of the buffer of the markdown files: the rows of the tables are written to the buffer as they are generated."""
+
 
 class MDReportBase(ABC):
     """Base class for all sections subclasses.
@@ -125,8 +130,7 @@ class MDReportBase(ABC):
             Flag to determine if it's the last table of the markdown file to avoid unnecessary new line. Defaults to False.
         """
         self.mdfile.write("\n".join(table_heading) + "\n")
-        for row in self.generate_rows():
-            self.mdfile.write(row)
+        self.mdfile.writelines(self.generate_rows())
         if not last_table:
             self.mdfile.write("\n")
 
@@ -546,6 +550,7 @@ class TestResults(MDReportBase):
         # Set configuration flags
         self.render_custom_field = report_options.get("render_custom_field", True)
         self.expand_results = report_options.get("expand_results", False)
+        self.stream = report_options.get("stream", False)
 
         if not self.render_custom_field:
             # Override the class variable to remove the "Custom Field" column
@@ -556,7 +561,7 @@ class TestResults(MDReportBase):
 
     def generate_rows(self) -> Generator[str, None, None]:
         """Generate the rows of the all test results table."""
-        for result in self.results.results:
+        for result in self.iter_results():
             # Check if we should render this as an expanded atomic result
             is_expanded = self.expand_results and bool(result.atomic_results)
 
@@ -567,6 +572,16 @@ class TestResults(MDReportBase):
             if is_expanded:
                 yield from self.generate_atomic_rows(result)
 
+    def iter_results(self) -> Iterator[TestResult]:
+        """Iterate over the results to render in the table.
+
+        The results are rendered in the order of the ResultManager. When the `stream` report option is set,
+        the results are rendered grouped by device using the indexes of the ResultManager, so it does not need to be sorted.
+        """
+        if not self.stream:
+            return iter(self.results)
+        return (result for _, results in self.results.iter_groups("device") for result in results)
+
     def generate_atomic_rows(self, result: TestResult) -> Generator[str, None, None]:
         """Generate the rows for atomic results."""
         total_atomic = len(result.atomic_results)
@@ -617,6 +632,148 @@ class TestResults(MDReportBase):
         return f"| {' | '.join(row_parts)} |\n"
 
 
+class TestResultsIndex(MDReportBase):
+    """Generate the `## Test Results` section of the index page of a markdown report split per device or per category.
+
+    The `_report_options` of `extra_data` must provide the `split_by`, `split_directory` and `split_filenames` keys,
+    set by `MDReportGenerator.generate_split()`.
+    """
+
+    ICON = "🧪"
+
+    def __init__(self, mdfile: TextIO, results: ResultManager, extra_data: dict[str, Any] | None = None) -> None:
+        """Initialize the `## Test Results` section of the index page."""
+        super().__init__(mdfile, results, extra_data)
+
+        data = self.extra_data or {}
+        report_options = data.get("_report_options", {})
+
+        self.split_by: Literal["device", "category"] = report_options["split_by"]
+        self.split_directory: str = report_options["split_directory"]
+        self.split_filenames: dict[str, str] = report_options["split_filenames"]
+        self.TABLE_HEADING = self.generate_table_heading(
+            columns=[
+                DEVICE if self.split_by == "device" else TEST_CATEGORY,
+                TOTAL_TESTS,
+                STATUS_MAP[AntaTestStatus.SUCCESS],
+                STATUS_MAP[AntaTestStatus.SKIPPED],
+                STATUS_MAP[AntaTestStatus.FAILURE],
+                STATUS_MAP[AntaTestStatus.ERROR],
+            ]
+        )
+
+    def generate_heading_name(self) -> str:
+        """Return the heading name of the section, `Test Results` as in the table of contents."""
+        return "Test Results"
+
+    def generate_rows(self) -> Generator[str, None, None]:
+        """Generate the rows of the table linking to the report of each device or category."""
+        stats = self.results.device_stats if self.split_by == "device" else self.results.category_stats
+        for name, _ in self.results.iter_groups(self.split_by):
+            stat = stats[name]
+            label = name if self.split_by == "device" else convert_single_category_cached(name)
+            total_tests = stat.tests_success_count + stat.tests_skipped_count + stat.tests_failure_count + stat.tests_error_count + stat.tests_unset_count
+            yield (
+                f"| [{label}]({self.split_directory}/{self.split_filenames[name]}) | {total_tests} | {stat.tests_success_count} | {stat.tests_skipped_count} "
+                f"| {stat.tests_failure_count} | {stat.tests_error_count} |\n"
+            )
+
+    def generate_section(self) -> None:
+        """Generate the `## Test Results` section of the index page."""
+        self.write_heading(heading_level=2)
+        self.write_table(table_heading=self.TABLE_HEADING, last_table=True)
+
+
+class GroupTestResults(TestResults):
+    """Generate the report of a device or a category of a markdown report split per device or per category.
+
+    The report is made of a heading with the name of the device or category, a link to the index page and the table of its test results.
+    """
+
+    def __init__(
+        self,
+        mdfile: TextIO,
+        results: ResultManager,
+        extra_data: dict[str, Any] | None = None,
+        *,
+        title: str,
+        group_results: Iterable[TestResult],
+        index_link: str,
+    ) -> None:
+        """Initialize the report of a device or a category.
+
+        Parameters
+        ----------
+        mdfile
+            An open file object to write the markdown data into.
+        results
+            The ResultsManager instance containing all test results.
+        extra_data
+            Optional extra data dictionary. The `_report_options` key configures the table as in the `TestResults` section.
+        title
+            Title of the report, e.g. the device name.
+        group_results
+            The test results of the device or category.
+        index_link
+            Relative link to the index page.
+        """
+        super().__init__(mdfile, results, extra_data)
+        self.title = title
+        self.group_results = group_results
+        self.index_link = index_link
+
+    def iter_results(self) -> Iterator[TestResult]:
+        """Iterate over the test results of the device or category."""
+        return iter(self.group_results)
+
+    def generate_section(self) -> None:
+        """Generate the report of the device or category."""
+        self.mdfile.write(f"# {self.ICON} {self.title}\n\n[⬅️ Back to the ANTA Report]({self.index_link})\n\n")
+        self.write_table(table_heading=self.TABLE_HEADING, last_table=True)
+
+
+def report_filename(name: str) -> str:
+    """Return the name of the markdown file of a device or a category in a split markdown report.
+
+    Characters which are not letters, digits, dots or dashes are replaced by underscores.
+
+    Parameters
+    ----------
+    name
+        The device or category name.
+
+    Returns
+    -------
+    str
+        The file name.
+    """
+    return re.sub(r"[^\w.-]", "_", name) + ".md"
+
+
+def report_filenames(names: Iterable[str]) -> dict[str, str]:
+    """Return the names of the markdown files of the devices or categories in a split markdown report.
+
+    The file names are built with `report_filename()`. Names leading to the same file name, e.g. `leaf 1` and `leaf/1`,
+    or to file names only differing by case, are suffixed with a short hash of the name so that their reports do not overwrite each other.
+
+    Parameters
+    ----------
+    names
+        The device or category names.
+
+    Returns
+    -------
+    dict[str, str]
+        The file name of each name.
+    """
+    filenames = {name: report_filename(name) for name in names}
+    counts = Counter(filename.casefold() for filename in filenames.values())
+    return {
+        name: f"{filename[:-3]}-{hashlib.sha256(name.encode()).hexdigest()[:8]}.md" if counts[filename.casefold()] > 1 else filename
+        for name, filename in filenames.items()
+    }
+
+
 # pylint: disable=too-few-public-methods
 class MDReportGenerator:
     """Class responsible for generating a Markdown report based on the provided `ResultManager` object.
@@ -630,6 +787,11 @@ class MDReportGenerator:
 
     - `generate_sections`: A custom list of sections is provided. Each section uses its own dedicated result manager instance,
     allowing greater flexibility or isolation between section generations.
+
+    - `generate_split`: The test results are split into one markdown file per device or per category, linked from an index page.
+
+    Set the `stream` key of the `_report_options` of `extra_data` to render the test results grouped by device without sorting the
+    result manager. The files are written through a buffer of `WRITE_BUFFER_SIZE` bytes.
     """
 
     DEFAULT_SECTIONS: ClassVar[list[type[MDReportBase]]] = [
@@ -656,7 +818,7 @@ class MDReportGenerator:
             Optional extra data dictionary that can be used by the section generators to render additional data.
         """
         try:
-            with md_filename.open("w", encoding="utf-8") as mdfile:
+            with md_filename.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as mdfile:
                 for section in cls.DEFAULT_SECTIONS:
                     section(mdfile, results, extra_data).generate_section()
         except OSError as exc:
@@ -678,10 +840,76 @@ class MDReportGenerator:
             Optional extra data dictionary that can be used by the section generators to render additional data.
         """
         try:
-            with md_filename.open("w", encoding="utf-8") as md_file:
+            with md_filename.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as md_file:
                 for section, rm in sections:
                     section(md_file, rm, extra_data).generate_section()
         except OSError as exc:
             message = f"OSError caught while writing the Markdown file '{md_filename.resolve()}'."
             anta_log_exception(exc, message, logger)
             raise
+
+    @classmethod
+    def generate_split(
+        cls,
+        results: ResultManager,
+        md_filename: Path,
+        split_by: Literal["device", "category"],
+        extra_data: dict[str, Any] | None = None,
+        *,
+        test_results: ResultManager | None = None,
+    ) -> list[Path]:
+        """Generate a markdown report split into one file per device or per category.
+
+        The index page is written to `md_filename`: it contains the sections defined in DEFAULT_SECTIONS, except the `Test Results`
+        section which links to the report of each device or category. The reports are written to a directory named after `md_filename`
+        without its suffix, e.g. `report/` for `report.md`. A result with several categories is rendered in the report of each of its categories.
+
+        The results are walked with `ResultManager.iter_groups()` and are not sorted.
+
+        Parameters
+        ----------
+        results
+            The ResultsManager instance containing all test results.
+        md_filename
+            The path to the markdown file to write the index page into.
+        split_by
+            Split the test results per `device` or per `category`.
+        extra_data
+            Optional extra data dictionary that can be used by the section generators to render additional data.
+        test_results
+            Optional ResultsManager instance containing the test results to render in the reports, e.g. a filtered view of `results`.
+            Defaults to `results`.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the reports of the devices or categories.
+        """
+        test_results = results if test_results is None else test_results
+        directory = md_filename.with_suffix("")
+        data = extra_data or {}
+        filenames = report_filenames(name for name, _ in test_results.iter_groups(split_by))
+        report_options = {**data.get("_report_options", {}), "split_by": split_by, "split_directory": directory.name, "split_filenames": filenames}
+        extra_data = {**data, "_report_options": report_options}
+        index_link = f"../{md_filename.name}"
+
+        paths: list[Path] = []
+        try:
+            with md_filename.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as mdfile:
+                for section in cls.DEFAULT_SECTIONS:
+                    if section is TestResults:
+                        TestResultsIndex(mdfile, test_results, extra_data).generate_section()
+                    else:
+                        section(mdfile, results, extra_data).generate_section()
+            directory.mkdir(exist_ok=True)
+            for name, group_results in test_results.iter_groups(split_by):
+                path = directory / filenames[name]
+                title = name if split_by == "device" else convert_single_category_cached(name)
+                with path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as mdfile:
+                    GroupTestResults(mdfile, test_results, extra_data, title=title, group_results=group_results, index_link=index_link).generate_section()
+                paths.append(path)
+        except OSError as exc:
+            message = f"OSError caught while writing the Markdown report '{md_filename.resolve()}'."
+            anta_log_exception(exc, message, logger)
+            raise
+        return paths
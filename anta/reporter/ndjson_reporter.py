@@ -0,0 +1,150 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""NDJSON Report management for ANTA."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    import pathlib
+    import sys
+    from types import TracebackType
+
+    from anta.result_manager.models import TestResult
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+"""Number of characters of serialised results buffered before being written to the file."""
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+"""Maximum time in seconds a serialised result stays buffered while the event loop is running."""
+
+
+class ReportNDJson:
+    """Write test results to a newline-delimited JSON (NDJSON) file as soon as they complete.
+
+    Each result is serialised on its own line, in the format of the `anta nrfu json` entries, when `write()` is called.
+    The lines are buffered and written to the file by a background thread so that the event loop is not blocked by disk I/O.
+    The buffer is flushed when it is full, at most `flush_interval` seconds after a result has been buffered and when
+    the writer is closed. The file only ever contains complete lines and can be tailed while ANTA is running.
+
+    `write()` can be used as the `on_result` callback of `AntaRunner.run()`.
+
+    Examples
+    --------
+    ```python
+    with ReportNDJson(Path("results.ndjson")) as report:
+        ctx = asyncio.run(AntaRunner().run(inventory, catalog, on_result=report.write))
+    ```
+    """
+
+    def __init__(self, filename: pathlib.Path, *, buffer_size: int = DEFAULT_BUFFER_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        """Initialize a ReportNDJson instance.
+
+        The file is truncated.
+
+        Parameters
+        ----------
+        filename
+            Path of the NDJSON file.
+        buffer_size
+            Number of characters of serialised results buffered before being written to the file.
+        flush_interval
+            Maximum time in seconds a serialised result stays buffered while the event loop is running.
+        """
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.count = 0
+        self._file: TextIO | None = filename.open(mode="w", encoding="utf-8")
+        # A single thread writes the buffered lines in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anta-ndjson")
+        self._buffer: list[str] = []
+        self._buffered_size = 0
+        self._last_flush = monotonic()
+        self._timer: asyncio.TimerHandle | None = None
+        self._error: OSError | None = None
+
+    def __enter__(self) -> Self:
+        """Enter the context of the writer."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Flush the buffered results and close the file."""
+        self.close()
+
+    def write(self, result: TestResult) -> None:
+        """Serialise a test result and buffer it.
+
+        Parameters
+        ----------
+        result
+            The test result.
+        """
+        if self._file is None:
+            msg = f"NDJSON report {self.filename} is closed"
+            raise ValueError(msg)
+        line = result.model_dump_json() + "\n"
+        self._buffer.append(line)
+        self._buffered_size += len(line)
+        self.count += 1
+        if self._buffered_size >= self.buffer_size or monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        elif self._timer is None:
+            # Without a running event loop, the buffer is flushed when it is full or when the writer is closed
+            with contextlib.suppress(RuntimeError):
+                self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Write the buffered results to the file in the background."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._last_flush = monotonic()
+        if not self._buffer or self._file is None:
+            return
+        chunk = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered_size = 0
+        self._executor.submit(self._write_chunk, self._file, chunk)
+
+    def _write_chunk(self, file: TextIO, chunk: str) -> None:
+        """Write a chunk of lines to the file and flush it to the OS. Run in the background thread."""
+        if self._error is not None:
+            return
+        try:
+            file.write(chunk)
+            file.flush()
+        except OSError as e:
+            self._error = e
+
+    def close(self) -> None:
+        """Write the buffered results, wait for the pending writes and close the file.
+
+        Raises
+        ------
+        OSError
+            If the results could not be written to the file.
+        """
+        if self._file is None:
+            return
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._file.close()
+        self._file = None
+        if self._error is not None:
+            raise self._error
+        logger.debug("%d results written to NDJSON report %s", self.count, self.filename)
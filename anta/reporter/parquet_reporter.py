@@ -0,0 +1,166 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Parquet Report management for ANTA.
+
+Requires the optional `pyarrow` dependency: `pip install 'anta[parquet]'`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pathlib
+    import sys
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from anta.result_manager.models import TestResult
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+"""Number of results written in each row group of the Parquet file."""
+
+COLUMNS: tuple[str, ...] = ("name", "test", "categories", "description", "result", "messages", "atomic_results", "custom_field")
+"""Columns of the Parquet file, named after the TestResult fields."""
+
+
+class ReportParquet:
+    """Write test results to a Parquet file, a columnar format for analytics tools.
+
+    Device names, test names, categories, descriptions and statuses are dictionary-encoded: each distinct string is stored once
+    per row group. The results are buffered and written as a row group every `row_group_size` results, so the results
+    can be written during the run with a bounded memory usage.
+
+    `write()` can be used as the `on_result` callback of `AntaRunner.run()`.
+
+    Examples
+    --------
+    ```python
+    with ReportParquet(Path("results.parquet")) as report:
+        ctx = asyncio.run(AntaRunner().run(inventory, catalog, on_result=report.write))
+    ```
+    """
+
+    def __init__(self, filename: pathlib.Path, *, row_group_size: int = DEFAULT_ROW_GROUP_SIZE, compression: str = "zstd") -> None:
+        """Initialize a ReportParquet instance.
+
+        The file is truncated.
+
+        Parameters
+        ----------
+        filename
+            Path of the Parquet file.
+        row_group_size
+            Number of results written in each row group.
+        compression
+            Compression codec of the Parquet file, see `pyarrow.parquet.ParquetWriter`.
+
+        Raises
+        ------
+        ImportError
+            If the optional pyarrow dependency is not installed.
+        """
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+            import pyarrow.parquet as pq  # noqa: PLC0415
+        except ImportError as e:
+            msg = "The Parquet report requires the pyarrow package, install it with: pip install 'anta[parquet]'"
+            raise ImportError(msg, name=e.name) from e
+
+        self.filename = filename
+        self.row_group_size = row_group_size
+        self.count = 0
+        string = pa.dictionary(pa.int32(), pa.string())
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("name", string),
+                ("test", string),
+                ("categories", pa.list_(string)),
+                ("description", string),
+                ("result", string),
+                ("messages", pa.list_(pa.string())),
+                ("atomic_results", pa.list_(pa.struct([("description", pa.string()), ("result", string), ("messages", pa.list_(pa.string()))]))),
+                ("custom_field", pa.string()),
+            ]
+        )
+        self._columns: dict[str, list[Any]] = {column: [] for column in COLUMNS}
+        self._writer: Any = pq.ParquetWriter(filename, self._schema, compression=compression)
+
+    def __enter__(self) -> Self:
+        """Enter the context of the writer."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Write the buffered results and close the file."""
+        self.close()
+
+    @classmethod
+    def generate(cls, results: Iterable[TestResult], filename: pathlib.Path, *, row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> None:
+        """Write test results to a Parquet file.
+
+        Parameters
+        ----------
+        results
+            Test results, e.g. a ResultManager.
+        filename
+            Path of the Parquet file.
+        row_group_size
+            Number of results written in each row group.
+        """
+        with cls(filename, row_group_size=row_group_size) as report:
+            for result in results:
+                report.write(result)
+
+    def write(self, result: TestResult) -> None:
+        """Buffer a test result, writing a row group when the buffer is full.
+
+        Parameters
+        ----------
+        result
+            The test result.
+        """
+        if self._writer is None:
+            msg = f"Parquet report {self.filename} is closed"
+            raise ValueError(msg)
+        columns = self._columns
+        columns["name"].append(result.name)
+        columns["test"].append(result.test)
+        columns["categories"].append(result.categories)
+        columns["description"].append(result.description)
+        columns["result"].append(result.result.value)
+        columns["messages"].append(result.messages)
+        columns["atomic_results"].append(
+            [{"description": atomic.description, "result": atomic.result.value, "messages": atomic.messages} for atomic in result.atomic_results]
+        )
+        columns["custom_field"].append(result.custom_field)
+        self.count += 1
+        if len(columns["name"]) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered results as a row group."""
+        if not self._columns["name"] or self._writer is None:
+            return
+        self._writer.write_table(self._pa.table(self._columns, schema=self._schema))
+        self._columns = {column: [] for column in COLUMNS}
+
+    def close(self) -> None:
+        """Write the buffered results and close the file."""
+        if self._writer is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._writer.close()
+            self._writer = None
+        logger.debug("%d results written to Parquet report %s", self.count, self.filename)
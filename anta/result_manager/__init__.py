@@ -6,18 +6,28 @@
 from __future__ import annotations
 
 import logging
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
-from functools import cached_property
-from itertools import chain
-from typing import Any
+from dataclasses import fields
+from functools import cache, partial
+from heapq import merge
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from pydantic import TypeAdapter
 from typing_extensions import deprecated
 
 from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.result_manager.store import CompactResultSelection, CompactResultStore, ResultFields
 
 from .models import CategoryStats, DeviceStats, TestStats
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    # Indexes of the results per status, device, test and categories
+    _Indexes = tuple[dict[AntaTestStatus, array[int]], dict[str, array[int]], dict[str, array[int]], dict[tuple[str, ...], array[int]]]
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +35,76 @@ logger = logging.getLogger(__name__)
 # https://docs.pydantic.dev/latest/api/type_adapter/
 ResultManagerTypeAdapter = TypeAdapter(list[TestResult])
 
+_FAILED_STATUSES = frozenset({AntaTestStatus.FAILURE, AntaTestStatus.ERROR})
+
+# Statuses of the results from which the set attributes of the statistics are built
+_STATS_SETS_STATUSES: dict[str, frozenset[AntaTestStatus]] = {
+    "tests_failure": _FAILED_STATUSES,
+    "categories_failed": _FAILED_STATUSES,
+    "categories_skipped": frozenset({AntaTestStatus.SKIPPED}),
+    "devices_failure": _FAILED_STATUSES,
+}
+
+StatsT = TypeVar("StatsT", DeviceStats, CategoryStats, TestStats)
+
+
+@cache
+def _stats_attributes(stats_type: type[DeviceStats | CategoryStats | TestStats], hide: frozenset[AntaTestStatus]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the count attributes and the set attributes of a statistics class built from the results with a visible status."""
+    # The count attributes are named `tests_<status>_count` or `devices_<status>_count`
+    names = [field.name for field in fields(stats_type)]
+    counts = tuple(name for name in names if name.endswith("_count") and name.split("_")[1] not in hide)
+    sets = tuple(name for name, statuses in _STATS_SETS_STATUSES.items() if name in names and not statuses <= hide)
+    return counts, sets
+
+
+def _combine_stats(target: defaultdict[str, StatsT], source: dict[str, StatsT], hide: frozenset[AntaTestStatus] = frozenset()) -> None:
+    """Add statistics to other statistics, ignoring the results with a hidden status.
+
+    Parameters
+    ----------
+    target
+        Statistics to update.
+    source
+        Statistics to add.
+    hide
+        Statuses of the results to ignore. If a set attribute of the statistics is built from both a hidden
+        and a visible status, the caller must compute the statistics from the results instead.
+    """
+    for key, stats in source.items():
+        count_names, set_names = _stats_attributes(type(stats), hide)
+        counts = [getattr(stats, name) for name in count_names]
+        if not any(counts):
+            continue
+        combined = target[key]
+        for name, count in zip(count_names, counts, strict=True):
+            if count:
+                setattr(combined, name, getattr(combined, name) + count)
+        for name in set_names:
+            values = getattr(stats, name)
+            if values:
+                getattr(combined, name).update(values)
+
+
+def _sort_key(sort_by: list[str]) -> Callable[[TestResult], list[Any]]:
+    """Return the function computing the key to sort results by TestResult fields.
+
+    Parameters
+    ----------
+    sort_by
+        List of TestResult fields to sort the results.
+
+    Raises
+    ------
+    ValueError
+        If some fields are not TestResult fields.
+    """
+    accepted_fields = TestResult.model_fields.keys()
+    if not set(sort_by).issubset(set(accepted_fields)):
+        msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
+        raise ValueError(msg)
+    return lambda result: [getattr(result, field) or "" for field in sort_by]
+
 
 class ResultManager:
     """Manager of ANTA Results.
@@ -47,15 +127,25 @@ class ResultManager:
     If the status of the added test is error, the status is untouched and the
     `error_status` attribute is set to True.
 
+    The statistics and the indexes of the results per status, device, test and categories are updated every time a result is added.
+    The filter methods return a `ResultManagerView` of the results selected with these indexes.
+
+    When created with `compact=True`, the results are kept in a `CompactResultStore` to reduce the memory
+    used by large runs: the messages of successful results are not kept and `TestResult` instances are
+    materialised on demand, e.g. when iterating over the ResultManager instance.
+
     Attributes
     ----------
     results
+    compact
+        Whether or not the results are kept in a `CompactResultStore`.
     dump
     status
         Status rerpesenting all the results.
     error_status
         Will be `True` if a test returned an error.
     results_by_status
+    results_by_category
     dump
     json
     device_stats
@@ -66,24 +156,40 @@ class ResultManager:
     # TODO: Remove the following pylint disable once deprecated methods are removed.
     # pylint: disable=too-many-public-methods
 
-    _results: list[TestResult]
+    _results: list[TestResult] | CompactResultStore | CompactResultSelection
+    compact: bool
     status: AntaTestStatus
     error_status: bool
 
     _device_stats: defaultdict[str, DeviceStats]
     _category_stats: defaultdict[str, CategoryStats]
     _test_stats: defaultdict[str, TestStats]
-    _stats_in_sync: bool
 
-    def __init__(self) -> None:
-        """Initialize a ResultManager instance."""
+    # Positions of the results per status, device, test and categories
+    _status_index: dict[AntaTestStatus, array[int]]
+    _device_index: defaultdict[str, array[int]]
+    _test_index: defaultdict[str, array[int]]
+    _categories_index: defaultdict[tuple[str, ...], array[int]]
+    # Indexes of merged ResultManager instances with the offset and the number of their results, added to the indexes on first use
+    _pending_indexes: list[tuple[int, int, _Indexes]]
+
+    def __init__(self, *, compact: bool = False) -> None:
+        """Initialize a ResultManager instance.
+
+        Parameters
+        ----------
+        compact
+            Keep the results in a `CompactResultStore`.
+        """
+        self.compact = compact
         self.reset()
 
     def reset(self) -> None:
         """Create or reset the attributes of the ResultManager instance."""
-        self._results = []
+        self._results = CompactResultStore() if self.compact else []
         self.status = AntaTestStatus.UNSET
         self.error_status = False
+        self._reset_indexes()
 
         # Initialize the statistics attributes
         self._reset_stats()
@@ -92,10 +198,17 @@ class ResultManager:
         """Implement __len__ method to count number of results."""
         return len(self._results)
 
+    def __iter__(self) -> Iterator[TestResult]:
+        """Iterate over the results, materialising them one at a time for a compact ResultManager."""
+        return iter(self._results)
+
     @property
     def results(self) -> list[TestResult]:
-        """Get the list of TestResult."""
-        return self._results
+        """Get the list of TestResult.
+
+        For a compact ResultManager, all the results are materialised: iterate over the ResultManager instance instead.
+        """
+        return self._results if isinstance(self._results, list) else list(self._results)
 
     @results.setter
     def results(self, value: list[TestResult]) -> None:
@@ -109,29 +222,26 @@ class ResultManager:
     @property
     def dump(self) -> list[dict[str, Any]]:
         """Get a list of dictionary of the results."""
-        return ResultManagerTypeAdapter.dump_python(self._results)
+        return ResultManagerTypeAdapter.dump_python(self.results)
 
     @property
     def json(self) -> str:
         """Get a JSON representation of the results."""
-        return ResultManagerTypeAdapter.dump_json(self._results, indent=4).decode()
+        return ResultManagerTypeAdapter.dump_json(self.results, indent=4).decode()
 
     @property
     def device_stats(self) -> dict[str, DeviceStats]:
         """Get the device statistics."""
-        self._ensure_stats_in_sync()
         return dict(sorted(self._device_stats.items()))
 
     @property
     def category_stats(self) -> dict[str, CategoryStats]:
         """Get the category statistics."""
-        self._ensure_stats_in_sync()
         return dict(sorted(self._category_stats.items()))
 
     @property
     def test_stats(self) -> dict[str, TestStats]:
         """Get the test statistics."""
-        self._ensure_stats_in_sync()
         return dict(sorted(self._test_stats.items()))
 
     @property
@@ -140,15 +250,54 @@ class ResultManager:
         """A property that returns the category_stats dictionary sorted by key name."""
         return self.category_stats
 
-    @cached_property
+    @property
     def results_by_status(self) -> dict[AntaTestStatus, list[TestResult]]:
-        """A cached property that returns the results grouped by status."""
-        return {status: [result for result in self._results if result.result == status] for status in AntaTestStatus}
+        """A property that returns the results grouped by status."""
+        self._ensure_indexes()
+        return {status: [self._results[position] for position in positions] for status, positions in self._status_index.items()}
 
-    @cached_property
+    @property
     def results_by_category(self) -> list[TestResult]:
-        """A cached property that returns the list of results sorted by categories."""
-        return sorted(self._results, key=lambda res: res.categories)
+        """A property that returns the list of results sorted by categories."""
+        self._ensure_indexes()
+        return [self._results[position] for categories in sorted(self._categories_index) for position in self._categories_index[categories]]
+
+    def iter_groups(self, group_by: Literal["device", "category"]) -> Iterator[tuple[str, Iterator[TestResult]]]:
+        """Iterate over the results grouped by device or by category, without sorting the results.
+
+        The groups are yielded sorted by name, using the indexes of the results. The results of a group are yielded one at a time
+        in the order they were added. A result with several categories is yielded in the group of each of its categories.
+
+        Parameters
+        ----------
+        group_by
+            Group the results by `device` or by `category`.
+
+        Raises
+        ------
+        ValueError
+            If `group_by` is not `device` or `category`.
+
+        Yields
+        ------
+        tuple[str, Iterator[TestResult]]
+            The device or category name and an iterator over the results of the group.
+        """
+        self._ensure_indexes()
+        groups: dict[str, list[array[int]]]
+        if group_by == "device":
+            groups = {device: [positions] for device, positions in self._device_index.items()}
+        elif group_by == "category":
+            groups = defaultdict(list)
+            for categories, positions in self._categories_index.items():
+                for category in categories:
+                    groups[category].append(positions)
+        else:
+            msg = f"Cannot group the results by '{group_by}', expected 'device' or 'category'"
+            raise ValueError(msg)
+        for name in sorted(groups):
+            # The positions of each index entry are sorted: merging them keeps the order of the results
+            yield name, map(self._results.__getitem__, merge(*groups[name]))
 
     def _update_status(self, test_status: AntaTestStatus) -> None:
         """Update the status of the ResultManager instance based on the test status.
@@ -171,7 +320,6 @@ class ResultManager:
         self._device_stats = defaultdict(DeviceStats)
         self._category_stats = defaultdict(CategoryStats)
         self._test_stats = defaultdict(TestStats)
-        self._stats_in_sync = False
 
     def _update_stats(self, result: TestResult) -> None:
         """Update the statistics based on the test result.
@@ -204,42 +352,118 @@ class ResultManager:
         if result.result in ("failure", "error"):
             test_stats.devices_failure.add(result.name)
 
-    def _compute_stats(self) -> None:
-        """Compute all statistics from the current results."""
-        logger.info("Computing statistics for all results.")
-
-        # Reset all stats
-        self._reset_stats()
+    def _reset_indexes(self) -> None:
+        """Create or reset the indexes of the results."""
+        self._status_index = {status: array("I") for status in AntaTestStatus}
+        self._device_index = defaultdict(partial(array, "I"))
+        self._test_index = defaultdict(partial(array, "I"))
+        self._categories_index = defaultdict(partial(array, "I"))
+        self._pending_indexes = []
+
+    def _ensure_indexes(self) -> None:
+        """Add the indexes of the merged ResultManager instances to the indexes."""
+        if not self._pending_indexes:
+            return
+        pending, self._pending_indexes = self._pending_indexes, []
+        indexes: _Indexes = (self._status_index, self._device_index, self._test_index, self._categories_index)
+        for offset, size, merged_indexes in pending:
+            for index, merged_index in zip(indexes, merged_indexes, strict=True):
+                for key, positions in merged_index.items():
+                    # Positions are sorted: results added to a merged ResultManager after the merge are ignored
+                    selected = positions[: bisect_left(positions, size)]
+                    if selected:
+                        index[key].extend(map(offset.__add__, selected) if offset else selected)  # type: ignore[index]
+
+    def _fields(self, position: int) -> ResultFields:
+        """Return the device, test, categories and status of a result without materialising it."""
+        if isinstance(self._results, list):
+            result = self._results[position]
+            return result.name, result.test, tuple(result.categories), result.result
+        return self._results.fields(position)
+
+    def _index(self, position: int, result_fields: ResultFields) -> None:
+        """Add the position of a result to the indexes."""
+        name, test, categories, status = result_fields
+        self._status_index[status].append(position)
+        self._device_index[name].append(position)
+        self._test_index[test].append(position)
+        self._categories_index[categories].append(position)
+
+    def _reindex(self) -> None:
+        """Rebuild the indexes of the results."""
+        self._reset_indexes()
+        for position in range(len(self._results)):
+            self._index(position, self._fields(position))
+
+    def _select(self, statuses: set[AntaTestStatus] | None = None, devices: set[str] | None = None, tests: set[str] | None = None) -> list[int]:
+        """Return the positions of the results matching filters, in order.
+
+        The index of the most selective filter is walked and the other filters are checked on the walked results only.
 
-        # Recompute stats for all results
-        for result in self._results:
-            self._update_stats(result)
+        Parameters
+        ----------
+        statuses
+            Statuses of the results to select. None to select all statuses.
+        devices
+            Devices of the results to select. None to select all devices.
+        tests
+            Tests of the results to select. None to select all tests.
+        """
+        self._ensure_indexes()
+        indexes: list[tuple[dict[Any, array[int]], set[Any]]] = [
+            (index, keys) for index, keys in ((self._status_index, statuses), (self._device_index, devices), (self._test_index, tests)) if keys is not None
+        ]
+        if not indexes:
+            return list(range(len(self._results)))
+        index, keys = min(indexes, key=lambda item: sum(len(item[0].get(key, ())) for key in item[1]))
+        positions: Iterable[int] = merge(*(index[key] for key in keys if key in index))
+        if len(indexes) == 1:
+            return list(positions)
+        return [
+            position
+            for position, (name, test, _, status) in ((position, self._fields(position)) for position in positions)
+            if (statuses is None or status in statuses) and (devices is None or name in devices) and (tests is None or test in tests)
+        ]
+
+    def _subset(self, positions: list[int]) -> list[TestResult] | CompactResultSelection:
+        """Return the results at some positions without copying them."""
+        if isinstance(self._results, list):
+            return [self._results[position] for position in positions]
+        return self._results.subset(positions)
+
+    def _append(self, result: TestResult) -> None:
+        """Add a result to the ResultManager instance without updating the statistics."""
+        if self._pending_indexes:
+            self._ensure_indexes()
+        self._index(len(self._results), (result.name, result.test, tuple(result.categories), result.result))
+        self._results.append(result)  # type: ignore[union-attr]
+        self._update_status(result.result)
 
-        self._stats_in_sync = True
+    def _extend(self, other: ResultManager) -> None:
+        """Add the results of another ResultManager instance without updating the statistics.
 
-    def _ensure_stats_in_sync(self) -> None:
-        """Ensure statistics are in sync with current results."""
-        if not self._stats_in_sync:
-            self._compute_stats()
+        The results are concatenated and the indexes of the other ResultManager are added to the indexes on first use.
+        """
+        other._ensure_indexes()
+        indexes: _Indexes = (other._status_index, other._device_index, other._test_index, other._categories_index)
+        self._pending_indexes.append((len(self._results), len(other._results), indexes))
+        self._results.extend(other._results)  # type: ignore[arg-type]
+        self.error_status |= other.error_status
+        self._update_status(other.status)
 
     def add(self, result: TestResult) -> None:
         """Add a result to the ResultManager instance.
 
-        The result is added to the internal list of results and the overall status
-        of the ResultManager instance is updated based on the added test status.
+        The result is added to the internal list of results, the overall status
+        of the ResultManager instance and the statistics are updated based on the added test status.
 
         Parameters
         ----------
         result
             TestResult to add to the ResultManager instance.
         """
-        self._results.append(result)
-        self._update_status(result.result)
-        self._stats_in_sync = False
-
-        # Every time a new result is added, we need to clear the cached properties
-        for name in ["results_by_status", "results_by_category"]:
-            self.__dict__.pop(name, None)
+        self._append(result)
+        self._update_stats(result)
 
     def get_results(self, status: set[AntaTestStatus] | None = None, sort_by: list[str] | None = None) -> list[TestResult]:
         """Get the results, optionally filtered by status and sorted by TestResult fields.
@@ -259,14 +483,10 @@ class ResultManager:
             List of results.
         """
         # Return all results if no status is provided, otherwise return results for multiple statuses
-        results = self._results if status is None else list(chain.from_iterable(self.results_by_status.get(status, []) for status in status))
+        results = self.results if status is None else [self._results[position] for position in self._select(statuses=status)]
 
         if sort_by:
-            accepted_fields = TestResult.model_fields.keys()
-            if not set(sort_by).issubset(set(accepted_fields)):
-                msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
-                raise ValueError(msg)
-            results = sorted(results, key=lambda result: [getattr(result, field) or "" for field in sort_by])
+            results = sorted(results, key=_sort_key(sort_by))
 
         return results
 
@@ -287,10 +507,11 @@ class ResultManager:
         """
         if status is None:
             # Return the total number of results
-            return sum(len(results) for results in self.results_by_status.values())
+            return len(self._results)
 
         # Return the total number of results for multiple statuses
-        return sum(len(self.results_by_status.get(status, [])) for status in status)
+        self._ensure_indexes()
+        return sum(len(self._status_index[status]) for status in status)
 
     def get_status(self, *, ignore_error: bool = False) -> str:
         """Return the current status including error_status if ignore_error is False."""
@@ -304,11 +525,8 @@ class ResultManager:
         sort_by
             List of TestResult fields to sort the results.
         """
-        accepted_fields = TestResult.model_fields.keys()
-        if not set(sort_by).issubset(set(accepted_fields)):
-            msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
-            raise ValueError(msg)
-        self._results.sort(key=lambda result: [getattr(result, field) or "" for field in sort_by])
+        self._results.sort(key=_sort_key(sort_by))
+        self._reindex()
         return self
 
     def filter(self, hide: set[AntaTestStatus]) -> ResultManager:
@@ -322,30 +540,43 @@ class ResultManager:
         Returns
         -------
         ResultManager
-            A filtered `ResultManager`.
+            A `ResultManagerView` of the results.
         """
         possible_statuses = set(AntaTestStatus)
-        manager = ResultManager()
-        manager.results = self.get_results(possible_statuses - hide)
-        return manager
+        return ResultManagerView(self._subset(self._select(statuses=possible_statuses - hide)), compact=self.compact, hidden_from=(self, frozenset(hide)))
 
     @classmethod
-    def merge_results(cls, results_managers: list[ResultManager]) -> ResultManager:
+    def merge_results(cls, results_managers: list[ResultManager], *, sorted_by: list[str] | None = None) -> ResultManager:
         """Merge multiple ResultManager instances.
 
+        The results are concatenated without being added one by one: the statistics of the ResultManager instances
+        are combined and their indexes are added to the indexes of the merged ResultManager on first use.
+        The results of compact ResultManager instances are copied without being materialised.
+
         Parameters
         ----------
         results_managers
             A list of ResultManager instances to merge.
+        sorted_by
+            Optional list of TestResult fields by which the results of each ResultManager are already sorted, e.g. with `sort()`.
+            The results are merged in this order instead of being concatenated.
 
         Returns
         -------
         ResultManager
             A new ResultManager instance containing the results of all the input ResultManagers.
         """
-        combined_results = list(chain(*(rm.results for rm in results_managers)))
-        merged_manager = cls()
-        merged_manager.results = combined_results
+        merged_manager = cls(compact=any(rm.compact for rm in results_managers))
+        if sorted_by is not None:
+            for result in merge(*results_managers, key=_sort_key(sorted_by)):
+                merged_manager._append(result)
+        else:
+            for rm in results_managers:
+                merged_manager._extend(rm)
+        for rm in results_managers:
+            _combine_stats(merged_manager._device_stats, rm.device_stats)
+            _combine_stats(merged_manager._category_stats, rm.category_stats)
+            _combine_stats(merged_manager._test_stats, rm.test_stats)
         return merged_manager
 
     @deprecated("This method is deprecated. This will be removed in ANTA v2.0.0.", category=DeprecationWarning)
@@ -360,11 +591,9 @@ class ResultManager:
         Returns
         -------
         ResultManager
-            A filtered `ResultManager`.
+            A `ResultManagerView` of the results.
         """
-        manager = ResultManager()
-        manager.results = [result for result in self._results if result.test in tests]
-        return manager
+        return ResultManagerView(self._subset(self._select(tests=tests)), compact=self.compact)
 
     @deprecated("This method is deprecated. This will be removed in ANTA v2.0.0.", category=DeprecationWarning)
     def filter_by_devices(self, devices: set[str]) -> ResultManager:
@@ -378,11 +607,9 @@ class ResultManager:
         Returns
         -------
         ResultManager
-            A filtered `ResultManager`.
+            A `ResultManagerView` of the results.
         """
-        manager = ResultManager()
-        manager.results = [result for result in self._results if result.name in devices]
-        return manager
+        return ResultManagerView(self._subset(self._select(devices=devices)), compact=self.compact)
 
     @deprecated("This method is deprecated. This will be removed in ANTA v2.0.0.", category=DeprecationWarning)
     def get_tests(self) -> set[str]:
@@ -393,7 +620,8 @@ class ResultManager:
         set[str]
             Set of test names.
         """
-        return {str(result.test) for result in self._results}
+        self._ensure_indexes()
+        return set(self._test_index)
 
     @deprecated("This method is deprecated. This will be removed in ANTA v2.0.0.", category=DeprecationWarning)
     def get_devices(self) -> set[str]:
@@ -404,4 +632,88 @@ class ResultManager:
         set[str]
             Set of device names.
         """
-        return {str(result.name) for result in self._results}
+        self._ensure_indexes()
+        return set(self._device_index)
+
+
+class ResultManagerView(ResultManager):
+    """Read-only view of the results of a ResultManager matching filters.
+
+    A view is returned by the filter methods of `ResultManager`. The results are not copied: they are shared with the
+    ResultManager and selected with its indexes, so creating a view, or a view of a view, costs O(matching results).
+    The statistics of a view are computed from its results on first access. When the view only hides test statuses,
+    they are instead derived from the statistics of the ResultManager when the view is created, so results added
+    to the ResultManager afterwards are not counted.
+
+    Results cannot be added to a view. A view of a compact ResultManager is invalidated when the ResultManager is sorted.
+    """
+
+    def __init__(
+        self,
+        results: list[TestResult] | CompactResultSelection,
+        *,
+        compact: bool = False,
+        hidden_from: tuple[ResultManager, frozenset[AntaTestStatus]] | None = None,
+    ) -> None:
+        """Initialize a ResultManagerView instance.
+
+        Parameters
+        ----------
+        results
+            Selected results of a ResultManager.
+        compact
+            Whether or not the ResultManager is compact.
+        hidden_from
+            ResultManager and statuses hidden by the view, if the view only filters the results of this ResultManager by status.
+        """
+        super().__init__(compact=compact)
+        self._results = results
+        for position in range(len(results)):
+            result_fields = self._fields(position)
+            self._index(position, result_fields)
+            self._update_status(result_fields[3])
+        self._stats_computed = False
+        # The statistics are derived from the ResultManager only if the hidden statuses do not split the sets of failed tests and categories
+        if hidden_from is not None and (hidden_from[1] >= _FAILED_STATUSES or hidden_from[1].isdisjoint(_FAILED_STATUSES)):
+            manager, hidden = hidden_from
+            _combine_stats(self._device_stats, manager.device_stats, hidden)
+            _combine_stats(self._category_stats, manager.category_stats, hidden)
+            _combine_stats(self._test_stats, manager.test_stats, hidden)
+            self._stats_computed = True
+
+    def _ensure_stats(self) -> None:
+        """Compute the statistics of the view from its results on first access."""
+        if self._stats_computed:
+            return
+        self._stats_computed = True
+        for result in self._results:
+            self._update_stats(result)
+
+    @property
+    def device_stats(self) -> dict[str, DeviceStats]:
+        """Get the device statistics."""
+        self._ensure_stats()
+        return super().device_stats
+
+    @property
+    def category_stats(self) -> dict[str, CategoryStats]:
+        """Get the category statistics."""
+        self._ensure_stats()
+        return super().category_stats
+
+    @property
+    def test_stats(self) -> dict[str, TestStats]:
+        """Get the test statistics."""
+        self._ensure_stats()
+        return super().test_stats
+
+    def add(self, result: TestResult) -> None:
+        """Raise a TypeError: results cannot be added to a view.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        msg = f"Cannot add {result.test} result to a ResultManagerView"
+        raise TypeError(msg)
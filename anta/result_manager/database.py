@@ -0,0 +1,351 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""SQLite database of ANTA test results used to store and query the results of many runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal
+
+from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus, TestResult
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import Collection, Iterable, Iterator, Sequence
+    from pathlib import Path
+    from types import TracebackType
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+"""Version of the database schema, stored in the SQLite `user_version` pragma."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    start_time TEXT,
+    end_time TEXT,
+    duration REAL,
+    cancel_reason TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    device TEXT NOT NULL,
+    test TEXT NOT NULL,
+    categories TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL,
+    messages TEXT NOT NULL,
+    atomic_results TEXT,
+    custom_field TEXT
+);
+CREATE INDEX IF NOT EXISTS results_run_id ON results (run_id);
+CREATE INDEX IF NOT EXISTS results_device ON results (device);
+CREATE INDEX IF NOT EXISTS results_test ON results (test);
+CREATE INDEX IF NOT EXISTS results_status ON results (status);
+"""
+
+ResultGroupBy = Literal["run", "device", "test", "status"]
+"""Field the results can be grouped by in `ResultDatabase.count()`."""
+
+_GROUP_BY_COLUMNS: dict[str, str] = {"run": "run_id", "device": "device", "test": "test", "status": "status"}
+
+
+@dataclass(frozen=True)
+class StoredRun:
+    """ANTA run stored in a ResultDatabase.
+
+    Attributes
+    ----------
+    id
+        Identifier of the run in the database, increasing with each stored run.
+    start_time
+        Time when the run started.
+    end_time
+        Time when the run ended.
+    duration
+        Duration of the run in seconds.
+    cancel_reason
+        Reason why the run was cancelled, None if it was not.
+    total_results
+        Number of results stored for the run.
+    """
+
+    id: int
+    start_time: datetime | None
+    end_time: datetime | None
+    duration: float | None
+    cancel_reason: str | None
+    total_results: int
+
+
+class ResultDatabase:
+    """SQLite database storing the test results of ANTA runs.
+
+    Each run is stored with its start and end times and the device, test, categories, status and messages of its results,
+    indexed by device, test and status. The database can be queried across runs with `count()` and `results()`,
+    and a stored run can be loaded back in a `ResultManager` with `load()` to be rendered by the reporters.
+
+    Examples
+    --------
+    ```python
+    with ResultDatabase(Path("anta.db")) as db:
+        db.add_run(ctx.manager, start_time=ctx.start_time, end_time=ctx.end_time)
+        # Failures by test across the last 10 runs
+        db.count(["test"], runs=[run.id for run in db.runs(last=10)], statuses={AntaTestStatus.FAILURE})
+    ```
+    """
+
+    def __init__(self, filename: Path) -> None:
+        """Initialize a ResultDatabase instance.
+
+        The database file and its schema are created if needed.
+
+        Parameters
+        ----------
+        filename
+            Path of the SQLite database file.
+
+        Raises
+        ------
+        sqlite3.DatabaseError
+            If the file is not an ANTA result database.
+        """
+        self.filename = filename
+        self._connection = sqlite3.connect(filename)
+        try:
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                msg = f"Unsupported schema version {version} of result database {filename}"
+                raise sqlite3.DatabaseError(msg)
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            with self._connection:
+                self._connection.executescript(_SCHEMA)
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> Self:
+        """Enter the database context."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def add_run(
+        self, results: Iterable[TestResult], *, start_time: datetime | None = None, end_time: datetime | None = None, cancel_reason: str | None = None
+    ) -> int:
+        """Store the results of a run in a single transaction.
+
+        Parameters
+        ----------
+        results
+            Test results of the run. They are consumed one at a time.
+        start_time
+            Time when the run started.
+        end_time
+            Time when the run ended.
+        cancel_reason
+            Reason why the run was cancelled, if it was.
+
+        Returns
+        -------
+        int
+            Identifier of the stored run.
+        """
+        duration = (end_time - start_time).total_seconds() if start_time is not None and end_time is not None else None
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (start_time, end_time, duration, cancel_reason) VALUES (?, ?, ?, ?)",
+                (start_time.isoformat() if start_time else None, end_time.isoformat() if end_time else None, duration, cancel_reason),
+            )
+            run_id = cursor.lastrowid
+            if run_id is None:  # pragma: no cover
+                msg = "SQLite did not return the identifier of the stored run"
+                raise sqlite3.DatabaseError(msg)
+            self._connection.executemany(
+                "INSERT INTO results (run_id, device, test, categories, description, status, messages, atomic_results, custom_field) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._row(run_id, result) for result in results),
+            )
+        logger.debug("Run %d stored in result database %s", run_id, self.filename)
+        return run_id
+
+    @staticmethod
+    def _row(run_id: int, result: TestResult) -> tuple[Any, ...]:
+        """Return the row of a test result in the results table."""
+        return (
+            run_id,
+            result.name,
+            result.test,
+            json.dumps(result.categories),
+            result.description,
+            result.result.value,
+            json.dumps(result.messages),
+            json.dumps([atomic.model_dump(mode="json") for atomic in result.atomic_results]) if result.atomic_results else None,
+            result.custom_field,
+        )
+
+    def runs(self, last: int | None = None) -> list[StoredRun]:
+        """Return the stored runs, the most recent first.
+
+        Parameters
+        ----------
+        last
+            Only return this number of most recent runs.
+        """
+        rows = self._connection.execute(
+            "SELECT runs.id, start_time, end_time, duration, cancel_reason, (SELECT COUNT(*) FROM results WHERE run_id = runs.id) "
+            "FROM runs ORDER BY runs.id DESC LIMIT ?",
+            (-1 if last is None else last,),
+        )
+        return [
+            StoredRun(
+                id=run_id,
+                start_time=datetime.fromisoformat(start_time) if start_time else None,
+                end_time=datetime.fromisoformat(end_time) if end_time else None,
+                duration=duration,
+                cancel_reason=cancel_reason,
+                total_results=total_results,
+            )
+            for run_id, start_time, end_time, duration, cancel_reason, total_results in rows
+        ]
+
+    @staticmethod
+    def _where(
+        runs: Collection[int] | None, statuses: Collection[AntaTestStatus] | None, devices: Collection[str] | None, tests: Collection[str] | None
+    ) -> tuple[str, list[Any]]:
+        """Return the WHERE clause of a query on the results table and its parameters."""
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        for column, values in (("run_id", runs), ("status", statuses), ("device", devices), ("test", tests)):
+            if values is not None:
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                parameters.extend(values)
+        return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), parameters
+
+    def count(
+        self,
+        group_by: Sequence[ResultGroupBy] = (),
+        *,
+        runs: Collection[int] | None = None,
+        statuses: Collection[AntaTestStatus] | None = None,
+        devices: Collection[str] | None = None,
+        tests: Collection[str] | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Count the stored results, grouped by some of their fields.
+
+        Parameters
+        ----------
+        group_by
+            Fields to group the results by. The results are not grouped if empty.
+        runs
+            Only count the results of these runs.
+        statuses
+            Only count the results with these statuses.
+        devices
+            Only count the results of these devices.
+        tests
+            Only count the results of these tests.
+
+        Returns
+        -------
+        list[tuple[Any, ...]]
+            One tuple per group with the values of the `group_by` fields followed by the number of results, the largest groups first.
+        """
+        columns = [_GROUP_BY_COLUMNS[field] for field in group_by]
+        where, parameters = self._where(runs, statuses, devices, tests)
+        query = f"SELECT {''.join(f'{column}, ' for column in columns)}COUNT(*) FROM results{where}"  # noqa: S608
+        if columns:
+            query += f" GROUP BY {', '.join(columns)} ORDER BY COUNT(*) DESC, {', '.join(columns)}"
+        rows = self._connection.execute(query, parameters).fetchall()
+        if "status" in group_by:
+            index = list(group_by).index("status")
+            rows = [(*row[:index], AntaTestStatus(row[index]), *row[index + 1 :]) for row in rows]
+        return rows
+
+    def results(
+        self,
+        *,
+        runs: Collection[int] | None = None,
+        statuses: Collection[AntaTestStatus] | None = None,
+        devices: Collection[str] | None = None,
+        tests: Collection[str] | None = None,
+    ) -> Iterator[TestResult]:
+        """Yield the stored results, in the order they were stored.
+
+        Parameters
+        ----------
+        runs
+            Only yield the results of these runs.
+        statuses
+            Only yield the results with these statuses.
+        devices
+            Only yield the results of these devices.
+        tests
+            Only yield the results of these tests.
+        """
+        where, parameters = self._where(runs, statuses, devices, tests)
+        cursor = self._connection.execute(
+            f"SELECT device, test, categories, description, status, messages, atomic_results, custom_field FROM results{where} ORDER BY rowid",  # noqa: S608
+            parameters,
+        )
+        for device, test, categories, description, status, messages, atomic_results, custom_field in cursor:
+            yield TestResult.from_dump(
+                {
+                    "name": device,
+                    "test": test,
+                    "categories": json.loads(categories),
+                    "description": description,
+                    "result": status,
+                    "messages": json.loads(messages),
+                    "atomic_results": json.loads(atomic_results) if atomic_results else [],
+                    "custom_field": custom_field,
+                }
+            )
+
+    def load(self, run_id: int | None = None, *, compact: bool = False) -> ResultManager:
+        """Load the results of a stored run in a ResultManager.
+
+        Parameters
+        ----------
+        run_id
+            Identifier of the run. Defaults to the most recent run.
+        compact
+            Keep the results in a compact form, see `ResultManager`.
+
+        Raises
+        ------
+        ValueError
+            If the run does not exist.
+        """
+        if run_id is None:
+            runs = self.runs(last=1)
+            if not runs:
+                msg = f"No run stored in result database {self.filename}"
+                raise ValueError(msg)
+            run_id = runs[0].id
+        elif self._connection.execute("SELECT 1 FROM runs WHERE id = ?", (run_id,)).fetchone() is None:
+            msg = f"Run {run_id} not found in result database {self.filename}"
+            raise ValueError(msg)
+        manager = ResultManager(compact=compact)
+        for result in self.results(runs=[run_id]):
+            manager.add(result)
+        return manager
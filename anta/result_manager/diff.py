@@ -0,0 +1,180 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Comparison of the test results of two ANTA runs."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from anta.result_manager.models import AntaTestStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from anta.result_manager.models import TestResult
+
+ResultKey = tuple[Hashable, ...]
+"""Key identifying a test result across runs."""
+
+FAILED_STATUSES: frozenset[AntaTestStatus] = frozenset({AntaTestStatus.FAILURE, AntaTestStatus.ERROR})
+"""Statuses of the test results counted as failures by `diff_results()`."""
+
+
+@dataclass(frozen=True)
+class AntaStatusChange:
+    """Change of a test result between two ANTA runs, e.g. two iterations of an ANTA watch run.
+
+    Attributes
+    ----------
+    previous: TestResult | None
+        Result of the previous run. None if the test was not run in the previous run.
+    current: TestResult | None
+        Result of the current run. None if the test was not run in the current run,
+        e.g. the device became unreachable.
+    """
+
+    previous: TestResult | None
+    current: TestResult | None
+
+    @property
+    def result(self) -> TestResult:
+        """Most recent result of the test."""
+        result = self.current if self.current is not None else self.previous
+        if result is None:  # pragma: no cover
+            msg = "AntaStatusChange must hold at least one result"
+            raise ValueError(msg)
+        return result
+
+    @property
+    def previous_status(self) -> AntaTestStatus | None:
+        """Status of the test in the previous run."""
+        return self.previous.result if self.previous is not None else None
+
+    @property
+    def current_status(self) -> AntaTestStatus | None:
+        """Status of the test in the current run."""
+        return self.current.result if self.current is not None else None
+
+
+def iter_keyed_results(results: Iterable[TestResult]) -> Iterator[tuple[ResultKey, TestResult]]:
+    """Yield test results with the key identifying them across runs.
+
+    The key is made of the device name, test name, description and custom field of the result.
+    The same test can be defined multiple times in a catalog with different inputs: JSON reports, NDJSON reports
+    and result databases do not store the test inputs, so these results cannot be told apart. They are sorted by
+    status and messages and numbered in this order, so that the same results are matched whatever the order
+    they were reported in. Only run journals, keyed by test inputs digest, match each definition of a test exactly.
+
+    Parameters
+    ----------
+    results
+        Test results of a run.
+    """
+    groups: dict[tuple[str, str, str, str | None], list[TestResult]] = defaultdict(list)
+    for result in results:
+        groups[(result.name, result.test, result.description, result.custom_field)].append(result)
+    for key, group in groups.items():
+        if len(group) > 1:
+            group.sort(key=lambda result: (result.result, result.messages))
+        for occurrence, result in enumerate(group):
+            yield (*key, occurrence), result
+
+
+def index_results(results: Iterable[TestResult]) -> dict[ResultKey, TestResult]:
+    """Index test results by the key identifying them across runs, see `iter_keyed_results()`.
+
+    Parameters
+    ----------
+    results
+        Test results of a run.
+    """
+    return dict(iter_keyed_results(results))
+
+
+@dataclass
+class ResultDiff:
+    """Differences between the test results of a baseline run and a current run.
+
+    A change can be listed in several attributes, e.g. a new failure is also a status change.
+
+    Attributes
+    ----------
+    status_changed
+        Tests run in both runs whose status changed.
+    new_failures
+        Tests failing or in error in the current run which were not failing or in error in the baseline run, or not run.
+    fixed_failures
+        Tests failing or in error in the baseline run which are not failing or in error in the current run.
+    messages_changed
+        Tests run in both runs with the same status but different messages.
+    added
+        Tests only run in the current run.
+    removed
+        Tests only run in the baseline run.
+    unchanged
+        Number of tests with the same status and messages in both runs.
+    """
+
+    status_changed: list[AntaStatusChange] = field(default_factory=list)
+    new_failures: list[AntaStatusChange] = field(default_factory=list)
+    fixed_failures: list[AntaStatusChange] = field(default_factory=list)
+    messages_changed: list[AntaStatusChange] = field(default_factory=list)
+    added: list[AntaStatusChange] = field(default_factory=list)
+    removed: list[AntaStatusChange] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def diff_results(
+    baseline: Iterable[TestResult] | Mapping[ResultKey, TestResult],
+    current: Iterable[TestResult] | Mapping[ResultKey, TestResult],
+) -> ResultDiff:
+    """Compare the test results of two runs.
+
+    The results are joined on their key with a hash table of the baseline results: each current result is looked up once.
+
+    When both runs are mappings, e.g. the entries of two `ResultJournal` keyed by device, test and inputs digest,
+    their keys are used. Otherwise the results are keyed with `iter_keyed_results()`.
+
+    Parameters
+    ----------
+    baseline
+        Test results of the baseline run, e.g. a ResultManager.
+    current
+        Test results of the current run, e.g. a ResultManager.
+
+    Returns
+    -------
+    ResultDiff
+        The differences between the two runs.
+    """
+    if isinstance(baseline, Mapping) and isinstance(current, Mapping):
+        pending = dict(baseline)
+        current_items: Iterable[tuple[ResultKey, TestResult]] = current.items()
+    else:
+        pending = index_results(baseline.values() if isinstance(baseline, Mapping) else baseline)
+        current_items = iter_keyed_results(current.values() if isinstance(current, Mapping) else current)
+
+    diff = ResultDiff()
+    for key, result in current_items:
+        previous = pending.pop(key, None)
+        change = AntaStatusChange(previous=previous, current=result)
+        if previous is None:
+            diff.added.append(change)
+            if result.result in FAILED_STATUSES:
+                diff.new_failures.append(change)
+        elif previous.result != result.result:
+            diff.status_changed.append(change)
+            if result.result in FAILED_STATUSES and previous.result not in FAILED_STATUSES:
+                diff.new_failures.append(change)
+            elif previous.result in FAILED_STATUSES and result.result not in FAILED_STATUSES:
+                diff.fixed_failures.append(change)
+        elif previous.messages != result.messages:
+            diff.messages_changed.append(change)
+        else:
+            diff.unchanged += 1
+    diff.removed = [AntaStatusChange(previous=result, current=None) for result in pending.values()]
+    return diff
@@ -0,0 +1,171 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""On-disk journal of ANTA test results used to checkpoint and resume runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TextIO
+
+from pydantic import ValidationError
+
+from anta.logger import exc_to_str
+from anta.result_manager.models import TestResult
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import Mapping
+    from pathlib import Path
+    from types import TracebackType
+
+    from anta.models import AntaTest
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+JournalKey = tuple[str, str, str]
+"""Key of a journal entry: device name, test name and test inputs digest."""
+
+
+def input_digest(inputs: AntaTest.Input) -> str:
+    """Return a stable digest of AntaTest inputs.
+
+    Unlike `hash()`, the digest is stable across Python processes and can be stored on disk.
+
+    Parameters
+    ----------
+    inputs
+        The AntaTest inputs.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the inputs.
+    """
+    return hashlib.blake2b(inputs.model_dump_json().encode(), digest_size=16).hexdigest()
+
+
+class ResultJournal:
+    """Append-only journal of test results stored as JSON lines.
+
+    Each completed test result is appended to the journal and flushed to disk so that the results
+    of an interrupted run are not lost. An existing journal can be reloaded to resume the run,
+    only scheduling the tests that are missing from the journal or in error. The entry of a test run
+    again replaces its previous entry when the journal is reloaded.
+
+    Entries are keyed by device name, test name and test inputs digest.
+
+    Examples
+    --------
+    ```python
+    with ResultJournal(Path("anta.journal"), resume=True) as journal:
+        ctx = asyncio.run(AntaRunner().run(inventory, catalog, journal=journal))
+    ```
+    """
+
+    def __init__(self, filename: Path, *, resume: bool = False) -> None:
+        """Initialize a ResultJournal.
+
+        Parameters
+        ----------
+        filename
+            Path of the journal file.
+        resume
+            Load the entries of an existing journal file and append new entries to it.
+            Otherwise the journal file is truncated when the first entry is appended.
+        """
+        self.filename = filename
+        self.resume = resume
+        self._entries: dict[JournalKey, TestResult] = {}
+        self._file: TextIO | None = None
+        if resume and filename.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the journal."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the journal contains an entry for the key."""
+        return key in self._entries
+
+    def __enter__(self) -> Self:
+        """Enter the journal context."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Close the journal file."""
+        self.close()
+
+    @property
+    def entries(self) -> Mapping[JournalKey, TestResult]:
+        """Results stored in the journal, keyed by device name, test name and test inputs digest."""
+        return MappingProxyType(self._entries)
+
+    def get(self, key: JournalKey) -> TestResult | None:
+        """Return the result stored in the journal for the key, or None if missing."""
+        return self._entries.get(key)
+
+    def _load(self) -> None:
+        """Load the entries of the journal file.
+
+        Invalid lines, e.g. a partially written last line after a crash, are skipped.
+        """
+        with self.filename.open(encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    key = (entry["device"], entry["test"], entry["inputs"])
+                    self._entries[key] = TestResult.from_dump(entry["result"])
+                except (ValueError, KeyError, TypeError, ValidationError) as e:
+                    logger.warning("Skipping invalid entry at line %s of journal %s: %s", line_number, self.filename, exc_to_str(e))
+        logger.info("Loaded %s entries from journal %s", len(self._entries), self.filename)
+
+    def _open(self) -> TextIO:
+        """Open the journal file for writing."""
+        if not self.resume or not self.filename.exists():
+            return self.filename.open(mode="w", encoding="utf-8")
+        # Terminate a partially written last line so that new entries start on a new line
+        partial_line = False
+        with self.filename.open(mode="rb") as file:
+            if file.seek(0, os.SEEK_END) > 0:
+                file.seek(-1, os.SEEK_END)
+                partial_line = file.read(1) != b"\n"
+        file = self.filename.open(mode="a", encoding="utf-8")
+        if partial_line:
+            file.write("\n")
+        return file
+
+    def append(self, key: JournalKey, result: TestResult) -> None:
+        """Append a test result to the journal and flush it to disk.
+
+        Parameters
+        ----------
+        key
+            Key of the entry: device name, test name and test inputs digest.
+        result
+            The test result.
+        """
+        if self._file is None:
+            self._file = self._open()
+        device, test, inputs = key
+        self._file.write(json.dumps({"device": device, "test": test, "inputs": inputs, "result": result.model_dump(mode="json")}) + "\n")
+        self._file.flush()
+        self._entries[key] = result
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -179,6 +179,30 @@ class TestResult(BaseTestResult):
         messages = f"\nMessages:\n{lines}" if self.messages else ""
         return f"Test {self.test} (on {self.name}): {results}{messages}"
 
+    @classmethod
+    def from_dump(cls, data: dict[str, Any]) -> TestResult:
+        """Create a TestResult from the output of `model_dump()`, e.g. an entry of the JSON report.
+
+        Unlike `model_validate()`, the atomic results are created with this TestResult as parent,
+        without adding their messages to it a second time.
+
+        Parameters
+        ----------
+        data
+            Dumped TestResult.
+        """
+        atomic_results = data.get("atomic_results") or []
+        result = cls.model_validate({**data, "atomic_results": []})
+        if atomic_results:
+            # Creating the atomic results updates the messages and the status of their parent: restore them afterwards
+            messages, status = result.messages, result.result
+            result.messages = []
+            for atomic in atomic_results:
+                result.atomic_results.append(AtomicTestResult.model_validate({**atomic, "parent": result}))
+            result.messages = messages
+            result.result = status
+        return result
+
     def add(self, description: str, status: AntaTestStatus = AntaTestStatus.UNSET, messages: list[str] | None = None) -> AtomicTestResult:
         """Create and add a new AtomicTestResult to this TestResult instance.
 
@@ -0,0 +1,344 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Compact storage of test results for large runs."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from anta.result_manager.models import AntaTestStatus, AtomicTestResult, TestResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+STATUSES: tuple[AntaTestStatus, ...] = tuple(AntaTestStatus)
+"""Test statuses, indexed by their code in a CompactResultStore."""
+
+_STATUS_CODES: dict[AntaTestStatus, int] = {status: code for code, status in enumerate(STATUSES)}
+
+# Atomic result stored as the interned description, the status code and the messages
+_AtomicRecord = tuple[int, int, tuple[str, ...]]
+
+# Device, test, categories and status of a result
+ResultFields = tuple[str, str, tuple[str, ...], AntaTestStatus]
+
+
+class CompactResultStore(Sequence[TestResult]):
+    """Sequence of test results stored in a compact form.
+
+    A `TestResult` is a pydantic model with its own dictionary and lists: millions of them use gigabytes of memory.
+    This store keeps each result as a few integers in arrays instead:
+
+    - device names, test names, descriptions and custom fields are interned in a table of strings,
+    - categories are interned as tuples of strings,
+    - the status is a one-byte code,
+    - messages are only kept for results which are not successful,
+    - atomic results are kept in a mapping only for the results having some.
+
+    `TestResult` instances are materialised on demand when the store is indexed or iterated. They are copies:
+    modifying them does not modify the store.
+    """
+
+    __slots__ = (
+        "_atomic_results",
+        "_categories",
+        "_categories_ids",
+        "_category_ids",
+        "_custom_field_ids",
+        "_description_ids",
+        "_messages",
+        "_name_ids",
+        "_statuses",
+        "_string_ids",
+        "_strings",
+        "_test_ids",
+        "_version",
+    )
+
+    def __init__(self, results: Iterable[TestResult] = ()) -> None:
+        """Initialize a CompactResultStore instance.
+
+        Parameters
+        ----------
+        results
+            Test results to store.
+        """
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self._categories: list[tuple[str, ...]] = []
+        self._categories_ids: dict[tuple[str, ...], int] = {}
+        self._name_ids = array("I")
+        self._test_ids = array("I")
+        self._description_ids = array("I")
+        self._category_ids = array("I")
+        # -1 when the result has no custom field
+        self._custom_field_ids = array("i")
+        self._statuses = bytearray()
+        self._messages: dict[int, tuple[str, ...]] = {}
+        self._atomic_results: dict[int, tuple[_AtomicRecord, ...]] = {}
+        # Incremented when the results are reordered, to detect stale selections
+        self._version = 0
+        for result in results:
+            self.append(result)
+
+    def _intern(self, value: str) -> int:
+        """Return the index of a string in the table of strings, adding it if needed."""
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def _intern_categories(self, categories: list[str]) -> int:
+        """Return the index of categories in the table of categories, adding them if needed."""
+        key = tuple(categories)
+        index = self._categories_ids.get(key)
+        if index is None:
+            index = self._categories_ids[key] = len(self._categories)
+            self._categories.append(tuple(self._strings[self._intern(category)] for category in key))
+        return index
+
+    def append(self, result: TestResult) -> None:
+        """Store a test result.
+
+        Parameters
+        ----------
+        result
+            TestResult to store. The messages of a successful result are not stored.
+        """
+        index = len(self._statuses)
+        keep_messages = result.result != AntaTestStatus.SUCCESS
+        self._name_ids.append(self._intern(result.name))
+        self._test_ids.append(self._intern(result.test))
+        self._description_ids.append(self._intern(result.description))
+        self._category_ids.append(self._intern_categories(result.categories))
+        self._custom_field_ids.append(-1 if result.custom_field is None else self._intern(result.custom_field))
+        self._statuses.append(_STATUS_CODES[result.result])
+        if keep_messages and result.messages:
+            self._messages[index] = tuple(result.messages)
+        if result.atomic_results:
+            self._atomic_results[index] = tuple(
+                (self._intern(atomic.description), _STATUS_CODES[atomic.result], tuple(atomic.messages) if keep_messages else ()) for atomic in result.atomic_results
+            )
+
+    def extend(self, results: Iterable[TestResult]) -> None:
+        """Store test results.
+
+        The results of another CompactResultStore are copied without being materialised: only its tables of strings
+        and categories are interned in this store, and its arrays are copied with the indexes remapped to this store.
+
+        Parameters
+        ----------
+        results
+            TestResults to store.
+        """
+        if isinstance(results, CompactResultStore):
+            self._copy(results)
+            return
+        for result in results:
+            self.append(result)
+
+    def _copy(self, other: CompactResultStore) -> None:
+        """Store the results of another CompactResultStore without materialising them."""
+        offset = len(self)
+        string_ids = array("I", map(self._intern, list(other._strings)))
+        category_ids = array("I", (self._intern_categories(list(categories)) for categories in list(other._categories)))
+        # Index -1 of a custom field, when the result has no custom field, is mapped to the last item: -1
+        custom_field_ids = array("i", [*string_ids, -1])
+        if string_ids == array("I", range(len(string_ids))):
+            # The strings of the other store are the first strings of this store: the indexes are the same
+            self._name_ids.extend(other._name_ids)
+            self._test_ids.extend(other._test_ids)
+            self._description_ids.extend(other._description_ids)
+            self._custom_field_ids.extend(other._custom_field_ids)
+        else:
+            self._name_ids.extend(array("I", map(string_ids.__getitem__, other._name_ids)))
+            self._test_ids.extend(array("I", map(string_ids.__getitem__, other._test_ids)))
+            self._description_ids.extend(array("I", map(string_ids.__getitem__, other._description_ids)))
+            self._custom_field_ids.extend(array("i", map(custom_field_ids.__getitem__, other._custom_field_ids)))
+        if category_ids == array("I", range(len(category_ids))):
+            self._category_ids.extend(other._category_ids)
+        else:
+            self._category_ids.extend(array("I", map(category_ids.__getitem__, other._category_ids)))
+        self._statuses.extend(other._statuses)
+        self._messages.update({offset + index: messages for index, messages in list(other._messages.items())})
+        self._atomic_results.update(
+            {
+                offset + index: tuple((string_ids[description_id], code, messages) for description_id, code, messages in records)
+                for index, records in list(other._atomic_results.items())
+            }
+        )
+
+    @property
+    def version(self) -> int:
+        """Number of times the stored results have been reordered."""
+        return self._version
+
+    def fields(self, index: int) -> ResultFields:
+        """Return the device, test, categories and status of a stored result without materialising it."""
+        return (
+            self._strings[self._name_ids[index]],
+            self._strings[self._test_ids[index]],
+            self._categories[self._category_ids[index]],
+            STATUSES[self._statuses[index]],
+        )
+
+    def subset(self, positions: list[int]) -> CompactResultSelection:
+        """Return a selection of the stored results, without copying them.
+
+        Parameters
+        ----------
+        positions
+            Positions of the selected results in the store.
+        """
+        return CompactResultSelection(self, positions)
+
+    def _materialise(self, index: int) -> TestResult:
+        """Create the TestResult instance of a stored result."""
+        strings = self._strings
+        custom_field_id = self._custom_field_ids[index]
+        status = STATUSES[self._statuses[index]]
+        # Validation is skipped: the stored values come from valid TestResult instances
+        result = TestResult.model_construct(
+            name=strings[self._name_ids[index]],
+            test=strings[self._test_ids[index]],
+            categories=list(self._categories[self._category_ids[index]]),
+            description=strings[self._description_ids[index]],
+            result=status,
+            messages=list(self._messages.get(index, ())),
+            atomic_results=[],
+            custom_field=None if custom_field_id == -1 else strings[custom_field_id],
+        )
+        if index in self._atomic_results:
+            # Creating the atomic results updates the messages and the status of their parent: restore them afterwards
+            messages, result.messages = result.messages, []
+            for description_id, code, atomic_messages in self._atomic_results[index]:
+                result.atomic_results.append(
+                    AtomicTestResult.model_construct(description=strings[description_id], result=STATUSES[code], messages=list(atomic_messages), parent=result)
+                )
+            result.messages = messages
+            result.result = status
+        return result
+
+    def sort(self, key: Callable[[TestResult], Any]) -> None:
+        """Sort the stored results in place.
+
+        Parameters
+        ----------
+        key
+            Function computing the sort key of a materialised TestResult.
+        """
+        order = sorted(range(len(self)), key=lambda index: key(self._materialise(index)))
+        self._name_ids = array("I", (self._name_ids[index] for index in order))
+        self._test_ids = array("I", (self._test_ids[index] for index in order))
+        self._description_ids = array("I", (self._description_ids[index] for index in order))
+        self._category_ids = array("I", (self._category_ids[index] for index in order))
+        self._custom_field_ids = array("i", (self._custom_field_ids[index] for index in order))
+        self._statuses = bytearray(self._statuses[index] for index in order)
+        self._messages = {new: self._messages[old] for new, old in enumerate(order) if old in self._messages}
+        self._atomic_results = {new: self._atomic_results[old] for new, old in enumerate(order) if old in self._atomic_results}
+        self._version += 1
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return len(self._statuses)
+
+    @overload
+    def __getitem__(self, index: int) -> TestResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TestResult]: ...
+
+    def __getitem__(self, index: int | slice) -> TestResult | list[TestResult]:
+        """Materialise a stored result or a slice of the stored results."""
+        if isinstance(index, slice):
+            return [self._materialise(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "CompactResultStore index out of range"
+            raise IndexError(msg)
+        return self._materialise(index)
+
+    def __iter__(self) -> Iterator[TestResult]:
+        """Materialise the stored results one at a time."""
+        for index in range(len(self)):
+            yield self._materialise(index)
+
+
+class CompactResultSelection(Sequence[TestResult]):
+    """Sequence of some results of a CompactResultStore, referenced by their position in the store.
+
+    A selection is invalidated when the store is sorted.
+    """
+
+    __slots__ = ("_positions", "_store", "_version")
+
+    def __init__(self, store: CompactResultStore, positions: list[int]) -> None:
+        """Initialize a CompactResultSelection instance.
+
+        Parameters
+        ----------
+        store
+            Store of the selected results.
+        positions
+            Positions of the selected results in the store.
+        """
+        self._store = store
+        self._positions = array("I", positions)
+        self._version = store.version
+
+    def _position(self, index: int) -> int:
+        """Return the position in the store of a selected result."""
+        if self._version != self._store.version:
+            msg = "The CompactResultStore of this selection has been sorted"
+            raise RuntimeError(msg)
+        return self._positions[index]
+
+    def fields(self, index: int) -> ResultFields:
+        """Return the device, test, categories and status of a selected result without materialising it."""
+        return self._store.fields(self._position(index))
+
+    def subset(self, positions: list[int]) -> CompactResultSelection:
+        """Return a selection of the selected results.
+
+        Parameters
+        ----------
+        positions
+            Positions of the results in this selection.
+        """
+        return CompactResultSelection(self._store, [self._position(position) for position in positions])
+
+    def sort(self, key: Callable[[TestResult], Any]) -> None:
+        """Sort the selected results in place, without modifying the store.
+
+        Parameters
+        ----------
+        key
+            Function computing the sort key of a materialised TestResult.
+        """
+        self._positions = array("I", sorted((self._position(index) for index in range(len(self))), key=lambda position: key(self._store[position])))
+
+    def __len__(self) -> int:
+        """Return the number of selected results."""
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> TestResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TestResult]: ...
+
+    def __getitem__(self, index: int | slice) -> TestResult | list[TestResult]:
+        """Materialise a selected result or a slice of the selected results."""
+        if isinstance(index, slice):
+            return [self._store[self._position(i)] for i in range(*index.indices(len(self)))]
+        return self._store[self._position(index)]
+
+    def __iter__(self) -> Iterator[TestResult]:
+        """Materialise the selected results one at a time."""
+        for index in range(len(self)):
+            yield self._store[self._position(index)]
@@ -0,0 +1,415 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Long-running ANTA service.
+
+The service holds a parsed catalog and an inventory connected once at startup, and runs jobs submitted
+through a local HTTP API, over TCP or a Unix socket. Connection pools and eAPI sessions stay hot between jobs, the device caches are cleared before each job.
+
+HTTP API:
+
+- `GET /health`: Return the service status as JSON.
+- `POST /jobs`: Submit a job. The optional JSON body holds the run filters (`devices`, `tags`, `tests`).
+  The test results are streamed back as newline-delimited JSON (NDJSON) as soon as the tests complete.
+  The job is cancelled if the client closes the connection before all the results are sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
+from anta.logger import anta_log_exception, exc_to_str
+from anta.settings import AntaRunnerSettings
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+    from types import TracebackType
+
+    from anta.catalog import AntaCatalog
+    from anta.inventory import AntaInventory
+    from anta.result_manager.models import TestResult
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUED_JOBS = 16
+"""Default maximum number of jobs waiting to be run."""
+
+DEFAULT_MAX_RUNNING_JOBS = 2
+"""Default maximum number of jobs running concurrently."""
+
+DEFAULT_JOB_CONCURRENCY = 100
+"""Default maximum number of tests running concurrently within a job."""
+
+MAX_REQUEST_BODY_SIZE = 1024 * 1024
+"""Maximum size in bytes of an HTTP request body."""
+
+_HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Content Too Large", 503: "Service Unavailable"}
+
+
+@dataclass
+class AntaJob:
+    """Job submitted to an ANTA service.
+
+    Attributes
+    ----------
+    id: int
+        Identifier of the job, unique per service.
+    filters: AntaRunFilters
+        Filters of the ANTA run.
+    ctx: AntaRunContext | None
+        Context of the ANTA run once the job is done.
+    error: str | None
+        Error message if the job failed.
+    stop_event: asyncio.Event
+        Event set when the job is cancelled.
+    """
+
+    id: int
+    filters: AntaRunFilters
+    ctx: AntaRunContext | None = None
+    error: str | None = None
+    stop_event: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _results: asyncio.Queue[TestResult | None] = field(default_factory=asyncio.Queue, repr=False)
+    _done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job is done."""
+        return self._done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job has been cancelled."""
+        return self.stop_event.is_set()
+
+    async def wait(self) -> None:
+        """Wait for the job to be done."""
+        await self._done.wait()
+
+    def cancel(self) -> None:
+        """Cancel the job gracefully.
+
+        A queued job is not run. The tests of a running job not started yet are skipped and the running tests are given
+        a grace period to complete, as when an ANTA run is interrupted.
+        """
+        self.stop_event.set()
+
+    def add_result(self, result: TestResult) -> None:
+        """Add a test result to the job results stream."""
+        self._results.put_nowait(result)
+
+    def set_done(self) -> None:
+        """Mark the job as done and close the job results stream."""
+        self._results.put_nowait(None)
+        self._done.set()
+
+    async def results(self) -> AsyncIterator[TestResult]:
+        """Yield the test results of the job as soon as the tests complete.
+
+        Results can only be consumed once.
+        """
+        while (result := await self._results.get()) is not None:
+            yield result
+
+
+class AntaService:
+    """Run ANTA jobs on a warm inventory and catalog.
+
+    Jobs are queued in a bounded queue and run by a fixed number of workers. Each job runs with its own
+    runner and concurrency budget, i.e. the maximum number of tests running concurrently within the job.
+
+    The inventory is connected once when the service starts and stays connected until the service stops:
+    the devices unreachable at startup are reported as unreachable by the jobs.
+
+    Examples
+    --------
+    ```python
+    async with AntaService(inventory, catalog) as service:
+        job = service.submit(AntaRunFilters(tags={"leaf"}))
+        async for result in job.results():
+            print(result)
+    ```
+    """
+
+    def __init__(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        *,
+        default_filters: AntaRunFilters | None = None,
+        max_queued_jobs: int = DEFAULT_MAX_QUEUED_JOBS,
+        max_running_jobs: int = DEFAULT_MAX_RUNNING_JOBS,
+        job_concurrency: int = DEFAULT_JOB_CONCURRENCY,
+    ) -> None:
+        """Initialize an AntaService.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        catalog
+            Catalog of tests to run.
+        default_filters
+            Filters applied to the jobs that do not specify them.
+        max_queued_jobs
+            Maximum number of jobs waiting to be run. New jobs are rejected when the queue is full.
+        max_running_jobs
+            Maximum number of jobs running concurrently.
+        job_concurrency
+            Maximum number of tests running concurrently within a job.
+        """
+        self.inventory = inventory
+        self.catalog = catalog
+        self.default_filters = default_filters if default_filters is not None else AntaRunFilters()
+        self.max_running_jobs = max_running_jobs
+        self._runner_settings = AntaRunnerSettings(max_concurrency=job_concurrency)
+        self._queue: asyncio.Queue[AntaJob] = asyncio.Queue(maxsize=max_queued_jobs)
+        self._workers: list[asyncio.Task[None]] = []
+        self._job_ids = count(1)
+        self.running_jobs = 0
+
+    async def __aenter__(self) -> Self:
+        """Connect the inventory and start the service workers."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Stop the service workers and disconnect the inventory."""
+        await self.stop()
+
+    @property
+    def queued_jobs(self) -> int:
+        """Number of jobs waiting to be run."""
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """Connect the inventory and start the service workers."""
+        if self._workers:
+            return
+        await self.inventory.connect_inventory()
+        self._workers = [asyncio.create_task(self._worker(), name=f"anta-service-worker-{i}") for i in range(self.max_running_jobs)]
+        logger.info("ANTA service started with %s workers", self.max_running_jobs)
+
+    async def stop(self) -> None:
+        """Stop the service workers and disconnect the inventory.
+
+        The running jobs are cancelled and the inventory is disconnected once their tests are cancelled.
+        The queued jobs are not run.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        # Wait for the workers to finish cancelling the running jobs before disconnecting the devices
+        if self._workers:
+            await asyncio.wait(self._workers)
+        self._workers = []
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            job.error = "ANTA service stopped"
+            job.set_done()
+        await self.inventory.disconnect_inventory()
+        logger.info("ANTA service stopped")
+
+    def submit(self, filters: AntaRunFilters | None = None) -> AntaJob:
+        """Submit a new job.
+
+        Parameters
+        ----------
+        filters
+            Filters of the ANTA run. If `None`, the service default filters are used.
+
+        Returns
+        -------
+        AntaJob
+            The submitted job.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the job queue is full.
+        """
+        job = AntaJob(id=next(self._job_ids), filters=filters if filters is not None else self.default_filters)
+        self._queue.put_nowait(job)
+        logger.debug("Job %s submitted: %s", job.id, job.filters)
+        return job
+
+    async def _worker(self) -> None:
+        """Run the jobs from the queue."""
+        while True:
+            job = await self._queue.get()
+            if job.cancelled:
+                job.set_done()
+                self._queue.task_done()
+                continue
+            self.running_jobs += 1
+            try:
+                await self._run_job(job)
+            finally:
+                self.running_jobs -= 1
+                self._queue.task_done()
+
+    async def _run_job(self, job: AntaJob) -> None:
+        """Run a job with its own runner and stream its results.
+
+        The caches of the devices of the job are cleared first so that commands are collected again from the devices.
+        """
+        logger.info("Running job %s", job.id)
+        for device in self.inventory.get_inventory(tags=job.filters.tags, devices=job.filters.devices).devices:
+            if device.cache is not None:
+                device.cache.clear()
+        runner = AntaRunner(settings=self._runner_settings)
+        try:
+            job.ctx = await runner.run(self.inventory, self.catalog, filters=job.filters, on_result=job.add_result, stop_event=job.stop_event, connect=False)
+        except Exception as e:  # noqa: BLE001
+            job.error = exc_to_str(e)
+            anta_log_exception(e, f"Job {job.id} failed", logger)
+        finally:
+            job.set_done()
+        logger.info("Job %s done", job.id)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+        """Serve the HTTP API over TCP.
+
+        Parameters
+        ----------
+        host
+            Address to listen on.
+        port
+            TCP port to listen on.
+
+        Returns
+        -------
+        asyncio.Server
+            The started server.
+        """
+        server = await asyncio.start_server(self._handle_http_request, host=host, port=port)
+        logger.info("ANTA service listening on http://%s:%s", host, port)
+        return server
+
+    async def serve_unix(self, path: Path) -> asyncio.Server:
+        """Serve the HTTP API over a Unix socket.
+
+        Parameters
+        ----------
+        path
+            Path of the Unix socket.
+
+        Returns
+        -------
+        asyncio.Server
+            The started server.
+        """
+        server = await asyncio.start_unix_server(self._handle_http_request, path=path)
+        logger.info("ANTA service listening on unix:%s", path)
+        return server
+
+    def _parse_filters(self, body: bytes) -> AntaRunFilters:
+        """Parse the run filters of a job request body, falling back to the service default filters."""
+        if not body.strip():
+            return self.default_filters
+        data = json.loads(body)
+        if not isinstance(data, dict):
+            msg = "Request body must be a JSON object"
+            raise TypeError(msg)
+        return AntaRunFilters(**{**self.default_filters.model_dump(), **data})
+
+    async def _handle_http_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle a single HTTP request."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1")
+            headers: dict[str, str] = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            method, _, target = request_line.partition(" ")
+            path = target.split(" ")[0]
+            content_length = int(headers.get("content-length", 0))
+            if content_length > MAX_REQUEST_BODY_SIZE:
+                await self._send_json(writer, 413, {"error": "Request body too large"})
+                return
+            body = await reader.readexactly(content_length) if content_length else b""
+
+            if path == "/health":
+                if method != "GET":
+                    await self._send_json(writer, 405, {"error": f"Method {method} not allowed"})
+                    return
+                await self._send_json(writer, 200, {"status": "ok", "queued_jobs": self.queued_jobs, "running_jobs": self.running_jobs})
+            elif path == "/jobs":
+                if method != "POST":
+                    await self._send_json(writer, 405, {"error": f"Method {method} not allowed"})
+                    return
+                await self._handle_job_request(reader, writer, body)
+            else:
+                await self._send_json(writer, 404, {"error": f"Unknown path {path}"})
+        except (ConnectionError, asyncio.IncompleteReadError, UnicodeDecodeError, ValueError) as e:
+            logger.debug("Error while handling an ANTA service request: %s", exc_to_str(e))
+        finally:
+            writer.close()
+
+    async def _handle_job_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, body: bytes) -> None:
+        """Submit a job and stream its results as NDJSON.
+
+        The job is cancelled if the client disconnects before all the results are sent.
+        """
+        try:
+            filters = self._parse_filters(body)
+        except (ValueError, TypeError, ValidationError) as e:
+            await self._send_json(writer, 400, {"error": exc_to_str(e)})
+            return
+        try:
+            job = self.submit(filters)
+        except asyncio.QueueFull:
+            await self._send_json(writer, 503, {"error": "Job queue is full"})
+            return
+
+        disconnect_watcher = asyncio.create_task(self._cancel_on_disconnect(reader, job))
+        try:
+            writer.write(self._headers(200, "application/x-ndjson", extra={"X-ANTA-Job-ID": str(job.id)}))
+            await writer.drain()
+            async for result in job.results():
+                writer.write(result.model_dump_json().encode() + b"\n")
+                await writer.drain()
+        finally:
+            disconnect_watcher.cancel()
+            if not job.done:
+                job.cancel()
+
+    @staticmethod
+    async def _cancel_on_disconnect(reader: asyncio.StreamReader, job: AntaJob) -> None:
+        """Cancel a job when the client closes the connection."""
+        with suppress(ConnectionError):
+            while await reader.read(4096):
+                pass
+        if not job.done:
+            logger.info("Client disconnected, cancelling job %s", job.id)
+            job.cancel()
+
+    @staticmethod
+    def _headers(status: int, content_type: str, content_length: int | None = None, extra: dict[str, str] | None = None) -> bytes:
+        """Build the HTTP response status line and headers."""
+        lines = [f"HTTP/1.1 {status} {_HTTP_REASONS[status]}", f"Content-Type: {content_type}", "Connection: close"]
+        if content_length is not None:
+            lines.append(f"Content-Length: {content_length}")
+        lines.extend(f"{name}: {value}" for name, value in (extra or {}).items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, data: dict[str, Any]) -> None:
+        """Send a JSON HTTP response."""
+        body = json.dumps(data).encode()
+        writer.write(self._headers(status, "application/json", len(body)) + body)
+        await writer.drain()
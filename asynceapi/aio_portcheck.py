@@ -33,7 +33,7 @@ __all__ = ["port_check_url"]
 # -----------------------------------------------------------------------------
 
 
-async def port_check_url(url: URL, timeout: int = 5) -> bool:
+async def port_check_url(url: URL, timeout: float = 5) -> bool:
     """Open the port designated by the URL given the timeout in seconds.
 
     Parameters
@@ -57,6 +57,7 @@ async def port_check_url(url: URL, timeout: int = 5) -> bool:
         # MUST close if opened!
         wr.close()
 
-    except TimeoutError:
+    # On Python 3.10, asyncio.wait_for() raises asyncio.TimeoutError which is not the builtin TimeoutError
+    except (TimeoutError, asyncio.TimeoutError):
         return False
     return True
@@ -153,6 +153,8 @@ class Device(httpx.AsyncClient):
 
         super().__init__(**kwargs)
         self.headers["Content-Type"] = "application/json-rpc"
+        # Number of bytes received in eAPI command responses
+        self.bytes_received = 0
 
     @deprecated("This method is deprecated, use `Device.check_api_endpoint` method instead. This will be removed in ANTA v2.0.0.", category=DeprecationWarning)
     async def check_connection(self) -> bool:
@@ -197,6 +199,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> EapiJsonOutput: ...
 
     # Multiple commands, JSON output, no suppression
@@ -212,6 +215,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> list[EapiJsonOutput]: ...
 
     # Single command, TEXT output, no suppression
@@ -227,6 +231,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> EapiTextOutput: ...
 
     # Multiple commands, TEXT output, no suppression
@@ -242,6 +247,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> list[EapiTextOutput]: ...
 
     # Single command, JSON output, with suppression
@@ -257,6 +263,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> EapiJsonOutput | None: ...
 
     # Multiple commands, JSON output, with suppression
@@ -272,6 +279,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> list[EapiJsonOutput] | None: ...
 
     # Single command, TEXT output, with suppression
@@ -287,6 +295,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> EapiTextOutput | None: ...
 
     # Multiple commands, TEXT output, with suppression
@@ -302,6 +311,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> list[EapiTextOutput] | None: ...
 
     # Actual implementation
@@ -316,6 +326,7 @@ class Device(httpx.AsyncClient):
         auto_complete: bool = False,
         expand_aliases: bool = False,
         req_id: int | str | None = None,
+        timeout: float | None = None,
     ) -> EapiJsonOutput | EapiTextOutput | list[EapiJsonOutput] | list[EapiTextOutput] | None:
         """Execute one or more CLI commands.
 
@@ -358,6 +369,8 @@ class Device(httpx.AsyncClient):
                 return the output of show version.
         req_id
             A unique identifier that will be echoed back by the switch. May be a string or number.
+        timeout
+            Timeout in seconds of the eAPI request. If None, the client timeout applies.
 
         Returns
         -------
@@ -392,7 +405,7 @@ class Device(httpx.AsyncClient):
         )
 
         try:
-            res = await self.jsonrpc_exec(jsonrpc)
+            res = await self.jsonrpc_exec(jsonrpc, timeout=timeout)
             return res[0] if command else res
         except EapiCommandError:
             if suppress_error:
@@ -459,13 +472,15 @@ class Device(httpx.AsyncClient):
             "id": req_id or id(self),
         }
 
-    async def jsonrpc_exec(self, jsonrpc: JsonRpc) -> list[EapiJsonOutput] | list[EapiTextOutput]:
+    async def jsonrpc_exec(self, jsonrpc: JsonRpc, timeout: float | None = None) -> list[EapiJsonOutput] | list[EapiTextOutput]:
         """Execute the JSON-RPC dictionary object.
 
         Parameters
         ----------
         jsonrpc
             The JSON-RPC as created by the `meth`:_jsonrpc_command().
+        timeout
+            Timeout in seconds of the eAPI request. If None, the client timeout applies.
 
         Raises
         ------
@@ -478,7 +493,8 @@ class Device(httpx.AsyncClient):
             The list of command results; either dict or text depending on the
             JSON-RPC format parameter.
         """
-        res = await self.post(self.EAPI_COMMAND_API_URL, json=jsonrpc)
+        res = await self.post(self.EAPI_COMMAND_API_URL, json=jsonrpc, timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT)
+        self.bytes_received += len(res.content)
         res.raise_for_status()
         body = res.json()
 
@@ -36,6 +36,7 @@ COMMANDS = [
     "anta debug --help",
     "anta debug run-cmd --help",
     "anta debug run-template --help",
+    "anta serve --help",
 ]
 
 for command in COMMANDS:
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Generates anta/tests/registry.json."""
+
+from pathlib import Path
+from sys import path
+
+# Override global path to load anta from pwd instead of any installed version.
+path.insert(0, str(Path(__file__).parents[2]))
+
+from anta.cli.get.utils import _explore_package
+from anta.registry import REGISTRY_FILE, REGISTRY_PACKAGE, AntaTestRegistry
+
+if __name__ == "__main__":
+    AntaTestRegistry.build(_explore_package(REGISTRY_PACKAGE)).dump(REGISTRY_FILE)
@@ -0,0 +1,25 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for anta.inventory."""
+
+from pathlib import Path
+
+import pytest
+
+from anta.inventory import AntaInventory
+
+DATA_DIR: Path = Path(__file__).parents[1].resolve() / "data"
+
+
+@pytest.mark.benchmark
+def test_inventory_get_inventory() -> None:
+    """Benchmark AntaInventory.get_inventory() on a large inventory, as done by the runner and the CLI."""
+    inventory = AntaInventory.parse(DATA_DIR / "test_inventory_large.yml", username="anta", password="anta")  # noqa: S106
+    devices = list(inventory.values())
+    for device in devices[::2]:
+        device.established = True
+    tags = {device.name for device in devices[::3]}
+    for _ in range(100):
+        filtered_inventory = inventory.get_inventory(tags=tags)
+        _ = filtered_inventory.get_inventory(established_only=True)
@@ -0,0 +1,25 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for loading ANTA input files."""
+
+from pathlib import Path
+
+import pytest
+
+from anta.catalog import AntaCatalog
+from anta.inventory import AntaInventory
+
+DATA_DIR: Path = Path(__file__).parents[1].resolve() / "data"
+
+
+@pytest.mark.benchmark
+def test_catalog_parse_yaml() -> None:
+    """Benchmark AntaCatalog.parse() with a large YAML catalog."""
+    _ = AntaCatalog.parse(DATA_DIR / "test_catalog_large.yml")
+
+
+@pytest.mark.benchmark
+def test_inventory_parse_yaml() -> None:
+    """Benchmark AntaInventory.parse() with a large YAML inventory."""
+    _ = AntaInventory.parse(DATA_DIR / "test_inventory_large.yml", username="anta", password="anta")  # noqa: S106
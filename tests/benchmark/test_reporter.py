@@ -6,6 +6,7 @@
 import json
 import logging
 from pathlib import Path
+from typing import Literal
 
 import pytest
 
@@ -72,9 +73,32 @@ def test_csv(results: ResultManager, tmp_path: Path) -> None:
     ReportCsv.generate(results=results, csv_filename=tmp_path / "report.csv")
 
 
+@pytest.mark.benchmark
+@pytest.mark.dependency(depends=["anta_benchmark"], scope="package")
+def test_csv_gzip(results: ResultManager, tmp_path: Path) -> None:
+    """Benchmark ReportCsv.generate() with a gzip compressed output."""
+    ReportCsv.generate(results=results, csv_filename=tmp_path / "report.csv.gz", compression="gzip")
+
+
 @pytest.mark.benchmark
 @pytest.mark.dependency(depends=["anta_benchmark"], scope="package")
 def test_markdown(results: ResultManager, tmp_path: Path) -> None:
     """Benchmark MDReportGenerator.generate_sections()."""
     sections = [(section, results) for section in MDReportGenerator.DEFAULT_SECTIONS]
     MDReportGenerator.generate_sections(sections=sections, md_filename=tmp_path / "report.md")
+
+
+@pytest.mark.benchmark
+@pytest.mark.dependency(depends=["anta_benchmark"], scope="package")
+def test_markdown_stream(results: ResultManager, tmp_path: Path) -> None:
+    """Benchmark MDReportGenerator.generate_sections() with the stream report option."""
+    sections = [(section, results) for section in MDReportGenerator.DEFAULT_SECTIONS]
+    MDReportGenerator.generate_sections(sections=sections, md_filename=tmp_path / "report.md", extra_data={"_report_options": {"stream": True}})
+
+
+@pytest.mark.benchmark
+@pytest.mark.dependency(depends=["anta_benchmark"], scope="package")
+@pytest.mark.parametrize("split_by", ["device", "category"])
+def test_markdown_split(results: ResultManager, tmp_path: Path, split_by: Literal["device", "category"]) -> None:
+    """Benchmark MDReportGenerator.generate_split()."""
+    MDReportGenerator.generate_split(results, tmp_path / "report.md", split_by)
@@ -0,0 +1,81 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for anta.result_manager."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from anta.result_manager import ResultManager
+from anta.result_manager.diff import diff_results
+from anta.result_manager.models import AntaTestStatus, TestResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+DEVICES_COUNT = 100
+TESTS_COUNT = 200
+
+
+def _results() -> Iterator[TestResult]:
+    """Yield the results of a run of 200 tests on 100 devices, 10% of them failing."""
+    for device in range(DEVICES_COUNT):
+        for test in range(TESTS_COUNT):
+            result = TestResult(name=f"device-{device}", test=f"VerifyTest{test}", categories=["routing", "bgp"], description=f"Verifies the test {test}.")
+            if test % 10 == 0:
+                result.is_failure(f"Peer: 10.0.{device}.{test} - Session state is not established - State: Idle")
+            else:
+                result.is_success()
+            yield result
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("compact", [pytest.param(False, id="list"), pytest.param(True, id="compact")])
+def test_result_manager_add(*, compact: bool) -> None:
+    """Benchmark ResultManager.add()."""
+    manager = ResultManager(compact=compact)
+    for result in _results():
+        manager.add(result)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("compact", [pytest.param(False, id="list"), pytest.param(True, id="compact")])
+def test_result_manager_stats(*, compact: bool) -> None:
+    """Benchmark the ResultManager statistics computation."""
+    manager = ResultManager(compact=compact)
+    for result in _results():
+        manager.add(result)
+    _ = manager.device_stats
+
+
+@pytest.mark.benchmark
+def test_result_manager_filter() -> None:
+    """Benchmark chained ResultManager filters and the statistics of the filtered results."""
+    manager = ResultManager()
+    for result in _results():
+        manager.add(result)
+    filtered = manager.filter({AntaTestStatus.SUCCESS})
+    _ = filtered.device_stats
+    with pytest.deprecated_call():
+        _ = filtered.filter_by_devices({"device-0", "device-1"}).test_stats
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("compact", [pytest.param(False, id="list"), pytest.param(True, id="compact")])
+def test_result_manager_merge(*, compact: bool) -> None:
+    """Benchmark merging the ResultManager instances of 20 runs and the statistics of the merged results."""
+    manager = ResultManager(compact=compact)
+    for result in _results():
+        manager.add(result)
+    merged = ResultManager.merge_results([manager] * 20)
+    assert merged.device_stats["device-0"].tests_failure_count == 20 * TESTS_COUNT // 10
+
+
+@pytest.mark.benchmark
+def test_diff_results() -> None:
+    """Benchmark the comparison of the results of two runs."""
+    baseline, current = list(_results()), list(_results())
+    assert diff_results(baseline, current).unchanged == DEVICES_COUNT * TESTS_COUNT
@@ -117,6 +117,18 @@ async def test_jsonrpc_exec_http_status_error(asynceapi_device: Device, httpx_mo
         await asynceapi_device.jsonrpc_exec(jsonrpc=jsonrpc_request)
 
 
+async def test_cli_timeout() -> None:
+    """Test the Device.cli method with a per-request timeout."""
+    with respx.mock as respx_mock:
+        command_route = respx_mock.post(f"{_BASE_URL}/command-api").respond(json=_jsonrpc_response())
+        async with Device(host=_HOST, username="admin", password=_PASSWORD, timeout=30) as dev:
+            await dev.cli(command="show version", timeout=2.5)
+            await dev.cli(command="show version")
+
+    assert command_route.calls[0].request.extensions["timeout"] == {"connect": 2.5, "read": 2.5, "write": 2.5, "pool": 2.5}
+    assert command_route.calls[1].request.extensions["timeout"] == {"connect": 30, "read": 30, "write": 30, "pool": 30}
+
+
 async def test_jsonrpc_exec_session_auth_concurrent_first_use_single_login() -> None:
     """Test concurrent session-auth requests share a single login and cookie."""
     with respx.mock as respx_mock:
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from anta.catalog_cache import CatalogCache
 from anta.cli import anta
 from anta.cli.utils import ExitCode
 
@@ -32,3 +33,31 @@ def test_catalog(click_runner: CliRunner, catalog_path: Path, expected_exit: int
     result = click_runner.invoke(anta, ["check", "catalog", "-c", str(DATA_DIR / catalog_path)])
     assert result.exit_code == expected_exit
     assert expected_output in result.output
+
+
+def test_catalog_compile(click_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `anta check catalog -c catalog --compile`."""
+    monkeypatch.setenv("ANTA_CATALOG_CACHE_DIR", str(tmp_path))
+    result = click_runner.invoke(anta, ["check", "catalog", "-c", str(DATA_DIR / "test_catalog.yml"), "--compile"])
+    assert result.exit_code == ExitCode.OK
+    assert "Compiled catalog saved to" in result.output
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+
+def test_catalog_compile_json(click_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `anta check catalog -c catalog --catalog-format json --compile`."""
+    monkeypatch.setenv("ANTA_CATALOG_CACHE_DIR", str(tmp_path))
+    result = click_runner.invoke(anta, ["check", "catalog", "-c", str(DATA_DIR / "test_catalog.json"), "--catalog-format", "json", "--compile"])
+    assert result.exit_code == ExitCode.OK
+    content = (DATA_DIR / "test_catalog.json").read_bytes()
+    assert CatalogCache(tmp_path).path(content, "json").exists()
+
+
+def test_catalog_compile_failure(click_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `anta check catalog -c catalog --compile` when the cache directory cannot be created."""
+    cache_dir = tmp_path / "file"
+    cache_dir.touch()
+    monkeypatch.setenv("ANTA_CATALOG_CACHE_DIR", str(cache_dir))
+    result = click_runner.invoke(anta, ["check", "catalog", "-c", str(DATA_DIR / "test_catalog.yml"), "--compile"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Failed to compile the catalog" in result.output
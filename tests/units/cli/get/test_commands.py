@@ -436,6 +436,31 @@ def test_get_tests(
     assert expected_output in result.output
 
 
+@pytest.mark.parametrize(
+    ("module", "test_name", "short"),
+    [
+        pytest.param(None, None, False, id="all"),
+        pytest.param("anta.tests.routing", "VerifyBGP", True, id="filtered"),
+    ],
+)
+def test_get_tests_without_registry(click_runner: CliRunner, module: str | None, test_name: str | None, *, short: bool) -> None:
+    """Test that `anta get tests` has the same output when the test registry cannot be used."""
+    cli_args = ["get", "tests"]
+    if module is not None:
+        cli_args.extend(["--module", module])
+    if test_name is not None:
+        cli_args.extend(["--test", test_name])
+    if short:
+        cli_args.append("--short")
+
+    result = click_runner.invoke(anta, cli_args)
+    with patch("anta.cli.get.utils.AntaTestRegistry.load", return_value=None):
+        result_without_registry = click_runner.invoke(anta, cli_args)
+
+    assert result.exit_code == result_without_registry.exit_code == ExitCode.OK
+    assert result.output == result_without_registry.output
+
+
 def test_get_tests_local_module(click_runner: CliRunner) -> None:
     """Test injecting CWD in sys.
 
@@ -636,3 +661,16 @@ def test_get_commands_unique(click_runner: CliRunner, module: str | None, test_n
     result = click_runner.invoke(anta, cli_args, env={"ANTA_CATALOG": None})
 
     assert expected_count == len(result.output.splitlines())
+
+
+@pytest.mark.parametrize("inventory_expansion", ["eager", "lazy", "probe"])
+def test_get_tags_inventory_expansion(tmp_path: Path, click_runner: CliRunner, inventory_expansion: str) -> None:
+    """Test `anta get tags` with the different inventory expansions."""
+    inventory = tmp_path / "inventory.yml"
+    inventory.write_text("anta_inventory:\n  networks:\n    - network: 10.0.0.0/30\n      tags: ['leaf']\n", encoding="UTF-8")
+    result = click_runner.invoke(anta, ["get", "tags", "--inventory", str(inventory), "--inventory-expansion", inventory_expansion])
+
+    assert result.exit_code == ExitCode.OK
+    assert '"leaf"' in result.output
+    # The devices of a lazy network are not created, their names are not tags of the inventory
+    assert ('"10.0.0.1"' in result.output) is (inventory_expansion == "eager")
@@ -5,17 +5,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import signal
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from anta._runner import AntaRunContext, AntaRunFilters, AntaStatusChange
+from anta.catalog import AntaCatalog
 from anta.cli import anta
+from anta.cli.nrfu.utils import _handle_signals
 from anta.cli.utils import ExitCode
 from anta.inventory import AntaInventory
+from anta.result_manager import ResultManager
+from anta.result_manager.database import ResultDatabase
+from anta.result_manager.journal import ResultJournal
+from anta.result_manager.models import AntaTestStatus
+from anta.result_manager.models import TestResult as AntaTestResult
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from click.testing import CliRunner
 
 DATA_DIR: Path = Path(__file__).parents[3].resolve() / "data"
@@ -67,7 +80,8 @@ def test_anta_nrfu_dry_run(click_runner: CliRunner) -> None:
 )
 def test_anta_nrfu_disconnect(click_runner: CliRunner, args: list[str], env: dict[str, str], expected: bool) -> None:
     """Test anta nrfu disconnect inputs are passed to the runner."""
-    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock()) as run_mock:
+    run_ctx = AntaRunContext(inventory=AntaInventory(), catalog=AntaCatalog(), manager=ResultManager(), filters=AntaRunFilters())
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock(return_value=run_ctx)) as run_mock:
         result = click_runner.invoke(anta, args, env=env)
 
     assert result.exit_code == ExitCode.OK
@@ -186,3 +200,180 @@ def test_invalid_catalog(caplog: pytest.LogCaptureFixture, click_runner: CliRunn
     assert "CRITICAL" in caplog.text
     assert "Failed to parse the catalog" in caplog.text
     assert result.exit_code == ExitCode.USAGE_ERROR
+
+
+def test_metrics_file(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test the `--metrics-file` option of the `anta nrfu` command."""
+    metrics_file = tmp_path / "anta.prom"
+    result = click_runner.invoke(anta, ["nrfu", "--metrics-file", str(metrics_file), "text"])
+    assert result.exit_code == ExitCode.OK
+    assert f"Metrics saved to {metrics_file}" in result.output
+    metrics = metrics_file.read_text(encoding="utf-8")
+    assert 'anta_test_results_total{test="VerifyEOSVersion",status="success"} 3.0' in metrics
+    assert metrics.endswith("# EOF\n")
+
+
+def test_metrics_file_failure(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test the `--metrics-file` option of the `anta nrfu` command when the file cannot be written."""
+    with patch("anta.metrics.AntaMetrics.write", side_effect=OSError("Simulated OSError")):
+        result = click_runner.invoke(anta, ["nrfu", "--metrics-file", str(tmp_path / "anta.prom"), "text"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Failed to save metrics to" in result.output
+
+
+def test_journal(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test the `--journal` and `--resume` options of the `anta nrfu` command."""
+    journal_file = tmp_path / "anta.journal"
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal_file), "text"])
+    assert result.exit_code == ExitCode.OK
+    assert len(journal_file.read_text(encoding="utf-8").splitlines()) == 3
+
+    result = click_runner.invoke(anta, ["nrfu", "--resume", str(journal_file), "text"])
+    assert result.exit_code == ExitCode.OK
+    # Results of the resumed tests are reported
+    assert result.output.count("VerifyEOSVersion") == 3
+    assert len(journal_file.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_journal_closed(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test that the journal file of the `anta nrfu` command is closed after the run."""
+    journal_file = tmp_path / "anta.journal"
+    with patch.object(ResultJournal, "close", autospec=True, side_effect=ResultJournal.close) as close:
+        result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal_file), "text"])
+    assert result.exit_code == ExitCode.OK
+    close.assert_called_once()
+    assert close.call_args.args[0]._file is None
+
+
+def test_journal_resume_exclusive(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test that the `--journal` and `--resume` options of the `anta nrfu` command are mutually exclusive."""
+    journal_file = tmp_path / "anta.journal"
+    journal_file.touch()
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal_file), "--resume", str(journal_file), "text"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Options --journal and --resume are mutually exclusive." in result.output
+
+
+def test_max_duration(click_runner: CliRunner) -> None:
+    """Test the `--max-duration` option of the `anta nrfu` command."""
+    run_ctx = AntaRunContext(inventory=AntaInventory(), catalog=AntaCatalog(), manager=ResultManager(), filters=AntaRunFilters())
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock(return_value=run_ctx)) as run_mock:
+        result = click_runner.invoke(anta, ["nrfu", "--max-duration", "60", "text"])
+    assert result.exit_code == ExitCode.OK
+    assert run_mock.await_args is not None
+    assert run_mock.await_args.kwargs["max_duration"] == 60.0
+    assert run_mock.await_args.kwargs["stop_event"] is not None
+
+
+@pytest.mark.parametrize(("args", "expected"), [pytest.param([], False, id="default"), pytest.param(["--prescan"], True, id="prescan")])
+def test_prescan(click_runner: CliRunner, args: list[str], *, expected: bool) -> None:
+    """Test the `--prescan` option of the `anta nrfu` command."""
+    run_ctx = AntaRunContext(inventory=AntaInventory(), catalog=AntaCatalog(), manager=ResultManager(), filters=AntaRunFilters())
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock(return_value=run_ctx)) as run_mock:
+        result = click_runner.invoke(anta, ["nrfu", *args, "text"])
+    assert result.exit_code == ExitCode.OK
+    assert run_mock.await_args is not None
+    assert run_mock.await_args.kwargs["prescan"] is expected
+
+
+@pytest.mark.parametrize(("args", "expected"), [pytest.param([], False, id="default"), pytest.param(["--compact-results"], True, id="compact")])
+def test_compact_results(click_runner: CliRunner, args: list[str], *, expected: bool) -> None:
+    """Test the `--compact-results` option of the `anta nrfu` command."""
+    run_ctx = AntaRunContext(inventory=AntaInventory(), catalog=AntaCatalog(), manager=ResultManager(), filters=AntaRunFilters())
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock(return_value=run_ctx)) as run_mock:
+        result = click_runner.invoke(anta, ["nrfu", *args, "text"])
+    assert result.exit_code == ExitCode.OK
+    assert run_mock.await_args is not None
+    assert run_mock.await_args.kwargs["result_manager"].compact is expected
+
+
+@pytest.mark.parametrize(
+    ("args", "expected_exit_code"),
+    [
+        pytest.param([], ExitCode.TESTS_ERROR, id="default"),
+        pytest.param(["--ignore-error"], ExitCode.OK, id="ignore-error"),
+        pytest.param(["--ignore-status"], ExitCode.OK, id="ignore-status"),
+    ],
+)
+def test_cancelled_run(click_runner: CliRunner, args: list[str], expected_exit_code: ExitCode) -> None:
+    """Test the `anta nrfu` command when the test run has been cancelled."""
+    manager = ResultManager()
+    manager.add(AntaTestResult(name="leaf1", test="VerifyEOSVersion", categories=["software"], description="Test", result=AntaTestStatus.SUCCESS))
+    run_ctx = AntaRunContext(
+        inventory=AntaInventory(), catalog=AntaCatalog(), manager=manager, filters=AntaRunFilters(), cancel_reason="Maximum run duration of 1s exceeded"
+    )
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock(return_value=run_ctx)):
+        result = click_runner.invoke(anta, ["nrfu", *args, "--max-duration", "1", "text"])
+    assert result.exit_code == expected_exit_code
+    assert "Maximum run duration of 1s exceeded: the test run has been cancelled, reporting partial results." in result.output
+
+
+async def test_handle_signals() -> None:
+    """Test that SIGINT sets the stop event of the test run."""
+    stop_event = asyncio.Event()
+
+    async def run() -> bool:
+        os.kill(os.getpid(), signal.SIGINT)
+        await asyncio.wait_for(stop_event.wait(), timeout=5)
+        return True
+
+    assert await _handle_signals(run(), stop_event)
+    assert stop_event.is_set()
+
+
+def test_watch(click_runner: CliRunner) -> None:
+    """Test the `--watch` option of the `anta nrfu` command."""
+    previous = AntaTestResult(name="leaf1", test="VerifyEOSVersion", categories=["software"], description="Test", result=AntaTestStatus.SUCCESS)
+    current = AntaTestResult(name="leaf1", test="VerifyEOSVersion", categories=["software"], description="Test", result=AntaTestStatus.FAILURE, messages=["Boom"])
+
+    async def watch(*args: Any, **kwargs: Any) -> AsyncIterator[tuple[AntaRunContext, list[AntaStatusChange]]]:  # noqa: ARG001, ANN401
+        ctx = AntaRunContext(inventory=AntaInventory(), catalog=AntaCatalog(), manager=ResultManager(), filters=AntaRunFilters())
+        yield ctx, [AntaStatusChange(previous=None, current=previous)]
+        yield ctx, [AntaStatusChange(previous=previous, current=current)]
+        raise KeyboardInterrupt
+
+    with patch("anta.cli.nrfu.utils.AntaRunner.watch", new=watch):
+        result = click_runner.invoke(anta, ["nrfu", "--watch", "10", "text"])
+
+    assert result.exit_code == ExitCode.OK
+    assert "Watching NRFU every 10 seconds" in result.output
+    assert "leaf1 :: VerifyEOSVersion :: SUCCESS" in result.output
+    assert "leaf1 :: VerifyEOSVersion :: SUCCESS -> FAILURE" in result.output
+    assert "    Boom" in result.output
+    assert "Watch mode stopped." in result.output
+
+
+def test_watch_invalid_interval(click_runner: CliRunner) -> None:
+    """Test the `--watch` option of the `anta nrfu` command with an invalid interval."""
+    result = click_runner.invoke(anta, ["nrfu", "--watch", "0"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+
+
+@pytest.mark.parametrize("reporter", [["csv", "--csv-output", "results.csv"], ["json", "--output", "results.json"], ["md-report", "--md-output", "report.md"]])
+def test_watch_reporter(click_runner: CliRunner, reporter: list[str]) -> None:
+    """Test the `--watch` option of the `anta nrfu` command with a reporter writing a report."""
+    with patch("anta.cli.nrfu.utils.AntaRunner.watch") as watch:
+        result = click_runner.invoke(anta, ["nrfu", "--watch", "10", *reporter])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert f"cannot be used with the `{reporter[0]}` reporter" in result.output
+    watch.assert_not_called()
+
+
+def test_results_db(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test the `--results-db` option of the `anta nrfu` command."""
+    database = tmp_path / "anta.db"
+    for run_id in (1, 2):
+        result = click_runner.invoke(anta, ["nrfu", "--results-db", str(database), "text"])
+        assert result.exit_code == ExitCode.OK
+        assert f"Results stored as run {run_id} in result database" in result.output
+    with ResultDatabase(database) as db:
+        assert [run.total_results for run in db.runs()] == [3, 3]
+
+
+def test_results_db_failure(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test the `--results-db` option of the `anta nrfu` command when the file is not a database."""
+    database = tmp_path / "anta.db"
+    database.write_text("Not a database" * 100, encoding="utf-8")
+    result = click_runner.invoke(anta, ["nrfu", "--results-db", str(database), "text"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Failed to store results in result database" in result.output
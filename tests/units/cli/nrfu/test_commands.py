@@ -5,12 +5,17 @@
 
 from __future__ import annotations
 
+import csv
+import gzip
 import json
 import re
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
+import pytest
+
 from anta.cli import anta
 from anta.cli.utils import ExitCode
 
@@ -161,6 +166,100 @@ def test_anta_nrfu_json_output_failure(click_runner: CliRunner, tmp_path: Path)
     assert not json_output.exists()
 
 
+def test_anta_nrfu_ndjson(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu ndjson."""
+    ndjson_output = tmp_path / "test.ndjson"
+    result = click_runner.invoke(anta, ["nrfu", "ndjson", "--output", str(ndjson_output)])
+    assert result.exit_code == ExitCode.OK
+    assert "NDJSON results saved to" in result.output
+    results = [json.loads(line) for line in ndjson_output.read_text(encoding="utf-8").splitlines()]
+    assert results
+    assert all(res["test"] == "VerifyEOSVersion" for res in results)
+
+
+def test_anta_nrfu_ndjson_hide(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --hide ndjson."""
+    ndjson_output = tmp_path / "test.ndjson"
+    result = click_runner.invoke(anta, ["nrfu", "--hide", "success", "ndjson", "--output", str(ndjson_output)])
+    assert result.exit_code == ExitCode.OK
+    assert all(json.loads(line)["result"] != "success" for line in ndjson_output.read_text(encoding="utf-8").splitlines())
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_status"),
+    [pytest.param(["--resume", "{journal}"], "success", id="resume"), pytest.param(["--dry-run"], "unset", id="dry-run")],
+)
+def test_anta_nrfu_ndjson_not_run(click_runner: CliRunner, tmp_path: Path, options: list[str], expected_status: str) -> None:
+    """Test anta nrfu ndjson with the results of tests which are not run."""
+    journal = tmp_path / "anta.journal"
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal), "text"])
+    assert result.exit_code == ExitCode.OK
+
+    ndjson_output = tmp_path / "test.ndjson"
+    result = click_runner.invoke(anta, ["nrfu", *(option.format(journal=journal) for option in options), "ndjson", "--output", str(ndjson_output)])
+    assert result.exit_code == ExitCode.OK
+    results = [json.loads(line) for line in ndjson_output.read_text(encoding="utf-8").splitlines()]
+    assert [res["result"] for res in results] == [expected_status] * 3
+
+
+def test_anta_nrfu_ndjson_output_failure(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu ndjson when the output file cannot be opened."""
+    ndjson_output = tmp_path / "test.ndjson"
+
+    original_open = Path.open
+
+    def mock_path_open(*args: Any, **kwargs: Any) -> Path:  # noqa: ANN401
+        """Mock Path.open only for the ndjson_output file of this test."""
+        if args[0] == ndjson_output:
+            msg = "Simulated OSError"
+            raise OSError(msg)
+        return original_open(*args, **kwargs)
+
+    with patch("pathlib.Path.open", mock_path_open):
+        result = click_runner.invoke(anta, ["nrfu", "ndjson", "--output", str(ndjson_output)])
+
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Failed to save NDJSON results to" in result.output
+    assert not ndjson_output.exists()
+
+
+def test_anta_nrfu_parquet(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu parquet."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    parquet_output = tmp_path / "test.parquet"
+    result = click_runner.invoke(anta, ["nrfu", "parquet", "--output", str(parquet_output)])
+    assert result.exit_code == ExitCode.OK
+    assert "Parquet results saved to" in result.output
+    assert pq.read_table(parquet_output).column("test").to_pylist() == ["VerifyEOSVersion"] * 3
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_status"),
+    [pytest.param(["--resume", "{journal}"], "success", id="resume"), pytest.param(["--dry-run"], "unset", id="dry-run")],
+)
+def test_anta_nrfu_parquet_not_run(click_runner: CliRunner, tmp_path: Path, options: list[str], expected_status: str) -> None:
+    """Test anta nrfu parquet with the results of tests which are not run."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    journal = tmp_path / "anta.journal"
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal), "text"])
+    assert result.exit_code == ExitCode.OK
+
+    parquet_output = tmp_path / "test.parquet"
+    result = click_runner.invoke(anta, ["nrfu", *(option.format(journal=journal) for option in options), "parquet", "--output", str(parquet_output)])
+    assert result.exit_code == ExitCode.OK
+    assert pq.read_table(parquet_output).column("result").to_pylist() == [expected_status] * 3
+
+
+def test_anta_nrfu_parquet_missing_pyarrow(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu parquet when pyarrow is not installed."""
+    parquet_output = tmp_path / "test.parquet"
+    with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None}):
+        result = click_runner.invoke(anta, ["nrfu", "parquet", "--output", str(parquet_output)])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "The Parquet report requires the pyarrow package" in result.output
+    assert not parquet_output.exists()
+
+
 def test_anta_nrfu_template(click_runner: CliRunner) -> None:
     """Test anta nrfu, catalog is given via env."""
     result = click_runner.invoke(anta, ["nrfu", "tpl-report", "--template", str(DATA_DIR / "template.j2")])
@@ -177,10 +276,50 @@ def test_anta_nrfu_csv(click_runner: CliRunner, tmp_path: Path) -> None:
     assert csv_output.exists()
 
 
+def test_anta_nrfu_csv_gzip(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu csv with a gzip compressed output."""
+    csv_output = tmp_path / "test.csv.gz"
+    result = click_runner.invoke(anta, ["nrfu", "--hide", "failure", "csv", "--csv-output", str(csv_output)])
+    assert result.exit_code == ExitCode.OK
+    assert "CSV report saved to" in result.output
+    with gzip.open(csv_output, mode="rt", encoding="utf-8", newline="") as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert len(rows) == 4
+    assert all(row[1] == "VerifyEOSVersion" for row in rows[1:])
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_status"),
+    [pytest.param(["--resume", "{journal}"], "success", id="resume"), pytest.param(["--dry-run"], "unset", id="dry-run")],
+)
+def test_anta_nrfu_csv_not_run(click_runner: CliRunner, tmp_path: Path, options: list[str], expected_status: str) -> None:
+    """Test anta nrfu csv with the results of tests which are not run."""
+    journal = tmp_path / "anta.journal"
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(journal), "text"])
+    assert result.exit_code == ExitCode.OK
+
+    csv_output = tmp_path / "test.csv"
+    result = click_runner.invoke(anta, ["nrfu", *(option.format(journal=journal) for option in options), "csv", "--csv-output", str(csv_output)])
+    assert result.exit_code == ExitCode.OK
+    with csv_output.open(encoding="utf-8", newline="") as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert [row[2] for row in rows[1:]] == [expected_status] * 3
+
+
 def test_anta_nrfu_csv_failure(click_runner: CliRunner, tmp_path: Path) -> None:
-    """Test anta nrfu csv."""
+    """Test anta nrfu csv when the output file cannot be opened."""
     csv_output = tmp_path / "test.csv"
-    with patch("anta.reporter.csv_reporter.ReportCsv.generate", side_effect=OSError()):
+
+    original_open = Path.open
+
+    def mock_path_open(*args: Any, **kwargs: Any) -> Path:  # noqa: ANN401
+        """Mock Path.open only for the csv_output file of this test."""
+        if args[0] == csv_output:
+            msg = "Simulated OSError"
+            raise OSError(msg)
+        return original_open(*args, **kwargs)
+
+    with patch("pathlib.Path.open", mock_path_open):
         result = click_runner.invoke(anta, ["nrfu", "csv", "--csv-output", str(csv_output)])
     assert result.exit_code == ExitCode.USAGE_ERROR
     assert "Failed to save CSV report to" in result.output
@@ -274,6 +413,25 @@ def test_anta_nrfu_md_report_with_hide(click_runner: CliRunner, tmp_path: Path)
     assert (row_count - 1) == 0
 
 
+def test_anta_nrfu_md_report_stream(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu md-report with the `--stream` option."""
+    md_output = tmp_path / "test.md"
+    result = click_runner.invoke(anta, ["nrfu", "md-report", "--md-output", str(md_output), "--stream"])
+    assert result.exit_code == ExitCode.OK
+    assert "Markdown report saved to" in result.output
+    assert '## 🧪 Test Results <a id="test-results"></a>' in md_output.read_text(encoding="utf-8")
+
+
+def test_anta_nrfu_md_report_split_by(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu md-report with the `--split-by` option."""
+    md_output = tmp_path / "test.md"
+    result = click_runner.invoke(anta, ["nrfu", "md-report", "--md-output", str(md_output), "--split-by", "device"])
+    assert result.exit_code == ExitCode.OK
+    assert f"Markdown report saved to {md_output} with 3 device reports" in result.output.replace("\n", "")
+    assert "| [leaf1](test/leaf1.md) | 1 | 1 | 0 | 0 | 0 |" in md_output.read_text(encoding="utf-8")
+    assert "| leaf1 | Software | VerifyEOSVersion |" in (tmp_path / "test" / "leaf1.md").read_text(encoding="utf-8")
+
+
 def test_anta_nrfu_table_sort(click_runner: CliRunner) -> None:
     """Test anta nrfu table with --sort-by option."""
     result = click_runner.invoke(
@@ -0,0 +1,159 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.cli.results.commands."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from anta.cli import anta
+from anta.cli.utils import ExitCode
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import CliRunner
+
+
+@pytest.fixture(name="database")
+def database_fixture(click_runner: CliRunner, tmp_path: Path) -> Path:
+    """Return a result database with two runs of the test catalog."""
+    database = tmp_path / "anta.db"
+    for _ in range(2):
+        result = click_runner.invoke(anta, ["nrfu", "--results-db", str(database), "text"])
+        assert result.exit_code == ExitCode.OK
+    return database
+
+
+def test_anta_results_runs(click_runner: CliRunner, database: Path) -> None:
+    """Test anta results runs."""
+    result = click_runner.invoke(anta, ["results", "runs", "--db", str(database)])
+    assert result.exit_code == ExitCode.OK
+    assert "│ 2   │" in result.output
+    assert "│ 1   │" in result.output
+
+    result = click_runner.invoke(anta, ["results", "runs", "--db", str(database), "--last", "1"])
+    assert result.exit_code == ExitCode.OK
+    assert "│ 1   │" not in result.output
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        pytest.param(["--group-by", "test"], "│ VerifyEOSVersion │ 3     │", id="last run"),
+        pytest.param(["--group-by", "test", "--last", "2"], "│ VerifyEOSVersion │ 6     │", id="last runs"),
+        pytest.param(["--group-by", "run", "--last", "2", "--device", "leaf1"], "│ 2   │ 1     │", id="device"),
+        pytest.param(["--group-by", "status", "--run", "1"], "│ success │ 3     │", id="run"),
+        pytest.param(["--group-by", "test", "--status", "failure"], "┃ Test ┃ Count ┃", id="no failure"),
+    ],
+)
+def test_anta_results_query_group_by(click_runner: CliRunner, database: Path, args: list[str], expected: str) -> None:
+    """Test anta results query --group-by."""
+    result = click_runner.invoke(anta, ["results", "query", "--db", str(database), *args])
+    assert result.exit_code == ExitCode.OK
+    assert expected in result.output
+
+
+def test_anta_results_query(click_runner: CliRunner, database: Path) -> None:
+    """Test anta results query listing the results of the most recent run."""
+    result = click_runner.invoke(anta, ["results", "query", "--db", str(database), "--test", "VerifyEOSVersion"])
+    assert result.exit_code == ExitCode.OK
+    assert "All tests results" in result.output
+    assert result.output.count("VerifyEOSVersion") == 3
+
+
+def test_anta_results_invalid_database(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta results query with a file which is not a result database."""
+    database = tmp_path / "anta.db"
+    database.write_text("Not a database" * 100, encoding="utf-8")
+    result = click_runner.invoke(anta, ["results", "query", "--db", str(database)])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Unable to open result database" in result.output
+
+
+@pytest.fixture(name="reports")
+def reports_fixture(click_runner: CliRunner, tmp_path: Path) -> dict[str, Path]:
+    """Return a JSON report, an NDJSON report and a run journal of the same run of the test catalog."""
+    reports = {"json": tmp_path / "report.json", "ndjson": tmp_path / "report.ndjson", "journal": tmp_path / "anta.journal"}
+    result = click_runner.invoke(anta, ["nrfu", "--journal", str(reports["journal"]), "json", "--output", str(reports["json"])])
+    assert result.exit_code == ExitCode.OK
+    result = click_runner.invoke(anta, ["nrfu", "ndjson", "--output", str(reports["ndjson"])])
+    assert result.exit_code == ExitCode.OK
+    return reports
+
+
+@pytest.mark.parametrize(("baseline", "current"), [("json", "ndjson"), ("ndjson", "json"), ("journal", "journal")])
+def test_anta_results_diff(click_runner: CliRunner, reports: dict[str, Path], baseline: str, current: str) -> None:
+    """Test anta results diff between reports of identical runs."""
+    result = click_runner.invoke(anta, ["results", "diff", str(reports[baseline]), str(reports[current])])
+    assert result.exit_code == ExitCode.OK
+    assert "│ Unchanged        │ 3     │" in result.output
+    assert "Results diff summary" in result.output
+
+
+def test_anta_results_diff_new_failure(click_runner: CliRunner, reports: dict[str, Path], tmp_path: Path) -> None:
+    """Test anta results diff exit code when a test is failing in the current run."""
+    results = json.loads(reports["json"].read_text(encoding="utf-8"))
+    results[0].update(result="failure", messages=["EOS version mismatch"])
+    current = tmp_path / "current.json"
+    current.write_text(json.dumps(results), encoding="utf-8")
+    result = click_runner.invoke(anta, ["results", "diff", str(reports["ndjson"]), str(current)])
+    assert result.exit_code == ExitCode.TESTS_FAILED
+    assert "│ New failures     │ 1     │" in result.output
+    assert "EOS version mismatch" in result.output
+
+    result = click_runner.invoke(anta, ["results", "diff", str(current), str(reports["ndjson"])])
+    assert result.exit_code == ExitCode.OK
+    assert "│ Fixed failures   │ 1     │" in result.output
+
+
+def test_anta_results_diff_duplicate_tests(click_runner: CliRunner, reports: dict[str, Path], tmp_path: Path) -> None:
+    """Test anta results diff when the same test defined twice for a device is reported in another order."""
+    results = json.loads(reports["json"].read_text(encoding="utf-8"))
+    results[1]["name"] = results[0]["name"]
+    results[0].update(result="failure", messages=["EOS version mismatch"])
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(results), encoding="utf-8")
+    current.write_text(json.dumps(results[::-1]), encoding="utf-8")
+    result = click_runner.invoke(anta, ["results", "diff", str(baseline), str(current)])
+    assert result.exit_code == ExitCode.OK
+    assert "│ Unchanged        │ 3     │" in result.output
+
+
+def test_anta_results_diff_database(click_runner: CliRunner, database: Path) -> None:
+    """Test anta results diff between runs stored in a result database."""
+    result = click_runner.invoke(anta, ["results", "diff", "--db", str(database), "1", "2"])
+    assert result.exit_code == ExitCode.OK
+    assert "│ Unchanged        │ 3     │" in result.output
+
+    result = click_runner.invoke(anta, ["results", "diff", "--db", str(database), "1", "42"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Run 42 not found in result database" in result.output
+
+    result = click_runner.invoke(anta, ["results", "diff", "--db", str(database), "1", "last"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "BASELINE and CURRENT must be run identifiers" in result.output
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param(None, "No such file or directory", id="missing file"),
+        pytest.param("Not a report", "is not a JSON report, an NDJSON report or a run journal", id="invalid report"),
+    ],
+)
+def test_anta_results_diff_invalid_file(
+    caplog: pytest.LogCaptureFixture, click_runner: CliRunner, reports: dict[str, Path], tmp_path: Path, content: str | None, expected: str
+) -> None:
+    """Test anta results diff with a file which is not a report."""
+    current = tmp_path / "current.json"
+    if content is not None:
+        current.write_text(content, encoding="utf-8")
+    result = click_runner.invoke(anta, ["results", "diff", str(reports["json"]), str(current)])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Unable to compare the test results" in caplog.text
+    assert expected in caplog.text
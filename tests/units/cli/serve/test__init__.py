@@ -0,0 +1,56 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.cli.serve."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+from anta.cli import anta
+from anta.cli.utils import ExitCode
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import CliRunner
+
+
+def test_anta_serve_help(click_runner: CliRunner) -> None:
+    """Test anta serve --help."""
+    result = click_runner.invoke(anta, ["serve", "--help"])
+    assert result.exit_code == ExitCode.OK
+    assert "Usage: anta serve" in result.output
+
+
+def test_anta_serve(click_runner: CliRunner) -> None:
+    """Test anta serve."""
+    with patch("anta.cli.serve._serve", new=AsyncMock()) as serve_mock:
+        result = click_runner.invoke(anta, ["serve", "--port", "8888", "--tags", "leaf", "--job-concurrency", "10"])
+    assert result.exit_code == ExitCode.OK
+    assert "Serving ANTA on http://127.0.0.1:8888" in result.output
+    serve_mock.assert_awaited_once()
+    assert serve_mock.await_args is not None
+    service, host, port, unix_socket = serve_mock.await_args.args
+    assert (host, port, unix_socket) == ("127.0.0.1", 8888, None)
+    assert service.default_filters.tags == {"leaf"}
+    assert service._runner_settings.max_concurrency == 10
+
+
+def test_anta_serve_unix_socket(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta serve --unix-socket."""
+    socket = tmp_path / "anta.sock"
+    with patch("anta.cli.serve._serve", new=AsyncMock()) as serve_mock:
+        result = click_runner.invoke(anta, ["serve", "--unix-socket", str(socket)])
+    assert result.exit_code == ExitCode.OK
+    assert f"Serving ANTA on unix:{socket}" in result.output
+    assert serve_mock.await_args is not None
+    assert serve_mock.await_args.args[3] == socket
+
+
+def test_anta_serve_error(click_runner: CliRunner) -> None:
+    """Test anta serve when the service cannot be started."""
+    with patch("anta.cli.serve._serve", new=AsyncMock(side_effect=OSError("Address already in use"))):
+        result = click_runner.invoke(anta, ["serve"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
@@ -92,3 +92,14 @@ def setenvvar(monkeypatch: pytest.MonkeyPatch) -> Generator[pytest.MonkeyPatch,
     """Fixture to set environment variables for testing."""
     with mock.patch.dict(os.environ, clear=True):
         yield monkeypatch
+
+
+class Py310AsyncioTimeoutError(Exception):
+    """Stand-in for `asyncio.TimeoutError` on Python 3.10, which is neither the builtin TimeoutError nor an OSError."""
+
+
+@pytest.fixture
+def py310_asyncio_timeout_error() -> Iterator[type[Exception]]:
+    """Replace `asyncio.TimeoutError` by an exception behaving as on Python 3.10 and return it."""
+    with patch("asyncio.TimeoutError", Py310AsyncioTimeoutError):
+        yield Py310AsyncioTimeoutError
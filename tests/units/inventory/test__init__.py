@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
@@ -17,12 +18,12 @@ from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from _pytest.mark.structures import ParameterSet
+    from httpx import URL
 
     from anta.device import AntaDevice
 
+DATA_DIR: Path = Path(__file__).parent.parent.parent.resolve() / "data"
 
 INIT_VALID_PARAMS: list[ParameterSet] = [
     pytest.param(
@@ -103,6 +104,51 @@ class TestAntaInventory:
             _ = AntaInventory.parse(filename="dummy.yml", username="arista", password="arista123")
         assert "Unable to parse ANTA Device Inventory file" in caplog.records[0].message
 
+    @pytest.mark.parametrize(
+        ("tags", "devices", "established_only", "expected"),
+        [
+            pytest.param(None, None, False, ["leaf1", "leaf2", "spine1"], id="no filter"),
+            pytest.param({"leaf"}, None, False, ["leaf1", "leaf2"], id="tags"),
+            pytest.param({"spine", "dc1"}, None, False, ["leaf1", "spine1"], id="multiple tags"),
+            pytest.param({"unknown"}, None, False, [], id="unknown tag"),
+            pytest.param(set(), None, False, [], id="empty tags"),
+            pytest.param(None, {"leaf2", "spine1", "unknown"}, False, ["leaf2", "spine1"], id="devices"),
+            pytest.param({"leaf"}, {"leaf2", "spine1"}, False, ["leaf2"], id="tags and devices"),
+            pytest.param(None, None, True, ["leaf1", "spine1"], id="established"),
+            pytest.param({"leaf"}, None, True, ["leaf1"], id="tags and established"),
+        ],
+    )
+    def test_get_inventory(self, tags: set[str] | None, devices: set[str] | None, *, established_only: bool, expected: list[str]) -> None:
+        """Test AntaInventory.get_inventory()."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        inventory["leaf1"].established = True
+        inventory["spine1"].established = True
+        assert list(inventory.get_inventory(established_only=established_only, tags=tags, devices=devices)) == expected
+
+    def test_get_inventory_established_changed(self) -> None:
+        """Test AntaInventory.get_inventory() when the devices established status changes between calls."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        assert not inventory.get_inventory(established_only=True)
+        inventory["leaf2"].established = True
+        assert list(inventory.get_inventory(established_only=True)) == ["leaf2"]
+        # The filtered inventory shares the devices with the original inventory
+        filtered_inventory = inventory.get_inventory(tags={"leaf"})
+        filtered_inventory["leaf1"].established = True
+        assert list(inventory.get_inventory(established_only=True)) == ["leaf1", "leaf2"]
+        inventory["leaf2"].established = False
+        assert list(filtered_inventory.get_inventory(established_only=True)) == ["leaf1"]
+
+    def test_tag_index_updated(self) -> None:
+        """Test the tag index of the inventory is updated when devices are replaced or removed."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        inventory.add_device(AsyncEOSDevice(name="leaf1", host="leaf1.anta.arista.com", username="anta", password="anta", tags={"spine"}))
+        assert list(inventory.get_inventory(tags={"leaf"})) == ["leaf2"]
+        assert list(inventory.get_inventory(tags={"spine"})) == ["leaf1", "spine1"]
+        assert not inventory.get_inventory(tags={"dc1"})
+        del inventory["spine1"]
+        assert list(inventory.get_inventory(tags={"spine"})) == ["leaf1"]
+        assert not inventory.get_inventory(tags={"spine1"})
+
     @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
     def test_max_potential_connections(self, inventory: AntaInventory) -> None:
         """Test max_potential_connections property with regular AsyncEOSDevice objects in the inventory."""
@@ -292,6 +338,120 @@ class TestAntaInventory:
         assert devices_by_host["10.0.1.1"]._client._use_session_auth is False
         assert devices_by_host["10.0.1.2"]._client._use_session_auth is False
 
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            {
+                "anta_inventory": {
+                    "hosts": [{"host": "10.0.0.1", "name": "leaf1", "tags": ["leaf"]}],
+                    "networks": [{"network": "10.0.1.0/30", "tags": ["spine"], "disable_cache": True}],
+                    "ranges": [{"start": "10.0.2.1", "end": "10.0.2.3", "tags": ["leaf"], "use_session_auth": True}],
+                }
+            }
+        ],
+        indirect=["yaml_file"],
+    )
+    async def test_parse_lazy(self, yaml_file: Path) -> None:
+        """Test AntaInventory.parse() with lazy networks and ranges."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123", lazy=True)
+        assert list(inventory) == ["leaf1"]
+        assert [str(entry) for entry in inventory.lazy_entries] == ["10.0.1.0/30", "10.0.2.1-10.0.2.3"]
+
+        # The lazy entries are filtered with the inventory
+        filtered_inventory = inventory.get_inventory(tags={"leaf", "10.0.1.2"})
+        assert list(filtered_inventory) == ["leaf1"]
+        assert [list(entry.addresses()) for entry in filtered_inventory.lazy_entries] == [["10.0.1.2"], ["10.0.2.1", "10.0.2.2", "10.0.2.3"]]
+        assert not inventory.get_inventory(established_only=True).lazy_entries
+        dump = filtered_inventory.dump()
+        assert dump.hosts is not None
+        assert [host.name for host in dump.hosts] == ["leaf1", "10.0.1.2"]
+        assert dump.networks is None
+        assert dump.ranges == [inventory.lazy_entries[1].entry]
+
+        with patch.object(AsyncEOSDevice, "refresh", new=AsyncMock()) as refresh:
+            await filtered_inventory.connect_inventory()
+        assert list(filtered_inventory) == ["leaf1", "10.0.1.2", "10.0.2.1", "10.0.2.2", "10.0.2.3"]
+        assert not filtered_inventory.lazy_entries
+        assert refresh.await_count == 5
+        assert filtered_inventory["10.0.1.2"].cache is None
+        assert all(filtered_inventory[f"10.0.2.{i}"].tags == {"leaf", f"10.0.2.{i}"} for i in range(1, 4))
+        assert all(filtered_inventory[f"10.0.2.{i}"]._client._use_session_auth for i in range(1, 4))
+
+        # The initial inventory is not expanded
+        assert list(inventory) == ["leaf1"]
+        await inventory.expand()
+        assert len(inventory) == 8
+        assert not inventory.lazy_entries
+
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [{"anta_inventory": {"networks": [{"network": "10.0.1.0/30"}]}}],
+        indirect=["yaml_file"],
+    )
+    async def test_parse_probe(self, yaml_file: Path) -> None:
+        """Test AntaInventory.parse() with probed networks."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123", probe=True)
+        assert not inventory
+        assert inventory.lazy_entries[0].probe
+        with patch("anta.inventory.probe.is_port_open", side_effect=lambda url, **_: url.host == "10.0.1.1"):
+            await inventory.expand()
+        assert list(inventory) == ["10.0.1.1"]
+
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            pytest.param({"anta_inventory": {"ranges": [{"start": "10.0.0.1", "end": "fe80::1"}]}}, id="range"),
+        ],
+        indirect=["yaml_file"],
+    )
+    def test_parse_lazy_invalid_range(self, yaml_file: Path) -> None:
+        """Test AntaInventory.parse() with lazy invalid ranges."""
+        with pytest.raises(InventoryIncorrectSchemaError):
+            AntaInventory.parse(filename=yaml_file, username="arista", password="arista123", lazy=True)
+
+    @pytest.mark.parametrize(("device"), [{"name": "base_device"}], indirect=True)
+    async def test_connect_inventory_prescan(self, caplog: pytest.LogCaptureFixture, device: AntaDevice) -> None:
+        """Test AntaInventory.connect_inventory() with a pre-scan of the eAPI ports."""
+        caplog.set_level(logging.INFO)
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        inventory.add_device(device)
+        for name in ("leaf1", "spine1"):
+            inventory[name].is_online = inventory[name].established = True
+
+        with (
+            patch("anta.inventory.probe.is_port_open", side_effect=lambda url, **_: url.host == "leaf1.anta.arista.com") as is_port_open,
+            patch.object(AsyncEOSDevice, "refresh", autospec=True) as async_device_refresh,
+            patch.object(device, "refresh", new=AsyncMock()) as device_refresh,
+        ):
+            await inventory.connect_inventory(prescan=True)
+
+        # The base AntaDevice has no eAPI URL and is not probed
+        assert is_port_open.call_count == 3
+        assert [call.args[0].name for call in async_device_refresh.call_args_list] == ["leaf1"]
+        device_refresh.assert_awaited_once()
+        assert not inventory["spine1"].is_online
+        assert not inventory["spine1"].established
+        assert "2 devices out of 3 do not have an open eAPI port" in caplog.messages
+
+    async def test_connect_inventory_prescan_asyncio_timeout(self, py310_asyncio_timeout_error: type[Exception]) -> None:
+        """Test that a host timing out with asyncio.TimeoutError on Python 3.10 is dropped by the pre-scan instead of aborting it."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+
+        async def port_check_url(url: URL, timeout: float) -> bool:  # noqa: ARG001
+            if url.host == "spine1.anta.arista.com":
+                raise py310_asyncio_timeout_error
+            return True
+
+        with (
+            patch("anta.inventory.probe.port_check_url", side_effect=port_check_url),
+            patch.object(AsyncEOSDevice, "refresh", autospec=True) as refresh,
+        ):
+            await inventory.connect_inventory(prescan=True)
+
+        assert "spine1" not in [call.args[0].name for call in refresh.call_args_list]
+        assert refresh.call_count == len(inventory) - 1
+        assert not inventory["spine1"].established
+
     @pytest.mark.parametrize(("device"), [{"name": "base_device"}], indirect=True)
     async def test_disconnect_inventory_logs_exceptions(self, caplog: pytest.LogCaptureFixture, async_device: AsyncEOSDevice, device: AntaDevice) -> None:
         """Test disconnect_inventory attempts every device and logs individual disconnect errors."""
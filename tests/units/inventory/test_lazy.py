@@ -0,0 +1,87 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.inventory.lazy.py."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from anta.inventory.lazy import LazyInventoryEntry
+from anta.inventory.models import AntaInventoryNetwork, AntaInventoryRange
+
+DEVICE_KWARGS: dict[str, Any] = {"username": "anta", "password": "anta"}
+NETWORK = AntaInventoryNetwork(network="10.0.0.0/29", tags={"leaf"})
+RANGE = AntaInventoryRange(start="10.0.1.250", end="10.0.2.2", tags={"spine"})
+IPV6_RANGE = AntaInventoryRange(start="fe80::fffe", end="fe80::1:1")
+
+
+class TestLazyInventoryEntry:
+    """Tests for anta.inventory.lazy.LazyInventoryEntry."""
+
+    @pytest.mark.parametrize(
+        ("entry", "names", "expected"),
+        [
+            pytest.param(NETWORK, None, [f"10.0.0.{i}" for i in range(8)], id="network"),
+            pytest.param(RANGE, None, [*(f"10.0.1.{i}" for i in range(250, 256)), "10.0.2.0", "10.0.2.1", "10.0.2.2"], id="range"),
+            pytest.param(IPV6_RANGE, None, ["fe80::fffe", "fe80::ffff", "fe80::1:0", "fe80::1:1"], id="ipv6 range"),
+            pytest.param(NETWORK, frozenset({"10.0.0.5", "10.0.0.10", "10.0.0.1", "leaf1"}), ["10.0.0.1", "10.0.0.5"], id="network names"),
+            pytest.param(RANGE, frozenset({"10.0.1.249", "10.0.2.0", "10.0.1.255", "fe80::1"}), ["10.0.1.255", "10.0.2.0"], id="range names"),
+        ],
+    )
+    def test_addresses(self, entry: AntaInventoryNetwork | AntaInventoryRange, names: frozenset[str] | None, expected: list[str]) -> None:
+        """Test LazyInventoryEntry.addresses()."""
+        assert list(LazyInventoryEntry(entry, DEVICE_KWARGS, names=names).addresses()) == expected
+
+    @pytest.mark.parametrize(
+        ("tags", "devices", "expected"),
+        [
+            pytest.param(None, None, [f"10.0.0.{i}" for i in range(8)], id="no filter"),
+            pytest.param({"leaf", "spine"}, None, [f"10.0.0.{i}" for i in range(8)], id="entry tags"),
+            pytest.param({"spine", "10.0.0.3"}, None, ["10.0.0.3"], id="device name tag"),
+            pytest.param({"spine"}, None, None, id="other tags"),
+            pytest.param(None, {"10.0.0.3", "10.0.0.1", "leaf1"}, ["10.0.0.1", "10.0.0.3"], id="devices"),
+            pytest.param({"leaf"}, {"10.0.0.3"}, ["10.0.0.3"], id="entry tags and devices"),
+            pytest.param({"10.0.0.2", "10.0.0.3"}, {"10.0.0.3", "10.0.0.4"}, ["10.0.0.3"], id="device name tags and devices"),
+            pytest.param(None, {"leaf1"}, None, id="other devices"),
+        ],
+    )
+    def test_filter(self, tags: set[str] | None, devices: set[str] | None, expected: list[str] | None) -> None:
+        """Test LazyInventoryEntry.filter()."""
+        entry = LazyInventoryEntry(NETWORK, DEVICE_KWARGS).filter(tags, devices)
+        if expected is None:
+            assert entry is None
+        else:
+            assert entry is not None
+            assert list(entry.addresses()) == expected
+
+    async def test_expand(self) -> None:
+        """Test LazyInventoryEntry.expand()."""
+        entry = LazyInventoryEntry(RANGE, {**DEVICE_KWARGS, "disable_cache": True})
+        devices = await entry.expand()
+        assert [device.name for device in devices] == list(entry.addresses())
+        assert all(device.tags == {"spine", device.name} for device in devices)
+        assert all(device.cache is None for device in devices)
+
+    @pytest.mark.parametrize(
+        ("probe", "override", "expected"),
+        [
+            pytest.param(True, None, ["10.0.0.2", "10.0.0.5"], id="probe"),
+            pytest.param(True, False, [f"10.0.0.{i}" for i in range(8)], id="probe disabled"),
+            pytest.param(False, True, ["10.0.0.2", "10.0.0.5"], id="probe enabled"),
+        ],
+    )
+    async def test_expand_probe(self, *, probe: bool, override: bool | None, expected: list[str]) -> None:
+        """Test LazyInventoryEntry.expand() when probing the eAPI port of the addresses."""
+        entry = LazyInventoryEntry(NETWORK, DEVICE_KWARGS, probe=probe)
+        with patch("anta.inventory.probe.is_port_open", side_effect=lambda url, **_: url.host in {"10.0.0.2", "10.0.0.5"}) as is_port_open:
+            devices = await entry.expand(probe=override)
+        assert [device.name for device in devices] == expected
+        if probe if override is None else override:
+            assert is_port_open.call_count == 8
+            assert is_port_open.call_args.args[0].scheme == "https"
+        else:
+            is_port_open.assert_not_called()
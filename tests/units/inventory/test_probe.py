@@ -0,0 +1,86 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.inventory.probe.py."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from httpx import URL
+
+from anta.inventory.probe import is_port_open, probe_ports
+from asynceapi.aio_portcheck import port_check_url
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine
+
+
+@pytest.fixture
+async def open_port() -> AsyncIterator[int]:
+    """Return a local TCP port accepting connections."""
+    server = await asyncio.start_server(lambda _reader, writer: writer.close(), host="127.0.0.1", port=0)
+    async with server:
+        yield server.sockets[0].getsockname()[1]
+
+
+@pytest.fixture
+def closed_port() -> int:
+    """Return a local TCP port not accepting connections."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+async def test_is_port_open(open_port: int, closed_port: int) -> None:
+    """Test is_port_open()."""
+    assert await is_port_open(URL(f"https://127.0.0.1:{open_port}"))
+    assert not await is_port_open(URL(f"https://127.0.0.1:{closed_port}"))
+
+
+async def test_is_port_open_timeout() -> None:
+    """Test is_port_open() when the connection times out."""
+    with patch("anta.inventory.probe.port_check_url", side_effect=TimeoutError):
+        assert not await is_port_open(URL("https://192.0.2.1"), timeout=0.1)
+
+
+async def test_is_port_open_asyncio_timeout(py310_asyncio_timeout_error: type[Exception]) -> None:
+    """Test is_port_open() when the connection times out with asyncio.TimeoutError on Python 3.10."""
+    with patch("anta.inventory.probe.port_check_url", side_effect=py310_asyncio_timeout_error):
+        assert not await is_port_open(URL("https://192.0.2.1"), timeout=0.1)
+
+
+async def test_port_check_url_asyncio_timeout(py310_asyncio_timeout_error: type[Exception]) -> None:
+    """Test port_check_url() when asyncio.wait_for() raises asyncio.TimeoutError on Python 3.10."""
+
+    async def wait_for(coro: Coroutine[Any, Any, Any], timeout: float) -> None:  # noqa: ARG001
+        coro.close()
+        raise py310_asyncio_timeout_error
+
+    with patch("asyncio.wait_for", new=wait_for):
+        assert not await port_check_url(URL("https://192.0.2.1"), timeout=0.1)
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 100])
+async def test_probe_ports(concurrency: int) -> None:
+    """Test probe_ports() returns the items with an open port in the input order."""
+    max_running = running = 0
+
+    async def _is_port_open(url: URL, timeout: float) -> bool:  # noqa: ARG001
+        nonlocal max_running, running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001 * (int(url.port or 0) % 3))
+        running -= 1
+        return int(url.port or 0) % 2 == 0
+
+    with patch("anta.inventory.probe.is_port_open", side_effect=_is_port_open):
+        items = await probe_ports(range(1, 11), lambda item: URL(f"https://127.0.0.1:{item}"), concurrency=concurrency)
+
+    assert items == [2, 4, 6, 8, 10]
+    assert max_running == min(concurrency, 10)
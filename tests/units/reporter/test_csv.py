@@ -6,15 +6,20 @@
 # pylint: disable=too-few-public-methods
 
 import csv
+import gc
+import gzip
 import pathlib
+import tracemalloc
 from collections.abc import Callable
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 
-from anta.reporter.csv_reporter import ReportCsv
+from anta.reporter.csv_reporter import ReportCsv, ReportCsvWriter
 from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus
+from anta.result_manager.models import TestResult as AntaTestResult
 from anta.tools import convert_categories
 
 
@@ -92,3 +97,100 @@ class TestReportCsv:
 
         assert len(caplog.record_tuples) == 1
         assert "OSError caught while writing the CSV file" in caplog.text
+
+    def test_convert_to_list_categories_cache(self) -> None:
+        """Test that the categories of the test results are converted once per report class."""
+
+        class PipeReportCsv(ReportCsv):
+            @classmethod
+            def split_list_to_txt_list(cls, usr_list: list[str], delimiter: str = " | ") -> str:
+                return super().split_list_to_txt_list(usr_list, delimiter)
+
+        results = [AntaTestResult(name=f"device{index}", test="VerifyTest", categories=["cache", "bgp"], description="") for index in range(3)]
+        with patch("anta.reporter.csv_reporter.convert_categories", wraps=convert_categories) as convert:
+            assert {ReportCsv.convert_to_list(result)[5] for result in results} == {"Cache - BGP"}
+            assert {PipeReportCsv.convert_to_list(result)[5] for result in results} == {"Cache | BGP"}
+        assert convert.call_count == 2
+
+
+class TestReportCsvWriter:
+    """Tester for ReportCsvWriter class."""
+
+    def test_write(self, result_manager: ResultManager, tmp_path: pathlib.Path) -> None:
+        """Test that the rows are the rows of ReportCsv.convert_to_list()."""
+        csv_filename = tmp_path / "test.csv"
+        with ReportCsvWriter(csv_filename) as report:
+            for result in result_manager:
+                report.write(result)
+        assert report.count == len(result_manager)
+
+        with pathlib.Path.open(csv_filename, encoding="utf-8", newline="") as csvfile:
+            rows = list(csv.reader(csvfile, delimiter=","))
+        assert rows[1:] == [ReportCsv.convert_to_list(result) for result in result_manager]
+
+    def test_report_class(self, result_manager: ResultManager, tmp_path: pathlib.Path) -> None:
+        """Test that the rows are built with the convert_to_list() method of a ReportCsv subclass."""
+
+        class UpperReportCsv(ReportCsv):
+            @classmethod
+            def convert_to_list(cls, result: AntaTestResult) -> list[str]:
+                return [value.upper() for value in super().convert_to_list(result)]
+
+        csv_filename = tmp_path / "test.csv"
+        UpperReportCsv.generate(result_manager, csv_filename)
+
+        with pathlib.Path.open(csv_filename, encoding="utf-8", newline="") as csvfile:
+            rows = list(csv.reader(csvfile, delimiter=","))
+        assert rows[1:] == [UpperReportCsv.convert_to_list(result) for result in result_manager]
+        assert all(row[0].isupper() for row in rows[1:])
+
+    def test_gzip(self, result_manager_factory: Callable[..., ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test writing a gzip compressed CSV report."""
+        csv_filename = tmp_path / "test.csv.gz"
+        result_manager = result_manager_factory(10, [AntaTestStatus.FAILURE])
+        ReportCsv.generate(result_manager, csv_filename, compression="gzip")
+
+        with gzip.open(csv_filename, mode="rt", encoding="utf-8", newline="") as csvfile:
+            rows = list(csv.reader(csvfile, delimiter=","))
+        assert rows[1:] == [ReportCsv.convert_to_list(result) for result in result_manager]
+
+    def test_write_closed(self, result_manager_factory: Callable[[int], ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that writing to a closed writer raises a ValueError."""
+        csv_filename = tmp_path / "test.csv"
+        report = ReportCsvWriter(csv_filename)
+        report.close()
+        report.close()
+        with pytest.raises(ValueError, match=f"CSV report {csv_filename} is closed"):
+            report.write(next(iter(result_manager_factory(1))))
+
+    def test_write_os_error(self, result_manager_factory: Callable[[int], ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that an OSError raised while writing a row is raised when the writer is closed."""
+        report = ReportCsvWriter(tmp_path / "test.csv")
+        with patch.object(report, "_writer") as writer:
+            writer.writerow.side_effect = OSError("No space left on device")
+            for result in result_manager_factory(2):
+                report.write(result)
+        assert writer.writerow.call_count == 1
+        with pytest.raises(OSError, match="No space left on device"):
+            report.close()
+
+    def test_write_memory(self, tmp_path: pathlib.Path) -> None:
+        """Test that the peak memory used to write test results as they arrive stays low, as the rows are not kept in memory."""
+        gc.collect()
+        tracemalloc.start()
+        with ReportCsvWriter(tmp_path / "test.csv") as report:
+            for index in range(20_000):
+                report.write(
+                    AntaTestResult(
+                        name=f"device-{index % 100}",
+                        test=f"VerifyTest{index // 100}",
+                        categories=["routing", "bgp"],
+                        description="Verifies the test.",
+                        result=AntaTestStatus.FAILURE if index % 10 == 0 else AntaTestStatus.SUCCESS,
+                        messages=["Peer: 10.0.0.1 VRF: default - Not found"] if index % 10 == 0 else [],
+                    )
+                )
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert report.count == 20_000
+        assert peak < 4 * 2**20
@@ -8,16 +8,17 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Literal
 from unittest.mock import patch
 
 import pytest
 
 # Alias the report section to prevent pytest from collecting it as a test class.
-from anta.reporter.md_reporter import MDReportBase, MDReportGenerator
+from anta.reporter.md_reporter import MDReportBase, MDReportGenerator, report_filename, report_filenames
 from anta.reporter.md_reporter import TestResults as MDTestResults
 from anta.result_manager import ResultManager
 from anta.result_manager.models import AntaTestStatus
+from anta.result_manager.models import TestResult as AntaTestResult
 from anta.tools import convert_categories
 
 if TYPE_CHECKING:
@@ -281,6 +282,85 @@ def test_md_report_generator_generate_sections_expand_results_custom_columns(tmp
     assert content == expected_content
 
 
+def test_md_report_generator_generate_stream(tmp_path: Path, result_manager: ResultManager) -> None:
+    """Test the MDReportGenerator.generate() class method with the stream report option."""
+    md_filename = tmp_path / "test.md"
+    expected_filename = tmp_path / "expected.md"
+
+    MDReportGenerator.generate(result_manager, md_filename, extra_data={"_report_options": {"stream": True}})
+
+    # The results of a device are streamed in the order they were added, as when the results are sorted by device with a stable sort
+    MDReportGenerator.generate(result_manager.sort(sort_by=["name"]), expected_filename)
+    assert md_filename.read_text(encoding="utf-8") == expected_filename.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("split_by", ["device", "category"])
+def test_md_report_generator_generate_split(tmp_path: Path, result_manager: ResultManager, split_by: Literal["device", "category"]) -> None:
+    """Test the MDReportGenerator.generate_split() class method."""
+    md_filename = tmp_path / "report.md"
+    view = result_manager.filter({AntaTestStatus.SUCCESS})
+
+    paths = MDReportGenerator.generate_split(result_manager, md_filename, split_by, test_results=view)
+
+    groups = [name for name, _ in view.iter_groups(split_by)]
+    assert paths == [tmp_path / "report" / report_filename(name) for name in groups]
+    index = md_filename.read_text(encoding="utf-8")
+    assert index.startswith('# 📊 ANTA Report <a id="anta-report"></a>')
+    # The summary sections render all the results, the test results index links to the report of each group
+    assert f"| {len(result_manager)} |" in index
+    for path in paths:
+        assert f"](report/{path.name}) |" in index
+
+    # The report of a group lists its results, not hidden, in order
+    name = groups[0]
+    expected = ResultManager()
+    expected.results = [r for r in view if (r.name == name if split_by == "device" else name in r.categories)]
+    with StringIO() as mdfile:
+        expected_rows = "".join(MDTestResults(mdfile, expected).generate_rows())
+    content = paths[0].read_text(encoding="utf-8")
+    assert "[⬅️ Back to the ANTA Report](../report.md)" in content
+    assert content.endswith(expected_rows)
+    assert "✅&nbsp;Success" not in content
+
+
+def test_md_report_generator_generate_split_collision(tmp_path: Path) -> None:
+    """Test MDReportGenerator.generate_split() with device names leading to the same file name."""
+    md_filename = tmp_path / "report.md"
+    manager = ResultManager()
+    for name in ("leaf 1", "leaf/1"):
+        manager.add(AntaTestResult(name=name, test="VerifyTest", categories=["test"], description="Test", result=AntaTestStatus.SUCCESS))
+
+    paths = MDReportGenerator.generate_split(manager, md_filename, "device")
+
+    assert len(set(paths)) == 2
+    assert all(path.exists() for path in paths)
+    assert [path.read_text(encoding="utf-8").splitlines()[0] for path in paths] == ["# 🧪 leaf 1", "# 🧪 leaf/1"]
+    index = md_filename.read_text(encoding="utf-8")
+    for path in paths:
+        assert f"](report/{path.name}) |" in index
+
+
+def test_md_report_generator_generate_split_error(tmp_path: Path, result_manager: ResultManager) -> None:
+    """Test that OSError is raised when the directory of the reports cannot be created."""
+    md_filename = tmp_path / "report.md"
+    (tmp_path / "report").write_text("Not a directory", encoding="utf-8")
+    with pytest.raises(OSError, match="File exists"):
+        MDReportGenerator.generate_split(result_manager, md_filename, "device")
+
+
+@pytest.mark.parametrize(
+    ("name", "expected_filename"),
+    [
+        pytest.param("leaf1", "leaf1.md", id="device"),
+        pytest.param("path-selection", "path-selection.md", id="category"),
+        pytest.param("dc1/leaf 1", "dc1_leaf_1.md", id="special_characters"),
+    ],
+)
+def test_report_filename(name: str, expected_filename: str) -> None:
+    """Test the report_filename() function."""
+    assert report_filename(name) == expected_filename
+
+
 def test_md_report_base() -> None:
     """Test the MDReportBase class."""
 
@@ -388,3 +468,16 @@ def test_md_report_error(result_manager: ResultManager) -> None:
 
     with pytest.raises(OSError, match="No such file or directory"):
         MDReportGenerator.generate(result_manager, md_filename)
+
+
+@pytest.mark.parametrize(
+    ("names", "expected_filenames"),
+    [
+        pytest.param(["leaf1", "leaf2"], {"leaf1": "leaf1.md", "leaf2": "leaf2.md"}, id="unique"),
+        pytest.param(["leaf 1", "leaf/1"], {"leaf 1": "leaf_1-ccbf76d2.md", "leaf/1": "leaf_1-cd1b5c45.md"}, id="collision"),
+        pytest.param(["Leaf1", "leaf1", "leaf2"], {"Leaf1": "Leaf1-d51c8067.md", "leaf1": "leaf1-d103cfb5.md", "leaf2": "leaf2.md"}, id="case"),
+    ],
+)
+def test_report_filenames(names: list[str], expected_filenames: dict[str, str]) -> None:
+    """Test the report_filenames() function."""
+    assert report_filenames(names) == expected_filenames
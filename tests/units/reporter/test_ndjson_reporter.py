@@ -0,0 +1,81 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.reporter.ndjson_reporter.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from anta.reporter.ndjson_reporter import ReportNDJson
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+    from anta.result_manager import ResultManager
+
+
+def _lines(path: pathlib.Path) -> list[dict[str, object]]:
+    """Return the parsed lines of an NDJSON file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestReportNDJson:
+    """Test ReportNDJson class."""
+
+    def test_write(self, result_manager: ResultManager, tmp_path: pathlib.Path) -> None:
+        """Test that each result is written on its own line, in the order of the writes."""
+        path = tmp_path / "results.ndjson"
+        with ReportNDJson(path) as report:
+            for result in result_manager:
+                report.write(result)
+        assert report.count == len(result_manager)
+        assert _lines(path) == [result.model_dump(mode="json") for result in result_manager]
+
+    def test_flush_buffer_size(self, result_manager_factory: Callable[[int], ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that the buffer is written to the file when it is full."""
+        path = tmp_path / "results.ndjson"
+        results = list(result_manager_factory(3))
+        report = ReportNDJson(path, buffer_size=1, flush_interval=3600)
+        with patch.object(report, "flush", wraps=report.flush) as flush:
+            for result in results:
+                report.write(result)
+            assert flush.call_count == 3
+        report.close()
+        assert len(_lines(path)) == 3
+
+    async def test_flush_interval(self, result_manager_factory: Callable[[int], ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that the buffer is written to the file in the background when the event loop is running."""
+        path = tmp_path / "results.ndjson"
+        result = next(iter(result_manager_factory(1)))
+        report = ReportNDJson(path, flush_interval=0.01)
+        report.write(result)
+        assert path.read_text(encoding="utf-8") == ""
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if path.read_text(encoding="utf-8"):
+                break
+        # The file can be tailed before the writer is closed
+        assert len(_lines(path)) == 1
+        report.close()
+
+    def test_write_closed(self, result_manager_factory: Callable[[int], ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that writing to a closed writer raises a ValueError."""
+        path = tmp_path / "results.ndjson"
+        report = ReportNDJson(path)
+        report.close()
+        with pytest.raises(ValueError, match=f"NDJSON report {path} is closed"):
+            report.write(next(iter(result_manager_factory(1))))
+
+    def test_write_error(self, result_manager_factory: Callable[[int], ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that an error of the background writes is raised when the writer is closed."""
+        report = ReportNDJson(tmp_path / "results.ndjson")
+        report.write(next(iter(result_manager_factory(1))))
+        with patch.object(report._file, "write", side_effect=OSError("No space left on device")), pytest.raises(OSError, match="No space left on device"):
+            report.close()
@@ -0,0 +1,62 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.reporter.parquet_reporter.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from anta.reporter.parquet_reporter import COLUMNS, ReportParquet
+from anta.result_manager.models import AntaTestStatus
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+    from anta.result_manager import ResultManager
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestReportParquet:
+    """Test ReportParquet class."""
+
+    def test_generate(self, result_manager: ResultManager, tmp_path: pathlib.Path) -> None:
+        """Test that the Parquet file contains the results."""
+        path = tmp_path / "results.parquet"
+        ReportParquet.generate(result_manager, path)
+        table = pq.read_table(path)
+        assert tuple(table.column_names) == COLUMNS
+        assert table.to_pylist() == [result.model_dump(mode="json") for result in result_manager]
+
+    def test_dictionary_encoding(self, result_manager: ResultManager, tmp_path: pathlib.Path) -> None:
+        """Test that the repeated strings are dictionary-encoded."""
+        path = tmp_path / "results.parquet"
+        ReportParquet.generate(result_manager, path)
+        schema = pq.read_schema(path)
+        for column in ("name", "test", "description", "result"):
+            assert pa.types.is_dictionary(schema.field(column).type)
+        assert pa.types.is_dictionary(schema.field("categories").type.value_type)
+
+    def test_row_groups(self, result_manager_factory: Callable[..., ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that the results are written one row group at a time."""
+        path = tmp_path / "results.parquet"
+        with ReportParquet(path, row_group_size=4) as report:
+            for result in result_manager_factory(10, [AntaTestStatus.FAILURE]):
+                report.write(result)
+        metadata = pq.ParquetFile(path).metadata
+        assert (metadata.num_rows, metadata.num_row_groups) == (10, 3)
+        assert report.count == 10
+
+    def test_write_closed(self, result_manager_factory: Callable[..., ResultManager], tmp_path: pathlib.Path) -> None:
+        """Test that writing to a closed writer raises a ValueError."""
+        path = tmp_path / "results.parquet"
+        report = ReportParquet(path)
+        report.close()
+        report.close()
+        with pytest.raises(ValueError, match=f"Parquet report {path} is closed"):
+            report.write(next(iter(result_manager_factory(1))))
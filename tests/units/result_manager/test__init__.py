@@ -5,15 +5,17 @@
 
 from __future__ import annotations
 
+import gc
 import json
 import logging
 import re
+import tracemalloc
 from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING
 
 import pytest
 
-from anta.result_manager import ResultManager, models
+from anta.result_manager import ResultManager, ResultManagerView, models
 from anta.result_manager.models import AntaTestStatus
 
 if TYPE_CHECKING:
@@ -168,30 +170,20 @@ class TestResultManager:
                 assert result_manager.status == expected_status
             assert len(result_manager) == 1
 
-    def test_add_clear_cache(self, result_manager: ResultManager, test_result_factory: Callable[..., TestResult]) -> None:
-        """Test ResultManager.add and make sure the cache is reset after adding a new test."""
-        # Check the cache is empty
-        assert "results_by_status" not in result_manager.__dict__
-
-        # Access the cache
+    def test_add_live_indexes(self, result_manager: ResultManager, test_result_factory: Callable[..., TestResult]) -> None:
+        """Test ResultManager.add and make sure the results grouped by status and category are updated after adding a new test."""
         assert result_manager.get_total_results() == 181
-
-        # Check the cache is filled with the correct results count
-        assert "results_by_status" in result_manager.__dict__
-        assert sum(len(v) for v in result_manager.__dict__["results_by_status"].values()) == 181
+        assert sum(len(v) for v in result_manager.results_by_status.values()) == 181
 
         # Add a new test
-        result_manager.add(result=test_result_factory())
-
-        # Check the cache has been reset
-        assert "results_by_status" not in result_manager.__dict__
+        test = test_result_factory()
+        test.result = AntaTestStatus.FAILURE
+        test.categories = ["system"]
+        result_manager.add(result=test)
 
-        # Access the cache again
         assert result_manager.get_total_results() == 182
-
-        # Check the cache is filled again with the correct results count
-        assert "results_by_status" in result_manager.__dict__
-        assert sum(len(v) for v in result_manager.__dict__["results_by_status"].values()) == 182
+        assert result_manager.results_by_status[AntaTestStatus.FAILURE][-1] is test
+        assert result_manager.results_by_category == sorted(result_manager.results, key=lambda res: res.categories)
 
     def test_get_results(self, result_manager: ResultManager) -> None:
         """Test ResultManager.get_results."""
@@ -382,104 +374,120 @@ class TestResultManager:
         assert len(result_manager.get_devices()) == 2
         assert all(t in result_manager.get_devices() for t in ["Device1", "Device2"])
 
-    def test_stats_computation_methods(self, test_result_factory: Callable[..., TestResult], caplog: pytest.LogCaptureFixture) -> None:
-        """Test ResultManager internal stats computation methods."""
+    def test_stats_incremental(self, test_result_factory: Callable[..., TestResult], caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the statistics are updated when adding results, without rescanning the results."""
         result_manager = ResultManager()
+        assert result_manager.device_stats == {}
 
-        # Initially stats should be unsynced
-        assert result_manager._stats_in_sync is False
-
-        # Test _reset_stats
-        result_manager._reset_stats()
-        assert result_manager._stats_in_sync is False
-        assert len(result_manager._device_stats) == 0
-        assert len(result_manager._category_stats) == 0
-        assert len(result_manager._test_stats) == 0
-
-        # Add some test results
         test1 = test_result_factory()
         test1.name = "device1"
         test1.result = AntaTestStatus.SUCCESS
         test1.categories = ["system"]
         test1.test = "test1"
-
-        test2 = test_result_factory()
-        test2.name = "device2"
-        test2.result = AntaTestStatus.FAILURE
-        test2.categories = ["interfaces"]
-        test2.test = "test2"
-
         result_manager.add(test1)
-        result_manager.add(test2)
-
-        # Stats should still be unsynced after adding results
-        assert result_manager._stats_in_sync is False
-
-        # Test _compute_stats directly
-        with caplog.at_level(logging.INFO):
-            result_manager._compute_stats()
-        assert "Computing statistics for all results" in caplog.text
-        assert result_manager._stats_in_sync is True
-
-        # Verify stats content
-        assert len(result_manager._device_stats) == 2
-        assert len(result_manager._category_stats) == 2
-        assert len(result_manager._test_stats) == 2
-        assert result_manager._device_stats["device1"].tests_success_count == 1
-        assert result_manager._device_stats["device2"].tests_failure_count == 1
-        assert result_manager._category_stats["system"].tests_success_count == 1
-        assert result_manager._category_stats["interfaces"].tests_failure_count == 1
-        assert result_manager._test_stats["test1"].devices_success_count == 1
-        assert result_manager._test_stats["test2"].devices_failure_count == 1
-
-    def test_stats_property_computation(self, test_result_factory: Callable[..., TestResult], caplog: pytest.LogCaptureFixture) -> None:
-        """Test that stats are computed only once when accessed via properties."""
-        result_manager = ResultManager()
 
-        # Add some test results
-        test1 = test_result_factory()
-        test1.name = "device1"
-        test1.result = AntaTestStatus.SUCCESS
-        test1.categories = ["system"]
-        result_manager.add(test1)
+        assert result_manager.device_stats["device1"].tests_success_count == 1
+        assert result_manager.category_stats["system"].tests_success_count == 1
+        assert result_manager.test_stats["test1"].devices_success_count == 1
 
         test2 = test_result_factory()
         test2.name = "device2"
         test2.result = AntaTestStatus.FAILURE
         test2.categories = ["interfaces"]
-        result_manager.add(test2)
-
-        # Stats should be unsynced after adding results
-        assert result_manager._stats_in_sync is False
-        assert "Computing statistics" not in caplog.text
-
-        # Access device_stats property - should trigger computation
-        with caplog.at_level(logging.INFO):
-            _ = result_manager.device_stats
-        assert "Computing statistics for all results" in caplog.text
-        assert result_manager._stats_in_sync is True
-
-        # Clear the log
-        caplog.clear()
-
-        # Access other stats properties - should not trigger computation again
-        with caplog.at_level(logging.INFO):
-            _ = result_manager.category_stats
-            _ = result_manager.test_stats
-        assert "Computing statistics" not in caplog.text
-
-        # Add another result - should mark stats as unsynced
-        test3 = test_result_factory()
-        test3.name = "device3"
-        test3.result = AntaTestStatus.ERROR
-        result_manager.add(test3)
-        assert result_manager._stats_in_sync is False
+        test2.test = "test2"
+        with caplog.at_level(logging.DEBUG):
+            result_manager.add(test2)
+        assert caplog.text == ""
+
+        assert len(result_manager.device_stats) == 2
+        assert result_manager.device_stats["device2"].tests_failure_count == 1
+        assert result_manager.device_stats["device2"].tests_failure == {"test2"}
+        assert result_manager.device_stats["device2"].categories_failed == {"interfaces"}
+        assert result_manager.category_stats["interfaces"].tests_failure_count == 1
+        assert result_manager.test_stats["test2"].devices_failure_count == 1
+        assert result_manager.test_stats["test2"].devices_failure == {"device2"}
 
-        # Access stats again - should trigger recomputation
-        with caplog.at_level(logging.INFO):
-            _ = result_manager.device_stats
-        assert "Computing statistics for all results" in caplog.text
-        assert result_manager._stats_in_sync is True
+    @pytest.mark.parametrize(
+        "hide",
+        [
+            pytest.param(set(), id="none"),
+            pytest.param({AntaTestStatus.SUCCESS}, id="success"),
+            pytest.param({AntaTestStatus.SKIPPED}, id="skipped"),
+            pytest.param({AntaTestStatus.FAILURE, AntaTestStatus.ERROR}, id="failure-error"),
+            pytest.param({AntaTestStatus.ERROR}, id="error"),
+            pytest.param(set(AntaTestStatus), id="all"),
+        ],
+    )
+    def test_filter_stats(self, result_manager: ResultManager, hide: set[AntaTestStatus]) -> None:
+        """Test that the statistics of a filtered ResultManager are the statistics of its results."""
+        filtered = result_manager.filter(hide)
+        expected = ResultManager()
+        expected.results = filtered.results
+        assert filtered.device_stats == expected.device_stats
+        assert filtered.category_stats == expected.category_stats
+        assert filtered.test_stats == expected.test_stats
+
+    def test_merge_stats(self, result_manager: ResultManager) -> None:
+        """Test that the statistics of merged ResultManager instances are the statistics of their results."""
+        first = result_manager.filter({AntaTestStatus.SUCCESS})
+        second = result_manager.filter({AntaTestStatus.FAILURE, AntaTestStatus.ERROR, AntaTestStatus.SKIPPED})
+        merged = ResultManager.merge_results([first, second, result_manager])
+        expected = ResultManager()
+        expected.results = [*first.results, *second.results, *result_manager.results]
+        assert merged.device_stats == expected.device_stats
+        assert merged.category_stats == expected.category_stats
+        assert merged.test_stats == expected.test_stats
+        assert merged.status == expected.status
+        assert merged.error_status == expected.error_status
+        assert merged.results == expected.results
+
+    @pytest.mark.parametrize("compact", [pytest.param(False, id="list"), pytest.param(True, id="compact")])
+    def test_merge_indexes(self, result_manager: ResultManager, test_result_factory: Callable[[], TestResult], *, compact: bool) -> None:
+        """Test that the indexes of merged ResultManager instances select the same results as the indexes of the added results."""
+        first, second = ResultManager(compact=compact), ResultManager(compact=compact)
+        first.results = result_manager.results[::2]
+        second.results = result_manager.results[1::2]
+        merged = ResultManager.merge_results([first, second, first])
+        # Results added to a merged ResultManager after the merge are not in the merged ResultManager
+        first.add(test_result_factory())
+        merged.add(test_result_factory())
+        expected = ResultManager(compact=compact)
+        expected.results = [*result_manager.results[::2], *result_manager.results[1::2], *result_manager.results[::2], test_result_factory()]
+        assert merged.compact == compact
+        assert [r.model_dump() for r in merged] == [r.model_dump() for r in expected]
+        for status in AntaTestStatus:
+            assert [r.model_dump() for r in merged.get_results({status})] == [r.model_dump() for r in expected.get_results({status})]
+        assert [r.model_dump() for r in merged.results_by_category] == [r.model_dump() for r in expected.results_by_category]
+        assert [r.model_dump() for r in merged.filter({AntaTestStatus.SUCCESS})] == [r.model_dump() for r in expected.filter({AntaTestStatus.SUCCESS})]
+        assert merged.device_stats == expected.device_stats
+        assert merged.test_stats == expected.test_stats
+        assert (merged.status, merged.error_status) == (expected.status, expected.error_status)
+
+    def test_merge_sorted(self, result_manager: ResultManager) -> None:
+        """Test merging sorted ResultManager instances in order."""
+        first, second = ResultManager(), ResultManager()
+        first.results = result_manager.results[::2]
+        second.results = result_manager.results[1::2]
+        merged = ResultManager.merge_results([first.sort(["name", "test"]), second.sort(["name", "test"])], sorted_by=["name", "test"])
+        assert [(r.name, r.test) for r in merged] == sorted((r.name, r.test) for r in result_manager)
+        assert merged.get_total_results({AntaTestStatus.FAILURE}) == result_manager.get_total_results({AntaTestStatus.FAILURE})
+        assert merged.device_stats == result_manager.device_stats
+        with pytest.raises(ValueError, match="Invalid sort_by fields"):
+            ResultManager.merge_results([first, second], sorted_by=["unknown"])
+
+    @pytest.mark.parametrize("compact", [pytest.param(False, id="list"), pytest.param(True, id="compact")])
+    def test_iter_groups(self, result_manager: ResultManager, *, compact: bool) -> None:
+        """Test iterating over the results grouped by device or by category, in order."""
+        manager = ResultManager(compact=compact)
+        manager.results = result_manager.results
+        by_device = [(device, [r.model_dump() for r in results]) for device, results in manager.iter_groups("device")]
+        assert by_device == [(device, [r.model_dump() for r in manager if r.name == device]) for device in sorted(manager.device_stats)]
+        by_category = [(category, [r.model_dump() for r in results]) for category, results in manager.iter_groups("category")]
+        assert by_category == [(category, [r.model_dump() for r in manager if category in r.categories]) for category in sorted(manager.category_stats)]
+        view = manager.filter({AntaTestStatus.SUCCESS})
+        assert sum(len(list(results)) for _, results in view.iter_groups("device")) == len(view)
+        with pytest.raises(ValueError, match="Cannot group the results by 'test'"):
+            next(manager.iter_groups("test"))  # type: ignore[arg-type]
 
     def test_sort_by_result(self, test_result_factory: Callable[[], TestResult]) -> None:
         """Test sorting by result."""
@@ -622,3 +630,98 @@ class TestResultManager:
         merged_rm = ResultManager.merge_results([])
         assert isinstance(merged_rm, ResultManager)
         assert len(merged_rm) == 0
+
+    def test_compact(self, result_manager: ResultManager) -> None:
+        """Test that a compact ResultManager reports the same statistics and results as a regular one."""
+        compact_manager = ResultManager(compact=True)
+        for result in result_manager:
+            compact_manager.add(result)
+        assert len(compact_manager) == len(result_manager)
+        assert compact_manager.status == result_manager.status
+        assert compact_manager.error_status == result_manager.error_status
+        assert compact_manager.device_stats == result_manager.device_stats
+        assert compact_manager.category_stats == result_manager.category_stats
+        assert compact_manager.test_stats == result_manager.test_stats
+        for status in AntaTestStatus:
+            assert compact_manager.get_total_results({status}) == result_manager.get_total_results({status})
+        assert compact_manager.get_total_results() == result_manager.get_total_results()
+        failures = {AntaTestStatus.FAILURE, AntaTestStatus.ERROR}
+        assert [r.model_dump() for r in compact_manager.get_results(failures, sort_by=["name", "test"])] == [
+            r.model_dump() for r in result_manager.get_results(failures, sort_by=["name", "test"])
+        ]
+        filtered = compact_manager.filter({AntaTestStatus.SUCCESS})
+        assert filtered.compact
+        assert len(filtered) == result_manager.get_total_results() - result_manager.get_total_results({AntaTestStatus.SUCCESS})
+        assert ResultManager.merge_results([result_manager, compact_manager]).compact
+        assert json.loads(compact_manager.json) == compact_manager.dump
+        assert compact_manager.sort(["result"]).results[0].result == AntaTestStatus.ERROR
+
+    def test_compact_memory(self) -> None:
+        """Test that a compact ResultManager uses at least 10 times less memory than a regular one for the same results."""
+        memory: dict[bool, int] = {}
+        for compact in (False, True):
+            gc.collect()
+            tracemalloc.start()
+            manager = ResultManager(compact=compact)
+            for device in range(25):
+                for test in range(200):
+                    result = models.TestResult(name=f"device-{device}", test=f"VerifyTest{test}", categories=["routing", "bgp"], description=f"Verifies {test}.")
+                    if test % 10 == 0:
+                        result.is_failure(f"Peer: 10.0.{device}.{test} - Session state is not established - State: Idle")
+                    else:
+                        result.is_success()
+                    manager.add(result)
+            gc.collect()
+            memory[compact], _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert manager.get_total_results({AntaTestStatus.FAILURE}) == 500
+            del manager
+        assert memory[True] * 10 < memory[False]
+
+    @pytest.mark.parametrize("compact", [pytest.param(False, id="list"), pytest.param(True, id="compact")])
+    def test_view(self, result_manager: ResultManager, *, compact: bool) -> None:
+        """Test that filters return views of the results matching the filters."""
+        manager = ResultManager(compact=compact)
+        manager.results = result_manager.results
+        view = manager.filter({AntaTestStatus.SUCCESS})
+        assert isinstance(view, ResultManagerView)
+        assert [r.model_dump() for r in view] == [r.model_dump() for r in manager if r.result != AntaTestStatus.SUCCESS]
+        assert view.get_total_results({AntaTestStatus.SUCCESS}) == 0
+        assert view.get_total_results({AntaTestStatus.FAILURE}) == manager.get_total_results({AntaTestStatus.FAILURE})
+        assert view.status == AntaTestStatus.FAILURE
+        assert view.error_status is True
+
+        # Chained filters
+        device = next(iter(manager.device_stats))
+        with pytest.deprecated_call():
+            chained = view.filter({AntaTestStatus.ERROR}).filter_by_devices({device})
+        expected = [r.model_dump() for r in manager if r.result not in {AntaTestStatus.SUCCESS, AntaTestStatus.ERROR} and r.name == device]
+        assert [r.model_dump() for r in chained] == expected
+        assert chained.error_status is False
+        assert chained.device_stats == {device: manager.filter({AntaTestStatus.SUCCESS, AntaTestStatus.ERROR}).device_stats[device]}
+
+        # Sorting a view does not sort the ResultManager
+        first = manager.results[0].model_dump()
+        view.sort(["test"])
+        assert manager.results[0].model_dump() == first
+        assert [r.test for r in view] == sorted(r.test for r in view)
+
+        with pytest.raises(TypeError, match="Cannot add VerifyTest result to a ResultManagerView"):
+            view.add(models.TestResult(name="device", test="VerifyTest", categories=[], description=""))
+
+    @pytest.mark.parametrize("hide", [pytest.param({AntaTestStatus.SUCCESS}, id="status"), pytest.param({AntaTestStatus.FAILURE}, id="failed-status")])
+    def test_view_stats_snapshot(self, result_manager: ResultManager, hide: set[AntaTestStatus]) -> None:
+        """Test that results added to a ResultManager after creating a view are not counted in the view statistics."""
+        view = result_manager.filter(hide)
+        expected = ResultManager()
+        expected.results = view.results
+        for status in AntaTestStatus:
+            result_manager.add(models.TestResult(name="new-device", test="VerifyNewTest", categories=["new"], description="", result=status))
+        assert view.device_stats == expected.device_stats
+        assert view.category_stats == expected.category_stats
+        assert view.test_stats == expected.test_stats
+
+    def test_view_shares_results(self, result_manager: ResultManager) -> None:
+        """Test that a view of a ResultManager does not copy the results."""
+        view = result_manager.filter({AntaTestStatus.FAILURE})
+        assert all(any(result is other for other in result_manager.results) for result in view)
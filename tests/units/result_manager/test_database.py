@@ -0,0 +1,101 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.result_manager.database.py."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from anta.result_manager.database import SCHEMA_VERSION, ResultDatabase
+from anta.result_manager.models import AntaTestStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from anta.result_manager import ResultManager
+
+
+class TestResultDatabase:
+    """Test ResultDatabase class."""
+
+    def test_add_run(self, result_manager: ResultManager, tmp_path: Path) -> None:
+        """Test that stored results are loaded back identical, with their atomic results."""
+        start_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            run_id = db.add_run(result_manager, start_time=start_time, end_time=start_time + timedelta(seconds=90), cancel_reason="Interrupted")
+            loaded = db.load(run_id)
+            (run,) = db.runs()
+        assert [result.model_dump() for result in loaded] == [result.model_dump() for result in result_manager]
+        assert loaded.get_total_results({AntaTestStatus.FAILURE}) == result_manager.get_total_results({AntaTestStatus.FAILURE})
+        assert (run.id, run.start_time, run.duration, run.cancel_reason, run.total_results) == (run_id, start_time, 90.0, "Interrupted", len(result_manager))
+
+    def test_atomic_results(self, result_manager_factory: Callable[..., ResultManager], tmp_path: Path) -> None:
+        """Test that the atomic results are linked to their parent and do not duplicate its messages."""
+        manager = result_manager_factory(2, [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE])
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            db.add_run(manager)
+            loaded = list(db.results())
+        assert [result.model_dump() for result in loaded] == [result.model_dump() for result in manager]
+        assert all(atomic.parent is result for result in loaded for atomic in result.atomic_results)
+
+    def test_runs(self, result_manager_factory: Callable[..., ResultManager], tmp_path: Path) -> None:
+        """Test that the runs are listed the most recent first and that load() defaults to the most recent run."""
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            run_ids = [db.add_run(result_manager_factory(size)) for size in (1, 2, 3)]
+            assert [run.id for run in db.runs()] == run_ids[::-1]
+            assert [(run.id, run.total_results) for run in db.runs(last=2)] == [(run_ids[2], 3), (run_ids[1], 2)]
+            assert len(db.load()) == 3
+        # Runs are kept when the database is reopened
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            assert len(db.runs()) == 3
+
+    def test_load_errors(self, tmp_path: Path) -> None:
+        """Test loading a run which does not exist."""
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            with pytest.raises(ValueError, match="No run stored in result database"):
+                db.load()
+            with pytest.raises(ValueError, match="Run 42 not found in result database"):
+                db.load(42)
+
+    def test_count(self, result_manager: ResultManager, tmp_path: Path) -> None:
+        """Test counting the results across runs."""
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            first, second = db.add_run(result_manager), db.add_run(result_manager)
+            assert db.count() == [(2 * len(result_manager),)]
+            assert db.count(["run"]) == [(first, len(result_manager)), (second, len(result_manager))]
+            by_status = db.count(["status"], runs=[second])
+            assert dict(by_status) == {status: result_manager.get_total_results({status}) for status in AntaTestStatus if result_manager.get_total_results({status})}
+            assert [count for *_, count in by_status] == sorted((count for *_, count in by_status), reverse=True)
+            failures = db.count(["test", "device"], statuses={AntaTestStatus.FAILURE}, runs=[first, second])
+            assert sum(count for *_, count in failures) == 2 * result_manager.get_total_results({AntaTestStatus.FAILURE})
+            device, test = result_manager.results[0].name, result_manager.results[0].test
+            assert db.count(devices={device}, tests={test}) == [(2 * sum(1 for r in result_manager if r.name == device and r.test == test),)]
+
+    def test_results_filters(self, result_manager: ResultManager, tmp_path: Path) -> None:
+        """Test querying the results with filters."""
+        with ResultDatabase(tmp_path / "anta.db") as db:
+            db.add_run(result_manager)
+            errors = list(db.results(statuses={AntaTestStatus.ERROR}))
+        assert [result.model_dump() for result in errors] == [result.model_dump() for result in result_manager.get_results({AntaTestStatus.ERROR})]
+
+    def test_invalid_database(self, tmp_path: Path) -> None:
+        """Test opening a file which is not a result database."""
+        path = tmp_path / "anta.db"
+        path.write_text("Not a database" * 100, encoding="utf-8")
+        with pytest.raises(sqlite3.DatabaseError):
+            ResultDatabase(path)
+
+    def test_unsupported_schema(self, tmp_path: Path) -> None:
+        """Test opening a result database created by a more recent version of ANTA."""
+        path = tmp_path / "anta.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        connection.close()
+        with pytest.raises(sqlite3.DatabaseError, match=f"Unsupported schema version {SCHEMA_VERSION + 1}"):
+            ResultDatabase(path)
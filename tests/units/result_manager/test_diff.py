@@ -0,0 +1,95 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.result_manager.diff.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from anta.result_manager.diff import diff_results, index_results
+from anta.result_manager.journal import ResultJournal
+from anta.result_manager.models import AntaTestStatus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from anta.result_manager.models import TestResult
+
+    from .conftest import TestResultFactoryProtocol
+
+
+def _results(test_result_factory: TestResultFactoryProtocol, statuses: list[AntaTestStatus]) -> list[TestResult]:
+    """Return one result on a distinct device for each status."""
+    results = []
+    for index, status in enumerate(statuses):
+        result = test_result_factory(index, distinct_devices=True)
+        result._set_status(status, message=f"{status} message")
+        results.append(result)
+    return results
+
+
+def test_index_results(test_result_factory: TestResultFactoryProtocol) -> None:
+    """Test that results of the same test defined multiple times in the catalog are told apart by their order."""
+    results = [test_result_factory(index) for index in range(3)]
+    index = index_results(results)
+    assert list(index.values()) == results
+    assert [key[-1] for key in index] == [0, 1, 2]
+
+
+def test_diff_results_duplicate_tests(test_result_factory: TestResultFactoryProtocol) -> None:
+    """Test that results of the same test defined multiple times in the catalog are matched whatever their order."""
+    baseline = [test_result_factory(index) for index in range(3)]
+    baseline[0]._set_status(AntaTestStatus.SUCCESS)
+    baseline[1]._set_status(AntaTestStatus.FAILURE, message="Failure message")
+    baseline[2]._set_status(AntaTestStatus.FAILURE, message="Another failure message")
+
+    diff = diff_results(baseline, baseline[::-1])
+
+    assert diff.unchanged == 3
+    assert not diff.new_failures
+    assert not diff.fixed_failures
+    assert not diff.messages_changed
+
+
+def test_diff_results(test_result_factory: TestResultFactoryProtocol) -> None:
+    """Test the categories of the differences between two runs."""
+    baseline = _results(
+        test_result_factory,
+        [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE, AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE, AntaTestStatus.ERROR, AntaTestStatus.SKIPPED],
+    )
+    current = _results(
+        test_result_factory,
+        [AntaTestStatus.SUCCESS, AntaTestStatus.SUCCESS, AntaTestStatus.ERROR, AntaTestStatus.FAILURE, AntaTestStatus.FAILURE],
+    )
+    current[3].messages = ["Another failure message"]
+    current.append(test_result_factory(42, distinct_devices=True))
+    current[-1]._set_status(AntaTestStatus.FAILURE)
+
+    diff = diff_results(baseline, current)
+
+    assert diff.unchanged == 1
+    assert [change.result.name for change in diff.fixed_failures] == [current[1].name]
+    assert [change.result.name for change in diff.new_failures] == [current[2].name, current[-1].name]
+    assert [change.result.name for change in diff.status_changed] == [current[1].name, current[2].name, current[4].name]
+    assert [(change.previous, change.current) for change in diff.messages_changed] == [(baseline[3], current[3])]
+    assert [(change.previous_status, change.current_status) for change in diff.added] == [(None, AntaTestStatus.FAILURE)]
+    assert [(change.previous, change.current) for change in diff.removed] == [(baseline[5], None)]
+
+
+def test_diff_results_journals(tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+    """Test that the entries of run journals are joined on their key, including the test inputs digest."""
+    baseline, current = _results(test_result_factory, [AntaTestStatus.SUCCESS] * 2), _results(test_result_factory, [AntaTestStatus.FAILURE] * 2)
+    with ResultJournal(tmp_path / "baseline.journal") as baseline_journal, ResultJournal(tmp_path / "current.journal") as current_journal:
+        baseline_journal.append(("device0", "VerifyTest", "digest1"), baseline[0])
+        baseline_journal.append(("device1", "VerifyTest", "digest1"), baseline[1])
+        current_journal.append(("device0", "VerifyTest", "digest1"), current[0])
+        # The inputs of the test changed: this is another test
+        current_journal.append(("device1", "VerifyTest", "digest2"), current[1])
+
+    diff = diff_results(ResultJournal(tmp_path / "baseline.journal", resume=True).entries, ResultJournal(tmp_path / "current.journal", resume=True).entries)
+
+    assert [change.result.name for change in diff.status_changed] == [current[0].name]
+    assert [change.result.name for change in diff.new_failures] == [current[0].name, current[1].name]
+    assert [change.result.name for change in diff.added] == [current[1].name]
+    assert [change.result.name for change in diff.removed] == [baseline[1].name]
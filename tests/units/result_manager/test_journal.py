@@ -0,0 +1,104 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.result_manager.journal.py."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from anta.result_manager.journal import ResultJournal, input_digest
+from anta.result_manager.models import AntaTestStatus
+from anta.tests.software import VerifyEOSVersion
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from anta.result_manager.models import TestResult
+
+    from .conftest import TestResultFactoryProtocol
+
+
+def test_input_digest() -> None:
+    """Test input_digest()."""
+    inputs = VerifyEOSVersion.Input(versions=["4.31.1F"])
+    assert input_digest(inputs) == input_digest(VerifyEOSVersion.Input(versions=["4.31.1F"]))
+    assert input_digest(inputs) != input_digest(VerifyEOSVersion.Input(versions=["4.32.1F"]))
+    assert len(input_digest(inputs)) == 32
+
+
+class TestResultJournal:
+    """Test ResultJournal class."""
+
+    def test_append(self, tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test ResultJournal.append()."""
+        filename = tmp_path / "anta.journal"
+        result: TestResult = test_result_factory(1)
+        with ResultJournal(filename) as journal:
+            journal.append(("device1", "VerifyTest1", "digest"), result)
+            assert len(journal) == 1
+            assert ("device1", "VerifyTest1", "digest") in journal
+            assert journal.get(("device1", "VerifyTest1", "digest")) == result
+            # Entries are flushed to disk as soon as they are appended
+            entry = json.loads(filename.read_text(encoding="utf-8"))
+        assert entry == {"device": "device1", "test": "VerifyTest1", "inputs": "digest", "result": result.model_dump(mode="json")}
+
+    def test_truncate(self, tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test that a journal not resumed is overwritten."""
+        filename = tmp_path / "anta.journal"
+        with ResultJournal(filename) as journal:
+            journal.append(("device1", "VerifyTest1", "digest"), test_result_factory(1))
+        with ResultJournal(filename) as journal:
+            assert len(journal) == 0
+            journal.append(("device2", "VerifyTest2", "digest"), test_result_factory(2))
+        assert len(filename.read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_resume(self, tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test resuming a journal."""
+        filename = tmp_path / "anta.journal"
+        result = test_result_factory(1)
+        with ResultJournal(filename) as journal:
+            journal.append(("device1", "VerifyTest1", "digest"), result)
+        with ResultJournal(filename, resume=True) as journal:
+            assert journal.get(("device1", "VerifyTest1", "digest")) == result
+            journal.append(("device2", "VerifyTest2", "digest"), test_result_factory(2))
+        assert len(ResultJournal(filename, resume=True)) == 2
+
+    def test_resume_missing_file(self, tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test resuming a journal that does not exist yet."""
+        filename = tmp_path / "anta.journal"
+        with ResultJournal(filename, resume=True) as journal:
+            assert len(journal) == 0
+            journal.append(("device1", "VerifyTest1", "digest"), test_result_factory(1))
+        assert len(ResultJournal(filename, resume=True)) == 1
+
+    def test_resume_partial_line(self, caplog: pytest.LogCaptureFixture, tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test resuming a journal with invalid lines, e.g. a partially written last line."""
+        caplog.set_level(logging.WARNING)
+        filename = tmp_path / "anta.journal"
+        with ResultJournal(filename) as journal:
+            journal.append(("device1", "VerifyTest1", "digest"), test_result_factory(1))
+        with filename.open("a", encoding="utf-8") as file:
+            file.write('{"device": "device2"}\n\n{"device": "device3", "te')
+
+        with ResultJournal(filename, resume=True) as journal:
+            assert len(journal) == 1
+            journal.append(("device4", "VerifyTest4", "digest"), test_result_factory(4))
+
+        assert "Skipping invalid entry at line 2" in caplog.text
+        assert "Skipping invalid entry at line 4" in caplog.text
+        # The partial line has been terminated before appending the new entry
+        assert len(ResultJournal(filename, resume=True)) == 2
+
+    def test_resume_atomic_results(self, tmp_path: Path, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test resuming a journal with results having atomic results."""
+        filename = tmp_path / "anta.journal"
+        result = test_result_factory(1, [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE])
+        with ResultJournal(filename) as journal:
+            journal.append(("device1", "VerifyTest1", "digest"), result)
+        entries = ResultJournal(filename, resume=True).entries
+        assert entries[("device1", "VerifyTest1", "digest")].model_dump() == result.model_dump()
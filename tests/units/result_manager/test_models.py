@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from anta.result_manager.models import AntaTestStatus
+from anta.result_manager.models import AntaTestStatus, TestResult
 from tests.units.conftest import DEVICE_NAME
 from tests.units.result_manager.conftest import FAKE_TEST
 
@@ -140,3 +140,11 @@ class TestTestResult:
         assert result.result == AntaTestStatus.FAILURE
         assert result.atomic_results[3].description == "Multiple messages"
         assert len(result.messages) == 2
+
+    def test_from_dump(self, test_result_factory: TestResultFactoryProtocol) -> None:
+        """Test TestResult.from_dump()."""
+        result = test_result_factory(1, [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE])
+        loaded = TestResult.from_dump(result.model_dump(mode="json"))
+        assert loaded.model_dump() == result.model_dump()
+        assert len(loaded.messages) == len(result.messages) == 2
+        assert all(atomic.parent is loaded for atomic in loaded.atomic_results)
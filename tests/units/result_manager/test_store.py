@@ -0,0 +1,124 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta.result_manager.store.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.result_manager.store import CompactResultStore
+
+if TYPE_CHECKING:
+    from anta.result_manager import ResultManager
+
+
+def _result(index: int, status: AntaTestStatus, *, custom_field: str | None = None) -> TestResult:
+    """Return a TestResult with an atomic result and a message."""
+    result = TestResult(name=f"device{index % 2}", test="VerifyTest", categories=["system", "hardware"], description="Verify something", custom_field=custom_field)
+    result.add(description=f"Atomic {index}", status=status, messages=[f"atomic message {index}"])
+    result.messages.append(f"message {index}")
+    result.result = status
+    return result
+
+
+class TestCompactResultStore:
+    """Test CompactResultStore class."""
+
+    def test_materialise(self, result_manager: ResultManager) -> None:
+        """Test that the materialised results are equal to the stored results, except the messages of successful results."""
+        results = result_manager.results
+        store = CompactResultStore(results)
+        assert len(store) == len(results)
+        for original, materialised in zip(results, store, strict=True):
+            if original.result == AntaTestStatus.SUCCESS:
+                assert materialised.messages == []
+                assert materialised.model_dump(exclude={"messages"}) == original.model_dump(exclude={"messages"})
+            else:
+                assert materialised.model_dump() == original.model_dump()
+
+    @pytest.mark.parametrize("status", [AntaTestStatus.FAILURE, AntaTestStatus.ERROR, AntaTestStatus.SKIPPED])
+    def test_atomic_results(self, status: AntaTestStatus) -> None:
+        """Test that atomic results and messages of results which are not successful are kept."""
+        original = _result(0, status, custom_field="custom")
+        materialised = CompactResultStore([original])[0]
+        assert materialised.model_dump() == original.model_dump()
+        assert materialised.atomic_results[0].parent is materialised
+        assert materialised.messages == ["Atomic 0 - atomic message 0", "message 0"]
+
+    def test_success(self) -> None:
+        """Test that the messages of successful results are not kept."""
+        materialised = CompactResultStore([_result(0, AntaTestStatus.SUCCESS)])[0]
+        assert materialised.result == AntaTestStatus.SUCCESS
+        assert materialised.messages == []
+        assert [(atomic.description, atomic.result, atomic.messages) for atomic in materialised.atomic_results] == [("Atomic 0", AntaTestStatus.SUCCESS, [])]
+
+    def test_interning(self) -> None:
+        """Test that the strings and categories are stored once."""
+        store = CompactResultStore(_result(i, AntaTestStatus.FAILURE) for i in range(10))
+        first, second = store[0], store[2]
+        assert first.name is second.name
+        assert first.description is second.description
+        assert first.categories[0] is second.categories[0]
+        # 2 devices, 1 test, 1 description, 2 categories and 10 atomic descriptions
+        assert len(store._strings) == 16
+        assert len(store._categories) == 1
+
+    def test_getitem(self) -> None:
+        """Test CompactResultStore.__getitem__."""
+        store = CompactResultStore(_result(i, AntaTestStatus.FAILURE) for i in range(5))
+        assert store[-1].atomic_results[0].description == "Atomic 4"
+        assert [result.atomic_results[0].description for result in store[1:4:2]] == ["Atomic 1", "Atomic 3"]
+        with pytest.raises(IndexError, match="CompactResultStore index out of range"):
+            store[5]
+
+    def test_fields(self) -> None:
+        """Test CompactResultStore.fields."""
+        store = CompactResultStore(_result(i, AntaTestStatus.FAILURE) for i in range(2))
+        assert store.fields(1) == ("device1", "VerifyTest", ("system", "hardware"), AntaTestStatus.FAILURE)
+
+    def test_subset(self) -> None:
+        """Test CompactResultStore.subset and CompactResultSelection."""
+        statuses = [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE, AntaTestStatus.ERROR, AntaTestStatus.FAILURE]
+        store = CompactResultStore(_result(i, status) for i, status in enumerate(statuses))
+        selection = store.subset([1, 2, 3])
+        assert len(selection) == 3
+        assert selection.fields(1)[3] == AntaTestStatus.ERROR
+        assert [result.atomic_results[0].description for result in selection.subset([0, 2])] == ["Atomic 1", "Atomic 3"]
+        assert [result.atomic_results[0].description for result in selection[::2]] == ["Atomic 1", "Atomic 3"]
+        selection.sort(key=lambda result: result.result)
+        assert [result.result for result in selection] == [AntaTestStatus.ERROR, AntaTestStatus.FAILURE, AntaTestStatus.FAILURE]
+        # Sorting a selection does not modify the store
+        assert [result.result for result in store] == statuses
+        store.sort(key=lambda result: result.result)
+        with pytest.raises(RuntimeError, match="The CompactResultStore of this selection has been sorted"):
+            selection[0]
+
+    def test_sort(self) -> None:
+        """Test CompactResultStore.sort."""
+        statuses = [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE, AntaTestStatus.ERROR, AntaTestStatus.SKIPPED]
+        store = CompactResultStore(_result(i, status, custom_field=str(i)) for i, status in enumerate(statuses))
+        store.sort(key=lambda result: result.result)
+        assert [(result.result, result.custom_field, len(result.messages)) for result in store] == [
+            (AntaTestStatus.ERROR, "2", 2),
+            (AntaTestStatus.FAILURE, "1", 2),
+            (AntaTestStatus.SKIPPED, "3", 2),
+            (AntaTestStatus.SUCCESS, "0", 0),
+        ]
+
+    def test_extend(self) -> None:
+        """Test that the results of another store are copied with their strings remapped to this store."""
+        statuses = [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE, AntaTestStatus.ERROR, AntaTestStatus.SKIPPED]
+        first = [_result(i, status, custom_field=str(i) if i % 2 else None) for i, status in enumerate(statuses)]
+        second = [_result(i + 5, status, custom_field=str(i)) for i, status in enumerate(reversed(statuses))]
+        second[0].categories = ["interfaces"]
+        store = CompactResultStore(first)
+        # The second store interns its strings in another order
+        store.extend(CompactResultStore(second))
+        store.extend(second[:1])
+        # Same strings as the store: the indexes are copied as is
+        store.extend(CompactResultStore(first))
+        assert [result.model_dump() for result in store] == [result.model_dump() for result in CompactResultStore([*first, *second, second[0], *first])]
@@ -5,28 +5,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import logging
 import os
+import tracemalloc
 from collections import defaultdict
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 import respx
 from pydantic import ValidationError
 
-from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
+from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner, OutputRetention
 from anta.catalog import AntaCatalog, AntaTestDefinition
 from anta.device import AsyncEOSDevice
 from anta.inventory import AntaInventory
+from anta.metrics import disable_metrics, enable_metrics
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.result_manager import ResultManager
+from anta.result_manager.journal import ResultJournal
+from anta.result_manager.models import AntaTestStatus
 from anta.result_manager.models import TestResult as AntaTestResult
 from anta.settings import DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, AntaRunnerSettings
 from anta.tests.routing.generic import VerifyRoutingTableEntry
 from tests.units.test_models import FakeTest
 
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
 DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
 
 
@@ -87,6 +97,31 @@ class TestAntaRunner:
 
         assert "Dry-run mode, exiting before running the tests." in caplog.messages
 
+    @pytest.mark.parametrize(
+        ("filters", "expected_devices"),
+        [
+            pytest.param(AntaRunFilters(), 8, id="no filter"),
+            pytest.param(AntaRunFilters(tags={"10.0.0.2", "10.0.0.3"}), 2, id="device name tags"),
+            pytest.param(AntaRunFilters(devices={"10.0.0.5"}), 1, id="devices"),
+            pytest.param(AntaRunFilters(devices={"10.0.1.5"}), 0, id="no match"),
+        ],
+    )
+    async def test_dry_run_lazy_inventory(self, caplog: pytest.LogCaptureFixture, tmp_path: Path, filters: AntaRunFilters, expected_devices: int) -> None:
+        """Test AntaRunner.run() in dry-run with a lazy inventory."""
+        caplog.set_level(logging.INFO)
+        inventory_file = tmp_path / "inventory.yml"
+        inventory_file.write_text("anta_inventory:\n  networks:\n    - network: 10.0.0.0/29\n", encoding="UTF-8")
+        inventory = AntaInventory.parse(filename=inventory_file, username="anta", password="anta", probe=True)
+        catalog = AntaCatalog.parse(filename=DATA_DIR / "test_catalog_with_tags.yml")
+        with patch("anta.inventory.probe.is_port_open") as is_port_open:
+            ctx = await AntaRunner().run(inventory, catalog, filters=filters, dry_run=True)
+
+        # Addresses are not probed in dry-run mode
+        is_port_open.assert_not_called()
+        assert len(ctx.selected_inventory) == expected_devices
+        if not expected_devices:
+            assert "The inventory is empty after filtering by tags/devices. Devices filter: 10.0.1.5. Exiting ..." in caplog.messages
+
     @pytest.mark.parametrize(
         ("filters", "expected_devices", "expected_tests"),
         [
@@ -273,6 +308,22 @@ class TestAntaRunner:
         assert warning_msg in ctx.warnings_at_setup
         assert warning_msg in caplog.messages
 
+    @pytest.mark.parametrize("inventory", [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_prescan(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a pre-scan of the eAPI ports: devices whose port is not open are not refreshed."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        with patch("anta.inventory.probe.is_port_open", side_effect=lambda url, **_: url.host != "device-1.anta.arista.com") as is_port_open:
+            ctx = await AntaRunner().run(inventory, catalog, prescan=True)
+        assert is_port_open.call_count == 3
+        assert ctx.prescan
+        assert ctx.devices_unreachable_at_setup == ["device-1"]
+        assert ctx.total_devices_selected_for_testing == 2
+        assert len(ctx.manager) == 2
+
     @pytest.mark.parametrize(("inventory"), [{"count": 2, "reachable": False}], indirect=True)
     async def test_run_disconnect_closes_unreachable_devices(self, inventory: AntaInventory) -> None:
         """Test that disconnect closes devices touched during setup even when none are selected."""
@@ -530,6 +581,406 @@ class TestAntaRunner:
         for result in ctx.manager.results:
             assert result.result == "failure"
 
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_on_result(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a result callback."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        runner = AntaRunner()
+        streamed: list[AntaTestResult] = []
+
+        ctx = await runner.run(inventory, catalog, on_result=streamed.append)
+
+        assert len(streamed) == 2
+        assert sorted(streamed, key=lambda r: r.name) == sorted(ctx.manager.results, key=lambda r: r.name)
+
+    async def test_run_on_result_dry_run(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a result callback in dry-run mode."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        streamed: list[AntaTestResult] = []
+
+        ctx = await AntaRunner().run(inventory, catalog, dry_run=True, on_result=streamed.append)
+
+        assert len(streamed) == len(inventory)
+        assert streamed == ctx.manager.results
+        assert all(result.result == "unset" for result in streamed)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @pytest.mark.parametrize(
+        ("output_retention", "expected_retained"),
+        [
+            pytest.param(OutputRetention.NONE, set(), id="none"),
+            pytest.param(OutputRetention.FAILURES, {"VerifyRoutingTableEntry"}, id="failures"),
+            pytest.param(OutputRetention.ALL, {"VerifyRoutingTableEntry", "FakeTest"}, id="all"),
+        ],
+    )
+    @respx.mock
+    async def test_run_output_retention(self, inventory: AntaInventory, output_retention: OutputRetention, expected_retained: set[str]) -> None:
+        """Test that the command outputs of the completed tests are released according to the output retention policy."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        routing_test = AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})
+        catalog = AntaCatalog(tests=[routing_test, AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner()
+        get_coroutine_test = AntaRunner._get_coroutine_test
+        tests: list[AntaTest] = []
+
+        def _get_test(coro: Coroutine[Any, Any, AntaTestResult]) -> AntaTest | None:
+            test = get_coroutine_test(coro)
+            if test is not None:
+                tests.append(test)
+            return test
+
+        with patch.object(AntaRunner, "_get_coroutine_test", side_effect=_get_test):
+            ctx = await runner.run(inventory, catalog, output_retention=output_retention)
+
+        assert len(ctx.manager) == len(tests) == 4
+        assert {test.name for test in ctx.retained_tests} == expected_retained
+        assert len(ctx.retained_tests) == 2 * len(expected_retained)
+        for test in tests:
+            retained = any(test is retained_test for retained_test in ctx.retained_tests)
+            assert all((command.output is not None) == retained for command in test.instance_commands)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 10}], indirect=True)
+    @respx.mock
+    async def test_run_output_retention_memory(self, inventory: AntaInventory) -> None:
+        """Test that releasing the command outputs lowers the peak memory of a run and the memory still used after the run."""
+        routes = {f"10.{index // 256}.{index % 256}.0/24": {"routeType": "eBGP", "vias": [{"nexthopAddr": "10.255.0.1"}]} for index in range(1000)}
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": routes}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.0.0.1"], "collect": "all"})])
+        memory: dict[OutputRetention, tuple[int, int]] = {}
+        for output_retention in (OutputRetention.NONE, OutputRetention.ALL):
+            catalog.clear_indexes()
+            gc.collect()
+            tracemalloc.start()
+            ctx = await AntaRunner(AntaRunnerSettings(max_concurrency=2)).run(inventory, catalog, output_retention=output_retention)
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory[output_retention] = (peak, current)
+            assert ctx.manager.get_total_results({AntaTestStatus.FAILURE}) == len(inventory)
+            del ctx
+        assert memory[OutputRetention.NONE][0] < memory[OutputRetention.ALL][0]
+        assert memory[OutputRetention.NONE][1] < memory[OutputRetention.ALL][1]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_journal(self, inventory: AntaInventory, tmp_path: Path) -> None:
+        """Test AntaRunner.run() with a result journal and resume the run from it."""
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default")
+        route.respond(json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+        definition = AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})
+        runner = AntaRunner()
+        filename = tmp_path / "anta.journal"
+
+        # Only run the tests of the first device
+        with ResultJournal(filename) as journal:
+            ctx = await runner.run(inventory, AntaCatalog(tests=[definition]), filters=AntaRunFilters(devices={"device-0"}), journal=journal)
+        assert ctx.tests_resumed == 0
+        assert len(ResultJournal(filename, resume=True)) == 1
+        assert route.call_count == 1
+
+        # Resume the run: only the test of the second device is run
+        streamed: list[AntaTestResult] = []
+        with ResultJournal(filename, resume=True) as journal:
+            ctx = await runner.run(inventory, AntaCatalog(tests=[definition]), journal=journal, on_result=streamed.append)
+        assert ctx.tests_resumed == 1
+        # The resumed results are streamed as well
+        assert [result.name for result in streamed] == ["device-0", "device-1"]
+        assert ctx.total_tests_scheduled == 1
+        assert route.call_count == 2
+        assert sorted(result.name for result in ctx.manager.results) == ["device-0", "device-1"]
+        assert len(ResultJournal(filename, resume=True)) == 2
+
+        # Tests with different inputs are not resumed
+        other_definition = AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.2"], "collect": "all"})
+        with ResultJournal(filename, resume=True) as journal:
+            ctx = await runner.run(inventory, AntaCatalog(tests=[other_definition]), journal=journal)
+        assert ctx.tests_resumed == 0
+        assert route.call_count == 4
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_journal_retry_errors(self, inventory: AntaInventory, tmp_path: Path) -> None:
+        """Test that tests in error in the journal, e.g. after a timeout, are run again when resuming the run."""
+        route = respx.post(
+            host="device-0.anta.arista.com",
+            path="/command-api",
+            headers={"Content-Type": "application/json-rpc"},
+            json__params__cmds__0__cmd="show ip route vrf default",
+        )
+        route.side_effect = httpx.ConnectTimeout("Connection timed out")
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        runner = AntaRunner()
+        filename = tmp_path / "anta.journal"
+        with ResultJournal(filename) as journal:
+            ctx = await runner.run(inventory, catalog, journal=journal)
+        assert {result.name: result.result for result in ctx.manager.results} == {"device-0": "error", "device-1": "failure"}
+        assert len(ResultJournal(filename, resume=True)) == 2
+
+        # Only the test in error is run again and its new result replaces the previous one in the journal
+        route.side_effect = None
+        route.respond(json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+        with ResultJournal(filename, resume=True) as journal:
+            ctx = await runner.run(inventory, catalog, journal=journal)
+        assert ctx.tests_resumed == 1
+        assert ctx.total_tests_scheduled == 1
+        assert {result.name: result.result for result in ctx.manager.results} == {"device-0": "failure", "device-1": "failure"}
+        assert [result.result for result in ResultJournal(filename, resume=True).entries.values()] == ["failure", "failure"]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 1}], indirect=True)
+    @respx.mock
+    async def test_run_journal_all_resumed(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory, tmp_path: Path) -> None:
+        """Test AntaRunner.run() when all the selected tests are already in the journal."""
+        caplog.set_level(logging.INFO)
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default")
+        route.respond(json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        runner = AntaRunner()
+        filename = tmp_path / "anta.journal"
+        with ResultJournal(filename) as journal:
+            await runner.run(inventory, catalog, journal=journal)
+
+        with ResultJournal(filename, resume=True) as journal:
+            ctx = await runner.run(inventory, catalog, journal=journal)
+
+        assert route.call_count == 1
+        assert ctx.tests_resumed == 1
+        assert len(ctx.manager) == 1
+        assert "All 1 selected tests have already been run according to the journal" in caplog.text
+        assert "No tests scheduled to run" not in caplog.text
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_max_duration(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() cancelled when the maximum run duration is exceeded."""
+        collect = AsyncEOSDevice._collect
+
+        async def _collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+            if command.command == "show version":
+                # Device refresh at inventory setup
+                await collect(self, command, collection_id=collection_id)
+                return
+            await asyncio.sleep(10)
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=1))
+        with patch.object(AsyncEOSDevice, "_collect", new=_collect):
+            ctx = await runner.run(inventory, catalog, max_duration=0.05, grace_period=0.05)
+
+        assert ctx.cancelled
+        assert ctx.cancel_reason == "Maximum run duration of 0.05s exceeded"
+        results = ctx.manager.results
+        assert len(results) == 3
+        # The running test is cancelled at the end of the grace period, the others never started
+        assert results[0].result == "error"
+        assert results[0].messages == ["Test cancelled: Maximum run duration of 0.05s exceeded"]
+        assert [r.result for r in results[1:]] == ["skipped", "skipped"]
+        assert results[1].messages == ["Test not run: Maximum run duration of 0.05s exceeded"]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_stop_event(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() cancelled gracefully with a stop event."""
+        collect = AsyncEOSDevice._collect
+
+        async def _collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+            if command.command == "show version":
+                # Device refresh at inventory setup
+                await collect(self, command, collection_id=collection_id)
+                return
+            await asyncio.sleep(0.1)
+            command.output = {"vrfs": {"default": {"routes": {"10.1.0.1/32": {}}}}}
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=1))
+        stop_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, stop_event.set)
+        streamed: list[AntaTestResult] = []
+        with patch.object(AsyncEOSDevice, "_collect", new=_collect):
+            ctx = await runner.run(inventory, catalog, stop_event=stop_event, on_result=streamed.append)
+
+        assert ctx.cancel_reason == "ANTA run interrupted"
+        # The running test completes within the grace period
+        assert [r.result for r in ctx.manager.results] == ["success", "skipped", "skipped"]
+        # The skipped results are streamed as well
+        assert sorted(r.result for r in streamed) == ["skipped", "skipped", "success"]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_cancelled(self, inventory: AntaInventory) -> None:
+        """Test that cancelling AntaRunner.run() cancels the test tasks before disconnecting the inventory."""
+        collect = AsyncEOSDevice._collect
+        started = asyncio.Event()
+
+        async def _collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+            if command.command == "show version":
+                # Device refresh at inventory setup
+                await collect(self, command, collection_id=collection_id)
+                return
+            started.set()
+            await asyncio.sleep(10)
+
+        def test_tasks() -> list[asyncio.Task[Any]]:
+            return [task for task in asyncio.all_tasks() if task.get_coro().__qualname__ == "AntaRunner._run_test"]  # type: ignore[union-attr]
+
+        pending_at_disconnect: list[asyncio.Task[Any]] = []
+
+        async def disconnect_inventory(self: AntaInventory) -> None:  # noqa: ARG001
+            pending_at_disconnect.extend(task for task in test_tasks() if not task.done())
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        with (
+            patch.object(AsyncEOSDevice, "_collect", new=_collect),
+            patch.object(AntaInventory, "disconnect_inventory", new=disconnect_inventory),
+        ):
+            run = asyncio.create_task(AntaRunner().run(inventory, catalog, disconnect=True))
+            await asyncio.wait_for(started.wait(), timeout=5)
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+        assert not pending_at_disconnect
+        assert not [task for task in test_tasks() if not task.done()]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_test_timeout(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a test timeout."""
+        collect = AsyncEOSDevice._collect
+
+        async def _collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+            if command.command == "show version":
+                # Device refresh at inventory setup
+                await collect(self, command, collection_id=collection_id)
+                return
+            # Only the first device is slow
+            await asyncio.sleep(10 if self.name == "device-0" else 0)
+            command.output = {"vrfs": {"default": {"routes": {"10.1.0.1/32": {}}}}}
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "timeout": 0.05})])
+        with patch.object(AsyncEOSDevice, "_collect", new=_collect):
+            ctx = await AntaRunner().run(inventory, catalog)
+
+        results = {result.name: result for result in ctx.manager.results}
+        assert results["device-0"].result == "error"
+        assert results["device-0"].messages == ["Test timed out after 0.05s"]
+        assert results["device-1"].result == "success"
+        assert not ctx.cancelled
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_metrics_scrape(self, inventory: AntaInventory) -> None:
+        """Test that test outcomes are exposed on the metrics endpoint while AntaRunner.run() is running."""
+        collect = AsyncEOSDevice._collect
+        release = asyncio.Event()
+
+        async def _collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+            if command.command == "show version":
+                # Device refresh at inventory setup
+                await collect(self, command, collection_id=collection_id)
+                return
+            # The second device is blocked until the endpoint has been scraped
+            if self.name == "device-1":
+                await release.wait()
+            command.output = {"vrfs": {"default": {"routes": {"10.1.0.1/32": {}}}}}
+
+        async def scrape(port: int) -> str:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response.decode()
+
+        async def scrape_until_observed(port: int) -> str:
+            # Poll the endpoint as a Prometheus server would
+            while True:
+                response = await scrape(port)
+                if 'anta_test_results_total{test="VerifyRoutingTableEntry",status="success"}' in response:
+                    release.set()
+                    return response
+                await asyncio.sleep(0.01)
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        metrics = enable_metrics()
+        server = await metrics.serve(port=0)
+        try:
+            with patch.object(AsyncEOSDevice, "_collect", new=_collect):
+                run = asyncio.create_task(AntaRunner().run(inventory, catalog))
+                response = await asyncio.wait_for(scrape_until_observed(server.sockets[0].getsockname()[1]), timeout=5)
+                ctx = await run
+        finally:
+            server.close()
+            await server.wait_closed()
+            disable_metrics()
+
+        # Only the result of the first device was available mid-run
+        assert 'anta_test_results_total{test="VerifyRoutingTableEntry",status="success"} 1.0' in response
+        assert [r.result for r in ctx.manager.results] == ["success", "success"]
+
+    async def test_run_not_cancelled(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() completing before the maximum run duration."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        ctx = await AntaRunner().run(inventory, catalog, max_duration=60)
+        assert not ctx.cancelled
+        assert ctx.cancel_reason is None
+        assert all(result.result == "success" for result in ctx.manager.results)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2, "disable_cache": False}], indirect=True)
+    @respx.mock
+    async def test_watch(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.watch()."""
+        failure = respx.MockResponse(json={"result": [{"vrfs": {"default": {"routes": {}}}}]})
+        success = respx.MockResponse(json={"result": [{"vrfs": {"default": {"routes": {"10.1.0.1/32": {}}}}}]})
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default")
+        # 2 devices: failure on the first 2 iterations, success on the third one
+        route.side_effect = [failure, failure, failure, failure, success, success]
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        runner = AntaRunner()
+
+        iterations = [(ctx, changes) async for ctx, changes in runner.watch(inventory, catalog, interval=0, iterations=3)]
+
+        assert len(iterations) == 3
+        assert route.call_count == 6
+        # First iteration reports all results
+        first_changes = iterations[0][1]
+        assert len(first_changes) == 2
+        assert all(change.previous is None and change.current_status == "failure" for change in first_changes)
+        # No status change on the second iteration, the device cache has been cleared
+        assert iterations[1][1] == []
+        third_changes = iterations[2][1]
+        assert {change.result.name for change in third_changes} == {"device-0", "device-1"}
+        assert all(change.previous_status == "failure" and change.current_status == "success" for change in third_changes)
+        assert all(isinstance(device, AsyncEOSDevice) and device._client.is_closed for device in inventory.devices)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_watch_test_not_run(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.watch() when a test is not run anymore."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+        runner = AntaRunner()
+
+        watch = runner.watch(inventory, catalog, interval=0, disconnect=False)
+        _, changes = await anext(watch)
+        assert len(changes) == 2
+        with patch.object(AsyncEOSDevice, "refresh", autospec=True, side_effect=lambda dev: setattr(dev, "established", dev.name != "device-1")):
+            _, changes = await anext(watch)
+        await watch.aclose()
+
+        assert len(changes) == 1
+        assert changes[0].current is None
+        assert changes[0].previous_status == "failure"
+        assert changes[0].result.name == "device-1"
+        assert not any(isinstance(device, AsyncEOSDevice) and device._client.is_closed for device in inventory.devices)
+
     async def test_run_disconnect_called_when_enabled(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test that disconnect_inventory is called after the run when disconnect=True."""
         caplog.set_level(logging.DEBUG)
@@ -0,0 +1,70 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta._yaml.py."""
+
+from __future__ import annotations
+
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from anta._yaml import NotAMappingError, iter_mapping, safe_load
+
+DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param("a: 1\nb: [1, {c: 2}]\n", [("a", 1), ("b", [1, {"c": 2}])], id="mapping"),
+        pytest.param("{}", [], id="empty-mapping"),
+        pytest.param("---\na: 1\n...\n", [("a", 1)], id="explicit-document"),
+        pytest.param("a: &anchor [1]\nb: *anchor\n", [("a", [1]), ("b", [1])], id="alias"),
+    ],
+)
+def test_iter_mapping(content: str, expected: list[tuple[Any, Any]]) -> None:
+    """Test iter_mapping()."""
+    assert list(iter_mapping(StringIO(content))) == expected
+
+
+@pytest.mark.parametrize(
+    ("content", "data"),
+    [
+        pytest.param("", None, id="empty"),
+        pytest.param("- 1\n- 2\n", [1, 2], id="list"),
+        pytest.param("anta", "anta", id="scalar"),
+    ],
+)
+def test_iter_mapping_not_a_mapping(content: str, data: Any) -> None:  # noqa: ANN401
+    """Test iter_mapping() with a YAML document which is not a mapping."""
+    with pytest.raises(NotAMappingError, match=f"YAML document must be a mapping, got {type(data).__name__}") as exc_info:
+        list(iter_mapping(content))
+    assert exc_info.value.data == data
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param("a: 1\n---\nb: 2\n", id="multiple-documents"),
+        pytest.param("a: 1\nb: [1\n", id="syntax-error"),
+        pytest.param("a: !vault 1\n", id="unknown-tag"),
+    ],
+)
+def test_iter_mapping_invalid(content: str) -> None:
+    """Test iter_mapping() with an invalid YAML document."""
+    with pytest.raises(yaml.YAMLError):
+        list(iter_mapping(content))
+
+
+def test_iter_mapping_large_file() -> None:
+    """Test that iter_mapping() and safe_load() load the same data as yaml.safe_load()."""
+    with (DATA_DIR / "test_catalog_medium.yml").open(encoding="UTF-8") as f:
+        expected = yaml.safe_load(f)
+    with (DATA_DIR / "test_catalog_medium.yml").open(encoding="UTF-8") as f:
+        assert dict(iter_mapping(f)) == expected
+    with (DATA_DIR / "test_catalog_medium.yml").open(encoding="UTF-8") as f:
+        assert safe_load(f) == expected
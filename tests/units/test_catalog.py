@@ -18,7 +18,7 @@ from anta.catalog import AntaCatalog, AntaCatalogFile, AntaTestDefinition
 from anta.models import AntaTest
 from anta.tests.interfaces import VerifyL3MTU
 from anta.tests.mlag import VerifyMlagStatus
-from anta.tests.software import VerifyEOSVersion
+from anta.tests.software import VerifyEOSVersion, VerifyTerminAttrVersion
 from anta.tests.system import (
     VerifyAgentLogs,
     VerifyCoredump,
@@ -185,6 +185,19 @@ class TestAntaCatalog:
                 inputs = test.Input(**inputs_data) if isinstance(inputs_data, dict) else inputs_data
                 assert inputs == catalog.tests[test_id].inputs
 
+    def test_parse_duplicate_module(self, tmp_path: Path) -> None:
+        """Instantiate AntaCatalog from a YAML file defining the same module twice."""
+        catalog_file = tmp_path / "catalog.yml"
+        catalog_file.write_text(
+            "anta.tests.software:\n  - VerifyEOSVersion:\n      versions: [4.31.1F]\n"
+            "anta.tests.system:\n  - VerifyUptime:\n      minimum: 10\n"
+            "anta.tests.software:\n  - VerifyTerminAttrVersion:\n      versions: [v1.13.6]\n",
+            encoding="UTF-8",
+        )
+        catalog: AntaCatalog = AntaCatalog.parse(catalog_file)
+        # Like a dictionary, the last definition of a module wins but it keeps its position
+        assert [test.test for test in catalog.tests] == [VerifyTerminAttrVersion, VerifyUptime]
+
     @pytest.mark.parametrize(("filename", "file_format", "error"), CATALOG_PARSE_FAIL_PARAMS)
     def test_parse_fail(self, filename: str, file_format: Literal["yaml", "json"], error: str) -> None:
         """Errors when instantiating AntaCatalog from a file."""
@@ -287,11 +300,69 @@ class TestAntaCatalog:
         """Test AntaCatalog.get_tests_by_tags()."""
         catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
         catalog.build_indexes()
-        tests: set[AntaTestDefinition] = catalog.get_tests_by_tags(tags={"leaf"})
+        tests: frozenset[AntaTestDefinition] = catalog.get_tests_by_tags(tags={"leaf"})
         assert len(tests) == 3
         tests = catalog.get_tests_by_tags(tags={"leaf", "spine"}, strict=True)
         assert len(tests) == 1
 
+    @pytest.mark.parametrize(
+        "tags",
+        [
+            pytest.param(set(), id="no tags"),
+            pytest.param({"leaf"}, id="one tag"),
+            pytest.param({"leaf", "spine"}, id="two tags"),
+            pytest.param({"leaf", "unknown"}, id="unknown tag"),
+            pytest.param({"unknown"}, id="only unknown tag"),
+        ],
+    )
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_get_tests_by_tags_index(self, tags: set[str], *, strict: bool) -> None:
+        """Test that AntaCatalog.get_tests_by_tags() matches the tag_to_tests index and memoises the result."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        catalog.build_indexes()
+        if not tags:
+            expected = catalog.tag_to_tests[None]
+        elif not (filtered_sets := [catalog.tag_to_tests[tag] for tag in tags if tag in catalog.tag_to_tests]):
+            expected = set()
+        else:
+            expected = set.intersection(*filtered_sets) if strict else set.union(*filtered_sets)
+        tests = catalog.get_tests_by_tags(tags, strict=strict)
+        assert tests == expected
+        assert catalog.get_tests_by_tags(set(tags), strict=strict) is tests
+
+    def test_get_tests_by_tags_rebuild_indexes(self) -> None:
+        """Test that AntaCatalog.get_tests_by_tags() results are recomputed when the indexes are rebuilt."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        catalog.build_indexes({"VerifyUptime"})
+        assert {test.test.name for test in catalog.get_tests_by_tags({"leaf"})} == {"VerifyUptime"}
+        catalog.clear_indexes()
+        catalog.build_indexes()
+        assert len(catalog.get_tests_by_tags({"leaf"})) == 3
+
+    @pytest.mark.parametrize(
+        ("device_tags", "tags", "expected"),
+        [
+            pytest.param({"leaf"}, None, 9, id="untagged and leaf tests"),
+            pytest.param(set(), None, 6, id="untagged tests"),
+            pytest.param({"leaf", "dc1"}, {"leaf"}, 3, id="leaf tests"),
+            pytest.param({"spine"}, {"leaf"}, 0, id="no matching tag"),
+        ],
+    )
+    def test_get_tests_by_device_tags(self, device_tags: set[str], tags: set[str] | None, expected: int) -> None:
+        """Test AntaCatalog.get_tests_by_device_tags()."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        catalog.build_indexes()
+        tests = catalog.get_tests_by_device_tags(device_tags, tags)
+        assert len(tests) == expected
+        # Devices with the same tags share the same selection, tags not used by the catalog are ignored
+        assert catalog.get_tests_by_device_tags({*device_tags, "device-name"}, tags) is tests
+
+    def test_get_tests_by_device_tags_no_indexes(self) -> None:
+        """Test AntaCatalog.get_tests_by_device_tags() without indexes."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        with pytest.raises(ValueError, match="Indexes have not been built yet"):
+            catalog.get_tests_by_device_tags({"leaf"})
+
     def test_merge_catalogs(self) -> None:
         """Test the merge_catalogs function."""
         # Load catalogs of different sizes
@@ -0,0 +1,146 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.catalog_cache.py."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from anta.catalog import AntaCatalog
+from anta.catalog_cache import CatalogCache, default_cache_dir
+from anta.input_models.routing import bgp
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        pytest.param({"ANTA_CATALOG_CACHE_DIR": "/anta/cache"}, Path("/anta/cache"), id="ANTA_CATALOG_CACHE_DIR"),
+        pytest.param({"XDG_CACHE_HOME": "/xdg"}, Path("/xdg/anta/catalogs"), id="XDG_CACHE_HOME"),
+        pytest.param({}, Path.home() / ".cache" / "anta" / "catalogs", id="default"),
+    ],
+)
+def test_default_cache_dir(monkeypatch: pytest.MonkeyPatch, env: dict[str, str], expected: Path) -> None:
+    """Test default_cache_dir()."""
+    monkeypatch.delenv("ANTA_CATALOG_CACHE_DIR", raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    assert default_cache_dir() == expected
+
+
+class TestCatalogCache:
+    """Test CatalogCache class."""
+
+    def test_compile_and_load(self, tmp_path: Path) -> None:
+        """Test AntaCatalog.compile() and AntaCatalog.parse() with a compiled catalog."""
+        cache = CatalogCache(tmp_path)
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml", cache=cache)
+        content = (DATA_DIR / "test_catalog_with_tags.yml").read_bytes()
+        assert cache.load(content) is None
+
+        path = catalog.compile(cache)
+        assert path == cache.path(content)
+        assert cache.load(content) == catalog.tests
+
+        with pytest.MonkeyPatch.context() as mp:
+            # The catalog file must not be parsed
+            mp.setattr("anta.catalog.AntaCatalog.from_dict", lambda *_args, **_kwargs: pytest.fail("Catalog file parsed"))
+            compiled_catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml", cache=cache)
+        assert compiled_catalog.tests == catalog.tests
+        assert compiled_catalog.filename == catalog.filename
+
+    def test_load_content_changed(self, tmp_path: Path) -> None:
+        """Test that a compiled catalog is not used once the catalog file content changed."""
+        cache = CatalogCache(tmp_path / "cache")
+        catalog_file = tmp_path / "catalog.yml"
+        catalog_file.write_text("anta.tests.software:\n  - VerifyEOSVersion:\n      versions: [4.31.1F]\n", encoding="utf-8")
+        AntaCatalog.parse(catalog_file).compile(cache)
+
+        catalog_file.write_text("anta.tests.software:\n  - VerifyEOSVersion:\n      versions: [4.32.1F]\n", encoding="utf-8")
+        catalog = AntaCatalog.parse(catalog_file, cache=cache)
+        assert catalog.tests[0].inputs.versions == ["4.32.1F"]
+
+    def test_load_file_format(self, tmp_path: Path) -> None:
+        """Test that a compiled catalog is keyed by the catalog file format."""
+        cache = CatalogCache(tmp_path)
+        content = (DATA_DIR / "test_catalog.yml").read_bytes()
+        assert cache.path(content, "yaml") != cache.path(content, "json")
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog.yml")
+        catalog.compile(cache, file_format="yaml")
+        assert cache.load(content, "yaml") == catalog.tests
+        assert cache.load(content, "json") is None
+
+    def test_load_module_modified(self, tmp_path: Path) -> None:
+        """Test that a compiled catalog is not used once a test module source file has been modified."""
+        cache = CatalogCache(tmp_path)
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog.yml")
+        catalog.compile(cache)
+        content = (DATA_DIR / "test_catalog.yml").read_bytes()
+        module: ModuleType = __import__(catalog.tests[0].test.__module__, fromlist=["_"])
+        assert module.__file__ is not None
+        stat = Path(module.__file__).stat()
+        try:
+            os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert cache.load(content) is None
+        finally:
+            os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert cache.load(content) == catalog.tests
+
+    def test_load_input_model_module_modified(self, tmp_path: Path) -> None:
+        """Test that a compiled catalog is not used once the source file of an input model used by a test has been modified."""
+        cache = CatalogCache(tmp_path / "cache")
+        catalog_file = tmp_path / "catalog.yml"
+        catalog_file.write_text("anta.tests.routing.bgp:\n  - VerifyBGPPeerSession:\n      bgp_peers:\n        - peer_address: 10.1.0.1\n", encoding="utf-8")
+        catalog = AntaCatalog.parse(catalog_file)
+        catalog.compile(cache)
+        content = catalog_file.read_bytes()
+        assert bgp.__file__ is not None
+        stat = Path(bgp.__file__).stat()
+        try:
+            os.utime(bgp.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert cache.load(content) is None
+        finally:
+            os.utime(bgp.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert cache.load(content) == catalog.tests
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="Requires POSIX file ownership")
+    @pytest.mark.parametrize(("mode", "uid_offset"), [pytest.param(0o755, 0, id="mode"), pytest.param(0o700, 1, id="owner")])
+    def test_load_cache_dir_not_private(self, tmp_path: Path, caplog: pytest.LogCaptureFixture, mode: int, uid_offset: int) -> None:
+        """Test that a compiled catalog is not loaded from a cache directory accessible by other users."""
+        cache = CatalogCache(tmp_path / "cache")
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog.yml")
+        catalog.compile(cache)
+        content = (DATA_DIR / "test_catalog.yml").read_bytes()
+        assert cache.load(content) == catalog.tests
+
+        cache.cache_dir.chmod(mode)
+        caplog.set_level(logging.WARNING)
+        with patch("os.getuid", return_value=os.getuid() + uid_offset):
+            assert cache.load(content) is None
+        assert "the cache directory" in caplog.text
+        assert "must be owned by the current user with mode 0700" in caplog.text
+
+    def test_load_invalid(self, tmp_path: Path) -> None:
+        """Test that an invalid compiled catalog is ignored."""
+        cache = CatalogCache(tmp_path)
+        content = (DATA_DIR / "test_catalog.yml").read_bytes()
+        cache.path(content).write_bytes(b"not a pickle")
+        assert cache.load(content) is None
+        assert AntaCatalog.parse(DATA_DIR / "test_catalog.yml", cache=cache).tests
+
+    def test_compile_without_file(self, tmp_path: Path) -> None:
+        """Test AntaCatalog.compile() with a catalog not loaded from a file."""
+        with pytest.raises(ValueError, match="Only a catalog loaded from a file can be compiled"):
+            AntaCatalog().compile(CatalogCache(tmp_path))
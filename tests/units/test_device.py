@@ -640,6 +640,10 @@ class TestAntaDevice:
         """Test max_connections property."""
         assert device.max_connections is None
 
+    def test_eapi_url(self, device: AntaDevice) -> None:
+        """Test eapi_url property."""
+        assert device.eapi_url is None
+
     def test_capabilities_default(self, device: AntaDevice) -> None:
         """Verify the base AntaDevice capabilities default to all-False."""
         assert device.capabilities == AntaDeviceCapabilities()
@@ -715,6 +719,18 @@ class TestAsyncEOSDevice:
         # HTTPX uses a max_connections of 100 by default
         assert async_device.max_connections == 100
 
+    @pytest.mark.parametrize(
+        ("async_device", "expected"),
+        [
+            pytest.param({}, "https://42.42.42.42", id="https"),
+            pytest.param({"proto": "http", "port": 8080}, "http://42.42.42.42:8080", id="http"),
+        ],
+        indirect=["async_device"],
+    )
+    def test_eapi_url(self, async_device: AsyncEOSDevice, expected: str) -> None:
+        """Test eapi_url property."""
+        assert str(async_device.eapi_url) == expected
+
     def test_max_connections_none(self, async_device: AsyncEOSDevice) -> None:
         """Test max_connections property when not available in the session object."""
         with patch.object(async_device, "_client", None):
@@ -785,10 +801,24 @@ class TestAsyncEOSDevice:
                 commands.append({"cmd": cmd.command, "revision": cmd.revision})
             else:
                 commands.append({"cmd": cmd.command})
-            async_device._client.cli.assert_called_once_with(commands=commands, ofmt=cmd.ofmt, version=cmd.version, req_id=f"ANTA-{collection_id}-{id(cmd)}")  # type: ignore[attr-defined] # asynceapi.Device.cli is patched
+            async_device._client.cli.assert_called_once_with(  # type: ignore[attr-defined] # asynceapi.Device.cli is patched
+                commands=commands, ofmt=cmd.ofmt, version=cmd.version, req_id=f"ANTA-{collection_id}-{id(cmd)}", timeout=cmd.timeout
+            )
             assert cmd.output == expected["output"]
             assert cmd.errors == expected["errors"]
 
+    async def test__collect_command_timeout(self, caplog: pytest.LogCaptureFixture, async_device: AsyncEOSDevice) -> None:
+        """Test AsyncEOSDevice._collect() with a command timeout."""
+        cmd = AntaCommand(command="show running-config", ofmt="text", timeout=120)
+        with patch.object(async_device._client, "cli", side_effect=TimeoutException("Test")) as cli_mock:
+            await async_device.collect(cmd)
+        assert cli_mock.call_args.kwargs["timeout"] == 120
+        assert cmd.errors == ["TimeoutException: Test"]
+        assert (
+            f"TimeoutException: Test occurred while sending 'show running-config' to {async_device.name}. Consider increasing the command timeout: 120.0"
+            in caplog.text
+        )
+
     @pytest.mark.parametrize(
         ("async_device", "copy"),
         ASYNCEAPI_COPY_PARAMS,
@@ -0,0 +1,147 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.metrics.py."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from httpx import ConnectError, HTTPError, TimeoutException
+
+from anta.metrics import AntaMetrics, Histogram, disable_metrics, enable_metrics, get_metrics
+from anta.models import AntaCommand
+from anta.result_manager.models import AntaTestStatus, TestResult
+from asynceapi import EapiCommandError
+from asynceapi.errors import EapiAuthenticationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from anta.device import AntaDevice, AsyncEOSDevice
+
+
+@pytest.fixture
+def metrics() -> Iterator[AntaMetrics]:
+    """Return the global metrics registry and disable it after the test."""
+    yield enable_metrics()
+    disable_metrics()
+
+
+def test_enable_disable_metrics() -> None:
+    """Test enable_metrics(), get_metrics() and disable_metrics()."""
+    assert get_metrics() is None
+    metrics = enable_metrics()
+    assert get_metrics() is metrics
+    disable_metrics()
+    assert get_metrics() is None
+
+
+def test_histogram() -> None:
+    """Test Histogram.observe()."""
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    # Bucket bounds are inclusive
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+
+
+def test_render_empty() -> None:
+    """Test AntaMetrics.render() without any observation."""
+    output = AntaMetrics().render()
+    assert "# TYPE anta_eapi_requests counter" in output
+    assert "# TYPE anta_device_request_duration_seconds histogram" in output
+    assert output.endswith("# EOF\n")
+
+
+def test_render(device: AntaDevice) -> None:
+    """Test AntaMetrics.render() with observations."""
+    metrics = AntaMetrics(buckets=(0.5, 1.0))
+    metrics.observe_request("leaf1", "show version", 0.2)
+    metrics.observe_request("leaf1", 'show "quoted"', 3.0, "timeout")
+    for status in (AntaTestStatus.SUCCESS, AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE):
+        metrics.observe_result(TestResult(name="leaf1", test="VerifyTest", categories=["test"], description="Test", result=status))
+    assert device.cache is not None
+    device.cache.stats["total"] = 4
+    device.cache.stats["hits"] = 1
+    metrics.register_device(device)
+
+    output = metrics.render()
+    assert 'anta_eapi_requests_total{device="leaf1"} 2.0' in output
+    assert 'anta_eapi_errors_total{device="leaf1",class="timeout"} 1.0' in output
+    assert f'anta_cache_lookups_total{{device="{device.name}"}} 4.0' in output
+    assert f'anta_cache_hits_total{{device="{device.name}"}} 1.0' in output
+    # AntaDevice does not expose received bytes
+    assert "anta_eapi_received_bytes_total{" not in output
+    assert 'anta_test_results_total{test="VerifyTest",status="success"} 2.0' in output
+    assert 'anta_test_results_total{test="VerifyTest",status="failure"} 1.0' in output
+    assert 'anta_device_request_duration_seconds_bucket{device="leaf1",le="0.5"} 1' in output
+    assert 'anta_device_request_duration_seconds_bucket{device="leaf1",le="1.0"} 1' in output
+    assert 'anta_device_request_duration_seconds_bucket{device="leaf1",le="+Inf"} 2' in output
+    assert 'anta_device_request_duration_seconds_count{device="leaf1"} 2' in output
+    assert 'anta_device_request_duration_seconds_sum{device="leaf1"} 3.2' in output
+    assert 'anta_command_request_duration_seconds_count{command="show \\"quoted\\""} 1' in output
+
+
+def test_write(tmp_path: Path) -> None:
+    """Test AntaMetrics.write()."""
+    metrics = AntaMetrics()
+    metrics.observe_request("leaf1", "show version", 0.2)
+    output = tmp_path / "anta.prom"
+    metrics.write(output)
+    assert output.read_text(encoding="utf-8") == metrics.render()
+    assert list(tmp_path.iterdir()) == [output]
+
+
+async def test_serve() -> None:
+    """Test AntaMetrics.serve()."""
+    metrics = AntaMetrics()
+    metrics.observe_request("leaf1", "show version", 0.2)
+    server = await metrics.serve(port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def get(path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    try:
+        response = await get("/metrics")
+        assert response.startswith(b"HTTP/1.1 200 OK")
+        assert b"application/openmetrics-text" in response
+        assert response.endswith(metrics.render().encode())
+        assert (await get("/unknown")).startswith(b"HTTP/1.1 404 Not Found")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.parametrize(
+    ("patch_kwargs", "expected_error"),
+    [
+        pytest.param({"return_value": [{}, {"output": "ok"}]}, None, id="success"),
+        pytest.param(
+            {"side_effect": EapiCommandError(passed=[], failed="show version", errors=["Invalid"], errmsg="Invalid", not_exec=[])}, "command", id="command"
+        ),
+        pytest.param({"side_effect": EapiAuthenticationError("42.42.42.42")}, "auth", id="auth"),
+        pytest.param({"side_effect": TimeoutException("Test")}, "timeout", id="timeout"),
+        pytest.param({"side_effect": ConnectError("Cannot open port")}, "connect", id="connect"),
+        pytest.param({"side_effect": HTTPError("404")}, "http", id="http"),
+    ],
+)
+async def test_collect_metrics(metrics: AntaMetrics, async_device: AsyncEOSDevice, patch_kwargs: dict[str, Any], expected_error: str | None) -> None:
+    """Test that AsyncEOSDevice._collect() records request metrics."""
+    with patch.object(async_device._client, "cli", **patch_kwargs):
+        await async_device.collect(AntaCommand(command="show version", use_cache=False))
+    assert metrics.requests == {async_device.name: 1}
+    assert metrics.command_latency["show version"].count == 1
+    assert metrics.errors == ({(async_device.name, expected_error): 1} if expected_error else {})
@@ -8,10 +8,13 @@
 from __future__ import annotations
 
 import asyncio
+import pickle
 import sys
 from typing import TYPE_CHECKING, Any, ClassVar
+from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
 from anta.decorators import deprecated_test, skip_on_platforms
 from anta.models import AntaCommand, AntaTemplate, AntaTest
@@ -356,7 +359,9 @@ ANTATEST_DATA: dict[tuple[type[AntaTest], str], Any] = {
         "expected": {
             "__init__": {
                 "result": "error",
-                "messages": ["Cannot render template {template='show interface {interface}' version='latest' revision=None ofmt='json' use_cache=True}"],
+                "messages": [
+                    "Cannot render template {template='show interface {interface}' version='latest' revision=None ofmt='json' use_cache=True timeout=None}"
+                ],
             },
             "test": {"result": "error"},
         },
@@ -579,12 +584,39 @@ class TestAntaTest:
         if custom_field:
             assert test.result.custom_field == "a custom field"
 
+    def test_input_hash(self) -> None:
+        """Test that the AntaTest.Input hash is computed once and invalidated when a field is assigned."""
+        inputs = FakeTestWithInput.Input(string="a")
+        with patch.object(FakeTestWithInput.Input, "model_dump_json", autospec=True, side_effect=FakeTestWithInput.Input.model_dump_json) as dump:
+            input_hash = hash(inputs)
+            assert hash(inputs) == input_hash
+            assert dump.call_count == 1
+            inputs.string = "b"
+            assert hash(inputs) == hash(FakeTestWithInput.Input(string="b"))
+            assert dump.call_count == 3
+
+    def test_input_hash_not_copied(self) -> None:
+        """Test that the cached AntaTest.Input hash is not compared, copied or pickled."""
+        inputs = FakeTestWithInput.Input(string="a")
+        hash(inputs)
+        assert inputs == FakeTestWithInput.Input(string="a")
+        assert hash(inputs.model_copy(update={"string": "b"})) == hash(FakeTestWithInput.Input(string="b"))
+        assert pickle.loads(pickle.dumps(inputs)) == inputs  # noqa: S301
+        assert not hasattr(pickle.loads(pickle.dumps(inputs)), "_hash")  # noqa: S301
+
 
 class TestAntaCommand:
     """Test for anta.models.AntaCommand."""
 
     # ruff: noqa: B018
 
+    def test_timeout(self) -> None:
+        """Test the timeout attribute, also rendered from an AntaTemplate."""
+        assert AntaCommand(command="show dummy").timeout is None
+        assert AntaTemplate(template="show dummy {arg}", timeout=60).render(arg="foo").timeout == 60
+        with pytest.raises(ValidationError):
+            AntaCommand(command="show dummy", timeout=0)
+
     def test_empty_output_access(self) -> None:
         """Test for both json and text ofmt."""
         json_cmd = AntaCommand(command="show dummy")
@@ -0,0 +1,139 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.registry.py."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+
+from anta.cli.get.utils import _explore_package
+from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.registry import REGISTRY_PACKAGE, AntaTestRegistry, RegisteredTest
+from anta.tests.routing.bgp import VerifyBGPPeerCount
+from anta.tests.software import VerifyEOSVersion
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_registry_up_to_date() -> None:
+    """Test that the registry file shipped with ANTA is up to date.
+
+    If this test fails, run `docs/scripts/generate_test_registry.py`.
+    """
+    registry = AntaTestRegistry.load()
+    assert registry is not None
+    assert registry == AntaTestRegistry.build(_explore_package(REGISTRY_PACKAGE))
+
+
+class TestRegisteredTest:
+    """Test RegisteredTest class."""
+
+    def test_from_test(self) -> None:
+        """Test RegisteredTest.from_test()."""
+        test = RegisteredTest.from_test(VerifyBGPPeerCount)
+        assert test.name == "VerifyBGPPeerCount"
+        assert test.module == "anta.tests.routing.bgp"
+        assert test.description == VerifyBGPPeerCount.description
+        assert test.categories == ["bgp"]
+        assert test.commands == [command.command if isinstance(command, AntaCommand) else command.template for command in VerifyBGPPeerCount.commands]
+        assert test.example is not None
+        assert test.example.startswith("```yaml")
+        assert test.input_schema == {}
+
+    def test_from_test_without_example(self) -> None:
+        """Test RegisteredTest.from_test() with a test without docstring example."""
+
+        class FakeTest(AntaTest):
+            """ANTA test without example."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show {command}")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                self.result.is_success()
+
+        test = RegisteredTest.from_test(FakeTest)
+        assert test.example is None
+        assert test.commands == ["show {command}"]
+
+    def test_load(self) -> None:
+        """Test RegisteredTest.load()."""
+        assert RegisteredTest.from_test(VerifyEOSVersion).load() is VerifyEOSVersion
+
+
+class TestAntaTestRegistry:
+    """Test AntaTestRegistry class."""
+
+    def test_build(self) -> None:
+        """Test AntaTestRegistry.build()."""
+        registry = AntaTestRegistry.build([VerifyEOSVersion, VerifyBGPPeerCount])
+        assert [test.name for test in registry.tests] == ["VerifyEOSVersion", "VerifyBGPPeerCount"]
+        assert "BgpAddressFamily" in registry.definitions
+        schema = registry.input_schema(registry.tests[1])
+        assert "$defs" not in schema
+        assert schema["definitions"] == registry.definitions
+        assert "#/definitions/BgpAddressFamily" in json.dumps(schema["properties"])
+
+    def test_build_conflict(self) -> None:
+        """Test AntaTestRegistry.build() with conflicting input models."""
+
+        class VerifyFake(AntaTest):
+            """ANTA test with an input model conflicting with a built-in one."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            class Input(AntaTest.Input):
+                """Input model for the VerifyFake test."""
+
+                class BgpAddressFamily(AntaTest.Input):
+                    """Conflicting input model."""
+
+                    afi: int
+
+                address_families: list[BgpAddressFamily]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                self.result.is_success()
+
+        with pytest.raises(ValueError, match="Input model BgpAddressFamily of test VerifyFake conflicts with another input model with the same name"):
+            AntaTestRegistry.build([VerifyBGPPeerCount, VerifyFake])
+
+    def test_dump_and_load(self, tmp_path: Path) -> None:
+        """Test AntaTestRegistry.dump() and AntaTestRegistry.load()."""
+        registry = AntaTestRegistry.build([VerifyEOSVersion, VerifyBGPPeerCount])
+        registry.dump(tmp_path / "registry.json")
+        assert AntaTestRegistry.load(tmp_path / "registry.json") == registry
+
+    def test_load_invalid(self, tmp_path: Path) -> None:
+        """Test AntaTestRegistry.load() with a missing, invalid or outdated registry file."""
+        assert AntaTestRegistry.load(tmp_path / "registry.json") is None
+        (tmp_path / "registry.json").write_text("{}", encoding="UTF-8")
+        assert AntaTestRegistry.load(tmp_path / "registry.json") is None
+        AntaTestRegistry(anta_version="0.0.0").dump(tmp_path / "registry.json")
+        assert AntaTestRegistry.load(tmp_path / "registry.json") is None
+
+    @pytest.mark.parametrize(
+        ("module_name", "test_name", "expected"),
+        [
+            pytest.param("anta.tests.software", None, ["VerifyEOSVersion", "VerifyTerminAttrVersion"], id="module"),
+            pytest.param("anta.tests", "VerifyTerminAttr", ["VerifyTerminAttrVersion"], id="package-test-name"),
+            pytest.param("anta.tests.routing", "VerifyBGPPeerC", ["VerifyBGPPeerCount"], id="sub-package"),
+            pytest.param("anta.tests.software", "VerifyBGP", [], id="no-test"),
+            pytest.param("anta.tests.unknown", None, None, id="unknown-module"),
+            pytest.param("anta.tests.soft", None, None, id="module-prefix"),
+            pytest.param("tests.units.cli.get.local_module", None, None, id="not-built-in"),
+        ],
+    )
+    def test_find(self, module_name: str, test_name: str | None, expected: list[str] | None) -> None:
+        """Test AntaTestRegistry.find()."""
+        registry = AntaTestRegistry.build([VerifyEOSVersion, *_explore_package("anta.tests.software", "VerifyTerminAttr"), VerifyBGPPeerCount])
+        tests = registry.find(module_name, test_name)
+        assert (None if tests is None else [test.name for test in tests]) == expected
@@ -0,0 +1,305 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.service.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+import respx
+
+from anta._runner import AntaRunFilters, AntaRunner
+from anta.catalog import AntaCatalog, AntaTestDefinition
+from anta.device import AsyncEOSDevice
+from anta.inventory import AntaInventory
+from anta.service import AntaJob, AntaService
+from anta.tests.routing.generic import VerifyRoutingTableEntry
+from tests.units.test_models import FakeTest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from anta.models import AntaCommand
+
+CATALOG = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"], "collect": "all"})])
+
+
+@pytest.fixture
+def routes() -> Iterator[respx.Route]:
+    """Mock the eAPI requests of VerifyRoutingTableEntry."""
+    with respx.mock:
+        respx.head(path="/command-api")
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show version").respond(
+            json={"result": [{"modelName": "pytest"}]}
+        )
+        yield respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+
+
+async def _http_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: bytes = b"") -> tuple[str, dict[str, str], bytes]:
+    """Send an HTTP request and return the status line, headers and body of the response."""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    status, *header_lines = head.decode().split("\r\n")
+    headers = {name.lower(): value.strip() for name, _, value in (line.partition(":") for line in header_lines)}
+    return status, headers, content
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2, "disable_cache": False}], indirect=True)
+async def test_submit(inventory: AntaInventory, routes: respx.Route) -> None:
+    """Test AntaService.submit()."""
+    with patch.object(AntaInventory, "connect_inventory", autospec=True, side_effect=AntaInventory.connect_inventory) as connect_inventory:
+        async with AntaService(inventory, CATALOG) as service:
+            first_job = service.submit()
+            first_results = [result async for result in first_job.results()]
+            # The route is now in the routing table of the devices
+            routes.respond(json={"result": [{"vrfs": {"default": {"routes": {"10.1.0.1/32": {}}}}}]})
+            second_job = service.submit(AntaRunFilters(devices={"device-1"}))
+            second_results = [result async for result in second_job.results()]
+            await second_job.wait()
+
+            assert first_job.id != second_job.id
+            assert first_job.done
+            assert first_job.error is None
+            assert first_job.ctx is not None
+            assert len(first_job.ctx.manager) == 2
+            assert {result.name for result in first_results} == {"device-0", "device-1"}
+            assert all(result.result == "failure" for result in first_results)
+            assert [result.name for result in second_results] == ["device-1"]
+            # The device caches are cleared before each job: the second job reports the current state of the device
+            assert [result.result for result in second_results] == ["success"]
+            assert routes.call_count == 3
+            # The inventory is connected once when the service starts
+            assert connect_inventory.call_count == 1
+            assert all(isinstance(device, AsyncEOSDevice) and not device._client.is_closed for device in inventory.devices)
+
+    assert all(isinstance(device, AsyncEOSDevice) and device._client.is_closed for device in inventory.devices)
+
+
+@pytest.mark.parametrize("inventory", [{"count": 1}], indirect=True)
+@pytest.mark.usefixtures("routes")
+async def test_submit_test_filters(inventory: AntaInventory) -> None:
+    """Test that a job only runs the tests selected by its filters when a previous job ran all the tests."""
+    catalog = AntaCatalog(tests=[*CATALOG.tests, AntaTestDefinition(test=FakeTest, inputs=None)])
+    async with AntaService(inventory, catalog) as service:
+        first_job = service.submit()
+        await first_job.wait()
+        second_job = service.submit(AntaRunFilters(tests={"VerifyRoutingTableEntry"}))
+        await second_job.wait()
+
+    assert first_job.ctx is not None
+    assert sorted(result.test for result in first_job.ctx.manager.results) == ["FakeTest", "VerifyRoutingTableEntry"]
+    assert second_job.ctx is not None
+    assert [result.test for result in second_job.ctx.manager.results] == ["VerifyRoutingTableEntry"]
+
+
+@pytest.mark.parametrize("inventory", [{"count": 1}], indirect=True)
+async def test_submit_queue_full(inventory: AntaInventory) -> None:
+    """Test AntaService.submit() when the job queue is full."""
+    # Workers are not started
+    service = AntaService(inventory, CATALOG, max_queued_jobs=1)
+    service.submit()
+    assert service.queued_jobs == 1
+    with pytest.raises(asyncio.QueueFull):
+        service.submit()
+
+
+@pytest.mark.parametrize("inventory", [{"count": 1}], indirect=True)
+async def test_job_error(inventory: AntaInventory, caplog: pytest.LogCaptureFixture) -> None:
+    """Test AntaService when the run raises an exception."""
+    async with AntaService(inventory, CATALOG) as service:
+        job = service.submit(AntaRunFilters(tags={"leaf"}))
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(AntaRunner, "run", _raise)
+            results = [result async for result in job.results()]
+
+    assert results == []
+    assert job.error == "RuntimeError: Boom"
+    assert "Job 1 failed" in caplog.text
+
+
+async def _raise(*args: Any, **kwargs: Any) -> None:  # noqa: ARG001, ANN401
+    msg = "Boom"
+    raise RuntimeError(msg)
+
+
+def _slow_collect(started: asyncio.Event, delay: float, running: list[int] | None = None) -> Any:  # noqa: ANN401
+    """Return an AsyncEOSDevice._collect() replacement where the tests take `delay` seconds to collect their commands."""
+    collect = AsyncEOSDevice._collect
+
+    async def _collect(self: AsyncEOSDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        if command.command == "show version":
+            # Device refresh when the service starts
+            await collect(self, command, collection_id=collection_id)
+            return
+        started.set()
+        if running is not None:
+            running.append(running[-1] + 1)
+        await asyncio.sleep(delay)
+        if running is not None:
+            running.append(running[-1] - 1)
+        command.output = {"vrfs": {"default": {"routes": {}}}}
+
+    return _collect
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2}], indirect=True)
+@pytest.mark.usefixtures("routes")
+async def test_job_concurrency(inventory: AntaInventory) -> None:
+    """Test that each running job has its own concurrency budget."""
+    running = [0]
+    with patch.object(AsyncEOSDevice, "_collect", new=_slow_collect(asyncio.Event(), 0.05, running)):
+        async with AntaService(inventory, CATALOG, max_running_jobs=2, job_concurrency=1) as service:
+            jobs = [service.submit(), service.submit()]
+            await asyncio.gather(*(job.wait() for job in jobs))
+
+    assert all(job.ctx is not None and len(job.ctx.manager) == 2 for job in jobs)
+    # One test at a time per job
+    assert max(running) == 2
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2}], indirect=True)
+@pytest.mark.usefixtures("routes")
+async def test_stop(inventory: AntaInventory) -> None:
+    """Test that AntaService.stop() cancels the running jobs before disconnecting the inventory."""
+    started = asyncio.Event()
+    pending_at_disconnect: list[asyncio.Task[Any]] = []
+
+    async def disconnect_inventory(self: AntaInventory) -> None:  # noqa: ARG001
+        pending_at_disconnect.extend(
+            task
+            for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__ == "AntaRunner._run_test" and not task.done()  # type: ignore[union-attr]
+        )
+
+    with (
+        patch.object(AsyncEOSDevice, "_collect", new=_slow_collect(started, 10)),
+        patch.object(AntaInventory, "disconnect_inventory", new=disconnect_inventory),
+    ):
+        service = AntaService(inventory, CATALOG, max_running_jobs=1)
+        await service.start()
+        running_job = service.submit()
+        queued_job = service.submit()
+        await asyncio.wait_for(started.wait(), timeout=5)
+        await service.stop()
+
+    assert not pending_at_disconnect
+    assert running_job.done
+    assert queued_job.done
+    assert queued_job.error == "ANTA service stopped"
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2}], indirect=True)
+@pytest.mark.usefixtures("routes")
+async def test_serve(inventory: AntaInventory) -> None:
+    """Test AntaService.serve()."""
+    async with AntaService(inventory, CATALOG, default_filters=AntaRunFilters(devices={"device-0"})) as service:
+        server = await service.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def request(method: str, path: str, body: bytes = b"") -> tuple[str, dict[str, str], bytes]:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            return await _http_request(reader, writer, method, path, body)
+
+        async with server:
+            status, _, content = await request("GET", "/health")
+            assert status == "HTTP/1.1 200 OK"
+            assert json.loads(content) == {"status": "ok", "queued_jobs": 0, "running_jobs": 0}
+
+            # Default filters
+            status, headers, content = await request("POST", "/jobs")
+            assert status == "HTTP/1.1 200 OK"
+            assert headers["content-type"] == "application/x-ndjson"
+            assert headers["x-anta-job-id"] == "1"
+            assert [json.loads(line)["name"] for line in content.splitlines()] == ["device-0"]
+
+            status, _, content = await request("POST", "/jobs", json.dumps({"devices": ["device-0", "device-1"]}).encode())
+            assert status == "HTTP/1.1 200 OK"
+            results = [json.loads(line) for line in content.splitlines()]
+            assert {result["name"] for result in results} == {"device-0", "device-1"}
+            assert all(result["test"] == "VerifyRoutingTableEntry" and result["result"] == "failure" for result in results)
+
+            status, _, content = await request("POST", "/jobs", b'{"unknown": 42}')
+            assert status == "HTTP/1.1 400 Bad Request"
+            assert "unknown" in json.loads(content)["error"]
+
+            status, _, _ = await request("POST", "/jobs", b"[42]")
+            assert status == "HTTP/1.1 400 Bad Request"
+
+            status, _, _ = await request("GET", "/jobs")
+            assert status == "HTTP/1.1 405 Method Not Allowed"
+
+            status, _, _ = await request("POST", "/health")
+            assert status == "HTTP/1.1 405 Method Not Allowed"
+
+            status, _, _ = await request("GET", "/unknown")
+            assert status == "HTTP/1.1 404 Not Found"
+
+
+@pytest.mark.parametrize("inventory", [{"count": 1}], indirect=True)
+async def test_serve_queue_full(inventory: AntaInventory) -> None:
+    """Test AntaService HTTP API when the job queue is full."""
+    # Workers are not started
+    service = AntaService(inventory, CATALOG, max_queued_jobs=1)
+    service.submit()
+    server = await service.serve(port=0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        status, _, content = await _http_request(reader, writer, "POST", "/jobs")
+    assert status == "HTTP/1.1 503 Service Unavailable"
+    assert json.loads(content) == {"error": "Job queue is full"}
+
+
+@pytest.mark.parametrize("inventory", [{"count": 1}], indirect=True)
+@pytest.mark.usefixtures("routes")
+async def test_serve_unix(inventory: AntaInventory, tmp_path: Path) -> None:
+    """Test AntaService.serve_unix()."""
+    socket = tmp_path / "anta.sock"
+    async with AntaService(inventory, CATALOG) as service:
+        server = await service.serve_unix(socket)
+        async with server:
+            reader, writer = await asyncio.open_unix_connection(socket)
+            status, _, content = await _http_request(reader, writer, "POST", "/jobs")
+    assert status == "HTTP/1.1 200 OK"
+    assert json.loads(content)["name"] == "device-0"
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2}], indirect=True)
+@pytest.mark.usefixtures("routes")
+async def test_serve_client_disconnect(inventory: AntaInventory) -> None:
+    """Test that a job is cancelled when the client disconnects."""
+    started = asyncio.Event()
+    jobs: list[AntaJob] = []
+    with patch.object(AsyncEOSDevice, "_collect", new=_slow_collect(started, 0.1)):
+        async with AntaService(inventory, CATALOG, job_concurrency=1) as service:
+            submit = service.submit
+
+            def _submit(filters: AntaRunFilters | None = None) -> AntaJob:
+                jobs.append(job := submit(filters))
+                return job
+
+            with patch.object(service, "submit", new=_submit):
+                server = await service.serve(port=0)
+                async with server:
+                    _, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+                    writer.write(b"POST /jobs HTTP/1.1\r\nHost: localhost\r\nContent-Length: 0\r\n\r\n")
+                    await writer.drain()
+                    await asyncio.wait_for(started.wait(), timeout=5)
+                    writer.close()
+                    await asyncio.wait_for(jobs[0].wait(), timeout=5)
+
+    assert jobs[0].cancelled
+    assert jobs[0].ctx is not None
+    # The running test completes, the other test is skipped
+    assert [result.result for result in jobs[0].ctx.manager.results] == ["failure", "skipped"]